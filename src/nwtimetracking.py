@@ -6,19 +6,36 @@ Alias: nwtt
 
 # GLOBAL MODULES
 import numpy as np
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import mimetypes
 import os
 import pandas as pd
 import re
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+import sqlite3
+import time
+from contextlib import closing
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, fields, replace
+from datetime import date, datetime, timedelta
+from html import escape
 from enum import StrEnum, auto
-from numpy import uint
+from io import BytesIO
+from numpy import int64, uint
+from openpyxl import load_workbook
 from pandas import DataFrame, Series, NamedAgg
 from pandas import Timedelta
+from pandas.io.formats.style import Styler
+from pandas.io.parsers import TextParser
 from pathlib import Path
-from re import Match
-from typing import Any, Literal, Optional, Tuple, cast
-from weasyprint import CSS, HTML
+from threading import Lock
+from pyarrow.parquet import ParquetFile
+from pypdf import PdfWriter
+from typing import Any, Callable, Iterator, Literal, Optional, Tuple, Union, cast
+from weasyprint import CSS, HTML, default_url_fetcher
 
 # LOCAL/NW MODULES
 from nwshared import FilePathManager, FileManager, Displayer
@@ -38,6 +55,8 @@ class TTCN(StrEnum):
     ISRELEASEDAY = "IsReleaseDay"
     YEAR = "Year"
     MONTH = "Month"
+    WEEK = "Week"
+    QUARTER = "Quarter"
     TREND = "↕"
     SOFTWAREPROJECTNAME = "SoftwareProjectName"
     SOFTWAREPROJECTVERSION = "SoftwareProjectVersion"
@@ -53,6 +72,14 @@ class TTCN(StrEnum):
     EXPECTED = "Expected"
     MESSAGE = "Message"
     ID = "Id"
+    TABLE = "Table"
+    SECONDS = "Seconds"
+    COLUMN = "Column"
+    MEMORYBEFORE = "MemoryBefore"
+    MEMORYAFTER = "MemoryAfter"
+    WORKBOOK = "Workbook"
+    STATUS = "Status"
+    ERROR = "Error"
 class DEFINITIONSTR(StrEnum):
     
     '''Collects all the column names used by definitions.'''
@@ -75,6 +102,67 @@ class EFFORTMODE(StrEnum):
 
     top_one_effort_per_row = auto()
     top_three_efforts = auto()
+    top_n_efforts = auto()
+    top_n_efforts_per_row = auto()
+    top_n_efforts_per_column = auto()
+    top_percentile_efforts = auto()
+    heat_scale = auto()
+class HIGHLIGHTMODE(StrEnum):
+
+    '''Represents a collection of ways TTAdapter can deliver the effort highlights.'''
+
+    tags = auto()
+    styler = auto()
+class EXECUTORTYPE(StrEnum):
+
+    '''Represents a collection of executors that TTAdapter can use to create the TTSummary tables concurrently.'''
+
+    thread = auto()
+    process = auto()
+class PARTITIONTYPE(StrEnum):
+
+    '''Represents a collection of ways TTDataFrameFactory can partition tt_df.'''
+
+    year = auto()
+    rows = auto()
+class BATCHSTATUS(StrEnum):
+
+    '''Represents a collection of outcomes TTBatchRunner can report for each workbook.'''
+
+    succeeded = auto()
+    failed = auto()
+class REPORTSTATUS(StrEnum):
+
+    '''Represents a collection of states a TTReportJob can be in.'''
+
+    pending = auto()
+    running = auto()
+    cancelled = auto()
+    succeeded = auto()
+    failed = auto()
+class QUERYMEASURE(StrEnum):
+
+    '''Represents a collection of measures a TTQuery can calculate for each group.'''
+
+    effort = auto()
+    occurrences = auto()
+    effort_percentage = auto()
+class QUERYSTEP(StrEnum):
+
+    '''Represents a collection of steps a TTQueryPlan can be made of, in the order they are run.'''
+
+    filter_years = auto()
+    filter_dates = auto()
+    filter_hashtags = auto()
+    select_software_projects = auto()
+    parse_descriptors = auto()
+    filter_software_project_names = auto()
+    unbox_efforts = auto()
+    group = auto()
+    calculate_percentage = auto()
+    sort = auto()
+    take_top_n = auto()
+    box_efforts = auto()
 class REPORTSTR(StrEnum):
     
     '''Collects all the strings related to TTReportManager.'''
@@ -89,7 +177,12 @@ class REPORTSTR(StrEnum):
     TTSBYHASHTAG = "By Hashtag"
     TTSBYYEARMONTHSPNV = "By Year, Month, Software Project"
     TTSBYTIMERANGES = "By TimeRanges"
+    TTSTIMERANGEMATRIX = "By TimeRanges (Heatmap)"
+    TTSBYQUARTER = "By Quarter"
+    TTSBYWEEK = "By Week"
+    TTSBYDAY = "By Day"
     DEFINITIONS = "Definitions"
+    LOGOURL = "https://avatars.githubusercontent.com/u/10279234"
 
 # STATIC CLASSES
 class _MessageCollection():
@@ -137,6 +230,117 @@ class _MessageCollection():
     def provided_mode_not_supported(mode : EFFORTMODE):
         return f"The provided mode is not supported: '{mode}'."
 
+    @staticmethod
+    def provided_group_keys_not_supported(keys : list[str]) -> str:
+        return f"The provided group keys are not supported: '{keys}'."
+    @staticmethod
+    def provided_order_keys_not_supported(keys : list[str]) -> str:
+        return f"The provided order keys are neither group keys nor the measure: '{keys}'."
+    @staticmethod
+    def provided_step_not_supported(step : QUERYSTEP) -> str:
+        return f"The provided step is not supported: '{step}'."
+    @staticmethod
+    def provided_url_not_in_asset_bundle(url : str) -> str:
+        return f"The provided URL is not in the asset bundle and it won't be fetched from the network: '{url}'."
+    @staticmethod
+    def provided_n_not_valid(n : int) -> str:
+        return f"The provided n must be greater than or equal to 1: '{n}'."
+    @staticmethod
+    def provided_percentile_not_valid(percentile : float) -> str:
+        return f"The provided percentile must be between 0 and 100: '{percentile}'."
+    @staticmethod
+    def provided_buckets_not_valid(buckets : int) -> str:
+        return f"The provided buckets must be greater than or equal to 1: '{buckets}'."
+class _TableWorker():
+
+    '''
+        Creates TTSummary tables within the worker processes of a ProcessPoolExecutor, out of a tt_df (and TTPartials object, if enabled)
+        that is shipped once per worker.
+    '''
+
+    loaders : dict[str, Callable[[], Any]] = {}
+
+    @staticmethod
+    def initialize(tt_adapter : Any, tt_df : DataFrame, setting_bag : Any, tt_partials : Any) -> None:
+
+        '''
+            Creates the loaders shared by all the tables of the worker process, once.
+
+            tt_partials is the TTPartials object already created by the parent process (None if not enabled), so the workers never
+            create it again. The SoftwareProjectFrame is memoized by the loaders, so it's created at most once per worker.
+        '''
+
+        _TableWorker.loaders = tt_adapter.create_table_loaders(tt_df = tt_df, setting_bag = setting_bag, tt_partials = tt_partials)
+
+    @staticmethod
+    def create_table(name : str) -> Tuple[Any, float]:
+
+        '''Runs the loader of the TTSummary field called name only and returns its outcome together with the elapsed seconds.'''
+
+        start : float = time.perf_counter()
+        table : Any = _TableWorker.loaders[name]()
+
+        return (table, time.perf_counter() - start)
+class _BatchWorker():
+
+    '''Creates the TTSummary object (and report) of one workbook within the worker processes of a ProcessPoolExecutor.'''
+
+    component_bag : Any = None
+
+    @staticmethod
+    def initialize(component_bag : Any) -> None:
+
+        '''Stores the ComponentBag shared by all the workbooks into the worker process.'''
+
+        _BatchWorker.component_bag = component_bag
+
+    @staticmethod
+    def process_workbook(component_bag : Any, setting_bag : Any) -> Tuple[Any, Optional[str], float]:
+
+        '''
+            Returns the TTSummary object of the workbook described by setting_bag (None if it failed), the error message (None if it succeeded) 
+            and the elapsed seconds. The report is saved as well, if setting_bag.options_report asks for it.
+
+            TTPartials are always created, because the team-level summary is made out of them.
+        '''
+
+        start : float = time.perf_counter()
+
+        try:
+            tt_processor : Any = TimeTrackingProcessor(
+                component_bag = component_bag, 
+                setting_bag = replace(setting_bag, enable_tt_partials = True, enable_lazy_summary = False)
+            )
+            tt_processor.initialize()
+
+            if len(setting_bag.options_report) > 0:
+                Path(setting_bag.working_folder_path).mkdir(parents = True, exist_ok = True)
+                tt_processor.save_as_report()
+
+            return (tt_processor.get_summary(), None, time.perf_counter() - start)
+        except Exception as e:
+            return (None, f"{type(e).__name__}: {e}", time.perf_counter() - start)
+    @staticmethod
+    def process(setting_bag : Any) -> Tuple[Any, Optional[str], float]:
+
+        '''Same as process_workbook(), but with the ComponentBag stored by initialize().'''
+
+        return _BatchWorker.process_workbook(component_bag = _BatchWorker.component_bag, setting_bag = setting_bag)
+class _PDFWorker():
+
+    '''Renders one part of the report to PDF within the worker processes of a ProcessPoolExecutor.'''
+
+    @staticmethod
+    def write_pdf(html : str, page_css : str, asset_bundle : Any) -> bytes:
+
+        '''
+            Returns the PDF bytes of html, laid out with page_css.
+
+            page_css is shipped as a string, because WeasyPrint's CSS and Document objects can't be pickled.
+        '''
+
+        return cast(bytes, HTML(string = html, url_fetcher = asset_bundle.fetch).write_pdf(stylesheets = [CSS(string = page_css)]))
+
 # CLASSES
 @dataclass(frozen=True)
 class EffortStatus():
@@ -159,6 +363,81 @@ class EffortStatus():
     is_correct : bool
     message : str 
 @dataclass(frozen = True)
+class TTPartials():
+
+    '''
+        Collects all the numeric aggregates the TTSummary tables are derived from.
+
+        They are mergeable: the aggregates of two sets of sessions can be summed up, which 
+        means that a TTSummary can be updated with new sessions without recomputing it from scratch.
+    '''
+
+    by_year_month : Series
+    by_year_hashtag : Series
+    by_software_project : Series
+    by_time_range : Series
+@dataclass(frozen = True)
+class SoftwareProjectFrame():
+
+    '''
+        Collects the software project sessions of tt_df, with parsed name/version and numeric effort, summed by 
+        (Year, Month, SoftwareProjectName, SoftwareProjectVersion, Hashtag).
+
+        It's created once per summary, and tts_by_spn_df, tts_by_spv_df and tts_by_year_month_spnv_df are grouped views of it.
+    '''
+
+    by_software_project : Series
+@dataclass(frozen = True)
+class EffortTable():
+
+    '''
+        Collects a tts table with boxed efforts (df) and its numeric shadow (minutes_df).
+
+        minutes_df has the same index and columns of df, with the minutes of each effort cell and NaN everywhere else, 
+        so that EffortHighlighter can rank the efforts without parsing them back.
+    '''
+
+    df : DataFrame
+    minutes_df : DataFrame
+@dataclass(frozen = True)
+class TTQuery():
+
+    '''
+        Describes an aggregation over tt_df in a declarative way:
+
+            - group_by:             the TTCN columns to group by (SoftwareProjectName/Version are parsed from Descriptor);
+            - measure:              what to calculate for each group;
+            - years ... end_date:   the filters, all optional;
+            - order_by:             a list of (column, ascending) pairs, the column being a group key or the measure;
+            - top_n:                how many groups to keep after ordering, all if None;
+            - box_efforts:          if True, the efforts are returned as strings ("05h 30m").
+    '''
+
+    group_by : list[str]
+    measure : QUERYMEASURE = field(default = QUERYMEASURE.effort)
+    years : Optional[list[int]] = field(default = None)
+    hashtags : Optional[list[str]] = field(default = None)
+    software_project_names : Optional[list[str]] = field(default = None)
+    start_date : Optional[date] = field(default = None)
+    end_date : Optional[date] = field(default = None)
+    order_by : list[Tuple[str, bool]] = field(default_factory = list)
+    top_n : Optional[int] = field(default = None)
+    box_efforts : bool = field(default = False)
+@dataclass(frozen = True)
+class TTQueryStep():
+
+    '''Represents a step of a TTQueryPlan.'''
+
+    step : QUERYSTEP
+    description : str
+@dataclass(frozen = True)
+class TTQueryPlan():
+
+    '''Collects the steps TTDataFrameFactory runs, in order, to answer query.'''
+
+    query : TTQuery
+    steps : list[TTQueryStep]
+@dataclass(frozen = True)
 class TTSummary():
 
     '''Collects all the dataframes, stylers and markdowns.'''
@@ -176,6 +455,99 @@ class TTSummary():
     tts_by_timeranges_df : DataFrame
     ttd_effort_status_df : DataFrame
     definitions_df : DataFrame
+    tt_partials : Optional[TTPartials] = field(default = None)
+    skipped_tables : list[str] = field(default_factory = list)
+    timings_df : DataFrame = field(default_factory = DataFrame)
+    tts_timerange_matrix_df : DataFrame = field(default_factory = DataFrame)
+    tt_memory_usage_df : DataFrame = field(default_factory = DataFrame)
+    tts_by_week_df : DataFrame = field(default_factory = DataFrame)
+    tts_by_day_df : DataFrame = field(default_factory = DataFrame)
+    tts_by_quarter_df : DataFrame = field(default_factory = DataFrame)
+    highlight_masks : dict[str, DataFrame] = field(default_factory = dict)
+class LazyTTSummary():
+
+    '''
+        Exposes the same fields as TTSummary, but each of them (but tt_df) is created on first access and memoized.
+
+        loaders maps each field name to the function that creates it.
+    '''
+
+    tt_df : DataFrame
+    __loaders : dict[str, Callable[[], Any]]
+    __values : dict[str, Any]
+
+    def __init__(self, tt_df : DataFrame, loaders : dict[str, Callable[[], Any]]) -> None:
+
+        self.tt_df = tt_df
+        self.__loaders = loaders
+        self.__values = {}
+
+    def __getattr__(self, name : str) -> Any:
+
+        '''Creates the field called name if it hasn't been accessed yet, otherwise returns the memoized value.'''
+
+        if name.startswith("_") or name not in self.__loaders:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        if name not in self.__values:
+            self.__values[name] = self.__loaders[name]()
+
+        return self.__values[name]
+    def is_loaded(self, name : str) -> bool:
+
+        '''Returns True if the field called name has already been created.'''
+
+        return name == "tt_df" or name in self.__values
+    def to_summary(self) -> TTSummary:
+
+        '''Creates all the fields that haven't been accessed yet and returns them as a TTSummary object.'''
+
+        values : dict[str, Any] = { f.name: getattr(self, f.name) for f in fields(TTSummary) if f.name == "tt_df" or f.name in self.__loaders }
+
+        return TTSummary(**values)
+@dataclass(frozen = True)
+class TTBatchSummary():
+
+    '''
+        Collects the outcome of TTBatchRunner:
+
+            - tt_summaries:     one TTSummary per SettingBag, in the same order (None if the workbook failed);
+            - team_summary:     the tables derived from the merged TTPartials of all the succeeded workbooks (None if none succeeded);
+            - progress_df:      one row per workbook with its status, elapsed seconds and error message.
+    '''
+
+    tt_summaries : list[Optional[TTSummary]]
+    team_summary : Optional[TTSummary]
+    progress_df : DataFrame
+@dataclass(frozen = True)
+class EffortRule():
+
+    '''
+        Represents how EffortHighlighter highlights the efforts of a table:
+
+            - mode:         the EFFORTMODE;
+            - n:            the N of the top_n_efforts* modes;
+            - percentile:   the threshold of top_percentile_efforts (i.e. 90.0 highlights the efforts at or above the 90th percentile);
+            - buckets:      the number of quantile buckets of heat_scale (one background intensity each).
+    '''
+
+    mode : EFFORTMODE = field(default = EFFORTMODE.top_three_efforts)
+    n : int = field(default = 3)
+    percentile : float = field(default = 90.0)
+    buckets : int = field(default = 4)
+
+    def __post_init__(self) -> None:
+
+        '''Raises a ValueError if n, percentile or buckets are out of range.'''
+
+        if self.n < 1:
+            raise ValueError(_MessageCollection.provided_n_not_valid(n = self.n))
+
+        if not (0.0 <= self.percentile <= 100.0):
+            raise ValueError(_MessageCollection.provided_percentile_not_valid(percentile = self.percentile))
+
+        if self.buckets < 1:
+            raise ValueError(_MessageCollection.provided_buckets_not_valid(buckets = self.buckets))
 class DefaultPathProvider():
 
     '''Responsible for proviving the default path to the dataset.'''
@@ -275,6 +647,10 @@ class SettingBag():
 
     # WITH DEFAULTS
     options_ttd_effort_status : list[Literal[OPTION.display]] = field(default_factory = list)
+    options_tts_timerange_matrix : list[Literal[OPTION.display]] = field(default_factory = list)
+    options_tts_by_week : list[Literal[OPTION.display]] = field(default_factory = list)
+    options_tts_by_day : list[Literal[OPTION.display]] = field(default_factory = list)
+    options_tts_by_quarter : list[Literal[OPTION.display]] = field(default_factory = list)
     working_folder_path : str = field(default = "/home/nwtimetracking/")
     excel_path : str = field(default = DefaultPathProvider().get_default_time_tracking_path())
     excel_skiprows : int = field(default = 0)
@@ -282,12 +658,39 @@ class SettingBag():
     years : Optional[list[int]] = field(default_factory = lambda : None)
     now : datetime = field(default = datetime.now())
     enable_effort_highlighting : bool = field(default = True)
+    effort_highlighting_mode : HIGHLIGHTMODE = field(default = HIGHLIGHTMODE.tags)
+    enable_compact_tt_df : bool = field(default = False)
+    enable_tt_partials : bool = field(default = False)
+    enable_tt_partials_cache : bool = field(default = False)
+    tt_partials_cache_folder_path : str = field(default = "/home/nwtimetracking/cache/")
+    enable_tt_partials_sqlite : bool = field(default = False)
+    tt_partials_sqlite_database_path : str = field(default = ":memory:")
+    enable_tt_partials_map_reduce : bool = field(default = False)
+    tt_partials_partition_type : PARTITIONTYPE = field(default = PARTITIONTYPE.year)
+    tt_partials_max_workers : int = field(default = 4)
+    enable_lazy_summary : bool = field(default = False)
+    enable_chunked_tt_df : bool = field(default = False)
+    tt_chunk_size : int = field(default = 100000)
+    tt_parquet_path : Optional[str] = field(default = None)
+    enable_table_pruning : bool = field(default = True)
+    max_workers : int = field(default = 1)
+    executor_type : EXECUTORTYPE = field(default = EXECUTORTYPE.thread)
+    report_max_workers : int = field(default = 1)
+    enable_report_cache : bool = field(default = False)
+    enable_report_streaming : bool = field(default = False)
+    report_chunk_size : int = field(default = 10000)
     tts_by_spn_software_project_names : list[str] = field(default_factory = lambda : SoftwareProjectNameProvider().get_all())
     tts_by_spv_software_project_names : list[str] = field(default_factory = lambda : SoftwareProjectNameProvider().get_latest_three())
     tts_by_hashtag_formatters : dict = field(default_factory = lambda : { TTCN.EFFORTPERC : "{:.2f}" })
     tts_by_timeranges_min_occurrences : int = field(default = 10)
     tts_by_timeranges_formatters : dict = field(default_factory = lambda : { TTCN.OCCURRENCEPERC : "{:.2f}" })
     ttd_effort_status_is_correct : bool = field(default = False)
+    tts_by_month_effort_rule : EffortRule = field(default = EffortRule())
+    tts_by_year_effort_rule : EffortRule = field(default = EffortRule())
+    tts_by_spv_effort_rule : EffortRule = field(default = EffortRule())
+    tts_by_hashtag_year_effort_rule : EffortRule = field(default = EffortRule())
+    tts_by_hashtag_effort_rule : EffortRule = field(default = EffortRule())
+    tts_by_year_month_spnv_effort_rule : EffortRule = field(default = EffortRule())
 class TTDataFrameHelper():
 
     '''Collects helper functions for TTDataFrameFactory.'''
@@ -466,7 +869,7 @@ class TTDataFrameHelper():
 
     def calculate_percentage(self, part : float, whole : float, rounding_digits : int = 2) -> float:
 
-        '''Calculates a percentage.'''
+        '''Calculates a percentage. part is divided by whole first, so that big timedeltas don't overflow.'''
 
         prct : Optional[float] = None
 
@@ -475,7 +878,7 @@ class TTDataFrameHelper():
         elif whole == 0:
             prct = 0
         else:
-            prct = (100 * part) / whole
+            prct = 100 * (part / whole)
 
         prct = round(number = prct, ndigits = rounding_digits)
 
@@ -512,31 +915,6 @@ class TTDataFrameHelper():
             return matches[0]
 
         return "ERROR"
-    def create_time_range_id(self, start_time : str, end_time : str) -> str:
-            
-        '''
-            Creates a unique time range identifier out of the provided parameters.
-
-            If parameters are empty, it returns "Unknown":
-
-                ...
-                start_time: '', end_time: '', time_range_id: 'Unknown'
-                start_time: '', end_time: '', time_range_id: 'Unknown'
-                start_time: '08:30', end_time: '09:00', time_range_id: '08:30-09:00'
-                start_time: '18:00', end_time: '19:30', time_range_id: '18:00-19:30'
-                ...
-
-            In "Time Tracking.xlsx" we don't have time ranges for the following period: [2015-10-31 -> 2019-05-31].
-        '''
-
-        unknown_id : str = "Unknown"
-        time_range_id : str = f"{start_time}-{end_time}"
-
-        if len(start_time) == 0 or len(end_time) == 0:
-            time_range_id = unknown_id
-
-        return time_range_id
-
     def is_year(self, value : Any) -> bool:
 
         """Returns True if value is a valid year."""
@@ -551,19 +929,170 @@ class TTDataFrameHelper():
         """Returns True if number is even."""
 
         return number % 2 == 0
+class TTQueryPlanner():
+
+    '''
+        Turns TTQuery objects into TTQueryPlan objects, without touching any data.
+
+        The filters run before the descriptors are parsed and the efforts are unboxed, so that both happen only for the rows that 
+        survived them (and only if the query needs them). A single groupby follows. Duplicated order keys are merged, 
+        and the sort is dropped if groupby already returns the groups in the requested order.
+    '''
+
+    __group_keys : list[str] = [
+        TTCN.DATE, TTCN.STARTTIME, TTCN.ENDTIME, TTCN.HASHTAG, TTCN.DESCRIPTOR, TTCN.ISSOFTWAREPROJECT, TTCN.ISRELEASEDAY, 
+        TTCN.YEAR, TTCN.MONTH, TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION
+    ]
+
+    def __get_measure_column_name(self, measure : QUERYMEASURE) -> str:
+
+        '''QUERYMEASURE.effort => "Effort", QUERYMEASURE.occurrences => "Occurrences", QUERYMEASURE.effort_percentage => "Effort%".'''
+
+        if measure == QUERYMEASURE.occurrences:
+            return TTCN.OCCURRENCES
+        elif measure == QUERYMEASURE.effort_percentage:
+            return TTCN.EFFORTPERC
+        
+        return TTCN.EFFORT
+    def __validate(self, query : TTQuery) -> None:
+
+        '''Raises an exception if query contains group keys or order keys that are not supported.'''
+
+        wrong_group_keys : list[str] = [key for key in query.group_by if key not in self.__group_keys]
+
+        if len(query.group_by) == 0 or len(wrong_group_keys) > 0:
+            raise Exception(_MessageCollection.provided_group_keys_not_supported(keys = wrong_group_keys))
+
+        allowed_order_keys : list[str] = query.group_by + [self.__get_measure_column_name(measure = query.measure)]
+        wrong_order_keys : list[str] = [key for key, _ in query.order_by if key not in allowed_order_keys]
+
+        if len(wrong_order_keys) > 0:
+            raise Exception(_MessageCollection.provided_order_keys_not_supported(keys = wrong_order_keys))
+    def __is_software_project_query(self, query : TTQuery) -> bool:
+
+        '''Returns True if query needs the SoftwareProjectName/SoftwareProjectVersion columns.'''
+
+        sp_keys : list[str] = [TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION]
+
+        return query.software_project_names is not None or any(key in sp_keys for key in query.group_by)
+    def __merge_order_by(self, query : TTQuery) -> list[Tuple[str, bool]]:
+
+        '''
+            [("Effort", False), ("Year", True), ("Effort", True)]   => [("Effort", False), ("Year", True)]
+            [("Year", True)] with group_by = ["Year", "Month"]        => [] (groupby already sorts by the group keys)
+        '''
+
+        order_by : list[Tuple[str, bool]] = []
+
+        for key, ascending in query.order_by:
+            if key not in [merged_key for merged_key, _ in order_by]:
+                order_by.append((key, ascending))
+
+        keys : list[str] = [key for key, _ in order_by]
+        is_group_order : bool = all(ascending for _, ascending in order_by) and keys == query.group_by[:len(keys)]
+
+        if is_group_order:
+            return []
+
+        return order_by
+    def __format_date_range(self, query : TTQuery) -> str:
+
+        '''"2024-01-01 <= Date <= 2024-12-31", "Date >= 2024-01-01", ...'''
+
+        conditions : list[str] = []
+
+        if query.start_date is not None:
+            conditions.append(f"{TTCN.DATE} >= {query.start_date}")
+
+        if query.end_date is not None:
+            conditions.append(f"{TTCN.DATE} <= {query.end_date}")
+
+        return " and ".join(conditions)
+    def __format_keys(self, keys : list[str]) -> str:
+
+        '''[TTCN.YEAR, TTCN.HASHTAG] => "['Year', 'Hashtag']"'''
+
+        return str([str(key) for key in keys])
+
+    def create_plan(self, query : TTQuery) -> TTQueryPlan:
+
+        '''Validates query and returns the steps that answer it.'''
+
+        self.__validate(query = query)
+
+        steps : list[TTQueryStep] = []
+        measure_column_name : str = self.__get_measure_column_name(measure = query.measure)
+
+        if query.years is not None:
+            steps.append(TTQueryStep(step = QUERYSTEP.filter_years, description = f"{TTCN.YEAR} in {query.years}"))
+
+        if query.start_date is not None or query.end_date is not None:
+            steps.append(TTQueryStep(step = QUERYSTEP.filter_dates, description = self.__format_date_range(query = query)))
+
+        if query.hashtags is not None:
+            steps.append(TTQueryStep(step = QUERYSTEP.filter_hashtags, description = f"{TTCN.HASHTAG} in {query.hashtags}"))
+
+        if self.__is_software_project_query(query = query):
+            steps.append(TTQueryStep(step = QUERYSTEP.select_software_projects, description = f"{TTCN.ISSOFTWAREPROJECT} == True"))
+            steps.append(TTQueryStep(
+                step = QUERYSTEP.parse_descriptors, 
+                description = f"{TTCN.DESCRIPTOR} => {TTCN.SOFTWAREPROJECTNAME}, {TTCN.SOFTWAREPROJECTVERSION}"))
+
+        if query.software_project_names is not None:
+            steps.append(TTQueryStep(
+                step = QUERYSTEP.filter_software_project_names, 
+                description = f"{TTCN.SOFTWAREPROJECTNAME} in {query.software_project_names}"))
+
+        if query.measure != QUERYMEASURE.occurrences:
+            steps.append(TTQueryStep(step = QUERYSTEP.unbox_efforts, description = f"{TTCN.EFFORT}: str => timedelta"))
+
+        aggregation : str = "size()" if query.measure == QUERYMEASURE.occurrences else f"sum({TTCN.EFFORT})"
+        steps.append(TTQueryStep(step = QUERYSTEP.group, description = f"groupby(by = {self.__format_keys(keys = query.group_by)}).{aggregation}"))
+
+        if query.measure == QUERYMEASURE.effort_percentage:
+            steps.append(TTQueryStep(step = QUERYSTEP.calculate_percentage, description = f"{TTCN.EFFORTPERC} = {TTCN.EFFORT} / sum({TTCN.EFFORT})"))
+
+        order_by : list[Tuple[str, bool]] = self.__merge_order_by(query = query)
+
+        if len(order_by) > 0:
+            steps.append(TTQueryStep(
+                step = QUERYSTEP.sort, 
+                description = f"sort_values(by = {self.__format_keys(keys = [key for key, _ in order_by])}, ascending = {[ascending for _, ascending in order_by]})"))
+
+        if query.top_n is not None:
+            steps.append(TTQueryStep(step = QUERYSTEP.take_top_n, description = f"head({query.top_n})"))
+
+        if query.box_efforts and measure_column_name == TTCN.EFFORT:
+            steps.append(TTQueryStep(step = QUERYSTEP.box_efforts, description = f"{TTCN.EFFORT}: timedelta => str"))
+
+        return TTQueryPlan(query = replace(query, order_by = order_by), steps = steps)
+    def explain(self, plan : TTQueryPlan) -> str:
+
+        '''
+            1. filter_years: Year in [2024]
+            2. unbox_efforts: Effort: str => timedelta
+            3. group: groupby(by = ['Year', 'Hashtag']).sum(Effort)
+            ...
+        '''
+
+        lines : list[str] = [f"{i}. {step.step}: {step.description}" for i, step in enumerate(plan.steps, start = 1)]
+
+        return "\n".join(lines)
 class TTDataFrameFactory():
 
     '''Encapsulates all the logic related to dataframe creation out of "Time Tracking.xlsx".'''
 
     __df_helper : TTDataFrameHelper
+    __query_planner : TTQueryPlanner
 
-    def __init__(self, df_helper : TTDataFrameHelper) -> None:
+    def __init__(self, df_helper : TTDataFrameHelper, query_planner : Optional[TTQueryPlanner] = None) -> None:
 
         self.__df_helper = df_helper
+        self.__query_planner = query_planner if query_planner is not None else TTQueryPlanner()
 
-    def __enforce_dataframe_definition_for_tt_df(self, tt_df : DataFrame) -> DataFrame:
+    def __get_tt_df_column_names(self) -> list[str]:
 
-        '''Enforces definition for the provided dataframe.'''
+        '''Returns the columns of tt_df, in order.'''
 
         column_names : list[str] = []
         column_names.append(TTCN.DATE)              # [0], date
@@ -577,6 +1106,13 @@ class TTDataFrameFactory():
         column_names.append(TTCN.YEAR)              # [8], int
         column_names.append(TTCN.MONTH)             # [9], int
 
+        return column_names
+    def __enforce_dataframe_definition_for_tt_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''Enforces definition for the provided dataframe.'''
+
+        column_names : list[str] = self.__get_tt_df_column_names()
+
         tt_df = tt_df[column_names]
     
         tt_df[column_names[0]] = pd.to_datetime(tt_df[column_names[0]], format="%Y-%m-%d") 
@@ -597,53 +1133,39 @@ class TTDataFrameFactory():
         tt_df[column_names[5]] = tt_df[column_names[5]].replace('nan', '')
 
         return tt_df    
-    def __enforce_dataframe_definition_for_raw_ttm_df(self, df : DataFrame) -> DataFrame:
+    def __enforce_dataframe_definition_for_tt_chunk_df(self, chunk_df : DataFrame, years : Optional[list[int]], compact : bool) -> DataFrame:
 
-        '''Ensures that the columns of the provided dataframe have the expected data types.'''
-
-        df = df.astype({TTCN.MONTH: int})
-        # can't enforce the year column as "timedelta"
+        '''Does to chunk_df what create_tt_df() does to the whole "Sessions" tab.'''
 
-        return df     
-    def __create_default_raw_ttm(self, year : int) -> DataFrame:
+        chunk_df = self.__enforce_dataframe_definition_for_tt_df(tt_df = chunk_df)
 
-        '''
-            default_df:
+        if years is not None:
+            if len(years) > 0:
+                chunk_df = self.__filter_by_year(df = chunk_df, years = years)
 
-                    Month	2019
-                0	1	    0 days
-                ...
-        '''
+        if compact:
+            chunk_df = self.create_compact_tt_df(tt_df = chunk_df)
 
-        td : timedelta = self.__df_helper.unbox_effort(effort_str = "0h 00m")
+        return chunk_df
+    def __enforce_dataframe_definition_for_raw_ttm_df(self, df : DataFrame) -> DataFrame:
 
-        default_df : DataFrame = pd.DataFrame(
-            {
-                f"{TTCN.MONTH}": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
-                f"{str(year)}": [td, td, td, td, td, td, td, td, td, td, td, td]
-            },
-            index=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],
-        )
+        '''Ensures that the columns of the provided dataframe have the expected data types.'''
 
-        default_df = self.__enforce_dataframe_definition_for_raw_ttm_df(df = default_df)
+        df = df.astype({TTCN.MONTH: int})
+        # can't enforce the year column as "timedelta"
 
-        return default_df    
-    def __create_raw_ttm(self, tt_df : DataFrame, year : int) -> DataFrame:
+        return df     
+    def __create_raw_ttm(self, by_year_month : Series, year : int) -> DataFrame:
         
         '''
-            ttm_df:
-
-                Year	    Month	Effort
-                0	2015	10	    8h 00m
-                1	2015	11	    10h 00m
-                2	2015	12	    0h 00m
-
-            ttm_df:
+            by_year_month:
 
-                Year	    Month	2015	        
-                0	2015	10	    0 days 08:00:00
-                1	2015	11	    0 days 10:00:00
-                2	2015	12	    0 days 00:00:00            
+                Year    Month
+                2015    10          0 days 08:00:00
+                        11          0 days 10:00:00
+                        12          0 days 00:00:00
+                2016    1           0 days 00:00:00
+                ...
 
             ttm_df:
 
@@ -653,80 +1175,19 @@ class TTDataFrameFactory():
                 9	10	    0 days 08:00:00
                 10	11	    0 days 10:00:00
                 11	12	    0 days 00:00:00
-        '''
-
-        ttm_df : DataFrame = tt_df.copy(deep=True)
-        ttm_df = ttm_df[[TTCN.YEAR, TTCN.MONTH, TTCN.EFFORT]]
-
-        condition : Series = (tt_df[TTCN.YEAR] == year)
-        ttm_df = ttm_df.loc[condition]
-
-        ttm_df[TTCN.EFFORT] = ttm_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.unbox_effort(effort_str = x))
-        ttm_df[str(year)] = ttm_df[TTCN.EFFORT]
-        cn_effort = str(year)    
-
-        ttm_df = ttm_df.groupby([TTCN.MONTH])[cn_effort].sum().sort_values(ascending = [False]).reset_index(name = cn_effort)
-        ttm_df = ttm_df.sort_values(by = TTCN.MONTH).reset_index(drop = True)
-
-        ttm_df = self.__try_complete_raw_ttm(ttm_df = ttm_df, year = year)
-        ttm_df = self.__enforce_dataframe_definition_for_raw_ttm_df(df = ttm_df)
-
-        return ttm_df
-    def __try_complete_raw_ttm(self, ttm_df : DataFrame, year : int) -> DataFrame:
-
-        '''
-            We expect ttm_df to have 12 months: 
-            
-                - if that's the case, we are done with it and we return it;
-                - if it's not the case, we generate a default_df and we use it to fill the missing values.
-
-                ttm_df
-            
-                        Month	2015
-                    0	10	    8h 00m
-                    1	11	    10h 00m
-                    2	12	    0h 00m
-            
-                default_df:
 
-                        Month	2015
-                    0	1	    0h 00m
-                    1	2	    0h 00m              
-                    ... ...     ...
-                    11	12	    0h 00m
-
-                missing_df:
-
-                        Month	2015
-                    0	1	    0h 00m
-                    1	2	    0h 00m              
-                    ... ...     ...
-                    8	9	    0h 00m                 
-
-                completed_df
-            
-                        Month	2015
-                    0	1	    0h 00m
-                    1	2	    0h 00m
-                    ... ...     ...
-                    9	10	    8h 00m
-                    10	11	    10h 00m
-                    11	12	    0h 00m  
+            The missing months are filled with zero by reindexing.
         '''
 
-        if ttm_df[TTCN.MONTH].count() != 12:
+        cn_effort : str = str(year)
+        by_month : Series = by_year_month.xs(year, level = TTCN.YEAR)
+        by_month = by_month.reindex(index = range(1, 13), fill_value = pd.Timedelta(0)).rename_axis(TTCN.MONTH)
 
-            default_df : DataFrame = self.__create_default_raw_ttm(year = year)
-            missing_df : DataFrame = default_df.loc[~default_df[TTCN.MONTH].astype(str).isin(ttm_df[TTCN.MONTH].astype(str))]
-
-            completed_df : DataFrame = pd.concat([ttm_df, missing_df], ignore_index = True)
-            completed_df = completed_df.sort_values(by = TTCN.MONTH, ascending = [True])
-            completed_df = completed_df.reset_index(drop = True)
-
-            return completed_df
+        ttm_df : DataFrame = by_month.reset_index(name = cn_effort)
+        ttm_df = self.__enforce_dataframe_definition_for_raw_ttm_df(df = ttm_df)
 
         return ttm_df
-    def __expand_raw_ttm_by_year(self, tt_df : DataFrame, years : list, tts_by_month_df : DataFrame, i : int, add_trend : bool) -> DataFrame:
+    def __expand_raw_ttm_by_year(self, by_year_month : Series, years : list, tts_by_month_df : DataFrame, i : int, add_trend : bool) -> DataFrame:
 
         '''    
             actual_df:
@@ -775,7 +1236,7 @@ class TTDataFrameFactory():
         '''
         
         actual_df : DataFrame = tts_by_month_df.copy(deep = True)
-        ttm_df : DataFrame = self.__create_raw_ttm(tt_df = tt_df, year = years[i])
+        ttm_df : DataFrame = self.__create_raw_ttm(by_year_month = by_year_month, year = years[i])
 
         expansion_df = pd.merge(
             left = actual_df, 
@@ -872,11 +1333,20 @@ class TTDataFrameFactory():
         tts_by_month_upd_df.iloc[:, idx_trend] = np.where(condition, new_value, tts_by_month_upd_df.iloc[:, idx_trend])
 
         return tts_by_month_upd_df
-    def __extract_years(self, tt_df : DataFrame) -> list[int]:
+    def __extract_years(self, aggregate : Series) -> list[int]:
+
+        '''
+            Extracts the years from the TTCN.YEAR index level of the provided aggregate:
 
-        '''Extract years.'''
+                Year    Month
+                2024    2        1 days 12:00:00
+                2025    1        0 days 01:30:00
+                ...
+                
+                => [2024, 2025]
+        '''
 
-        year_list : list[int] = pd.Series(tt_df[TTCN.YEAR]).dropna().astype(int).sort_values().unique().tolist()
+        year_list : list[int] = aggregate.index.get_level_values(TTCN.YEAR).unique().sort_values().astype(int).tolist()
 
         return year_list
     def __filter_by_year(self, df : DataFrame, years : list[int]) -> DataFrame:
@@ -891,80 +1361,303 @@ class TTDataFrameFactory():
         filtered_df = df.loc[condition]
 
         return filtered_df
+    def __unbox_efforts(self, df : DataFrame) -> DataFrame:
 
-    def create_tt_df(self, excel_path : str, excel_skiprows : int, excel_nrows : int, excel_tabname : str, years : Optional[list[int]] = None) -> DataFrame:
-        
-        '''Retrieves the content of the "Sessions" tab and returns it as a Dataframe.'''
-
-        tt_df : DataFrame = pd.read_excel(
-            io = excel_path, 	
-            skiprows = excel_skiprows,
-            nrows = excel_nrows,
-            sheet_name = excel_tabname, 
-            engine = 'openpyxl'
-            )      
-        tt_df = self.__enforce_dataframe_definition_for_tt_df(tt_df = tt_df)
+        '''Returns a copy of df in which the TTCN.EFFORT column contains timedeltas instead of strings ("5h 30m" => 5:30:00).'''
 
-        if years is not None:
-            if len(years) > 0:
-                tt_df = self.__filter_by_year(df = tt_df, years = years)
+        unboxed_df : DataFrame = df.copy(deep = True)
+        unboxed_df[TTCN.EFFORT] = pd.to_timedelta(unboxed_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.unbox_effort(effort_str = x)))
 
-        return tt_df
-    def create_tt_latest_four_df(self, tt_df : DataFrame) -> DataFrame:
+        return unboxed_df
+    def __sum_effort_by(self, tt_df : DataFrame, by : list[str]) -> Series:
 
-        '''Returns latest four rows of tt_df'''
+        '''
+            Runs a TTQuery that groups tt_df by the provided columns.
 
-        tt_latest_four_df : DataFrame = tt_df.copy(deep = True)
-        tt_latest_four_df = tt_latest_four_df.tail(4)
+                Year    Hashtag
+                2024    #csharp         0 days 06:15:00
+                        #maintenance    0 days 04:30:00
+                ...
+        '''
 
-        return tt_latest_four_df
-    def create_tts_by_month_df(self, tt_df : DataFrame, now : datetime) -> DataFrame:
+        return self.__run_query(tt_df = tt_df, query = TTQuery(group_by = by))
+    def __normalize_index(self, aggregate : Series) -> Series:
 
         '''
-                2016	↕   2017	    ↕	2018    ...
-            0	0h 00m	↑	13h 00m		↓	0h 00m
-            1	0h 00m	↑	1h 00m	    ↓	0h 00m
-            ...            
+            Converts the categorical and the small integer levels of the index of aggregate back to object and int64, 
+            so that aggregates (and all the tables derived from them) are the same whether tt_df is compact or not.
         '''
 
-        years : list[int] = self.__extract_years(tt_df = tt_df)
-        tts_df : DataFrame = pd.DataFrame()
+        levels : list[pd.Index] = []
 
-        for i in range(len(years)):
+        for i in range(aggregate.index.nlevels):
+            level : pd.Index = aggregate.index.get_level_values(i)
 
-            if i == 0:
-                tts_df = self.__create_raw_ttm(tt_df = tt_df, year = years[i])
-            else:
-                tts_df = self.__expand_raw_ttm_by_year(
-                    tt_df = tt_df, 
-                    years = years, 
-                    tts_by_month_df = tts_df, 
-                    i = i, 
-                    add_trend = True)
+            if isinstance(level.dtype, pd.CategoricalDtype):
+                level = level.astype(object)
+            elif pd.api.types.is_integer_dtype(level.dtype):
+                level = level.astype(int64)
+
+            levels.append(level)
+
+        normalized : Series = aggregate.copy()
+        normalized.index = pd.MultiIndex.from_arrays(arrays = levels) if len(levels) > 1 else levels[0]
+
+        return normalized
+    def __sum_effort_by_period(self, unboxed_df : DataFrame, freq : str) -> Series:
+
+        '''
+            Expects a df returned by __unbox_efforts(). 
+            
+            Sums up the effort by the periods (freq: "D", "W-SUN", "Q-DEC", ...) the TTCN.DATE column falls into, 
+            then reindexes the outcome over all the periods between the first and the last one, filling the missing ones with zero:
+
+                2024-02-12      0 days 01:00:00
+                2024-02-13      0 days 04:15:00
+                ...
+                2024-02-16      0 days 00:00:00
+                ...
+        '''
+
+        periods : pd.PeriodIndex = pd.PeriodIndex(pd.to_datetime(unboxed_df[TTCN.DATE]), freq = freq)
+        aggregate : Series = unboxed_df[TTCN.EFFORT].groupby(by = periods).sum()
+
+        if len(aggregate) == 0:
+            return aggregate
+
+        all_periods : pd.PeriodIndex = pd.period_range(start = aggregate.index.min(), end = aggregate.index.max(), freq = freq)
+        aggregate = aggregate.reindex(index = all_periods, fill_value = pd.Timedelta(0))
+
+        return aggregate
+    def __box_efforts(self, aggregate : Series) -> list[str]:
+
+        '''Boxes all the efforts in aggregate ("5:30:00" => "05h 30m").'''
+
+        return [self.__df_helper.box_effort(effort_td = effort_td, add_plus_sign = False) for effort_td in aggregate]
+    def __create_effort_table(self, df : DataFrame) -> EffortTable:
+
+        '''
+            Boxes the timedelta cells of df ("5:30:00" => "05h 30m") and keeps their minutes in an aligned shadow:
+
+                    2015    ↕   2016                    2015    ↕       2016
+                0   18h 00m ↑   615h 15m    =>      0   1080.0  NaN     36915.0
+
+            Columns are accessed by position, because the trend columns share the same name.
+        '''
+
+        boxed_df : DataFrame = df.copy(deep = False)
+        minutes_df : DataFrame = DataFrame(data = np.nan, index = df.index, columns = df.columns)
+
+        for idx in range(len(df.columns)):
+
+            column : Series = df.iloc[:, idx]
+
+            if pd.api.types.is_timedelta64_dtype(column):
+                is_effort : np.ndarray = column.notna().to_numpy(dtype = bool)
+            elif column.dtype == object:
+                is_effort = column.map(lambda x : isinstance(x, timedelta)).to_numpy(dtype = bool)
+            else:
+                continue
+
+            if not is_effort.any():
+                continue
+
+            efforts : Series = pd.to_timedelta(column[is_effort])
+            boxed : Series = column.astype(object)
+            boxed[is_effort] = self.__box_efforts(aggregate = efforts)
+
+            boxed_df.isetitem(idx, boxed)
+            minutes_df.iloc[is_effort, idx] = (efforts.dt.total_seconds() // 60).to_numpy()
+
+        return EffortTable(df = boxed_df, minutes_df = minutes_df)
+    def __filter_by_dates(self, df : DataFrame, start_date : Optional[date], end_date : Optional[date]) -> DataFrame:
+
+        '''Returns the rows of df whose TTCN.DATE is between start_date and end_date (both included and both optional).'''
+
+        dates : Series = pd.to_datetime(df[TTCN.DATE])
+        condition : Series = Series(True, index = df.index)
+
+        if start_date is not None:
+            condition &= (dates >= pd.Timestamp(start_date))
+
+        if end_date is not None:
+            condition &= (dates <= pd.Timestamp(end_date))
+
+        return df.loc[condition]
+    def __parse_descriptors(self, df : DataFrame) -> DataFrame:
+
+        '''Returns a copy of df with the TTCN.SOFTWAREPROJECTNAME and TTCN.SOFTWAREPROJECTVERSION columns added.'''
+
+        sp_df : DataFrame = df.copy(deep = True)
+
+        sp_df[TTCN.SOFTWAREPROJECTNAME] = sp_df[TTCN.DESCRIPTOR].apply(lambda x : self.__df_helper.extract_software_project_name(descriptor = x))
+        sp_df[TTCN.SOFTWAREPROJECTVERSION] = sp_df[TTCN.DESCRIPTOR].apply(lambda x : self.__df_helper.extract_software_project_version(descriptor = x))
+
+        return sp_df
+    def __group(self, df : DataFrame, query : TTQuery) -> Series:
+
+        '''Runs the only groupby of the plan, the outcome being named after the measure of query.'''
+
+        if query.measure == QUERYMEASURE.occurrences:
+            aggregate : Series = df.groupby(by = query.group_by, observed = True).size().rename(TTCN.OCCURRENCES)
+        else:
+            aggregate = df.groupby(by = query.group_by, observed = True)[TTCN.EFFORT].sum()
+
+        return self.__normalize_index(aggregate = aggregate)
+    def __calculate_percentages(self, aggregate : Series) -> Series:
+
+        '''Converts the efforts in aggregate to percentages of their sum.'''
+
+        whole : Timedelta = aggregate.sum()
+        percentages : list[float] = [self.__df_helper.calculate_percentage(part = part, whole = whole) for part in aggregate]
+
+        return Series(data = percentages, index = aggregate.index, name = TTCN.EFFORTPERC, dtype = float)
+    def __sort(self, aggregate : Series, order_by : list[Tuple[str, bool]]) -> Series:
+
+        '''Sorts aggregate by any combination of its index levels and its values, in a single (stable) sort.'''
+
+        sorted_df : DataFrame = aggregate.reset_index().sort_values(
+            by = [key for key, _ in order_by], 
+            ascending = [ascending for _, ascending in order_by], 
+            kind = "stable")
+
+        return aggregate.iloc[sorted_df.index.to_numpy()]
+    def __run_query_step(self, data : Any, step : TTQueryStep, query : TTQuery) -> Any:
+
+        '''Runs step against data, which is a DataFrame before the QUERYSTEP.group step and a Series after it.'''
+
+        if step.step == QUERYSTEP.filter_years:
+            return self.__filter_by_year(df = data, years = cast(list[int], query.years))
+        elif step.step == QUERYSTEP.filter_dates:
+            return self.__filter_by_dates(df = data, start_date = query.start_date, end_date = query.end_date)
+        elif step.step == QUERYSTEP.filter_hashtags:
+            return data.loc[data[TTCN.HASHTAG].isin(values = cast(list[str], query.hashtags))]
+        elif step.step == QUERYSTEP.select_software_projects:
+            return data.loc[data[TTCN.ISSOFTWAREPROJECT] == True]
+        elif step.step == QUERYSTEP.parse_descriptors:
+            return self.__parse_descriptors(df = data)
+        elif step.step == QUERYSTEP.filter_software_project_names:
+            return data.loc[data[TTCN.SOFTWAREPROJECTNAME].isin(values = cast(list[str], query.software_project_names))]
+        elif step.step == QUERYSTEP.unbox_efforts:
+            return self.__unbox_efforts(df = data)
+        elif step.step == QUERYSTEP.group:
+            return self.__group(df = data, query = query)
+        elif step.step == QUERYSTEP.calculate_percentage:
+            return self.__calculate_percentages(aggregate = data)
+        elif step.step == QUERYSTEP.sort:
+            return self.__sort(aggregate = data, order_by = query.order_by)
+        elif step.step == QUERYSTEP.take_top_n:
+            return data.head(n = query.top_n)
+        elif step.step == QUERYSTEP.box_efforts:
+            return data.apply(lambda x : self.__df_helper.box_effort(effort_td = x, add_plus_sign = False))
+        else:
+            raise Exception(_MessageCollection.provided_step_not_supported(step = step.step))
+    def __run_query(self, tt_df : DataFrame, query : TTQuery) -> Series:
+
+        '''Plans query and runs its steps against tt_df, returning the measure indexed by the group keys.'''
+
+        plan : TTQueryPlan = self.__query_planner.create_plan(query = query)
+        data : Any = tt_df
+
+        for step in plan.steps:
+            data = self.__run_query_step(data = data, step = step, query = plan.query)
+
+        return cast(Series, data)
+    def __create_time_slots(self) -> list[str]:
+
+        '''["00:00", "00:15", ..., "23:45"]'''
+
+        return [f"{x // 4:02d}:{(x % 4) * 15:02d}" for x in range(96)]
+    def __convert_to_time_slots(self, times : Series) -> np.ndarray:
+
+        '''"00:00" => 0, "08:15" => 33, ..., "23:45" => 95 (minutes are floored to the quarter hour).'''
+
+        hours : np.ndarray = times.str.slice(0, 2).astype(int).to_numpy()
+        minutes : np.ndarray = times.str.slice(3, 5).astype(int).to_numpy()
+
+        return hours * 4 + minutes // 15
+    def __create_timerange_matrix_df(self, counts : np.ndarray) -> DataFrame:
+
+        '''Labels the provided 96 x 96 counts with the time slots (StartTime x EndTime).'''
+
+        time_slots : list[str] = self.__create_time_slots()
+
+        return DataFrame(
+            data = counts,
+            index = pd.Index(data = time_slots, name = TTCN.STARTTIME),
+            columns = pd.Index(data = time_slots, name = TTCN.ENDTIME)
+        )
+    def __count_time_ranges(self, tt_df : DataFrame) -> Series:
+
+        '''
+            TimeRange
+            08:00-08:30     1
+            08:15-12:45     1
+            ...
+            Unknown         4
+
+            The sessions without start or end time are counted as "Unknown" (in "Time Tracking.xlsx" we don't have time ranges for the 
+            following period: [2015-10-31 -> 2019-05-31]).
+        '''
+
+        counts : np.ndarray = self.create_tts_timerange_matrix_df(tt_df = tt_df).to_numpy()
+        time_slots : list[str] = self.__create_time_slots()
+        start_slots, end_slots = np.nonzero(counts)
+
+        by_time_range : Series = Series(
+            data = counts[start_slots, end_slots],
+            index = pd.Index(data = [f"{time_slots[x]}-{time_slots[y]}" for x, y in zip(start_slots, end_slots)], name = TTCN.TIMERANGE),
+            name = TTCN.OCCURRENCES
+        )
+
+        unknown_id : str = "Unknown"
+        unknown_occurrences : int = len(tt_df) - int(counts.sum())
+
+        if unknown_occurrences > 0:
+            by_time_range.loc[unknown_id] = unknown_occurrences
+
+        return by_time_range
+    def __merge_aggregates(self, aggregates : list[Series]) -> Series:
+
+        '''Sums up the provided aggregates by index, keeping the index sorted as groupby() does.'''
+
+        merged : Series = pd.concat(objs = aggregates)
+        merged = merged.groupby(level = list(range(merged.index.nlevels))).sum()
+
+        return merged
+    def __format_tts_by_month(self, by_year_month : Series, now : datetime) -> EffortTable:
+
+        '''Formats the provided aggregate as tts_by_month_df.'''
+
+        years : list[int] = self.__extract_years(aggregate = by_year_month)
+        tts_df : DataFrame = pd.DataFrame()
+
+        for i in range(len(years)):
+
+            if i == 0:
+                tts_df = self.__create_raw_ttm(by_year_month = by_year_month, year = years[i])
+            else:
+                tts_df = self.__expand_raw_ttm_by_year(
+                    by_year_month = by_year_month, 
+                    years = years, 
+                    tts_by_month_df = tts_df, 
+                    i = i, 
+                    add_trend = True)
                 
         for year in years:
-            tts_df[str(year)] = tts_df[str(year)].apply(lambda x : self.__df_helper.box_effort(effort_td = x, add_plus_sign = False))
+            tts_df[str(year)] = tts_df[str(year)].astype(object)
 
         tts_df.rename(columns = (lambda x : self.__try_consolidate_trend_column_name(column_name = x)), inplace = True)
         
         tts_df = self.__update_future_months_to_empty(tts_by_month_df = tts_df, now = now)
         tts_df.drop(columns = [TTCN.MONTH], inplace = True)
 
-        return tts_df
-    def create_tts_by_year_df(self, tt_df : DataFrame) -> DataFrame:
-
-        '''
-                2015    ↕   2016        ↕   2017        ↕   2018        ↕   2019        ↕   ...
-            0  18h 00m  ↑   615h 15m    ↑   762h 45m    ↑   829h 45m    ↓   515h 15m    ↓   ...
-        '''
-
-        years : list[int] = self.__extract_years(tt_df = tt_df)
+        return self.__create_effort_table(df = tts_df)
+    def __format_tts_by_year(self, by_year : Series) -> EffortTable:
 
-        tts_df: DataFrame = tt_df.loc[tt_df[TTCN.YEAR].isin(years)].copy(deep = True)
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.unbox_effort(effort_str = x))
-        tts_df[TTCN.EFFORT] = pd.to_timedelta(tts_df[TTCN.EFFORT])
+        '''Formats the provided aggregate as tts_by_year_df.'''
 
-        by_year : Series = tts_df.groupby(TTCN.YEAR)[TTCN.EFFORT].sum().reindex(years, fill_value = Timedelta(0))
+        years : list[int] = self.__extract_years(aggregate = by_year)
 
         column_names : list[str] = []
         row_values : list[Timedelta | str] = []
@@ -972,7 +1665,7 @@ class TTDataFrameFactory():
         for i, year in enumerate(years):
 
             column_names.append(str(year))
-            row_values.append(self.__df_helper.box_effort(by_year.loc[year], False))
+            row_values.append(by_year.loc[year])
 
             if i < len(years) - 1:
 
@@ -990,680 +1683,2555 @@ class TTDataFrameFactory():
                 column_names.append(TTCN.TREND)
                 row_values.append(arrow)
 
-        tts_df = pd.DataFrame([row_values], columns = column_names)
+        tts_df : DataFrame = pd.DataFrame([row_values], columns = column_names)
+
+        return self.__create_effort_table(df = tts_df)
+    def __format_tts_by_range(self, by_year : Series) -> DataFrame:
+
+        '''Formats the provided aggregate as tts_by_range_df.'''
+
+        years_count : int = len(self.__extract_years(aggregate = by_year))
+        effort_td : Timedelta = by_year.sum()
+        effort_str : str = self.__df_helper.box_effort(effort_td = effort_td, add_plus_sign = False)
+        label : str = f"{years_count} Year" if years_count == 1 else f"{years_count} Years"
+
+        tts_df : DataFrame = pd.DataFrame({label: [effort_str]})
 
         return tts_df
-    def create_tts_by_range_df(self, tt_df: DataFrame) -> DataFrame:
+    def __format_tts_by_spn(self, by_spn_hashtag : Series, software_project_names : list[str]) -> DataFrame:
 
         '''
-                11 Years
-            0   6485h 30m
+            Formats the provided aggregate as tts_by_spn_df.
+
+            Hashtags are joined in a single aggregation, ordered by effort (descending) and then by name. 
         '''
 
-        years : list[int] = self.__extract_years(tt_df = tt_df)
+        tts_df : DataFrame = by_spn_hashtag.reset_index(name = TTCN.EFFORT)
 
-        tts_df: DataFrame = tt_df.loc[tt_df[TTCN.YEAR].isin(years)].copy(deep = True)
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.unbox_effort(effort_str = x))
-        tts_df[TTCN.EFFORT] = pd.to_timedelta(tts_df[TTCN.EFFORT])
+        condition : Series = (tts_df[TTCN.SOFTWAREPROJECTNAME].isin(values = software_project_names))
+        tts_df = tts_df.loc[condition]
+        tts_df = tts_df.sort_values(by = [TTCN.SOFTWAREPROJECTNAME, TTCN.EFFORT, TTCN.HASHTAG], ascending = [True, False, True])
 
-        per_year : Series = tts_df.groupby(TTCN.YEAR, as_index = False)[TTCN.EFFORT].sum()
-        years_count : int = int(per_year[TTCN.YEAR].nunique())
-        effort_td : Timedelta = per_year[TTCN.EFFORT].sum()
-        effort_str : str = self.__df_helper.box_effort(effort_td = effort_td, add_plus_sign = False)
-        label : str = f"{years_count} Year" if years_count == 1 else f"{years_count} Years"
+        tts_df = tts_df.groupby(by = TTCN.SOFTWAREPROJECTNAME, sort = False).agg(**{
+            TTCN.EFFORT: NamedAgg(column = TTCN.EFFORT, aggfunc = "sum"),
+            TTCN.HASHTAGS: NamedAgg(column = TTCN.HASHTAG, aggfunc = lambda x : ", ".join(x.astype(str)))
+        }).reset_index()
+        tts_df = tts_df.sort_values(by = [TTCN.EFFORT, TTCN.SOFTWAREPROJECTNAME], ascending = [False, True]).reset_index(drop = True)
 
-        tts_df = pd.DataFrame({label: [effort_str]})
+        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.box_effort(effort_td = x, add_plus_sign = False)) 
 
         return tts_df
-    def create_tts_by_spn_df(self, tt_df : DataFrame, software_project_names : list[str]) -> DataFrame:
+    def __format_tts_by_spv(self, by_spn_spv : Series, software_project_names : list[str]) -> EffortTable:
 
-        '''
-                SoftwareProjectName     Effort      Hashtags
-            0   nwknowledgebase         337h 15m    #adoc, #python
-            1   nwtraderaanalytics      263h 15m    #python
-            ...
-        '''
+        '''Formats the provided aggregate as tts_by_spv_df.'''
 
-        years : list[int] = self.__extract_years(tt_df = tt_df)
+        tts_df : DataFrame = by_spn_spv.reset_index(name = TTCN.EFFORT)
 
-        tts_df : DataFrame = tt_df.copy(deep = True)
+        condition : Series = (tts_df[TTCN.SOFTWAREPROJECTNAME].isin(values = software_project_names))
+        tts_df = tts_df.loc[condition]
+        tts_df = tts_df.sort_values(by = [TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION]).reset_index(drop = True)
 
-        condition_one : Series = (tt_df[TTCN.YEAR].isin(values = years))
-        condition_two : Series = (tt_df[TTCN.ISSOFTWAREPROJECT] == True)
-        tts_df = tts_df.loc[condition_one & condition_two]
+        return self.__create_effort_table(df = tts_df)
+    def __format_tts_by_hashtag_year(self, by_year_hashtag : Series) -> EffortTable:
 
-        tts_df[TTCN.SOFTWAREPROJECTNAME] = tts_df[TTCN.DESCRIPTOR].apply(lambda x : self.__df_helper.extract_software_project_name(descriptor = x))
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.unbox_effort(effort_str = x))
-        tts_df = tts_df.groupby(by = [TTCN.SOFTWAREPROJECTNAME, TTCN.HASHTAG])[TTCN.EFFORT].sum().sort_values(ascending = [False]).reset_index(name = TTCN.EFFORT)
-        tts_df = tts_df.sort_values(by = [TTCN.SOFTWAREPROJECTNAME]).reset_index(drop = True)
+        '''Formats the provided aggregate as tts_by_hashtag_year_df.'''
 
-        condition_three : Series = (tts_df[TTCN.SOFTWAREPROJECTNAME].isin(values = software_project_names))
-        tts_df = tts_df.loc[condition_three] 
-        tts_df = tts_df.sort_values(by = [TTCN.EFFORT], ascending = [False]).reset_index(drop = True)
-          
-        tts_df = tts_df[[TTCN.SOFTWAREPROJECTNAME, TTCN.EFFORT, TTCN.HASHTAG]]
+        tts_df : DataFrame = by_year_hashtag.sort_values(ascending = [False]).reset_index(name = TTCN.EFFORT)
+        tts_df = tts_df.sort_values(by = [TTCN.HASHTAG, TTCN.YEAR]).reset_index(drop = True)
 
-        hashtags_df : DataFrame = (
-            tts_df
-                .sort_values(by = [TTCN.SOFTWAREPROJECTNAME, TTCN.EFFORT], ascending = [True, False])
-                .groupby(by = [TTCN.SOFTWAREPROJECTNAME])[TTCN.HASHTAG].agg(lambda s : ", ".join(dict.fromkeys(s.astype(str))))
-                .reset_index(name = TTCN.HASHTAGS))
+        tts_df = tts_df.pivot(index = TTCN.HASHTAG, columns = TTCN.YEAR, values = TTCN.EFFORT).rename_axis(None, axis=1).reset_index()
+        effort_table : EffortTable = self.__create_effort_table(df = tts_df)
 
-        effort_df : DataFrame = tts_df.groupby(by = [TTCN.SOFTWAREPROJECTNAME])[TTCN.EFFORT].sum().reset_index(name = TTCN.EFFORT)
-        tts_df = effort_df.merge(right = hashtags_df, on = TTCN.SOFTWAREPROJECTNAME, how = "left")
-        tts_df = tts_df.sort_values(by = [TTCN.EFFORT], ascending = [False]).reset_index(drop = True)
-        tts_df = tts_df[[TTCN.SOFTWAREPROJECTNAME, TTCN.EFFORT, TTCN.HASHTAGS]]
+        return EffortTable(df = effort_table.df.fillna(""), minutes_df = effort_table.minutes_df)
+    def __format_tts_by_hashtag(self, by_hashtag : Series) -> EffortTable:
 
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.box_effort(effort_td = x, add_plus_sign = False)) 
+        '''Formats the provided aggregate as tts_by_hashtag_df.'''
 
-        return tts_df
-    def create_tts_by_spv_df(self, tt_df : DataFrame, software_project_names : list[str]) -> DataFrame:
+        tts_df : DataFrame = by_hashtag.sort_values(ascending = [False]).reset_index(name = TTCN.EFFORT)
 
-        '''
-                ProjectName	                ProjectVersion	Effort
-            0	NW.MarkdownTables	        1.0.0	        15h 15m
-            1	NW.MarkdownTables	        1.0.1	        02h 30m
-            2	NW.NGramTextClassification	1.0.0	        74h 15m
-            ...    
-        '''
+        summarized : float = tts_df[TTCN.EFFORT].sum()
+        tts_df[TTCN.EFFORTPERC] = tts_df.apply(lambda x : self.__df_helper.calculate_percentage(part = x[TTCN.EFFORT], whole = summarized), axis = 1)
 
-        years : list[int] = self.__extract_years(tt_df = tt_df)
+        tts_df = tts_df.sort_values(by = TTCN.HASHTAG, ascending = True, kind = "stable").reset_index(drop = True)
 
-        tts_df : DataFrame = tt_df.copy(deep = True)
+        return self.__create_effort_table(df = tts_df)
+    def __format_tts_by_year_month_spnv(self, by_year_month_spnv : Series, software_project_names : list[str]) -> EffortTable:
 
-        condition_one : Series = (tt_df[TTCN.YEAR].isin(values = years))
-        condition_two : Series = (tt_df[TTCN.ISSOFTWAREPROJECT] == True)
-        tts_df = tts_df.loc[condition_one & condition_two]
+        '''Formats the provided aggregate as tts_by_year_month_spnv_df.'''
 
-        tts_df[TTCN.SOFTWAREPROJECTNAME] = tts_df[TTCN.DESCRIPTOR].apply(lambda x : self.__df_helper.extract_software_project_name(descriptor = x))
-        tts_df[TTCN.SOFTWAREPROJECTVERSION] = tts_df[TTCN.DESCRIPTOR].apply(lambda x : self.__df_helper.extract_software_project_version(descriptor = x))
+        tts_df : DataFrame = by_year_month_spnv.reset_index(name = TTCN.EFFORT)
+        tts_df = tts_df.sort_values(by = [TTCN.YEAR, TTCN.MONTH, TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION]).reset_index(drop = True)
+    
+        condition : Series = (tts_df[TTCN.SOFTWAREPROJECTNAME].isin(values = software_project_names))
+        tts_df = tts_df.loc[condition]        
 
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.unbox_effort(effort_str = x))
-        tts_df = tts_df.groupby(by = [TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION])[TTCN.EFFORT].sum().sort_values(ascending = [False]).reset_index(name = TTCN.EFFORT)
-        tts_df = tts_df.sort_values(by = [TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION]).reset_index(drop = True)
+        return self.__create_effort_table(df = tts_df)
+    def __format_tts_by_week(self, by_week : Series) -> DataFrame:
 
-        condition_three : Series = (tts_df[TTCN.SOFTWAREPROJECTNAME].isin(values = software_project_names))
-        tts_df = tts_df.loc[condition_three]
-        tts_df = tts_df.sort_values(by = [TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION]).reset_index(drop = True)
+        '''Formats the provided aggregate as tts_by_week_df.'''
 
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.box_effort(effort_td = x, add_plus_sign = False))   
+        iso_calendar : DataFrame = by_week.index.start_time.isocalendar()
 
-        return tts_df
-    def create_tts_by_hashtag_year_df(self, tt_df : DataFrame) -> DataFrame:
+        tts_df : DataFrame = DataFrame({
+            TTCN.YEAR: iso_calendar["year"].to_numpy(dtype = int64),
+            TTCN.WEEK: iso_calendar["week"].to_numpy(dtype = int64),
+            TTCN.EFFORT: self.__box_efforts(aggregate = by_week)
+        })
 
-        '''
-                Hashtag     2015    2016    2017    2018    2019    2020    2021    2022    2023    2024    2025
-            0   #adoc                                                                                       327h 45m
-            1   #bash                                                                                       20h 30m
-            ...
-        '''
+        return tts_df
+    def __format_tts_by_day(self, by_day : Series) -> DataFrame:
 
-        years : list[int] = self.__extract_years(tt_df = tt_df)            
+        '''Formats the provided aggregate as tts_by_day_df.'''
 
-        tts_df : DataFrame = tt_df.copy(deep = True)
+        tts_df : DataFrame = DataFrame({
+            TTCN.DATE: by_day.index.to_timestamp().date,
+            TTCN.EFFORT: self.__box_efforts(aggregate = by_day)
+        })
 
-        condition : Series = (tt_df[TTCN.YEAR].isin(values = years))
-        tts_df = tts_df.loc[condition]
+        return tts_df
+    def __format_tts_by_quarter(self, by_quarter : Series) -> DataFrame:
 
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.unbox_effort(effort_str = x))
-        tts_df = tts_df.groupby(by = [TTCN.YEAR, TTCN.HASHTAG])[TTCN.EFFORT].sum().sort_values(ascending = [False]).reset_index(name = TTCN.EFFORT)
-        tts_df = tts_df.sort_values(by = [TTCN.HASHTAG, TTCN.YEAR]).reset_index(drop = True)
+        '''Formats the provided aggregate as tts_by_quarter_df (the quarters outside of the reindexed range are left empty).'''
 
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.box_effort(effort_td = x, add_plus_sign = False))   
+        tts_df : DataFrame = DataFrame({
+            TTCN.YEAR: by_quarter.index.year.to_numpy(dtype = int64),
+            TTCN.QUARTER: [f"Q{quarter}" for quarter in by_quarter.index.quarter],
+            TTCN.EFFORT: self.__box_efforts(aggregate = by_quarter)
+        })
 
-        tts_df = tts_df.pivot(index = TTCN.HASHTAG, columns = TTCN.YEAR, values = TTCN.EFFORT).rename_axis(None, axis=1).reset_index()
+        quarters : list[str] = ["Q1", "Q2", "Q3", "Q4"]
+        tts_df = tts_df.pivot(index = TTCN.YEAR, columns = TTCN.QUARTER, values = TTCN.EFFORT)
+        tts_df = tts_df.reindex(columns = quarters).rename_axis(None, axis = 1).reset_index()
         tts_df = tts_df.fillna("")
 
         return tts_df
-    def create_tts_by_hashtag_df(self, tt_df : DataFrame) -> DataFrame:
+    def __format_tts_by_timeranges(self, by_time_range : Series, min_occurrences : int) -> DataFrame:
+
+        '''Formats the provided aggregate as tts_by_timeranges_df.'''
+
+        tts_df : DataFrame = by_time_range.reset_index(name = TTCN.OCCURRENCES)
+
+        unknown_id : str = "Unknown"
+        condition_one : Series = (tts_df[TTCN.TIMERANGE] != unknown_id)
+        tts_df = tts_df.loc[condition_one]	
+        tts_df.reset_index(drop = True, inplace = True)
 
+        ascending : bool = False
+        tts_df = tts_df.sort_values(by = [TTCN.OCCURRENCES], ascending = ascending).reset_index(drop = True)
+
+        timeranges : NamedAgg = pd.NamedAgg(column = TTCN.TIMERANGE, aggfunc = list)
+        tts_df = tts_df.groupby(by = [TTCN.OCCURRENCES], as_index = False).agg(TimeRanges = timeranges)
+        tts_df = tts_df.sort_values(by = [TTCN.OCCURRENCES], ascending = ascending).reset_index(drop = True)
+        tts_df = tts_df[[TTCN.OCCURRENCES, TTCN.TIMERANGES]]
+
+        occurrences_total : int = int(tts_df[TTCN.OCCURRENCES].sum())
+        tts_df[TTCN.OCCURRENCETOTAL] = occurrences_total
+        tts_df[TTCN.OCCURRENCEPERC] = tts_df.apply(
+            lambda x : self.__df_helper.calculate_percentage(float(x[TTCN.OCCURRENCES]), float(occurrences_total), 2), axis = 1)
+        tts_df = tts_df[[TTCN.OCCURRENCES, TTCN.OCCURRENCETOTAL, TTCN.OCCURRENCEPERC, TTCN.TIMERANGES]]
+
+        condition_two : Series = (tts_df[TTCN.OCCURRENCES] >= min_occurrences)
+        tts_df = tts_df.loc[condition_two]	
+        tts_df.reset_index(drop = True, inplace = True)
+
+        tts_df = tts_df[[TTCN.OCCURRENCES, TTCN.OCCURRENCEPERC, TTCN.TIMERANGES]]
+
+        return tts_df
+
+    def create_tt_df(
+        self, 
+        excel_path : str, 
+        excel_skiprows : int, 
+        excel_nrows : int, 
+        excel_tabname : str, 
+        years : Optional[list[int]] = None, 
+        compact : bool = False) -> DataFrame:
+        
         '''
-                Hashtag	        Effort  Effort%
-            0   #csharp	        67h 30m 56.49
-            1   #maintenance	51h 00m 23.97
-            2   #powershell	    04h 30m 6.43
-            ...    
+            Retrieves the content of the "Sessions" tab and returns it as a Dataframe.
+            
+            If compact is True, the dataframe is returned as create_compact_tt_df() does.
         '''
-    
-        tts_df : DataFrame = tt_df.copy(deep = True)
 
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.unbox_effort(effort_str = x))
-        tts_df = tts_df.groupby(by = [TTCN.HASHTAG])[TTCN.EFFORT].sum().sort_values(ascending = [False]).reset_index(name = TTCN.EFFORT)
+        tt_df : DataFrame = pd.read_excel(
+            io = excel_path, 	
+            skiprows = excel_skiprows,
+            nrows = excel_nrows,
+            sheet_name = excel_tabname, 
+            engine = 'openpyxl'
+            )      
+        tt_df = self.__enforce_dataframe_definition_for_tt_df(tt_df = tt_df)
 
-        summarized : float = tts_df[TTCN.EFFORT].sum()
-        tts_df[TTCN.EFFORTPERC] = tts_df.apply(lambda x : self.__df_helper.calculate_percentage(part = x[TTCN.EFFORT], whole = summarized), axis = 1)
+        if years is not None:
+            if len(years) > 0:
+                tt_df = self.__filter_by_year(df = tt_df, years = years)
 
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.box_effort(effort_td = x, add_plus_sign = False))
-        tts_df = tts_df.sort_values(by = TTCN.HASHTAG, ascending = True, kind = "stable").reset_index(drop = True)
+        if compact:
+            tt_df = self.create_compact_tt_df(tt_df = tt_df)
 
-        return tts_df
-    def create_tts_by_year_month_spnv_df(self, tt_df : DataFrame, software_project_names : list[str]) -> DataFrame:
+        return tt_df
+    def create_tt_df_chunks(
+        self, 
+        excel_path : str, 
+        excel_skiprows : int, 
+        excel_nrows : int, 
+        excel_tabname : str, 
+        chunk_size : int,
+        years : Optional[list[int]] = None, 
+        compact : bool = False) -> Iterator[DataFrame]:
 
         '''
-                Year    Month   SoftwareProjectName     SoftwareProjectVersion  Effort
-            0   2025    1       nwknowledgebase         1.0.0                   01h 30m
-            1   2025    4       nwknowledgebase         1.0.0                   24h 15m
-            ...
+            Same as create_tt_df(), but the "Sessions" tab is streamed and returned chunk_size rows at a time, so that it never 
+            needs to fit in memory as a whole. Cells are parsed by the same TextParser pd.read_excel() uses.
+            
+            As with pd.read_excel(), the rows whose cells are all empty (i.e. formatted but blank trailing rows) are skipped.
+            Each chunk keeps the index the rows would have in tt_df, and at least one (maybe empty) chunk is always returned.
         '''
 
-        years : list[int] = self.__extract_years(tt_df = tt_df) 
+        workbook : Any = load_workbook(filename = excel_path, read_only = True, data_only = True)
+
+        try:
+            rows : Iterator[tuple] = workbook[excel_tabname].iter_rows(min_row = excel_skiprows + 1, values_only = True)
+            column_names : list = list(next(rows, ()))
+            rows = (row for row in itertools.islice(rows, excel_nrows) if any(x is not None for x in row))
+            start : int = 0
 
-        tts_df : DataFrame = tt_df.copy(deep = True)
+            while True:
+                chunk : list[list] = [ ["" if x is None else x for x in row] for row in itertools.islice(rows, chunk_size) ]
 
-        condition_one : Series = (tt_df[TTCN.YEAR].isin(values = years))
-        condition_two : Series = (tt_df[TTCN.ISSOFTWAREPROJECT] == True)
-        tts_df = tts_df.loc[condition_one & condition_two]
+                if len(chunk) == 0 and start > 0:
+                    break
 
-        tts_df[TTCN.SOFTWAREPROJECTNAME] = tts_df[TTCN.DESCRIPTOR].apply(lambda x : self.__df_helper.extract_software_project_name(descriptor = x))
-        tts_df[TTCN.SOFTWAREPROJECTVERSION] = tts_df[TTCN.DESCRIPTOR].apply(lambda x : self.__df_helper.extract_software_project_version(descriptor = x))
+                chunk_df : DataFrame = TextParser([column_names] + chunk, header = 0).read()
+                chunk_df.index = pd.RangeIndex(start = start, stop = start + len(chunk))
+                start += len(chunk)
 
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.unbox_effort(effort_str = x))
-        tts_df = tts_df.groupby(by = [TTCN.YEAR, TTCN.MONTH, TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION])[TTCN.EFFORT].sum().sort_values(ascending = [False]).reset_index(name = TTCN.EFFORT)
-        tts_df = tts_df.sort_values(by = [TTCN.YEAR, TTCN.MONTH, TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION]).reset_index(drop = True)
-    
-        condition_three : Series = (tts_df[TTCN.SOFTWAREPROJECTNAME].isin(values = software_project_names))
-        tts_df = tts_df.loc[condition_three]        
+                yield self.__enforce_dataframe_definition_for_tt_chunk_df(chunk_df = chunk_df, years = years, compact = compact)
 
-        tts_df[TTCN.EFFORT] = tts_df[TTCN.EFFORT].apply(lambda x : self.__df_helper.box_effort(effort_td = x, add_plus_sign = False))
+                if len(chunk) < chunk_size:
+                    break
+        finally:
+            workbook.close()
+    def create_tt_df_chunks_from_parquet(
+        self, 
+        parquet_path : str, 
+        chunk_size : int, 
+        years : Optional[list[int]] = None, 
+        compact : bool = False) -> Iterator[DataFrame]:
 
-        return tts_df
-    def create_tts_by_timeranges_df(self, tt_df : DataFrame, min_occurrences : int) -> DataFrame:
+        '''Same as create_tt_df_chunks(), but out of a Parquet file with the same columns as the "Sessions" tab.'''
 
-            '''
-                    Occurrences Occurrence%     TimeRanges
-                0   71          22.33           [08:00-08:45]
-                1   37          11.64           [08:00-08:30]
-                ...
-            '''
+        parquet_file : ParquetFile = ParquetFile(source = parquet_path)
+        start : int = 0
+
+        for batch in parquet_file.iter_batches(batch_size = chunk_size, columns = self.__get_tt_df_column_names()):
+            chunk_df : DataFrame = batch.to_pandas()
+            chunk_df.index = pd.RangeIndex(start = start, stop = start + len(chunk_df))
+            start += len(chunk_df)
 
-            tts_df : DataFrame = tt_df.copy(deep = True)
-            tts_df = tts_df[[TTCN.STARTTIME, TTCN.ENDTIME]]
+            yield self.__enforce_dataframe_definition_for_tt_chunk_df(chunk_df = chunk_df, years = years, compact = compact)
 
-            tts_df[TTCN.TIMERANGE] = tts_df.apply(
-                lambda x : self.__df_helper.create_time_range_id(
-                    start_time = x[TTCN.STARTTIME], 
-                    end_time = x[TTCN.ENDTIME]), axis = 1)
+        if start == 0:
+            empty_df : DataFrame = parquet_file.schema_arrow.empty_table().to_pandas()
 
-            count : NamedAgg = pd.NamedAgg(column = TTCN.TIMERANGE, aggfunc = "count")
-            tts_df = tts_df[[TTCN.TIMERANGE]].groupby(by = [TTCN.TIMERANGE], as_index = False).agg(count = count)
-            tts_df.rename(columns={"count" : TTCN.OCCURRENCES}, inplace = True)
+            yield self.__enforce_dataframe_definition_for_tt_chunk_df(chunk_df = empty_df, years = years, compact = compact)
+    def filter_tt_df(self, tt_df : DataFrame, years : Optional[list[int]]) -> DataFrame:
 
-            unknown_id : str = "Unknown"
-            condition_one : Series = (tts_df[TTCN.TIMERANGE] != unknown_id)
-            tts_df = tts_df.loc[condition_one]	
-            tts_df.reset_index(drop = True, inplace = True)
+        '''Returns the rows of tt_df that belong to years, the same way create_tt_df() does (all of them if years is None or empty).'''
 
-            ascending : bool = False
-            tts_df = tts_df.sort_values(by = [TTCN.OCCURRENCES], ascending = ascending).reset_index(drop = True)
+        if years is not None:
+            if len(years) > 0:
+                return self.__filter_by_year(df = tt_df, years = years)
 
-            timeranges : NamedAgg = pd.NamedAgg(column = TTCN.TIMERANGE, aggfunc = list)
-            tts_df = tts_df.groupby(by = [TTCN.OCCURRENCES], as_index = False).agg(TimeRanges = timeranges)
-            tts_df = tts_df.sort_values(by = [TTCN.OCCURRENCES], ascending = ascending).reset_index(drop = True)
-            tts_df = tts_df[[TTCN.OCCURRENCES, TTCN.TIMERANGES]]
+        return tt_df
+    def create_compact_tt_df(self, tt_df : DataFrame) -> DataFrame:
 
-            occurrences_total : int = int(tts_df[TTCN.OCCURRENCES].sum())
-            tts_df[TTCN.OCCURRENCETOTAL] = occurrences_total
-            tts_df[TTCN.OCCURRENCEPERC] = tts_df.apply(
-                lambda x : self.__df_helper.calculate_percentage(float(x[TTCN.OCCURRENCES]), float(occurrences_total), 2), axis = 1)
-            tts_df = tts_df[[TTCN.OCCURRENCES, TTCN.OCCURRENCETOTAL, TTCN.OCCURRENCEPERC, TTCN.TIMERANGES]]
+        '''
+            Returns a copy of tt_df with a smaller memory footprint:
 
-            condition_two : Series = (tts_df[TTCN.OCCURRENCES] >= min_occurrences)
-            tts_df = tts_df.loc[condition_two]	
-            tts_df.reset_index(drop = True, inplace = True)
+                - Date:                             datetime64[ns]
+                - StartTime, EndTime, Effort:       string[pyarrow]
+                - Hashtag, Descriptor:              category
+                - Year, Month:                      int16, int8
 
-            tts_df = tts_df[[TTCN.OCCURRENCES, TTCN.OCCURRENCEPERC, TTCN.TIMERANGES]]
+            All the create_tts_* methods return the same dataframes out of it.
+        '''
 
-            return tts_df
-    def create_ttd_effort_status_df(self, tt_df : DataFrame, is_correct : bool) -> DataFrame:
+        compact_df : DataFrame = tt_df.copy(deep = True)
+
+        compact_df[TTCN.DATE] = pd.to_datetime(compact_df[TTCN.DATE])
+        compact_df = compact_df.astype({
+            TTCN.STARTTIME: "string[pyarrow]",
+            TTCN.ENDTIME: "string[pyarrow]",
+            TTCN.EFFORT: "string[pyarrow]",
+            TTCN.HASHTAG: "category",
+            TTCN.DESCRIPTOR: "category",
+            TTCN.YEAR: "int16",
+            TTCN.MONTH: "int8"
+        })
+
+        return compact_df
+    def create_tt_memory_usage_df(self, tt_df : DataFrame, compact_tt_df : DataFrame) -> DataFrame:
 
         '''
-            StartTime	EndTime	Effort	IsCorrect	Expected    Message
-            21:00       23:00   1h 00m  False       2h 00m      ...
+                Column          MemoryBefore    MemoryAfter
+            0   Index           132             132
+            1   Date            81720           14528
             ...
+            11  Total           ...             ...
         '''
 
-        ttd_df : DataFrame = tt_df.copy(deep = True)
-        
-        ttd_df[TTCN.EFFORTSTATUS] = ttd_df.apply(
-            lambda x : self.__df_helper.create_effort_status_and_cast_to_any(
-                    idx = x.name, 
-                    start_time_str = x[TTCN.STARTTIME],
-                    end_time_str = x[TTCN.ENDTIME],
-                    effort_str = x[TTCN.EFFORT]),
-            axis = 1)
-        
-        ttd_df[TTCN.ISCORRECT] = ttd_df[TTCN.EFFORTSTATUS].apply(lambda x : x.is_correct)
-        ttd_df[TTCN.EXPECTED] = ttd_df[TTCN.EFFORTSTATUS].apply(lambda x : x.expected_str)
-        ttd_df[TTCN.MESSAGE] = ttd_df[TTCN.EFFORTSTATUS].apply(lambda x : x.message)
-        ttd_df = ttd_df[[TTCN.STARTTIME, TTCN.ENDTIME, TTCN.EFFORT, TTCN.ISCORRECT, TTCN.EXPECTED, TTCN.MESSAGE]]
+        before : Series = tt_df.memory_usage(index = True, deep = True)
+        after : Series = compact_tt_df.memory_usage(index = True, deep = True)
 
-        condition : Series = (ttd_df[TTCN.ISCORRECT] == is_correct)
-        ttd_df = ttd_df.loc[condition]
+        memory_df : DataFrame = DataFrame({
+            TTCN.COLUMN: before.index.tolist() + ["Total"],
+            TTCN.MEMORYBEFORE: before.tolist() + [int(before.sum())],
+            TTCN.MEMORYAFTER: after.reindex(before.index).tolist() + [int(after.sum())]
+        })
 
-        return ttd_df    
-    def create_definitions_df(self) -> DataFrame:
+        return memory_df
+    def create_tt_delta_df(self, tt_df : DataFrame, new_tt_df : DataFrame, years : Optional[list[int]] = None) -> DataFrame:
 
-        '''Creates a dataframe containing all the definitions in use in this application.'''
+        '''
+            Returns the rows of new_tt_df that belong to years (all of them if years is None or empty), 
+            re-indexed so that they follow the last row of tt_df - as if they were read together with it from the Excel file.
+        '''
 
-        columns : list[str] = [DEFINITIONSTR.TERM, DEFINITIONSTR.DEFINITION]
+        tt_delta_df : DataFrame = new_tt_df.copy(deep = True)
 
-        definitions : dict[str, str] = {
-            DEFINITIONSTR.TIMETRACKING: "Time Tracking is the process of keeping track of all self-growth sessions.",
-            TTCN.TIMERANGE: "A time range is defined by a start time, an end time, and an effort expressed in hours and minutes.",
-            TTCN.HASHTAG: "A hashtag is a category label that summarizes the content of a self-growth session.",
-            TTCN.DESCRIPTOR: "A descriptor contains additional information about the self-growth session - e.g. the software project name and version.",
-            f"Trend ({TTCN.TREND})": "A trend is a gamification metric that indicates whether a measure (e.g., total work hours) has increased or decreased over time."
-        }
-        
-        definitions_df : DataFrame = DataFrame(
-            data = definitions.items(), 
-            columns = columns
-        )
+        if years is not None:
+            if len(years) > 0:
+                tt_delta_df = self.__filter_by_year(df = tt_delta_df, years = years)
+
+        start : int = int(tt_df.index.max()) + 1 if len(tt_df) > 0 else 0
+        tt_delta_df.index = pd.RangeIndex(start = start, stop = start + len(tt_delta_df), step = 1)
+
+        return tt_delta_df
+    def append_tt_delta_df(self, tt_df : DataFrame, tt_delta_df : DataFrame) -> DataFrame:
+
+        '''Appends the rows returned by create_tt_delta_df() to tt_df.'''
+
+        return pd.concat(objs = [tt_df, tt_delta_df])
+    def create_tt_latest_four_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''Returns latest four rows of tt_df'''
+
+        tt_latest_four_df : DataFrame = tt_df.copy(deep = True)
+        tt_latest_four_df = tt_latest_four_df.tail(4)
+
+        return tt_latest_four_df
+    def create_tts_by_month_df(self, tt_df : DataFrame, now : datetime) -> DataFrame:
+
+        '''
+                2016	↕   2017	    ↕	2018    ...
+            0	0h 00m	↑	13h 00m		↓	0h 00m
+            1	0h 00m	↑	1h 00m	    ↓	0h 00m
+            ...            
+        '''
+
+        return self.create_tts_by_month_table(tt_df = tt_df, now = now).df
+    def create_tts_by_month_table(self, tt_df : DataFrame, now : datetime) -> EffortTable:
+
+        '''Same as create_tts_by_month_df(), but together with its numeric shadow.'''
+
+        by_year_month : Series = self.__sum_effort_by(tt_df = tt_df, by = [TTCN.YEAR, TTCN.MONTH])
+
+        return self.__format_tts_by_month(by_year_month = by_year_month, now = now)
+    def create_tts_by_year_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''
+                2015    ↕   2016        ↕   2017        ↕   2018        ↕   2019        ↕   ...
+            0  18h 00m  ↑   615h 15m    ↑   762h 45m    ↑   829h 45m    ↓   515h 15m    ↓   ...
+        '''
+
+        return self.create_tts_by_year_table(tt_df = tt_df).df
+    def create_tts_by_year_table(self, tt_df : DataFrame) -> EffortTable:
+
+        '''Same as create_tts_by_year_df(), but together with its numeric shadow.'''
+
+        by_year : Series = self.__sum_effort_by(tt_df = tt_df, by = [TTCN.YEAR])
+
+        return self.__format_tts_by_year(by_year = by_year)
+    def create_tts_by_range_df(self, tt_df: DataFrame) -> DataFrame:
+
+        '''
+                11 Years
+            0   6485h 30m
+        '''
+
+        by_year : Series = self.__sum_effort_by(tt_df = tt_df, by = [TTCN.YEAR])
+
+        return self.__format_tts_by_range(by_year = by_year)
+    def create_tts_by_spn_df(self, tt_df : DataFrame, software_project_names : list[str]) -> DataFrame:
+
+        '''
+                SoftwareProjectName     Effort      Hashtags
+            0   nwknowledgebase         337h 15m    #adoc, #python
+            1   nwtraderaanalytics      263h 15m    #python
+            ...
+        '''
+
+        sp_frame : SoftwareProjectFrame = self.create_software_project_frame(tt_df = tt_df)
+
+        return self.create_tts_by_spn_df_from_frame(sp_frame = sp_frame, software_project_names = software_project_names)
+    def create_tts_by_spv_df(self, tt_df : DataFrame, software_project_names : list[str]) -> DataFrame:
+
+        '''
+                ProjectName	                ProjectVersion	Effort
+            0	NW.MarkdownTables	        1.0.0	        15h 15m
+            1	NW.MarkdownTables	        1.0.1	        02h 30m
+            2	NW.NGramTextClassification	1.0.0	        74h 15m
+            ...    
+        '''
+
+        sp_frame : SoftwareProjectFrame = self.create_software_project_frame(tt_df = tt_df)
+
+        return self.create_tts_by_spv_df_from_frame(sp_frame = sp_frame, software_project_names = software_project_names)
+    def create_tts_by_hashtag_year_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''
+                Hashtag     2015    2016    2017    2018    2019    2020    2021    2022    2023    2024    2025
+            0   #adoc                                                                                       327h 45m
+            1   #bash                                                                                       20h 30m
+            ...
+        '''
+
+        return self.create_tts_by_hashtag_year_table(tt_df = tt_df).df
+    def create_tts_by_hashtag_year_table(self, tt_df : DataFrame) -> EffortTable:
+
+        '''Same as create_tts_by_hashtag_year_df(), but together with its numeric shadow.'''
+
+        by_year_hashtag : Series = self.__sum_effort_by(tt_df = tt_df, by = [TTCN.YEAR, TTCN.HASHTAG])
+
+        return self.__format_tts_by_hashtag_year(by_year_hashtag = by_year_hashtag)
+    def create_tts_by_hashtag_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''
+                Hashtag	        Effort  Effort%
+            0   #csharp	        67h 30m 56.49
+            1   #maintenance	51h 00m 23.97
+            2   #powershell	    04h 30m 6.43
+            ...    
+        '''
+    
+        return self.create_tts_by_hashtag_table(tt_df = tt_df).df
+    def create_tts_by_hashtag_table(self, tt_df : DataFrame) -> EffortTable:
+
+        '''Same as create_tts_by_hashtag_df(), but together with its numeric shadow.'''
+
+        by_hashtag : Series = self.__sum_effort_by(tt_df = tt_df, by = [TTCN.HASHTAG])
+
+        return self.__format_tts_by_hashtag(by_hashtag = by_hashtag)
+    def create_tts_by_year_month_spnv_df(self, tt_df : DataFrame, software_project_names : list[str]) -> DataFrame:
+
+        '''
+                Year    Month   SoftwareProjectName     SoftwareProjectVersion  Effort
+            0   2025    1       nwknowledgebase         1.0.0                   01h 30m
+            1   2025    4       nwknowledgebase         1.0.0                   24h 15m
+            ...
+        '''
+
+        sp_frame : SoftwareProjectFrame = self.create_software_project_frame(tt_df = tt_df)
+
+        return self.create_tts_by_year_month_spnv_df_from_frame(sp_frame = sp_frame, software_project_names = software_project_names)
+    def create_tts_by_timeranges_df(self, tt_df : DataFrame, min_occurrences : int) -> DataFrame:
+
+        '''
+                Occurrences Occurrence%     TimeRanges
+            0   71          22.33           [08:00-08:45]
+            1   37          11.64           [08:00-08:30]
+            ...
+        '''
+
+        by_time_range : Series = self.__count_time_ranges(tt_df = tt_df)
+
+        return self.__format_tts_by_timeranges(by_time_range = by_time_range, min_occurrences = min_occurrences)
+    def create_tts_by_week_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''
+            Sums up the effort by ISO week, from the first to the last week in tt_df (weeks without sessions are included).
+
+                Year    Week    Effort
+            0   2024    7       12h 45m
+            1   2024    8       18h 45m
+            ...
+        '''
+
+        unboxed_df : DataFrame = self.__unbox_efforts(df = tt_df)
+        by_week : Series = self.__sum_effort_by_period(unboxed_df = unboxed_df, freq = "W-SUN")
+
+        return self.__format_tts_by_week(by_week = by_week)
+    def create_tts_by_day_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''
+            Sums up the effort by day, from the first to the last day in tt_df (days without sessions are included).
+
+                Date        Effort
+            0   2024-02-12  01h 00m
+            1   2024-02-13  04h 15m
+            ...
+            4   2024-02-16  00h 00m
+            ...
+        '''
+
+        unboxed_df : DataFrame = self.__unbox_efforts(df = tt_df)
+        by_day : Series = self.__sum_effort_by_period(unboxed_df = unboxed_df, freq = "D")
+
+        return self.__format_tts_by_day(by_day = by_day)
+    def create_tts_by_quarter_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''
+            Sums up the effort by quarter, from the first to the last quarter in tt_df (quarters without sessions are included).
+
+                Year    Q1          Q2          Q3          Q4
+            0   2015                                        18h 00m
+            1   2016    84h 15m     148h 15m    162h 00m    220h 45m
+            ...
+        '''
+
+        unboxed_df : DataFrame = self.__unbox_efforts(df = tt_df)
+        by_quarter : Series = self.__sum_effort_by_period(unboxed_df = unboxed_df, freq = "Q-DEC")
+
+        return self.__format_tts_by_quarter(by_quarter = by_quarter)
+    def create_tts_timerange_matrix_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''
+            Counts the sessions by StartTime (rows) and EndTime (columns), both expressed as quarter-hour time slots.
+            Sessions without time range are ignored.
+
+            EndTime     00:00   00:15   ...     08:30   08:45   ...
+            StartTime
+            00:00       0       0       ...     0       0       ...
+            ...
+            08:00       0       0       ...     37      71      ...
+            ...
+        '''
+
+        condition : Series = (tt_df[TTCN.STARTTIME].str.len() > 0) & (tt_df[TTCN.ENDTIME].str.len() > 0)
+        tr_df : DataFrame = tt_df.loc[condition]
+
+        start_slots : np.ndarray = self.__convert_to_time_slots(times = tr_df[TTCN.STARTTIME])
+        end_slots : np.ndarray = self.__convert_to_time_slots(times = tr_df[TTCN.ENDTIME])
+        counts : np.ndarray = np.bincount(start_slots * 96 + end_slots, minlength = 96 * 96).reshape(96, 96)
+
+        return self.__create_timerange_matrix_df(counts = counts)
+    def create_ttd_effort_status_df(self, tt_df : DataFrame, is_correct : bool) -> DataFrame:
+
+        '''
+            StartTime	EndTime	Effort	IsCorrect	Expected    Message
+            21:00       23:00   1h 00m  False       2h 00m      ...
+            ...
+        '''
+
+        ttd_df : DataFrame = tt_df.copy(deep = True)
+        
+        ttd_df[TTCN.EFFORTSTATUS] = ttd_df.apply(
+            lambda x : self.__df_helper.create_effort_status_and_cast_to_any(
+                    idx = x.name, 
+                    start_time_str = x[TTCN.STARTTIME],
+                    end_time_str = x[TTCN.ENDTIME],
+                    effort_str = x[TTCN.EFFORT]),
+            axis = 1)
+        
+        ttd_df[TTCN.ISCORRECT] = ttd_df[TTCN.EFFORTSTATUS].apply(lambda x : x.is_correct)
+        ttd_df[TTCN.EXPECTED] = ttd_df[TTCN.EFFORTSTATUS].apply(lambda x : x.expected_str)
+        ttd_df[TTCN.MESSAGE] = ttd_df[TTCN.EFFORTSTATUS].apply(lambda x : x.message)
+        ttd_df = ttd_df[[TTCN.STARTTIME, TTCN.ENDTIME, TTCN.EFFORT, TTCN.ISCORRECT, TTCN.EXPECTED, TTCN.MESSAGE]]
+
+        condition : Series = (ttd_df[TTCN.ISCORRECT] == is_correct)
+        ttd_df = ttd_df.loc[condition]
+
+        return ttd_df    
+    def create_definitions_df(self) -> DataFrame:
+
+        '''Creates a dataframe containing all the definitions in use in this application.'''
+
+        columns : list[str] = [DEFINITIONSTR.TERM, DEFINITIONSTR.DEFINITION]
+
+        definitions : dict[str, str] = {
+            DEFINITIONSTR.TIMETRACKING: "Time Tracking is the process of keeping track of all self-growth sessions.",
+            TTCN.TIMERANGE: "A time range is defined by a start time, an end time, and an effort expressed in hours and minutes.",
+            TTCN.HASHTAG: "A hashtag is a category label that summarizes the content of a self-growth session.",
+            TTCN.DESCRIPTOR: "A descriptor contains additional information about the self-growth session - e.g. the software project name and version.",
+            f"Trend ({TTCN.TREND})": "A trend is a gamification metric that indicates whether a measure (e.g., total work hours) has increased or decreased over time."
+        }
+        
+        definitions_df : DataFrame = DataFrame(
+            data = definitions.items(), 
+            columns = columns
+        )
+
+        return definitions_df
+    def create_query_df(self, tt_df : DataFrame, query : TTQuery) -> DataFrame:
+
+        '''
+            Runs query against tt_df and returns one row per group, for ex. TTQuery(group_by = [TTCN.HASHTAG], order_by = [(TTCN.EFFORT, False)], top_n = 2):
+
+                Hashtag         Effort
+            0   #studying       0 days 23:15:00
+            1   #csharp         0 days 06:15:00
+        '''
+
+        query_df : DataFrame = self.__run_query(tt_df = tt_df, query = query).reset_index()
+
+        return query_df
+    def explain_query(self, query : TTQuery) -> str:
+
+        '''Returns the plan create_query_df() would run for query, one step per line.'''
+
+        plan : TTQueryPlan = self.__query_planner.create_plan(query = query)
+
+        return self.__query_planner.explain(plan = plan)
+    def create_tt_partials(self, tt_df : DataFrame) -> TTPartials:
+
+        '''
+            Creates the numeric aggregates all the tts_* tables can be derived from:
+
+                - by_year_month:        (Year, Month) => Effort
+                - by_year_hashtag:      (Year, Hashtag) => Effort
+                - by_software_project:  (Year, Month, SoftwareProjectName, SoftwareProjectVersion, Hashtag) => Effort
+                - by_time_range:        (TimeRange) => Occurrences
+        '''
+
+        tt_partials : TTPartials = TTPartials(
+            by_year_month = self.__sum_effort_by(tt_df = tt_df, by = [TTCN.YEAR, TTCN.MONTH]),
+            by_year_hashtag = self.__sum_effort_by(tt_df = tt_df, by = [TTCN.YEAR, TTCN.HASHTAG]),
+            by_software_project = self.__sum_effort_by(
+                tt_df = tt_df, 
+                by = [TTCN.YEAR, TTCN.MONTH, TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION, TTCN.HASHTAG]),
+            by_time_range = self.__count_time_ranges(tt_df = tt_df)
+        )
+
+        return tt_partials
+    def create_tt_hash(self, tt_df : DataFrame) -> str:
+
+        '''Returns a SHA-256 hash of the rows in tt_df, which changes as soon as any row is added, removed or edited.'''
+
+        row_hashes : Series = pd.util.hash_pandas_object(tt_df, index = False)
+
+        return hashlib.sha256(row_hashes.to_numpy().tobytes()).hexdigest()
+    def create_tt_partitions(self, tt_df : DataFrame, partition_type : PARTITIONTYPE, partition_count : int) -> list[DataFrame]:
+
+        '''
+            Splits tt_df into partitions whose TTPartials can be created independently and merged afterwards:
+
+                - year: one partition per year;
+                - rows: partition_count row ranges of (almost) the same size.
+
+            Empty partitions are left out, but one partition is always returned.
+        '''
+
+        if partition_type == PARTITIONTYPE.year:
+            partitions : list[DataFrame] = [ year_df for _, year_df in tt_df.groupby(by = TTCN.YEAR, sort = True) ]
+        else:
+            bounds : np.ndarray = np.linspace(start = 0, stop = len(tt_df), num = max(partition_count, 1) + 1).astype(int)
+            partitions = [ tt_df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start ]
+
+        return partitions if len(partitions) > 0 else [tt_df]
+    def merge_tt_partials(self, tt_partials : list[TTPartials]) -> TTPartials:
+
+        '''Merges the provided TTPartials objects into one, as if they were created out of a single tt_df.'''
+
+        merged : TTPartials = TTPartials(
+            by_year_month = self.__merge_aggregates(aggregates = [x.by_year_month for x in tt_partials]),
+            by_year_hashtag = self.__merge_aggregates(aggregates = [x.by_year_hashtag for x in tt_partials]),
+            by_software_project = self.__merge_aggregates(aggregates = [x.by_software_project for x in tt_partials]),
+            by_time_range = self.__merge_aggregates(aggregates = [x.by_time_range for x in tt_partials])
+        )
+
+        return merged
+    def create_software_project_frame(self, tt_df : DataFrame) -> SoftwareProjectFrame:
+
+        '''Filters the software project sessions of tt_df, parses their descriptors and sums their efforts, once for all the tables that need them.'''
+
+        by_software_project : Series = self.__sum_effort_by(
+            tt_df = tt_df, 
+            by = [TTCN.YEAR, TTCN.MONTH, TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION, TTCN.HASHTAG])
+
+        return SoftwareProjectFrame(by_software_project = by_software_project)
+    def create_software_project_frame_from_partials(self, tt_partials : TTPartials) -> SoftwareProjectFrame:
+
+        '''Same as create_software_project_frame(), but out of tt_partials.'''
+
+        return SoftwareProjectFrame(by_software_project = tt_partials.by_software_project)
+    def create_tts_by_spn_df_from_frame(self, sp_frame : SoftwareProjectFrame, software_project_names : list[str]) -> DataFrame:
+
+        '''Same as create_tts_by_spn_df(), but out of sp_frame.'''
+
+        by_spn_hashtag : Series = sp_frame.by_software_project.groupby(level = [TTCN.SOFTWAREPROJECTNAME, TTCN.HASHTAG]).sum()
+
+        return self.__format_tts_by_spn(by_spn_hashtag = by_spn_hashtag, software_project_names = software_project_names)
+    def create_tts_by_spv_df_from_frame(self, sp_frame : SoftwareProjectFrame, software_project_names : list[str]) -> DataFrame:
+
+        '''Same as create_tts_by_spv_df(), but out of sp_frame.'''
+
+        return self.create_tts_by_spv_table_from_frame(sp_frame = sp_frame, software_project_names = software_project_names).df
+    def create_tts_by_spv_table_from_frame(self, sp_frame : SoftwareProjectFrame, software_project_names : list[str]) -> EffortTable:
+
+        '''Same as create_tts_by_spv_df_from_frame(), but together with its numeric shadow.'''
+
+        by_spn_spv : Series = sp_frame.by_software_project.groupby(level = [TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION]).sum()
+
+        return self.__format_tts_by_spv(by_spn_spv = by_spn_spv, software_project_names = software_project_names)
+    def create_tts_by_year_month_spnv_df_from_frame(self, sp_frame : SoftwareProjectFrame, software_project_names : list[str]) -> DataFrame:
+
+        '''Same as create_tts_by_year_month_spnv_df(), but out of sp_frame.'''
+
+        return self.create_tts_by_year_month_spnv_table_from_frame(sp_frame = sp_frame, software_project_names = software_project_names).df
+    def create_tts_by_year_month_spnv_table_from_frame(self, sp_frame : SoftwareProjectFrame, software_project_names : list[str]) -> EffortTable:
+
+        '''Same as create_tts_by_year_month_spnv_df_from_frame(), but together with its numeric shadow.'''
+
+        by_year_month_spnv : Series = (
+            sp_frame.by_software_project
+                .groupby(level = [TTCN.YEAR, TTCN.MONTH, TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION])
+                .sum())
+
+        return self.__format_tts_by_year_month_spnv(by_year_month_spnv = by_year_month_spnv, software_project_names = software_project_names)
+    def create_tts_by_month_df_from_partials(self, tt_partials : TTPartials, now : datetime) -> DataFrame:
+
+        '''Same as create_tts_by_month_df(), but out of tt_partials.'''
+
+        return self.create_tts_by_month_table_from_partials(tt_partials = tt_partials, now = now).df
+    def create_tts_by_month_table_from_partials(self, tt_partials : TTPartials, now : datetime) -> EffortTable:
+
+        '''Same as create_tts_by_month_table(), but out of tt_partials.'''
+
+        return self.__format_tts_by_month(by_year_month = tt_partials.by_year_month, now = now)
+    def create_tts_by_year_df_from_partials(self, tt_partials : TTPartials) -> DataFrame:
+
+        '''Same as create_tts_by_year_df(), but out of tt_partials.'''
+
+        return self.create_tts_by_year_table_from_partials(tt_partials = tt_partials).df
+    def create_tts_by_year_table_from_partials(self, tt_partials : TTPartials) -> EffortTable:
+
+        '''Same as create_tts_by_year_table(), but out of tt_partials.'''
+
+        by_year : Series = tt_partials.by_year_month.groupby(level = TTCN.YEAR).sum()
+
+        return self.__format_tts_by_year(by_year = by_year)
+    def create_tts_by_range_df_from_partials(self, tt_partials : TTPartials) -> DataFrame:
+
+        '''Same as create_tts_by_range_df(), but out of tt_partials.'''
+
+        by_year : Series = tt_partials.by_year_month.groupby(level = TTCN.YEAR).sum()
+
+        return self.__format_tts_by_range(by_year = by_year)
+    def create_tts_by_spn_df_from_partials(self, tt_partials : TTPartials, software_project_names : list[str]) -> DataFrame:
+
+        '''Same as create_tts_by_spn_df(), but out of tt_partials.'''
+
+        sp_frame : SoftwareProjectFrame = self.create_software_project_frame_from_partials(tt_partials = tt_partials)
+
+        return self.create_tts_by_spn_df_from_frame(sp_frame = sp_frame, software_project_names = software_project_names)
+    def create_tts_by_spv_df_from_partials(self, tt_partials : TTPartials, software_project_names : list[str]) -> DataFrame:
+
+        '''Same as create_tts_by_spv_df(), but out of tt_partials.'''
+
+        sp_frame : SoftwareProjectFrame = self.create_software_project_frame_from_partials(tt_partials = tt_partials)
+
+        return self.create_tts_by_spv_df_from_frame(sp_frame = sp_frame, software_project_names = software_project_names)
+    def create_tts_by_hashtag_year_df_from_partials(self, tt_partials : TTPartials) -> DataFrame:
+
+        '''Same as create_tts_by_hashtag_year_df(), but out of tt_partials.'''
+
+        return self.create_tts_by_hashtag_year_table_from_partials(tt_partials = tt_partials).df
+    def create_tts_by_hashtag_year_table_from_partials(self, tt_partials : TTPartials) -> EffortTable:
+
+        '''Same as create_tts_by_hashtag_year_table(), but out of tt_partials.'''
+
+        return self.__format_tts_by_hashtag_year(by_year_hashtag = tt_partials.by_year_hashtag)
+    def create_tts_by_hashtag_df_from_partials(self, tt_partials : TTPartials) -> DataFrame:
+
+        '''Same as create_tts_by_hashtag_df(), but out of tt_partials.'''
+
+        return self.create_tts_by_hashtag_table_from_partials(tt_partials = tt_partials).df
+    def create_tts_by_hashtag_table_from_partials(self, tt_partials : TTPartials) -> EffortTable:
+
+        '''Same as create_tts_by_hashtag_table(), but out of tt_partials.'''
+
+        by_hashtag : Series = tt_partials.by_year_hashtag.groupby(level = TTCN.HASHTAG).sum()
+
+        return self.__format_tts_by_hashtag(by_hashtag = by_hashtag)
+    def create_tts_by_year_month_spnv_df_from_partials(self, tt_partials : TTPartials, software_project_names : list[str]) -> DataFrame:
+
+        '''Same as create_tts_by_year_month_spnv_df(), but out of tt_partials.'''
+
+        sp_frame : SoftwareProjectFrame = self.create_software_project_frame_from_partials(tt_partials = tt_partials)
+
+        return self.create_tts_by_year_month_spnv_df_from_frame(sp_frame = sp_frame, software_project_names = software_project_names)
+    def create_tts_by_timeranges_df_from_partials(self, tt_partials : TTPartials, min_occurrences : int) -> DataFrame:
+
+        '''Same as create_tts_by_timeranges_df(), but out of tt_partials.'''
+
+        return self.__format_tts_by_timeranges(by_time_range = tt_partials.by_time_range, min_occurrences = min_occurrences)
+    def create_tts_timerange_matrix_df_from_partials(self, tt_partials : TTPartials) -> DataFrame:
+
+        '''Same as create_tts_timerange_matrix_df(), but out of tt_partials.'''
+
+        by_time_range : Series = tt_partials.by_time_range.drop(labels = ["Unknown"], errors = "ignore")
+        time_ranges : Series = by_time_range.index.to_series()
+
+        start_slots : np.ndarray = self.__convert_to_time_slots(times = time_ranges.str.slice(0, 5))
+        end_slots : np.ndarray = self.__convert_to_time_slots(times = time_ranges.str.slice(6, 11))
+        counts : np.ndarray = np.zeros(shape = (96, 96), dtype = int64)
+        np.add.at(counts, (start_slots, end_slots), by_time_range.to_numpy())
+
+        return self.__create_timerange_matrix_df(counts = counts)
+class EffortHighlighter():
+
+    '''Encapsulates all the logic related to highlighting cells in dataframes containing efforts.'''
+
+    __df_helper : TTDataFrameHelper
+
+    def __init__(self, df_helper : TTDataFrameHelper) -> None:
+
+        self.__df_helper = df_helper
+
+    def __get_effort_pattern(self) -> str:
+
+        '''Returns the pattern of the efforts (i.e. "00h 00m", "101h 30m", "+71h 00m", "-455h 45m"), with sign, hours and minutes as groups.'''
+
+        return r"^([+-]?)(\d{2,})h (0[0-9]|[1-5][0-9])m$"
+    def __extract_n(self, mode : EFFORTMODE, n : int = 3) -> int:
+
+        '''Extracts n from mode (the provided n for the top_n_efforts* modes).'''
+
+        if mode == EFFORTMODE.top_one_effort_per_row:
+            return 1
+        elif mode == EFFORTMODE.top_three_efforts:
+            return 3
+        elif mode in [EFFORTMODE.top_n_efforts, EFFORTMODE.top_n_efforts_per_row, EFFORTMODE.top_n_efforts_per_column]:
+            return n
+        else:
+            raise Exception(_MessageCollection.provided_mode_not_supported(mode))
+    def __create_minutes_matrix(self, cells : np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+
+        '''
+            Parses all the cells at once:
+
+                "10h 30m"   "↑"     "-20h 45m"          630     0   -1245       True    False   True
+                "15h 45m"   "↑"     "20h 00m"     =>    945     0   1200    ,   True    False   True
+
+            Returns the efforts in minutes and the mask of the cells that contain an effort (see __get_effort_pattern()).
+        '''
+
+        flat : Series = Series(cells.ravel(), dtype = object).astype(str)
+        mask : np.ndarray = flat.str.fullmatch(pat = self.__get_effort_pattern()).to_numpy(dtype = bool)
+        minutes : np.ndarray = np.zeros(shape = len(flat), dtype = int64)
+
+        if mask.any():
+            parts : DataFrame = flat[mask].str.extract(pat = self.__get_effort_pattern())
+            signs : np.ndarray = np.where(parts[0].to_numpy() == "-", -1, 1)
+            minutes[mask] = signs * (parts[1].astype(int64).to_numpy() * 60 + parts[2].astype(int64).to_numpy())
+
+        return (minutes.reshape(cells.shape), mask.reshape(cells.shape))
+    def __read_minutes_matrix(self, minutes_df : DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+
+        '''Same as __create_minutes_matrix(), but out of a numeric shadow (see EffortTable), therefore without any parsing.'''
+
+        values : np.ndarray = minutes_df.to_numpy(dtype = float)
+        mask : np.ndarray = ~np.isnan(values)
+        minutes : np.ndarray = np.where(mask, values, 0).astype(int64)
+
+        return (minutes, mask)
+    def __select_top_n(self, minutes : np.ndarray, mask : np.ndarray, n : int) -> np.ndarray:
+
+        '''
+            Returns the flat (row-major) positions of the n highest efforts among the masked cells, from the highest.
+
+            Ties keep their row-major order, as a stable sort on the whole matrix would do, but only the candidates 
+            selected by np.argpartition() are sorted.
+        '''
+
+        if n < 1:
+            return np.empty(shape = 0, dtype = int64)
+
+        positions : np.ndarray = np.flatnonzero(mask)
+        values : np.ndarray = minutes.ravel()[positions]
+
+        if len(values) > n:
+            threshold : int64 = values[np.argpartition(-values, n - 1)[:n]].min()
+            keep : np.ndarray = values > threshold
+            ties : np.ndarray = np.flatnonzero(values == threshold)[:(n - int(keep.sum()))]
+            keep[ties] = True
+            positions, values = positions[keep], values[keep]
+
+        return positions[np.lexsort((positions, -values))]
+    def __select_top_n_per_row(self, minutes : np.ndarray, mask : np.ndarray, n : int) -> np.ndarray:
+
+        '''Same as __select_top_n(), but for each row (from the first one).'''
+
+        width : int = minutes.shape[1]
+
+        if width == 0:
+            return np.empty(shape = 0, dtype = int64)
+
+        keys : np.ndarray = np.where(mask, -minutes, np.iinfo(int64).max)
+        top_n : np.ndarray = np.argsort(keys, axis = 1, kind = "stable")[:, :n]
+        positions : np.ndarray = (np.arange(len(minutes))[:, None] * width + top_n).ravel()
+
+        return positions[mask.ravel()[positions]]
+    def __select_top_n_per_column(self, minutes : np.ndarray, mask : np.ndarray, n : int) -> np.ndarray:
+
+        '''Same as __select_top_n(), but for each column (from the first one).'''
+
+        height, width = minutes.shape
+
+        if height == 0:
+            return np.empty(shape = 0, dtype = int64)
+
+        keys : np.ndarray = np.where(mask, -minutes, np.iinfo(int64).max)
+        top_n : np.ndarray = np.argsort(keys, axis = 0, kind = "stable")[:n, :]
+        positions : np.ndarray = (top_n * width + np.arange(width)[None, :]).ravel(order = "F")
+
+        return positions[mask.ravel()[positions]]
+    def __select_top_percentile(self, minutes : np.ndarray, mask : np.ndarray, percentile : float) -> np.ndarray:
+
+        '''Returns the flat (row-major) positions of the masked efforts at or above percentile, from the highest (ties keep their row-major order).'''
+
+        positions : np.ndarray = np.flatnonzero(mask)
+        values : np.ndarray = minutes.ravel()[positions]
+
+        if len(values) == 0:
+            return positions
+
+        threshold : float = np.percentile(values, percentile)
+        keep : np.ndarray = values >= threshold
+        positions, values = positions[keep], values[keep]
+
+        return positions[np.lexsort((positions, -values))]
+    def __calculate_heat_intensities(self, minutes : np.ndarray, mask : np.ndarray, buckets : int) -> Tuple[np.ndarray, np.ndarray]:
+
+        '''
+            Splits the masked efforts in quantile buckets and returns their flat (row-major) positions together with their 
+            intensities, from 1 / buckets (lowest bucket) to 1.0 (highest bucket). Equal efforts always fall in the same bucket.
+        '''
+
+        positions : np.ndarray = np.flatnonzero(mask)
+        values : np.ndarray = minutes.ravel()[positions]
+
+        if len(values) == 0:
+            return (positions, np.empty(shape = 0, dtype = float))
+
+        edges : np.ndarray = np.quantile(values, np.linspace(0, 1, buckets + 1)[1:-1])
+        levels : np.ndarray = np.searchsorted(edges, values, side = "right") + 1
+
+        return (positions, levels / buckets)
+    def __locate_efforts(
+        self, 
+        df : DataFrame, 
+        mode : EFFORTMODE, 
+        column_names : list[str], 
+        minutes_df : Optional[DataFrame] = None, 
+        effort_rule : Optional[EffortRule] = None) -> Tuple[list[int], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+
+        '''
+            Selects the efforts to highlight according to df and mode, and returns:
+
+                - col_indices:  the positions in df of the columns in column_names;
+                - cells:        the contents of those columns;
+                - minutes:      the efforts in those columns, in minutes;
+                - positions:    the flat (row-major) positions in cells of the selected efforts, in ranking order;
+                - intensities:  the intensity of each of them (always 1.0, but for EFFORTMODE.heat_scale).
+
+            Column names are compared as strings. Duplicated column names (i.e. "↕") never contain efforts, therefore they are skipped.
+            If minutes_df is provided, the efforts are ranked on it instead of being parsed out of df.
+            The n, percentile and buckets of the newer modes are read from effort_rule (the EffortRule defaults, if not provided).
+        '''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule(mode = mode)
+        columns : pd.Index = df.columns.map(str)
+        col_locs : list = [columns.get_loc(column_name) for column_name in column_names if column_name in columns]
+        col_indices : list[int] = [col_loc for col_loc in col_locs if isinstance(col_loc, int)]
+
+        cells : np.ndarray = df.iloc[:, col_indices].to_numpy(dtype = object)
+
+        if minutes_df is None:
+            minutes, mask = self.__create_minutes_matrix(cells = cells)
+        else:
+            minutes, mask = self.__read_minutes_matrix(minutes_df = minutes_df.iloc[:, col_indices])
+
+        positions : np.ndarray
+        intensities : Optional[np.ndarray] = None
+        if mode in [EFFORTMODE.top_one_effort_per_row, EFFORTMODE.top_n_efforts_per_row]:
+            positions = self.__select_top_n_per_row(minutes = minutes, mask = mask, n = self.__extract_n(mode = mode, n = effort_rule.n))
+        elif mode == EFFORTMODE.top_n_efforts_per_column:
+            positions = self.__select_top_n_per_column(minutes = minutes, mask = mask, n = self.__extract_n(mode = mode, n = effort_rule.n))
+        elif mode == EFFORTMODE.top_percentile_efforts:
+            positions = self.__select_top_percentile(minutes = minutes, mask = mask, percentile = effort_rule.percentile)
+        elif mode == EFFORTMODE.heat_scale:
+            positions, intensities = self.__calculate_heat_intensities(minutes = minutes, mask = mask, buckets = effort_rule.buckets)
+        else:
+            positions = self.__select_top_n(minutes = minutes, mask = mask, n = self.__extract_n(mode = mode, n = effort_rule.n))
+
+        if intensities is None:
+            intensities = np.ones(shape = len(positions), dtype = float)
+
+        return (col_indices, cells, minutes, positions, intensities)
+    def __create_intensity_matrix(
+        self, 
+        df : DataFrame, 
+        mode : EFFORTMODE, 
+        column_names : list[str], 
+        minutes_df : Optional[DataFrame] = None, 
+        effort_rule : Optional[EffortRule] = None) -> np.ndarray:
+
+        '''
+            Returns a matrix with the same shape of df, which contains the intensity of the efforts selected by __locate_efforts() 
+            and 0.0 elsewhere.
+        '''
+
+        col_indices, _, _, positions, intensities = self.__locate_efforts(
+            df = df, 
+            mode = mode, 
+            column_names = column_names, 
+            minutes_df = minutes_df, 
+            effort_rule = effort_rule
+        )
+
+        matrix : np.ndarray = np.zeros(shape = df.shape, dtype = float)
+
+        if len(positions) > 0:
+            rows, idx = np.divmod(positions, len(col_indices))
+            matrix[rows, np.asarray(col_indices)[idx]] = intensities
+
+        return matrix
+    def __create_background_color(self, intensity : float) -> str:
+
+        '''1.0 => "pink", 0.5 => "rgba(255, 192, 203, 0.50)".'''
+
+        if intensity >= 1.0:
+            return "pink"
+
+        return f"rgba(255, 192, 203, {intensity:.2f})"
+    def __add_tags(self, df : DataFrame, mask : np.ndarray, tags : Tuple[str, str]) -> DataFrame:
+
+        '''
+            Adds two HTML tags around the content of the cells with a positive intensity in mask (same shape as df), 
+            with one masked assignment per column and intensity.
+            
+            The left tag is a template, which receives the background color of each intensity as "color".
+        '''
+
+        tagged_df : DataFrame = df.copy(deep = True)
+
+        right_h : str = tags[1]
+
+        for intensity in np.unique(mask[mask > 0]).tolist():
+
+            left_h : str = tags[0].format(color = self.__create_background_color(intensity = intensity))
+
+            for col in np.flatnonzero((mask == intensity).any(axis = 0)).tolist():
+
+                rows : np.ndarray = np.flatnonzero(mask[:, col] == intensity)
+                tagged_df.iloc[rows, col] = (left_h + df.iloc[rows, col].astype(str) + right_h).to_numpy(dtype = object)
+            
+        return tagged_df
+    def __highlight_dataframe(
+        self, 
+        df : DataFrame, 
+        mode : EFFORTMODE, 
+        column_names : list[str] = [], 
+        minutes_df : Optional[DataFrame] = None, 
+        effort_rule : Optional[EffortRule] = None) -> DataFrame:
+
+        '''
+            Expects a df containing efforts into cells - i.e. "45h 45m", "77h 45m".
+            Returns a df with highlighted cells as per arguments.
+
+            Note: column names are converted to string to aid column search when the dataframe has mixed type column names.
+        '''
+
+        highlighted_df : DataFrame = df.copy(deep = True)
+        highlighted_df.columns = highlighted_df.columns.map(str)
+
+        if len(column_names) == 0:
+            column_names = highlighted_df.columns.to_list()
+
+        mask : np.ndarray = self.__create_intensity_matrix(
+            df = highlighted_df, 
+            mode = mode,
+            column_names = column_names,
+            minutes_df = minutes_df,
+            effort_rule = effort_rule
+        )
+
+        tags : Tuple[str, str] = ("<mark style='background-color: {color}'>", "</mark>")
+        highlighted_df = self.__add_tags(df = highlighted_df, mask = mask, tags = tags)
+
+        return highlighted_df
+    def __mask_dataframe(
+        self, 
+        df : DataFrame, 
+        mode : EFFORTMODE, 
+        column_names : list[str] = [], 
+        minutes_df : Optional[DataFrame] = None, 
+        effort_rule : Optional[EffortRule] = None) -> DataFrame:
+
+        '''
+            Same as __highlight_dataframe(), but df is left untouched (no copy is made) and a boolean dataframe with the same 
+            index and columns of df is returned instead, which is True for the cells to highlight.
+
+            With EFFORTMODE.heat_scale the dataframe contains the intensity of each cell instead (0.0 if not highlighted).
+        '''
+
+        if len(column_names) == 0:
+            column_names = df.columns.map(str).to_list()
+
+        mask : np.ndarray = self.__create_intensity_matrix(
+            df = df, 
+            mode = mode,
+            column_names = column_names,
+            minutes_df = minutes_df,
+            effort_rule = effort_rule
+        )
+
+        if mode != EFFORTMODE.heat_scale:
+            mask = mask > 0
+
+        return DataFrame(data = mask, index = df.index, columns = df.columns)
+    def __get_latest_year(self, tts_by_hashtag_year_df : DataFrame) -> str:
+
+        '''
+            [ "Hashtag", "2015", "2016", "2017", "2018", "2019", "2020", "2021", "2022", "2023", "2024", "2025"]
+                -> "2025"
+        '''
+
+        latest_year : str = str(max(int(column_name) for column_name in tts_by_hashtag_year_df.columns if str(column_name).isdigit()))
+        
+        return latest_year
+
+    def highlight_tts_by_month(self, tts_by_month_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+        
+        '''Returns the provided dataframe with adequate highlights as per effort_rule (ranked on minutes_df, if provided).'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        highlighted_df : DataFrame = self.__highlight_dataframe(
+            df = tts_by_month_df,
+            mode = effort_rule.mode,
+            minutes_df = minutes_df,
+            effort_rule = effort_rule
+        )
+        
+        return highlighted_df
+    def highlight_tts_by_year(self, tts_by_year_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+        
+        '''Returns the provided dataframe with adequate highlights as per effort_rule (ranked on minutes_df, if provided).'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        highlighted_df : DataFrame = self.__highlight_dataframe(
+            df = tts_by_year_df,
+            mode = effort_rule.mode,
+            minutes_df = minutes_df,
+            effort_rule = effort_rule
+        )
+        
+        return highlighted_df
+    def highlight_tts_by_spv(self, tts_by_spv_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+    
+        '''Returns the provided dataframe with adequate highlights as per effort_rule (ranked on minutes_df, if provided).'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        highlighted_df : DataFrame = self.__highlight_dataframe(
+            df = tts_by_spv_df,
+            mode = effort_rule.mode,
+            minutes_df = minutes_df,
+            effort_rule = effort_rule
+        )
+        
+        return highlighted_df
+    def highlight_tts_by_hashtag_year(self, tts_by_hashtag_year_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+        
+        '''Returns the provided dataframe with adequate highlights as per effort_rule (ranked on minutes_df, if provided).'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+        latest_year : str = self.__get_latest_year(tts_by_hashtag_year_df)
+
+        highlighted_df : DataFrame = self.__highlight_dataframe(
+            df = tts_by_hashtag_year_df,
+            mode = effort_rule.mode,
+            column_names = [latest_year],
+            minutes_df = minutes_df,
+            effort_rule = effort_rule
+        )
+        
+        return highlighted_df
+    def highlight_tts_by_hashtag(self, tts_by_hashtag_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+        
+        '''Returns the provided dataframe with adequate highlights as per effort_rule (ranked on minutes_df, if provided).'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        highlighted_df : DataFrame = self.__highlight_dataframe(
+            df = tts_by_hashtag_df,
+            mode = effort_rule.mode,
+            minutes_df = minutes_df,
+            effort_rule = effort_rule
+        )
+        
+        return highlighted_df
+    def highlight_tts_by_year_month_spnv(self, tts_by_year_month_spnv_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+        
+        '''Returns the provided dataframe with adequate highlights as per effort_rule (ranked on minutes_df, if provided).'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        highlighted_df : DataFrame = self.__highlight_dataframe(
+            df = tts_by_year_month_spnv_df,
+            mode = effort_rule.mode,
+            minutes_df = minutes_df,
+            effort_rule = effort_rule
+        )
+        
+        return highlighted_df
+    def mask_tts_by_month(self, tts_by_month_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+
+        '''Returns the same highlights of highlight_tts_by_month() as a mask, without touching the provided dataframe.'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        return self.__mask_dataframe(df = tts_by_month_df, mode = effort_rule.mode, minutes_df = minutes_df, effort_rule = effort_rule)
+    def mask_tts_by_year(self, tts_by_year_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+
+        '''Returns the same highlights of highlight_tts_by_year() as a mask, without touching the provided dataframe.'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        return self.__mask_dataframe(df = tts_by_year_df, mode = effort_rule.mode, minutes_df = minutes_df, effort_rule = effort_rule)
+    def mask_tts_by_spv(self, tts_by_spv_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+
+        '''Returns the same highlights of highlight_tts_by_spv() as a mask, without touching the provided dataframe.'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        return self.__mask_dataframe(df = tts_by_spv_df, mode = effort_rule.mode, minutes_df = minutes_df, effort_rule = effort_rule)
+    def mask_tts_by_hashtag_year(self, tts_by_hashtag_year_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+
+        '''Returns the same highlights of highlight_tts_by_hashtag_year() as a mask, without touching the provided dataframe.'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+        latest_year : str = self.__get_latest_year(tts_by_hashtag_year_df)
+
+        return self.__mask_dataframe(df = tts_by_hashtag_year_df, mode = effort_rule.mode, column_names = [latest_year], minutes_df = minutes_df, effort_rule = effort_rule)
+    def mask_tts_by_hashtag(self, tts_by_hashtag_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+
+        '''Returns the same highlights of highlight_tts_by_hashtag() as a mask, without touching the provided dataframe.'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        return self.__mask_dataframe(df = tts_by_hashtag_df, mode = effort_rule.mode, minutes_df = minutes_df, effort_rule = effort_rule)
+    def mask_tts_by_year_month_spnv(self, tts_by_year_month_spnv_df : DataFrame, minutes_df : Optional[DataFrame] = None, effort_rule : Optional[EffortRule] = None) -> DataFrame:
+
+        '''Returns the same highlights of highlight_tts_by_year_month_spnv() as a mask, without touching the provided dataframe.'''
+
+        effort_rule = effort_rule if effort_rule is not None else EffortRule()
+
+        return self.__mask_dataframe(df = tts_by_year_month_spnv_df, mode = effort_rule.mode, minutes_df = minutes_df, effort_rule = effort_rule)
+class TTPartialsCache():
+
+    '''
+        Persists the TTPartials of the closed years, keyed by a hash of their rows.
+
+        The key is stored as JSON and each aggregate as Parquet, so loading a cache folder never runs code (as pickle would).
+        The aggregates are read only if the stored key matches.
+    '''
+
+    def __create_key_path(self, folder_path : str, year : int) -> Path:
+
+        '''Example: /home/nwtimetracking/cache/TTPARTIALS2024.json'''
+
+        return Path(folder_path) / f"TTPARTIALS{year}.json"
+    def __create_partial_path(self, folder_path : str, year : int, name : str) -> Path:
+
+        '''Example: /home/nwtimetracking/cache/TTPARTIALS2024.by_year_month.parquet'''
+
+        return Path(folder_path) / f"TTPARTIALS{year}.{name}.parquet"
+    def __load_key(self, key_path : Path) -> Optional[str]:
+
+        '''Returns the key stored in key_path, or None if the file is missing or malformed.'''
+
+        if not key_path.exists():
+            return None
+
+        try:
+            return json.loads(key_path.read_text(encoding = "utf-8")).get("key")
+        except (ValueError, AttributeError):
+            return None
+
+    def load(self, folder_path : str, year : int, key : str) -> Optional[TTPartials]:
+
+        '''Returns the TTPartials object stored for year, or None if there is none or if it has been stored with a different key.'''
+
+        if self.__load_key(key_path = self.__create_key_path(folder_path = folder_path, year = year)) != key:
+            return None
+
+        file_paths : dict[str, Path] = {
+            f.name: self.__create_partial_path(folder_path = folder_path, year = year, name = f.name) for f in fields(TTPartials)
+        }
+
+        if not all(file_path.exists() for file_path in file_paths.values()):
+            return None
+
+        return TTPartials(**{ name: pd.read_parquet(path = file_path).iloc[:, 0] for name, file_path in file_paths.items() })
+    def save(self, folder_path : str, year : int, key : str, tt_partials : TTPartials) -> None:
+
+        '''Stores tt_partials for year, together with key (which is written last, so that a partially written year is never loaded).'''
+
+        key_path : Path = self.__create_key_path(folder_path = folder_path, year = year)
+        key_path.parent.mkdir(parents = True, exist_ok = True)
+        key_path.unlink(missing_ok = True)
+
+        for f in fields(TTPartials):
+            file_path : Path = self.__create_partial_path(folder_path = folder_path, year = year, name = f.name)
+            getattr(tt_partials, f.name).to_frame().to_parquet(path = file_path)
+
+        key_path.write_text(data = json.dumps({ "key": key }), encoding = "utf-8")
+class TTSQLiteBackend():
+
+    '''
+        Loads tt_df into a stdlib sqlite3 database (in-memory by default) and creates the TTPartials aggregates with SQL, 
+        so that TTDataFrameFactory can turn them into the same tts_* tables as the pandas path.
+
+        The "Sessions" table has the same columns as tt_df (Effort in seconds) plus the parsed SoftwareProjectName and 
+        SoftwareProjectVersion, and it's indexed on Date, (Year, Month), Hashtag and SoftwareProjectName.
+    '''
+
+    __df_helper : TTDataFrameHelper
+
+    def __init__(self, df_helper : TTDataFrameHelper) -> None:
+
+        self.__df_helper = df_helper
+
+    def __create_sessions_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''
+            Returns a copy of tt_df ready to be inserted into the "Sessions" table:
+
+                Date        StartTime   EndTime Effort  Hashtag     ... SoftwareProjectName     SoftwareProjectVersion
+            0   2024-02-12  21:00       22:00   3600    #maintenance    ... None                    None
+            1   2024-02-13  11:00       13:00   7200    #csharp         ... NW.Shared.Serialization 1.0.0
+            ...
+
+            Descriptors repeat a lot, therefore each of them is parsed only once.
+        '''
+
+        sessions_df : DataFrame = DataFrame({
+            TTCN.DATE: pd.to_datetime(tt_df[TTCN.DATE]).dt.strftime("%Y-%m-%d"),
+            TTCN.STARTTIME: tt_df[TTCN.STARTTIME].astype(str),
+            TTCN.ENDTIME: tt_df[TTCN.ENDTIME].astype(str),
+            TTCN.EFFORT: pd.to_timedelta(tt_df[TTCN.EFFORT].astype(str)).dt.total_seconds().astype(int64),
+            TTCN.HASHTAG: tt_df[TTCN.HASHTAG].astype(str),
+            TTCN.DESCRIPTOR: tt_df[TTCN.DESCRIPTOR].astype(str),
+            TTCN.ISSOFTWAREPROJECT: tt_df[TTCN.ISSOFTWAREPROJECT].astype(bool),
+            TTCN.ISRELEASEDAY: tt_df[TTCN.ISRELEASEDAY].astype(bool),
+            TTCN.YEAR: tt_df[TTCN.YEAR].astype(int64),
+            TTCN.MONTH: tt_df[TTCN.MONTH].astype(int64)
+        })
+
+        descriptors : Series = sessions_df.loc[sessions_df[TTCN.ISSOFTWAREPROJECT], TTCN.DESCRIPTOR]
+        unique_descriptors : list[str] = descriptors.unique().tolist()
+        names : dict[str, str] = { x: self.__df_helper.extract_software_project_name(descriptor = x) for x in unique_descriptors }
+        versions : dict[str, str] = { x: self.__df_helper.extract_software_project_version(descriptor = x) for x in unique_descriptors }
+
+        sessions_df[TTCN.SOFTWAREPROJECTNAME] = descriptors.map(names)
+        sessions_df[TTCN.SOFTWAREPROJECTVERSION] = descriptors.map(versions)
+
+        return sessions_df
+    def __read_effort_aggregate(self, connection : sqlite3.Connection, sql : str, by : list[str]) -> Series:
+
+        '''Runs sql (which returns the by columns and the summed TTCN.EFFORT in seconds) and returns it the way TTDataFrameFactory aggregates do.'''
+
+        aggregate_df : DataFrame = pd.read_sql_query(sql = sql, con = connection)
+        aggregate_df = aggregate_df.astype({ x: int64 for x in [TTCN.YEAR, TTCN.MONTH] if x in by })
+        aggregate_df[TTCN.EFFORT] = pd.to_timedelta(aggregate_df[TTCN.EFFORT].astype(int64), unit = "s")
+
+        aggregate : Series = aggregate_df.set_index(keys = by)[TTCN.EFFORT]
+
+        return aggregate
+    def __read_time_range_aggregate(self, connection : sqlite3.Connection) -> Series:
+
+        '''Counts the sessions by time range (start and end times floored to the quarter hour), plus the "Unknown" ones.'''
+
+        sql : str = f"""
+            SELECT 
+                printf('%02d:%02d-%02d:%02d', StartSlot / 4, (StartSlot % 4) * 15, EndSlot / 4, (EndSlot % 4) * 15) AS "{TTCN.TIMERANGE}",
+                COUNT(*) AS "{TTCN.OCCURRENCES}"
+            FROM (
+                SELECT
+                    CAST(substr("{TTCN.STARTTIME}", 1, 2) AS INTEGER) * 4 + CAST(substr("{TTCN.STARTTIME}", 4, 2) AS INTEGER) / 15 AS StartSlot,
+                    CAST(substr("{TTCN.ENDTIME}", 1, 2) AS INTEGER) * 4 + CAST(substr("{TTCN.ENDTIME}", 4, 2) AS INTEGER) / 15 AS EndSlot
+                FROM Sessions
+                WHERE length("{TTCN.STARTTIME}") > 0 AND length("{TTCN.ENDTIME}") > 0
+            )
+            GROUP BY StartSlot, EndSlot
+            ORDER BY StartSlot, EndSlot
+        """
+
+        aggregate_df : DataFrame = pd.read_sql_query(sql = sql, con = connection)
+        by_time_range : Series = aggregate_df.set_index(keys = TTCN.TIMERANGE)[TTCN.OCCURRENCES].astype(int64)
+
+        total : int = int(connection.execute("SELECT COUNT(*) FROM Sessions").fetchone()[0])
+        unknown_occurrences : int = total - int(by_time_range.sum())
+
+        if unknown_occurrences > 0:
+            by_time_range.loc["Unknown"] = unknown_occurrences
+
+        return by_time_range
+
+    def load(self, tt_df : DataFrame, database_path : str = ":memory:") -> sqlite3.Connection:
+
+        '''Creates (or replaces) the "Sessions" table in database_path, fills it with tt_df, indexes it and returns the open connection.'''
+
+        connection : sqlite3.Connection = sqlite3.connect(database = database_path)
+
+        connection.executescript(f"""
+            DROP TABLE IF EXISTS Sessions;
+            CREATE TABLE Sessions (
+                "{TTCN.DATE}" TEXT NOT NULL,
+                "{TTCN.STARTTIME}" TEXT NOT NULL,
+                "{TTCN.ENDTIME}" TEXT NOT NULL,
+                "{TTCN.EFFORT}" INTEGER NOT NULL,
+                "{TTCN.HASHTAG}" TEXT NOT NULL,
+                "{TTCN.DESCRIPTOR}" TEXT NOT NULL,
+                "{TTCN.ISSOFTWAREPROJECT}" INTEGER NOT NULL,
+                "{TTCN.ISRELEASEDAY}" INTEGER NOT NULL,
+                "{TTCN.YEAR}" INTEGER NOT NULL,
+                "{TTCN.MONTH}" INTEGER NOT NULL,
+                "{TTCN.SOFTWAREPROJECTNAME}" TEXT,
+                "{TTCN.SOFTWAREPROJECTVERSION}" TEXT
+            );
+        """)
+
+        sessions_df : DataFrame = self.__create_sessions_df(tt_df = tt_df)
+        sessions_df.to_sql(name = "Sessions", con = connection, if_exists = "append", index = False, chunksize = 100000)
+
+        connection.executescript(f"""
+            CREATE INDEX IX_Sessions_Date ON Sessions ("{TTCN.DATE}");
+            CREATE INDEX IX_Sessions_YearMonth ON Sessions ("{TTCN.YEAR}", "{TTCN.MONTH}");
+            CREATE INDEX IX_Sessions_Hashtag ON Sessions ("{TTCN.HASHTAG}");
+            CREATE INDEX IX_Sessions_SoftwareProjectName ON Sessions ("{TTCN.SOFTWAREPROJECTNAME}");
+            ANALYZE;
+        """)
+        connection.commit()
+
+        return connection
+    def read_sql(self, connection : sqlite3.Connection, sql : str) -> DataFrame:
+
+        '''Runs any SELECT statement against the "Sessions" table and returns its outcome.'''
+
+        return pd.read_sql_query(sql = sql, con = connection)
+    def create_tt_partials(self, connection : sqlite3.Connection) -> TTPartials:
+
+        '''Same as TTDataFrameFactory.create_tt_partials(), but with SQL against the "Sessions" table.'''
+
+        sp_by : list[str] = [TTCN.YEAR, TTCN.MONTH, TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION, TTCN.HASHTAG]
+        sp_columns : str = ", ".join(f'"{x}"' for x in sp_by)
+
+        tt_partials : TTPartials = TTPartials(
+            by_year_month = self.__read_effort_aggregate(
+                connection = connection,
+                sql = f'SELECT "{TTCN.YEAR}", "{TTCN.MONTH}", SUM("{TTCN.EFFORT}") AS "{TTCN.EFFORT}" FROM Sessions GROUP BY 1, 2 ORDER BY 1, 2',
+                by = [TTCN.YEAR, TTCN.MONTH]
+            ),
+            by_year_hashtag = self.__read_effort_aggregate(
+                connection = connection,
+                sql = f'SELECT "{TTCN.YEAR}", "{TTCN.HASHTAG}", SUM("{TTCN.EFFORT}") AS "{TTCN.EFFORT}" FROM Sessions GROUP BY 1, 2 ORDER BY 1, 2',
+                by = [TTCN.YEAR, TTCN.HASHTAG]
+            ),
+            by_software_project = self.__read_effort_aggregate(
+                connection = connection,
+                sql = (
+                    f'SELECT {sp_columns}, SUM("{TTCN.EFFORT}") AS "{TTCN.EFFORT}" FROM Sessions '
+                    f'WHERE "{TTCN.ISSOFTWAREPROJECT}" = 1 GROUP BY 1, 2, 3, 4, 5 ORDER BY 1, 2, 3, 4, 5'
+                ),
+                by = sp_by
+            ),
+            by_time_range = self.__read_time_range_aggregate(connection = connection)
+        )
+
+        return tt_partials
+class TTAdapter():
+
+    '''Adapts SettingBag properties for use in TT*Factory methods.'''
+
+    __df_factory : TTDataFrameFactory
+    __effort_highlighter : EffortHighlighter
+    __tt_partials_cache : TTPartialsCache
+    __sqlite_backend : TTSQLiteBackend
+
+    def __init__(
+        self, 
+        df_factory : TTDataFrameFactory, 
+        effort_highlighter : EffortHighlighter,
+        tt_partials_cache : Optional[TTPartialsCache] = None,
+        sqlite_backend : Optional[TTSQLiteBackend] = None) -> None:
+        
+        self.__df_factory = df_factory
+        self.__effort_highlighter = effort_highlighter
+        self.__tt_partials_cache = tt_partials_cache if tt_partials_cache is not None else TTPartialsCache()
+        self.__sqlite_backend = sqlite_backend if sqlite_backend is not None else TTSQLiteBackend(df_helper = TTDataFrameHelper())
+
+    def __create_tt_df(self, setting_bag : SettingBag) -> DataFrame:
+
+        '''Creates the expected dataframe out of the provided arguments.'''
+
+        tt_df : DataFrame = self.__df_factory.create_tt_df(
+            excel_path = setting_bag.excel_path,
+            excel_skiprows = setting_bag.excel_skiprows,
+            excel_nrows = setting_bag.excel_nrows,
+            excel_tabname = setting_bag.excel_tabname,
+            years = setting_bag.years
+        )
+
+        return tt_df
+    def __compact_tt_df(self, tt_df : DataFrame, setting_bag : SettingBag) -> Tuple[DataFrame, DataFrame]:
+
+        '''Returns tt_df (compacted if setting_bag.enable_compact_tt_df is True) and its memory usage before/after (empty if not compacted).'''
+
+        if not setting_bag.enable_compact_tt_df:
+            return (tt_df, DataFrame())
+
+        compact_tt_df : DataFrame = self.__df_factory.create_compact_tt_df(tt_df = tt_df)
+        tt_memory_usage_df : DataFrame = self.__df_factory.create_tt_memory_usage_df(tt_df = tt_df, compact_tt_df = compact_tt_df)
+
+        return (compact_tt_df, tt_memory_usage_df)
+    def __create_tt_latest_four_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''Creates the expected dataframes out of the provided arguments.'''
+
+        return self.__df_factory.create_tt_latest_four_df(tt_df = tt_df)
+    def __create_tts_by_month_table(self, tt_df : DataFrame, setting_bag : SettingBag) -> EffortTable:
+
+        '''Creates the expected table out of the provided arguments.'''
+
+        tts_by_month_table : EffortTable = self.__df_factory.create_tts_by_month_table(
+            tt_df = tt_df,
+            now = setting_bag.now
+        )
+
+        return tts_by_month_table
+    def __create_tts_by_year_table(self, tt_df : DataFrame) -> EffortTable:
+
+        '''Creates the expected table out of the provided arguments.'''
+
+        tts_by_year_table : EffortTable = self.__df_factory.create_tts_by_year_table(
+            tt_df = tt_df
+        )
+
+        return tts_by_year_table
+    def __create_tts_by_range_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''Creates the expected dataframe out of the provided arguments.'''
+
+        tts_by_range_df : DataFrame = self.__df_factory.create_tts_by_range_df(
+            tt_df = tt_df
+        )
+
+        return tts_by_range_df
+    def __create_tts_by_spn_df(self, sp_frame : SoftwareProjectFrame, setting_bag : SettingBag) -> DataFrame:
+
+        '''Creates the expected dataframe out of the provided arguments.'''
+
+        tts_by_spn_df : DataFrame = self.__df_factory.create_tts_by_spn_df_from_frame(
+            sp_frame = sp_frame,
+            software_project_names = setting_bag.tts_by_spn_software_project_names
+        )
+
+        return tts_by_spn_df
+    def __create_tts_by_spv_table(self, sp_frame : SoftwareProjectFrame, setting_bag : SettingBag) -> EffortTable:
+
+        '''Creates the expected table out of the provided arguments.'''
+
+        tts_by_spn_spv_table : EffortTable = self.__df_factory.create_tts_by_spv_table_from_frame(
+            sp_frame = sp_frame,
+            software_project_names = setting_bag.tts_by_spv_software_project_names
+        )
+
+        return tts_by_spn_spv_table
+    def __create_tts_by_hashtag_year_table(self, tt_df : DataFrame) -> EffortTable:
+
+        '''Creates the expected table out of the provided arguments.'''
+
+        tts_by_hashtag_year_table : EffortTable = self.__df_factory.create_tts_by_hashtag_year_table(tt_df = tt_df)
+
+        return tts_by_hashtag_year_table
+    def __create_tts_by_hashtag_table(self, tt_df : DataFrame) -> EffortTable:
+
+        '''Creates the expected table out of the provided arguments.'''
+
+        tts_by_hashtag_table : EffortTable = self.__df_factory.create_tts_by_hashtag_table(tt_df = tt_df)
+
+        return tts_by_hashtag_table
+    def __create_tts_by_year_month_spnv_table(self, sp_frame : SoftwareProjectFrame, setting_bag : SettingBag) -> EffortTable:
+
+        '''Creates the expected table out of the provided arguments.'''
+
+        tts_by_year_month_spnv_table : EffortTable = self.__df_factory.create_tts_by_year_month_spnv_table_from_frame(
+            sp_frame = sp_frame,
+            software_project_names = setting_bag.tts_by_spv_software_project_names
+        )
+
+        return tts_by_year_month_spnv_table
+    def __create_tts_by_timeranges_df(self, tt_df : DataFrame, setting_bag : SettingBag) -> DataFrame:
+
+        '''Creates the expected dataframe out of the provided arguments.'''
+
+        tts_by_timeranges_df : DataFrame = self.__df_factory.create_tts_by_timeranges_df(
+            tt_df = tt_df,
+            min_occurrences = setting_bag.tts_by_timeranges_min_occurrences
+        )
+
+        return tts_by_timeranges_df
+    def __create_tts_timerange_matrix_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''Creates the expected dataframe out of the provided arguments.'''
+
+        return self.__df_factory.create_tts_timerange_matrix_df(tt_df = tt_df)
+    def __create_tts_by_week_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''Creates the expected dataframe out of the provided arguments.'''
+
+        return self.__df_factory.create_tts_by_week_df(tt_df = tt_df)
+    def __create_tts_by_day_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''Creates the expected dataframe out of the provided arguments.'''
+
+        return self.__df_factory.create_tts_by_day_df(tt_df = tt_df)
+    def __create_tts_by_quarter_df(self, tt_df : DataFrame) -> DataFrame:
+
+        '''Creates the expected dataframe out of the provided arguments.'''
+
+        return self.__df_factory.create_tts_by_quarter_df(tt_df = tt_df)
+    def __create_ttd_effort_status_df(self, tt_df : DataFrame, setting_bag : SettingBag) -> DataFrame:
+
+        '''Creates the expected dataframe out of the provided arguments.'''
+
+        ttd_effort_status_df : DataFrame = self.__df_factory.create_ttd_effort_status_df(
+            tt_df = tt_df,
+            is_correct = setting_bag.ttd_effort_status_is_correct
+        )
+
+        return ttd_effort_status_df
+    def __highlight(self, table : EffortTable, highlight : Callable[[DataFrame, DataFrame], DataFrame], setting_bag : SettingBag) -> DataFrame:
+
+        '''
+            Runs highlight against table.df and table.minutes_df if setting_bag.enable_effort_highlighting is True 
+            and setting_bag.effort_highlighting_mode is HIGHLIGHTMODE.tags, otherwise returns table.df untouched.
+        '''
+
+        if setting_bag.enable_effort_highlighting and setting_bag.effort_highlighting_mode == HIGHLIGHTMODE.tags:
+            return highlight(table.df, table.minutes_df)
+
+        return table.df
+    def __get_highlighted_table_names(self) -> list[str]:
+
+        '''Returns the names of the TTSummary tables that EffortHighlighter can highlight.'''
+
+        return [
+            "tts_by_month_df", 
+            "tts_by_year_df", 
+            "tts_by_spv_df", 
+            "tts_by_hashtag_year_df", 
+            "tts_by_hashtag_df", 
+            "tts_by_year_month_spnv_df"
+        ]
+    def __create_highlight_masks(self, tables : dict[str, Any], setting_bag : SettingBag) -> dict[str, DataFrame]:
+
+        '''
+            Returns a boolean mask for each of the highlightable tables in tables, which TTReportManager and TimeTrackingProcessor 
+            apply at render time via Styler, so that the tables themselves stay clean data.
+            
+            Returns an empty dictionary unless setting_bag.enable_effort_highlighting is True and setting_bag.effort_highlighting_mode 
+            is HIGHLIGHTMODE.styler. Missing and empty tables are skipped.
+        '''
+
+        if not setting_bag.enable_effort_highlighting or setting_bag.effort_highlighting_mode != HIGHLIGHTMODE.styler:
+            return {}
+
+        highlighter : EffortHighlighter = self.__effort_highlighter
+        masks : dict[str, Callable[[DataFrame], DataFrame]] = {
+            "tts_by_month_df": lambda df : highlighter.mask_tts_by_month(tts_by_month_df = df, effort_rule = setting_bag.tts_by_month_effort_rule),
+            "tts_by_year_df": lambda df : highlighter.mask_tts_by_year(tts_by_year_df = df, effort_rule = setting_bag.tts_by_year_effort_rule),
+            "tts_by_spv_df": lambda df : highlighter.mask_tts_by_spv(tts_by_spv_df = df, effort_rule = setting_bag.tts_by_spv_effort_rule),
+            "tts_by_hashtag_year_df": lambda df : highlighter.mask_tts_by_hashtag_year(tts_by_hashtag_year_df = df, effort_rule = setting_bag.tts_by_hashtag_year_effort_rule),
+            "tts_by_hashtag_df": lambda df : highlighter.mask_tts_by_hashtag(tts_by_hashtag_df = df, effort_rule = setting_bag.tts_by_hashtag_effort_rule),
+            "tts_by_year_month_spnv_df": lambda df : highlighter.mask_tts_by_year_month_spnv(tts_by_year_month_spnv_df = df, effort_rule = setting_bag.tts_by_year_month_spnv_effort_rule)
+        }
+
+        return { 
+            name: mask(tables[name]) 
+            for name, mask in masks.items() 
+            if isinstance(tables.get(name), DataFrame) and not tables[name].empty 
+        }
+    def __memoize(self, loader : Callable[[], Any]) -> Callable[[], Any]:
+
+        '''
+            Same as functools.cache(loader), but thread-safe: when the tables run in threads, the ones that share loader wait for 
+            its first call instead of running it again.
+        '''
+
+        lock : Lock = Lock()
+        values : list[Any] = []
+
+        def memoized() -> Any:
+            with lock:
+                if len(values) == 0:
+                    values.append(loader())
+
+            return values[0]
+
+        return memoized
+    def __create_loaders(self, tt_df : DataFrame, setting_bag : SettingBag, tt_partials : Optional[TTPartials] = None) -> dict[str, Callable[[], Any]]:
+
+        '''
+            Maps each TTSummary field (but tt_df) to the function that creates (and highlights) it out of tt_df (or out of its TTPartials, if enabled).
+
+            If tt_partials is provided, it's used instead of creating the TTPartials object out of tt_df.
+        '''
+
+        highlighter : EffortHighlighter = self.__effort_highlighter
+        sp_frame : Callable[[], SoftwareProjectFrame] = self.__memoize(lambda : self.__df_factory.create_software_project_frame(tt_df = tt_df))
+
+        loaders : dict[str, Callable[[], Any]] = {
+            "tt_latest_four_df": lambda : self.__create_tt_latest_four_df(tt_df = tt_df),
+            "tts_by_month_df": lambda : self.__highlight(
+                table = self.__create_tts_by_month_table(tt_df = tt_df, setting_bag = setting_bag),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_month(tts_by_month_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_month_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_year_df": lambda : self.__highlight(
+                table = self.__create_tts_by_year_table(tt_df = tt_df),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_year(tts_by_year_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_year_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_range_df": lambda : self.__create_tts_by_range_df(tt_df = tt_df),
+            "tts_by_spn_df": lambda : self.__create_tts_by_spn_df(sp_frame = sp_frame(), setting_bag = setting_bag),
+            "tts_by_spv_df": lambda : self.__highlight(
+                table = self.__create_tts_by_spv_table(sp_frame = sp_frame(), setting_bag = setting_bag),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_spv(tts_by_spv_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_spv_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_hashtag_year_df": lambda : self.__highlight(
+                table = self.__create_tts_by_hashtag_year_table(tt_df = tt_df),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_hashtag_year(tts_by_hashtag_year_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_hashtag_year_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_hashtag_df": lambda : self.__highlight(
+                table = self.__create_tts_by_hashtag_table(tt_df = tt_df),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_hashtag(tts_by_hashtag_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_hashtag_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_year_month_spnv_df": lambda : self.__highlight(
+                table = self.__create_tts_by_year_month_spnv_table(sp_frame = sp_frame(), setting_bag = setting_bag),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_year_month_spnv(tts_by_year_month_spnv_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_year_month_spnv_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_timeranges_df": lambda : self.__create_tts_by_timeranges_df(tt_df = tt_df, setting_bag = setting_bag),
+            "tts_timerange_matrix_df": lambda : self.__create_tts_timerange_matrix_df(tt_df = tt_df),
+            "tts_by_week_df": lambda : self.__create_tts_by_week_df(tt_df = tt_df),
+            "tts_by_day_df": lambda : self.__create_tts_by_day_df(tt_df = tt_df),
+            "tts_by_quarter_df": lambda : self.__create_tts_by_quarter_df(tt_df = tt_df),
+            "ttd_effort_status_df": lambda : self.__create_ttd_effort_status_df(tt_df = tt_df, setting_bag = setting_bag),
+            "definitions_df": lambda : self.__df_factory.create_definitions_df(),
+            "tt_partials": lambda : self.__create_tt_partials(tt_df = tt_df, setting_bag = setting_bag)
+        }
+
+        if setting_bag.enable_tt_partials:
+            partials : Callable[[], TTPartials] = self.__memoize(
+                lambda : tt_partials if tt_partials is not None else cast(TTPartials, self.__create_tt_partials(tt_df = tt_df, setting_bag = setting_bag))
+            )
+            loaders.update(self.__create_loaders_from_partials(tt_partials = partials, setting_bag = setting_bag))
+            loaders["tt_partials"] = partials
+
+        return loaders
+    def __create_cached_tt_partials(self, tt_df : DataFrame, setting_bag : SettingBag) -> TTPartials:
+
+        '''
+            Creates the TTPartials object of each year in tt_df and merges them. 
+            
+            The ones of the closed years (before setting_bag.now) are loaded from setting_bag.tt_partials_cache_folder_path if the hash of 
+            their rows hasn't changed, otherwise they are re-created and stored again. The open years are always re-created.
+        '''
+
+        if len(tt_df) == 0:
+            return self.__df_factory.create_tt_partials(tt_df = tt_df)
+
+        folder_path : str = setting_bag.tt_partials_cache_folder_path
+        tt_partials : list[TTPartials] = []
+
+        for year in sorted(tt_df[TTCN.YEAR].unique().tolist()):
+            year_df : DataFrame = tt_df.loc[tt_df[TTCN.YEAR] == year]
+
+            if year >= setting_bag.now.year:
+                tt_partials.append(self.__df_factory.create_tt_partials(tt_df = year_df))
+                continue
+
+            key : str = self.__df_factory.create_tt_hash(tt_df = year_df)
+            cached : Optional[TTPartials] = self.__tt_partials_cache.load(folder_path = folder_path, year = year, key = key)
+
+            if cached is None:
+                cached = self.__df_factory.create_tt_partials(tt_df = year_df)
+                self.__tt_partials_cache.save(folder_path = folder_path, year = year, key = key, tt_partials = cached)
+
+            tt_partials.append(cached)
+
+        return self.__df_factory.merge_tt_partials(tt_partials = tt_partials)
+    def __create_sqlite_tt_partials(self, tt_df : DataFrame, setting_bag : SettingBag) -> TTPartials:
+
+        '''Loads tt_df into the SQLite database at setting_bag.tt_partials_sqlite_database_path and lets it calculate the TTPartials object.'''
+
+        database_path : str = setting_bag.tt_partials_sqlite_database_path
+
+        with closing(self.__sqlite_backend.load(tt_df = tt_df, database_path = database_path)) as connection:
+            return self.__sqlite_backend.create_tt_partials(connection = connection)
+    def __create_map_reduced_tt_partials(self, tt_df : DataFrame, setting_bag : SettingBag) -> TTPartials:
+
+        '''
+            Partitions tt_df as described by setting_bag.tt_partials_partition_type, creates the TTPartials object of each partition 
+            in a ProcessPoolExecutor with setting_bag.tt_partials_max_workers workers (map) and merges them (reduce).
+        '''
+
+        partitions : list[DataFrame] = self.__df_factory.create_tt_partitions(
+            tt_df = tt_df, 
+            partition_type = setting_bag.tt_partials_partition_type, 
+            partition_count = setting_bag.tt_partials_max_workers
+        )
+
+        if setting_bag.tt_partials_max_workers <= 1 or len(partitions) == 1:
+            tt_partials : list[TTPartials] = [ self.__df_factory.create_tt_partials(tt_df = x) for x in partitions ]
+        else:
+            with ProcessPoolExecutor(max_workers = min(setting_bag.tt_partials_max_workers, len(partitions))) as executor:
+                tt_partials = list(executor.map(self.__df_factory.create_tt_partials, partitions))
+
+        return self.__df_factory.merge_tt_partials(tt_partials = tt_partials)
+    def __create_tt_partials(self, tt_df : DataFrame, setting_bag : SettingBag) -> Optional[TTPartials]:
+
+        '''Creates the expected TTPartials object out of the provided arguments, if enabled.'''
+
+        if not setting_bag.enable_tt_partials:
+            return None
+
+        if setting_bag.enable_tt_partials_cache:
+            return self.__create_cached_tt_partials(tt_df = tt_df, setting_bag = setting_bag)
+
+        if setting_bag.enable_tt_partials_sqlite:
+            return self.__create_sqlite_tt_partials(tt_df = tt_df, setting_bag = setting_bag)
+
+        if setting_bag.enable_tt_partials_map_reduce:
+            return self.__create_map_reduced_tt_partials(tt_df = tt_df, setting_bag = setting_bag)
+
+        return self.__df_factory.create_tt_partials(tt_df = tt_df)
+    def __update_ttd_effort_status_df(self, tt_summary : TTSummary, tt_delta_df : DataFrame, setting_bag : SettingBag) -> DataFrame:
+
+        '''Appends the effort statuses of the rows in tt_delta_df to the ones in tt_summary.'''
+
+        delta_df : DataFrame = self.__create_ttd_effort_status_df(tt_df = tt_delta_df, setting_bag = setting_bag)
+
+        if len(delta_df) == 0:
+            return tt_summary.ttd_effort_status_df
+        
+        if len(tt_summary.ttd_effort_status_df) == 0:
+            return delta_df
+
+        return pd.concat(objs = [tt_summary.ttd_effort_status_df, delta_df])
+    def __create_loaders_from_partials(self, tt_partials : Callable[[], TTPartials], setting_bag : SettingBag) -> dict[str, Callable[[], Any]]:
+
+        '''
+            Maps each TTSummary field that can be derived from TTPartials to the function that creates (and highlights) it.
+
+            tt_partials is a loader as well, so the TTPartials object is created on first need only.
+        '''
+
+        highlighter : EffortHighlighter = self.__effort_highlighter
+        sp_frame : Callable[[], SoftwareProjectFrame] = self.__memoize(lambda : self.__df_factory.create_software_project_frame_from_partials(tt_partials = tt_partials()))
+
+        loaders : dict[str, Callable[[], Any]] = {
+            "tts_by_month_df": lambda : self.__highlight(
+                table = self.__df_factory.create_tts_by_month_table_from_partials(tt_partials = tt_partials(), now = setting_bag.now),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_month(tts_by_month_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_month_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_year_df": lambda : self.__highlight(
+                table = self.__df_factory.create_tts_by_year_table_from_partials(tt_partials = tt_partials()),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_year(tts_by_year_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_year_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_range_df": lambda : self.__df_factory.create_tts_by_range_df_from_partials(tt_partials = tt_partials()),
+            "tts_by_spn_df": lambda : self.__df_factory.create_tts_by_spn_df_from_frame(
+                sp_frame = sp_frame(), 
+                software_project_names = setting_bag.tts_by_spn_software_project_names
+            ),
+            "tts_by_spv_df": lambda : self.__highlight(
+                table = self.__df_factory.create_tts_by_spv_table_from_frame(
+                    sp_frame = sp_frame(), 
+                    software_project_names = setting_bag.tts_by_spv_software_project_names
+                ),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_spv(tts_by_spv_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_spv_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_hashtag_year_df": lambda : self.__highlight(
+                table = self.__df_factory.create_tts_by_hashtag_year_table_from_partials(tt_partials = tt_partials()),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_hashtag_year(tts_by_hashtag_year_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_hashtag_year_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_hashtag_df": lambda : self.__highlight(
+                table = self.__df_factory.create_tts_by_hashtag_table_from_partials(tt_partials = tt_partials()),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_hashtag(tts_by_hashtag_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_hashtag_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_year_month_spnv_df": lambda : self.__highlight(
+                table = self.__df_factory.create_tts_by_year_month_spnv_table_from_frame(
+                    sp_frame = sp_frame(), 
+                    software_project_names = setting_bag.tts_by_spv_software_project_names
+                ),
+                highlight = lambda df, minutes_df : highlighter.highlight_tts_by_year_month_spnv(tts_by_year_month_spnv_df = df, minutes_df = minutes_df, effort_rule = setting_bag.tts_by_year_month_spnv_effort_rule),
+                setting_bag = setting_bag
+            ),
+            "tts_by_timeranges_df": lambda : self.__df_factory.create_tts_by_timeranges_df_from_partials(
+                tt_partials = tt_partials(),
+                min_occurrences = setting_bag.tts_by_timeranges_min_occurrences
+            ),
+            "tts_timerange_matrix_df": lambda : self.__df_factory.create_tts_timerange_matrix_df_from_partials(tt_partials = tt_partials())
+        }
+
+        return loaders
+    def __get_required_tables(self, setting_bag : SettingBag) -> list[str]:
+
+        '''
+            Returns the names of the TTSummary tables that are needed by at least one of the options in setting_bag.
+
+            The report needs all the tables but ttd_effort_status_df, tts_by_week_df and tts_by_day_df (which are 
+            added to it only if they are requested by their own options).
+        '''
+
+        options : dict[str, list] = {
+            "tt_latest_four_df": setting_bag.options_tt_latest_four,
+            "tts_by_month_df": setting_bag.options_tts_by_month,
+            "tts_by_year_df": setting_bag.options_tts_by_year,
+            "tts_by_range_df": setting_bag.options_tts_by_range,
+            "tts_by_spn_df": setting_bag.options_tts_by_spn,
+            "tts_by_spv_df": setting_bag.options_tts_by_spv,
+            "tts_by_hashtag_year_df": setting_bag.options_tts_by_hashtag_year,
+            "tts_by_hashtag_df": setting_bag.options_tts_by_hashtag,
+            "tts_by_year_month_spnv_df": setting_bag.options_tts_by_year_month_spnv,
+            "tts_by_timeranges_df": setting_bag.options_tts_by_timeranges,
+            "tts_timerange_matrix_df": setting_bag.options_tts_timerange_matrix,
+            "tts_by_week_df": setting_bag.options_tts_by_week,
+            "tts_by_day_df": setting_bag.options_tts_by_day,
+            "tts_by_quarter_df": setting_bag.options_tts_by_quarter,
+            "ttd_effort_status_df": setting_bag.options_ttd_effort_status,
+            "definitions_df": setting_bag.options_definitions
+        }
+        report_tables : list[str] = [name for name in options.keys() if name not in ["ttd_effort_status_df", "tts_by_week_df", "tts_by_day_df"]]
+        is_report : bool = len(setting_bag.options_report) > 0
+
+        required_tables : list[str] = [
+            name for name, option_list in options.items() 
+            if len(option_list) > 0 or (is_report and name in report_tables)
+        ]
+
+        return required_tables
+    def __prune_loaders(self, loaders : dict[str, Callable[[], Any]], setting_bag : SettingBag) -> dict[str, Callable[[], Any]]:
+
+        '''
+            Replaces the loaders of the tables that no option in setting_bag needs with empty dataframes, and adds a "skipped_tables" loader.
+
+            Nothing is pruned if setting_bag.enable_table_pruning is False.
+        '''
+
+        skipped_tables : list[str] = []
+
+        if setting_bag.enable_table_pruning:
+            required_tables : list[str] = self.__get_required_tables(setting_bag = setting_bag)
+            skipped_tables = [name for name in loaders.keys() if name.endswith("_df") and name not in required_tables]
+
+        pruned_loaders : dict[str, Callable[[], Any]] = { 
+            name: (DataFrame if name in skipped_tables else loader) for name, loader in loaders.items() 
+        }
+        pruned_loaders["skipped_tables"] = lambda : skipped_tables
+
+        return pruned_loaders
+    def __create_tt_df_chunks(self, setting_bag : SettingBag) -> Iterator[DataFrame]:
+
+        '''Creates the expected chunks of tt_df out of the provided arguments.'''
+
+        if setting_bag.tt_parquet_path is not None:
+            return self.__df_factory.create_tt_df_chunks_from_parquet(
+                parquet_path = setting_bag.tt_parquet_path,
+                chunk_size = setting_bag.tt_chunk_size,
+                years = setting_bag.years,
+                compact = setting_bag.enable_compact_tt_df
+            )
+
+        return self.__df_factory.create_tt_df_chunks(
+            excel_path = setting_bag.excel_path,
+            excel_skiprows = setting_bag.excel_skiprows,
+            excel_nrows = setting_bag.excel_nrows,
+            excel_tabname = setting_bag.excel_tabname,
+            chunk_size = setting_bag.tt_chunk_size,
+            years = setting_bag.years,
+            compact = setting_bag.enable_compact_tt_df
+        )
+    def __create_summary_from_partials(self, tt_partials : TTPartials, loaders : dict[str, Callable[[], Any]], setting_bag : SettingBag) -> TTSummary:
+
+        '''
+            Creates a TTSummary object out of tt_partials, plus loaders for the tables that can't be derived from it. 
+            
+            The remaining tables are left empty and listed in TTSummary.skipped_tables (after the pruned ones), and tt_df is empty as well.
+        '''
+
+        partials_loaders : dict[str, Callable[[], Any]] = self.__create_loaders_from_partials(tt_partials = lambda : tt_partials, setting_bag = setting_bag)
+        partials_loaders["definitions_df"] = lambda : self.__df_factory.create_definitions_df()
+        partials_loaders.update(loaders)
+        partials_loaders = self.__prune_loaders(loaders = partials_loaders, setting_bag = setting_bag)
+
+        missing_tables : list[str] = [ 
+            name for name in ["tt_latest_four_df", "tts_by_week_df", "tts_by_day_df", "tts_by_quarter_df", "ttd_effort_status_df"] 
+            if name not in loaders 
+        ]
+        skipped_tables : list[str] = partials_loaders["skipped_tables"]() + missing_tables
+
+        values : dict[str, Any] = { name: loader() for name, loader in partials_loaders.items() if name != "skipped_tables" }
+        values.update({ name: DataFrame() for name in missing_tables })
+        values["highlight_masks"] = self.__create_highlight_masks(tables = values, setting_bag = setting_bag)
+
+        return TTSummary(tt_df = DataFrame(), tt_partials = tt_partials, skipped_tables = skipped_tables, **values)
+    def __create_scenario_summary(self, tt_df : DataFrame, tt_partials_by_year : dict[int, TTPartials], setting_bag : SettingBag) -> TTSummary:
+
+        '''
+            Creates the TTSummary object of one of the scenarios of create_summaries(), out of the shared tt_df and tt_partials_by_year.
+
+            The tables that can be derived from TTPartials are created out of the merged TTPartials of the years in setting_bag.years 
+            (all of them if None or empty), the others out of tt_df filtered by the same years. The tables always run in threads 
+            (if setting_bag.max_workers is greater than 1), because worker processes can't see the shared TTPartials.
+        '''
+
+        scenario_df : DataFrame = self.__df_factory.filter_tt_df(tt_df = tt_df, years = setting_bag.years)
+        scenario_df, tt_memory_usage_df = self.__compact_tt_df(tt_df = scenario_df, setting_bag = setting_bag)
+
+        scenario_years : set[int] = set(scenario_df[TTCN.YEAR].unique().tolist())
+        years : list[int] = [ year for year in tt_partials_by_year.keys() if year in scenario_years ]
+        tt_partials : TTPartials = (
+            self.__df_factory.merge_tt_partials(tt_partials = [tt_partials_by_year[year] for year in years]) 
+            if len(years) > 0 else self.__df_factory.create_tt_partials(tt_df = scenario_df)
+        )
+
+        loaders : dict[str, Callable[[], Any]] = self.__create_loaders(tt_df = scenario_df, setting_bag = replace(setting_bag, enable_tt_partials = False))
+        loaders.update(self.__create_loaders_from_partials(tt_partials = lambda : tt_partials, setting_bag = setting_bag))
+        loaders["tt_partials"] = lambda : tt_partials
+        loaders = self.__prune_loaders(loaders = loaders, setting_bag = setting_bag)
+
+        values, timings_df = self.__run_loaders(loaders = loaders, tt_df = scenario_df, setting_bag = replace(setting_bag, executor_type = EXECUTORTYPE.thread))
+        values["highlight_masks"] = self.__create_highlight_masks(tables = values, setting_bag = setting_bag)
+
+        return TTSummary(tt_df = scenario_df, timings_df = timings_df, tt_memory_usage_df = tt_memory_usage_df, **values)
+    def __time_loader(self, loader : Callable[[], Any]) -> Tuple[Any, float]:
+
+        '''Runs loader and returns its outcome together with the elapsed seconds.'''
+
+        start : float = time.perf_counter()
+        value : Any = loader()
+
+        return (value, time.perf_counter() - start)
+    def __create_executor(self, tt_df : DataFrame, tt_partials : Optional[TTPartials], setting_bag : SettingBag) -> Executor:
+
+        '''Creates the executor described by setting_bag.executor_type.'''
+
+        if setting_bag.executor_type == EXECUTORTYPE.process:
+            return ProcessPoolExecutor(
+                max_workers = setting_bag.max_workers,
+                initializer = _TableWorker.initialize,
+                initargs = (self, tt_df, setting_bag, tt_partials)
+            )
+
+        return ThreadPoolExecutor(max_workers = setting_bag.max_workers)
+    def __run_loaders(self, loaders : dict[str, Callable[[], Any]], tt_df : DataFrame, setting_bag : SettingBag) -> Tuple[dict[str, Any], DataFrame]:
+
+        '''
+            Runs all loaders and returns their outcomes (in the same order as loaders) and a dataframe with the elapsed seconds of each of them.
+
+            If setting_bag.max_workers is greater than 1, the loaders run concurrently. The process executor only receives the tables that
+            haven't been skipped, the remaining loaders run in the current process. The TTPartials object is created in the current process
+            beforehand and shipped to the workers, so that it's created once (and its own process pool, if any, is never nested into theirs).
+        '''
+
+        if setting_bag.max_workers <= 1:
+            outcomes : dict[str, Tuple[Any, float]] = { name: self.__time_loader(loader = loader) for name, loader in loaders.items() }
+        else:
+            skipped_tables : list[str] = loaders["skipped_tables"]() if "skipped_tables" in loaders else []
+            local_outcomes : dict[str, Tuple[Any, float]] = {}
+
+            if setting_bag.executor_type == EXECUTORTYPE.process and "tt_partials" in loaders:
+                local_outcomes["tt_partials"] = self.__time_loader(loader = loaders["tt_partials"])
+
+            tt_partials : Optional[TTPartials] = local_outcomes["tt_partials"][0] if "tt_partials" in local_outcomes else None
+
+            with self.__create_executor(tt_df = tt_df, tt_partials = tt_partials, setting_bag = setting_bag) as executor:
+                futures : dict[str, Future] = {}
+
+                for name, loader in loaders.items():
+                    if setting_bag.executor_type == EXECUTORTYPE.thread:
+                        futures[name] = executor.submit(self.__time_loader, loader)
+                    elif name != "skipped_tables" and name != "tt_partials" and name not in skipped_tables:
+                        futures[name] = executor.submit(_TableWorker.create_table, name)
+
+                outcomes = { 
+                    name: futures[name].result() if name in futures else local_outcomes.get(name) or self.__time_loader(loader = loader) 
+                    for name, loader in loaders.items() 
+                }
+
+        values : dict[str, Any] = { name: outcome[0] for name, outcome in outcomes.items() }
+        timings_df : DataFrame = DataFrame(
+            data = [(name, outcome[1]) for name, outcome in outcomes.items()],
+            columns = [TTCN.TABLE, TTCN.SECONDS]
+        )
+
+        return (values, timings_df)
+
+    def create_table_loaders(self, tt_df : DataFrame, setting_bag : SettingBag, tt_partials : Optional[TTPartials] = None) -> dict[str, Callable[[], Any]]:
+
+        '''
+            Maps each TTSummary field (but tt_df) to the function that creates (and highlights) it out of tt_df (or out of tt_partials, if enabled).
+
+            The loaders share the TTPartials object and the SoftwareProjectFrame, which are both created on first need (if tt_partials isn't provided).
+        '''
+
+        return self.__create_loaders(tt_df = tt_df, setting_bag = setting_bag, tt_partials = tt_partials)
+    def create_summary(self, setting_bag : SettingBag) -> TTSummary:
+
+        '''
+            Creates a TTSummary object out of setting_bag.
+
+            Once tt_df is created, all the other tables are independent from each other, therefore they are created concurrently 
+            if setting_bag.max_workers is greater than 1. The elapsed seconds of each table are collected in TTSummary.timings_df.
+        '''
+
+        tt_df, tt_memory_usage_df = self.__compact_tt_df(tt_df = self.__create_tt_df(setting_bag = setting_bag), setting_bag = setting_bag)
+        loaders : dict[str, Callable[[], Any]] = self.__create_loaders(tt_df = tt_df, setting_bag = setting_bag)
+        loaders = self.__prune_loaders(loaders = loaders, setting_bag = setting_bag)
+
+        values, timings_df = self.__run_loaders(loaders = loaders, tt_df = tt_df, setting_bag = setting_bag)
+        values["highlight_masks"] = self.__create_highlight_masks(tables = values, setting_bag = setting_bag)
+        tt_summary : TTSummary = TTSummary(tt_df = tt_df, timings_df = timings_df, tt_memory_usage_df = tt_memory_usage_df, **values)
+
+        return tt_summary
+    def create_lazy_summary(self, setting_bag : SettingBag) -> LazyTTSummary:
+
+        '''Same as create_summary(), but only tt_df is created upfront, while all the other fields are created on first access.'''
+
+        tt_df, tt_memory_usage_df = self.__compact_tt_df(tt_df = self.__create_tt_df(setting_bag = setting_bag), setting_bag = setting_bag)
+        loaders : dict[str, Callable[[], Any]] = self.__create_loaders(tt_df = tt_df, setting_bag = setting_bag)
+        loaders = self.__prune_loaders(loaders = loaders, setting_bag = setting_bag)
+        loaders["tt_memory_usage_df"] = lambda : tt_memory_usage_df
+
+        lazy_summary : LazyTTSummary = LazyTTSummary(tt_df = tt_df, loaders = loaders)
+        loaders["highlight_masks"] = lambda : self.__create_highlight_masks(
+            tables = { name: getattr(lazy_summary, name) for name in self.__get_highlighted_table_names() if name in loaders },
+            setting_bag = setting_bag
+        )
+
+        return lazy_summary
+    def update_summary(self, tt_summary : TTSummary, new_tt_df : DataFrame, setting_bag : SettingBag) -> TTSummary:
+
+        '''
+            Returns a new TTSummary that includes the sessions in new_tt_df (same layout as tt_df) without recomputing everything from scratch.
+
+            The TTPartials of the new sessions are merged into the ones of tt_summary (created out of tt_summary.tt_df if missing), 
+            then only the tables affected by the new sessions are re-created and re-highlighted. 
+            The outcome is the same as running create_summary() against the full set of sessions. 
+            The tables in tt_summary.skipped_tables are left untouched.
+        '''
+
+        tt_delta_df : DataFrame = self.__df_factory.create_tt_delta_df(tt_df = tt_summary.tt_df, new_tt_df = new_tt_df, years = setting_bag.years)
+        old_partials : TTPartials = tt_summary.tt_partials if tt_summary.tt_partials is not None else self.__df_factory.create_tt_partials(tt_df = tt_summary.tt_df)
+
+        if len(tt_delta_df) == 0:
+            return replace(tt_summary, tt_partials = old_partials)
 
-        return definitions_df
-@dataclass(frozen = True)
-class EffortCell():
-    
-    '''Collects all the information related to a DataFrame cell that are required by EffortHighlighter.'''
+        tt_df : DataFrame = self.__df_factory.append_tt_delta_df(tt_df = tt_summary.tt_df, tt_delta_df = tt_delta_df)
+        tt_df, _ = self.__compact_tt_df(tt_df = tt_df, setting_bag = setting_bag)
+        delta_partials : TTPartials = self.__df_factory.create_tt_partials(tt_df = tt_delta_df)
+        tt_partials : TTPartials = self.__df_factory.merge_tt_partials(tt_partials = [old_partials, delta_partials])
 
-    coordinate_pair : Tuple[int, int]
-    effort_str : str
-    effort_td : timedelta
-class EffortHighlighter():
+        table_names : list[str] = ["tts_by_month_df", "tts_by_year_df", "tts_by_range_df", "tts_by_hashtag_year_df", "tts_by_hashtag_df"]
 
-    '''Encapsulates all the logic related to highlighting cells in dataframes containing efforts.'''
+        if len(delta_partials.by_software_project) > 0:
+            table_names += ["tts_by_spn_df", "tts_by_spv_df", "tts_by_year_month_spnv_df"]
 
-    __df_helper : TTDataFrameHelper
+        if len(delta_partials.by_time_range.drop(labels = ["Unknown"], errors = "ignore")) > 0:
+            table_names += ["tts_by_timeranges_df", "tts_timerange_matrix_df"]
 
-    def __init__(self, df_helper : TTDataFrameHelper) -> None:
+        loaders : dict[str, Callable[[], Any]] = self.__create_loaders_from_partials(tt_partials = lambda : tt_partials, setting_bag = setting_bag)
+        loaders["tt_latest_four_df"] = lambda : self.__create_tt_latest_four_df(tt_df = tt_df)
+        loaders["tts_by_week_df"] = lambda : self.__create_tts_by_week_df(tt_df = tt_df)
+        loaders["tts_by_day_df"] = lambda : self.__create_tts_by_day_df(tt_df = tt_df)
+        loaders["tts_by_quarter_df"] = lambda : self.__create_tts_by_quarter_df(tt_df = tt_df)
+        loaders["ttd_effort_status_df"] = lambda : self.__update_ttd_effort_status_df(tt_summary = tt_summary, tt_delta_df = tt_delta_df, setting_bag = setting_bag)
+        table_names += ["tt_latest_four_df", "tts_by_week_df", "tts_by_day_df", "tts_by_quarter_df", "ttd_effort_status_df"]
 
-        self.__df_helper = df_helper
+        values : dict[str, Any] = { name: loaders[name]() for name in table_names if name not in tt_summary.skipped_tables }
+        values["highlight_masks"] = { **tt_summary.highlight_masks, **self.__create_highlight_masks(tables = values, setting_bag = setting_bag) }
 
-    def __is_effort(self, cell_content : str) -> bool :
+        return replace(tt_summary, tt_df = tt_df, tt_partials = tt_partials, **values)
+    def complete_summary(self, tt_summary : TTSummary, setting_bag : SettingBag) -> TTSummary:
 
-        '''Returns True if content in ["00h 00m", "08h 00m", "20h 45m", "101h 30m", "+71h 00m", "-455h 45m", ...].'''
+        '''
+            Returns a new TTSummary in which the tables in tt_summary.skipped_tables (the pruned ones) have been created (and highlighted).
+
+            If tt_summary.tt_df is empty and tt_summary.tt_partials isn't (i.e. create_chunked_summary()), only the tables that can be
+            derived from it are created, while the others stay in skipped_tables.
+        '''
 
-        pattern : str = r"^[+-]?(\d{2,})h (0[0-9]|[1-5][0-9])m$"
-        match : Optional[Match[str]] = re.fullmatch(pattern = pattern, string = cell_content)
+        if len(tt_summary.skipped_tables) == 0:
+            return tt_summary
 
-        if match is not None:
-            return True
+        if len(tt_summary.tt_df) == 0 and tt_summary.tt_partials is not None:
+            tt_partials : TTPartials = tt_summary.tt_partials
+            loaders : dict[str, Callable[[], Any]] = self.__create_loaders_from_partials(tt_partials = lambda : tt_partials, setting_bag = setting_bag)
+            loaders["definitions_df"] = lambda : self.__df_factory.create_definitions_df()
         else:
-            return False
-    def __append_new_effort_cell(self, effort_cells : list[EffortCell], coordinate_pair : Tuple[int, int], cell_content : str) -> None:
+            loaders = self.__create_loaders(tt_df = tt_summary.tt_df, setting_bag = setting_bag, tt_partials = tt_summary.tt_partials)
 
-        '''Creates and append new EffortCell object to effort_cells.'''
+        values : dict[str, Any] = { name: loaders[name]() for name in tt_summary.skipped_tables if name in loaders }
+        skipped_tables : list[str] = [ name for name in tt_summary.skipped_tables if name not in values ]
+        values["highlight_masks"] = { **tt_summary.highlight_masks, **self.__create_highlight_masks(tables = values, setting_bag = setting_bag) }
 
-        effort_cell : EffortCell = EffortCell(
-            coordinate_pair = coordinate_pair,
-            effort_str = cell_content,
-            effort_td = self.__df_helper.unbox_effort(effort_str = cell_content)
-        )
-        
-        effort_cells.append(effort_cell)
-    def __extract_row(self, df : DataFrame, row_idx : int, column_names : list[str]) -> list[EffortCell]:
+        return replace(tt_summary, skipped_tables = skipped_tables, **values)
+    def create_summaries(self, setting_bags : list[SettingBag], max_workers : int = 1) -> list[TTSummary]:
 
-        '''Returns a collection of EffortCell objects for provided arguments.'''
+        '''
+            Creates one TTSummary object per scenario in setting_bags (same order), out of a single tt_df and a single set of TTPartials per year.
 
-        effort_cells : list[EffortCell] = []
-        col_indices : list = [df.columns.get_loc(column_name) for column_name in column_names if column_name in df.columns]
+            The workbook is read once with the settings of setting_bags[0] (without filtering by year), then each scenario filters 
+            tt_df by its own years, merges the TTPartials of those years and formats its own tables. If max_workers is greater than 1, 
+            the scenarios run concurrently in a ThreadPoolExecutor, sharing tt_df and the TTPartials.
+        '''
 
-        for col_idx in col_indices:
+        tt_df : DataFrame = self.__create_tt_df(setting_bag = replace(setting_bags[0], years = None))
+        tt_partials_by_year : dict[int, TTPartials] = {
+            int(partition[TTCN.YEAR].iloc[0]): self.__df_factory.create_tt_partials(tt_df = partition)
+            for partition in self.__df_factory.create_tt_partitions(tt_df = tt_df, partition_type = PARTITIONTYPE.year, partition_count = 1)
+            if len(partition) > 0
+        }
 
-            coordinate_pair : Tuple[int, int] = (row_idx, col_idx)
-            cell_content : str = str(df.iloc[row_idx, col_idx])
+        if max_workers <= 1:
+            return [ self.__create_scenario_summary(tt_df = tt_df, tt_partials_by_year = tt_partials_by_year, setting_bag = x) for x in setting_bags ]
 
-            if self.__is_effort(cell_content = cell_content):
-                self.__append_new_effort_cell(effort_cells, coordinate_pair, cell_content)
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+            futures : list[Future] = [ 
+                executor.submit(self.__create_scenario_summary, tt_df, tt_partials_by_year, x) for x in setting_bags 
+            ]
 
-        return effort_cells
-    def __extract_n(self, mode : EFFORTMODE) -> int:
+            return [ future.result() for future in futures ]
+    def create_chunked_summary(self, setting_bag : SettingBag) -> TTSummary:
 
-        '''Extracts n from mode.'''
+        '''
+            Same as create_summary(), but tt_df is read setting_bag.tt_chunk_size rows at a time (out of setting_bag.tt_parquet_path, 
+            if provided) and never kept in memory as a whole: the TTPartials of each chunk are merged into the running ones, 
+            and the effort statuses and latest four rows are collected along the way.
 
-        if mode == EFFORTMODE.top_one_effort_per_row:
-            return 1
-        elif mode == EFFORTMODE.top_three_efforts:
-            return 3
-        else:
-            raise Exception(_MessageCollection.provided_mode_not_supported(mode))
-    def __extract_top_n_effort_cells(self, effort_cells : list[EffortCell], n : int) -> list[EffortCell]:
+            The tables that can't be derived from TTPartials are left empty and listed in TTSummary.skipped_tables, and tt_df is empty as well.
+            Memory stays bounded by the chunk size, as long as setting_bag.ttd_effort_status_is_correct is False (only the failures are kept).
+        '''
 
-        '''Extracts the n objects in bym_cells with the highest effort_td.'''
+        required_tables : Optional[list[str]] = self.__get_required_tables(setting_bag = setting_bag) if setting_bag.enable_table_pruning else None
+        is_ttd_required : bool = required_tables is None or "ttd_effort_status_df" in required_tables
 
-        sorted_cells : list[EffortCell] = sorted(effort_cells, key = lambda cell : cell.effort_td, reverse = True)
-        top_n : list[EffortCell] = sorted_cells[:n]
+        tt_partials : Optional[TTPartials] = None
+        tt_latest_four_df : DataFrame = DataFrame()
+        ttd_effort_status_dfs : list[DataFrame] = []
 
-        return top_n
-    def __calculate_effort_cells(self, df : DataFrame, mode : EFFORTMODE, column_names : list[str]) -> list[EffortCell]:
+        for tt_chunk_df in self.__create_tt_df_chunks(setting_bag = setting_bag):
+            chunk_partials : TTPartials = self.__df_factory.create_tt_partials(tt_df = tt_chunk_df)
+            tt_partials = chunk_partials if tt_partials is None else self.__df_factory.merge_tt_partials(tt_partials = [tt_partials, chunk_partials])
+            tt_latest_four_df = self.__create_tt_latest_four_df(tt_df = pd.concat(objs = [tt_latest_four_df, tt_chunk_df]) if len(tt_latest_four_df) > 0 else tt_chunk_df)
 
-        '''Returns a list of EffortCell objects according to df and mode.'''
+            if is_ttd_required and len(tt_chunk_df) > 0:
+                ttd_effort_status_dfs.append(self.__create_ttd_effort_status_df(tt_df = tt_chunk_df, setting_bag = setting_bag))
 
-        effort_cells : list[EffortCell] = []
+        loaders : dict[str, Callable[[], Any]] = {
+            "tt_latest_four_df": lambda : tt_latest_four_df,
+            "ttd_effort_status_df": lambda : pd.concat(objs = ttd_effort_status_dfs) if len(ttd_effort_status_dfs) > 0 else DataFrame()
+        }
 
-        last_row_idx : int = len(df)
-        n : int = self.__extract_n(mode = mode)
-        current : list[EffortCell] = []
+        return self.__create_summary_from_partials(tt_partials = cast(TTPartials, tt_partials), loaders = loaders, setting_bag = setting_bag)
+    def create_team_summary(self, tt_partials : list[TTPartials], setting_bag : SettingBag) -> TTSummary:
 
-        if mode == EFFORTMODE.top_one_effort_per_row:
-            for row_idx in range(last_row_idx):
+        '''
+            Merges tt_partials (one per person) and creates a TTSummary object out of them. 
+            
+            The tables that can't be derived from TTPartials are left empty and listed in TTSummary.skipped_tables, and tt_df is empty as well.
+        '''
 
-                current = self.__extract_row(df = df, row_idx = row_idx, column_names = column_names)
-                current = self.__extract_top_n_effort_cells(effort_cells = current, n = n)
-                effort_cells.extend(current)
-                
-        elif mode == EFFORTMODE.top_three_efforts:
-            for row_idx in range(last_row_idx):
-                
-                current = self.__extract_row(df = df, row_idx = row_idx, column_names = column_names)
-                effort_cells.extend(current)
+        merged : TTPartials = self.__df_factory.merge_tt_partials(tt_partials = tt_partials)
 
-            effort_cells = self.__extract_top_n_effort_cells(effort_cells = effort_cells, n = n)
+        return self.__create_summary_from_partials(tt_partials = merged, loaders = {}, setting_bag = replace(setting_bag, enable_table_pruning = False))
+class TTHTMLTableRenderer():
 
-        else:
-            raise Exception(_MessageCollection.provided_mode_not_supported(mode))
+    '''
+        Renders dataframes as plain HTML tables, without pandas Styler.
 
-        return effort_cells
-    def __add_tags(self, df : DataFrame, effort_cells : list[EffortCell], tags : Tuple[str, str]) -> DataFrame:
+        The cells are formatted one column at a time (same default formatting as Styler), escaped and streamed through a precompiled 
+        row template. Striping and headers come from the shared CSS classes returned by create_css(), instead of per-cell ids.
+    '''
 
-        '''Adds two HTML tags around the content of the cells listed in effort_cells.'''
+    def __get_table_class(self) -> str:
 
-        tagged_df : DataFrame = df.copy(deep = True)
+        '''Returns the CSS class of the rendered tables.'''
 
-        left_h : str = tags[0]
-        right_h : str = tags[1]
+        return "tt-table"
+    def __get_mark_pattern(self) -> str:
 
-        for effort_cell in effort_cells:
+        '''Returns the pattern of the escaped highlight tags added by EffortHighlighter (HIGHLIGHTMODE.tags).'''
 
-            row, col = effort_cell.coordinate_pair
+        return r"&lt;mark style=&#x27;(background-color: [a-z0-9(),. ]+)&#x27;&gt;(.*?)&lt;/mark&gt;"
+    def __format_default(self, value : Any, precision : int) -> str:
 
-            if row < len(df) and col < len(df.columns):
-                tagged_df.iloc[row, col] = f"{left_h}{str(df.iloc[row, col])}{right_h}"
-            
-        return tagged_df
-    def __highlight_dataframe(self, df : DataFrame, mode : EFFORTMODE, column_names : list[str] = []) -> DataFrame:
+        '''Same as the default formatter of Styler: 1.5 => "1.500000", 3 => "3", "abc" => "abc".'''
 
-        '''
-            Expects a df containing efforts into cells - i.e. "45h 45m", "77h 45m".
-            Returns a df with highlighted cells as per arguments.
+        if isinstance(value, (float, np.floating)):
+            return f"{value:.{precision}f}"
 
-            Note: column names are converted to string to aid column search when the dataframe has mixed type column names.
-        '''
+        return str(value)
+    def __format_column(self, column : Series, formatter : Optional[Union[str, Callable[[Any], str]]]) -> list[str]:
 
-        highlighted_df : DataFrame = df.copy(deep = True)
-        highlighted_df.columns = highlighted_df.columns.map(str)
+        '''Formats column as a whole: float columns through np.char.mod(), string columns as they are, the others value by value.'''
 
-        if len(column_names) == 0:
-            column_names = highlighted_df.columns.to_list()
+        precision : int = pd.get_option("styler.format.precision")
 
-        effort_cells : list[EffortCell] = self.__calculate_effort_cells(
-            df = highlighted_df, 
-            mode = mode,
-            column_names = column_names
-        )
+        if formatter is not None:
+            function : Callable[[Any], str] = formatter.format if isinstance(formatter, str) else formatter
+            return [function(value) for value in column.tolist()]
 
-        tags : Tuple[str, str] = (f"<mark style='background-color: pink'>", "</mark>")
-        highlighted_df = self.__add_tags(df = highlighted_df, effort_cells = effort_cells, tags = tags)
+        if pd.api.types.is_float_dtype(column.dtype):
+            return np.char.mod(f"%.{precision}f", column.to_numpy(dtype = float)).tolist()
 
-        return highlighted_df
-    def __get_latest_year(self, tts_by_hashtag_year_df : DataFrame) -> str:
+        if pd.api.types.is_integer_dtype(column.dtype) or pd.api.types.is_bool_dtype(column.dtype):
+            return [str(value) for value in column.tolist()]
 
-        '''
-            [ "Hashtag", "2015", "2016", "2017", "2018", "2019", "2020", "2021", "2022", "2023", "2024", "2025"]
-                -> "2025"
-        '''
+        values : list = column.tolist()
 
-        latest_year : str = str(max(int(column_name) for column_name in tts_by_hashtag_year_df.columns if str(column_name).isdigit()))
-        
-        return latest_year
+        if pd.api.types.infer_dtype(values, skipna = False) == "string":
+            return values
 
-    def highlight_tts_by_month(self, tts_by_month_df : DataFrame) -> DataFrame:
-        
-        '''Returns the provided dataframe with adequate highlights.'''
+        return [self.__format_default(value = value, precision = precision) for value in values]
+    def __escape_column(self, texts : list[str]) -> list[str]:
 
-        mode : EFFORTMODE = EFFORTMODE.top_three_efforts
+        '''Escapes texts, but the highlight tags added by EffortHighlighter, which are restored as they were.'''
 
-        highlighted_df : DataFrame = self.__highlight_dataframe(
-            df = tts_by_month_df,
-            mode = mode
-        )
-        
-        return highlighted_df
-    def highlight_tts_by_year(self, tts_by_year_df : DataFrame) -> DataFrame:
-        
-        '''Returns the provided dataframe with adequate highlights.'''
+        pattern : re.Pattern = re.compile(self.__get_mark_pattern())
 
-        mode : EFFORTMODE = EFFORTMODE.top_three_efforts
+        return [
+            pattern.sub(r"<mark style='\1'>\2</mark>", escaped) if "&lt;/mark&gt;" in escaped else escaped
+            for escaped in (escape(text) for text in texts)
+        ]
+    def __create_cells(self, df : DataFrame, formatters : Optional[dict], styles : Optional[np.ndarray]) -> list[list[str]]:
 
-        highlighted_df : DataFrame = self.__highlight_dataframe(
-            df = tts_by_year_df,
-            mode = mode
-        )
-        
-        return highlighted_df
-    def highlight_tts_by_spv(self, tts_by_spv_df : DataFrame) -> DataFrame:
-    
-        '''Returns the provided dataframe with adequate highlights.'''
+        '''Returns one list of "<td>...</td>" strings for each column of df (by position, therefore duplicated column names are fine).'''
 
-        mode : EFFORTMODE = EFFORTMODE.top_three_efforts
+        formatters = formatters if isinstance(formatters, dict) else {}
+        columns : list[list[str]] = []
 
-        highlighted_df : DataFrame = self.__highlight_dataframe(
-            df = tts_by_spv_df,
-            mode = mode
-        )
-        
-        return highlighted_df
-    def highlight_tts_by_hashtag_year(self, tts_by_hashtag_year_df : DataFrame) -> DataFrame:
-        
-        '''Returns the provided dataframe with adequate highlights.'''
+        for idx, column_name in enumerate(df.columns):
 
-        mode : EFFORTMODE = EFFORTMODE.top_three_efforts
-        latest_year : str = self.__get_latest_year(tts_by_hashtag_year_df)
+            texts : list[str] = self.__escape_column(texts = self.__format_column(column = df.iloc[:, idx], formatter = formatters.get(column_name)))
 
-        highlighted_df : DataFrame = self.__highlight_dataframe(
-            df = tts_by_hashtag_year_df,
-            mode = mode,
-            column_names = [latest_year]
-        )
-        
-        return highlighted_df
-    def highlight_tts_by_hashtag(self, tts_by_hashtag_df : DataFrame) -> DataFrame:
-        
-        '''Returns the provided dataframe with adequate highlights.'''
+            if styles is None or not any(styles[:, idx]):
+                columns.append([f"<td>{text}</td>" for text in texts])
+            else:
+                columns.append([
+                    f"<td style=\"{style}\">{text}</td>" if style else f"<td>{text}</td>" 
+                    for style, text in zip(styles[:, idx].tolist(), texts)
+                ])
 
-        mode : EFFORTMODE = EFFORTMODE.top_three_efforts
+        return columns
 
-        highlighted_df : DataFrame = self.__highlight_dataframe(
-            df = tts_by_hashtag_df,
-            mode = mode
-        )
-        
-        return highlighted_df
-    def highlight_tts_by_year_month_spnv(self, tts_by_year_month_spnv_df : DataFrame) -> DataFrame:
-        
-        '''Returns the provided dataframe with adequate highlights.'''
+    def create_css(self) -> str:
 
-        mode : EFFORTMODE = EFFORTMODE.top_three_efforts
+        '''Returns the CSS rules shared by all the tables rendered by render(), with the same look as the former Styler-based tables.'''
 
-        highlighted_df : DataFrame = self.__highlight_dataframe(
-            df = tts_by_year_month_spnv_df,
-            mode = mode
+        table_class : str = self.__get_table_class()
+
+        return (
+            f".{table_class} {{ border-collapse: collapse; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif; font-size: 12px; color: #444; }}\n"
+            f".{table_class} thead th {{ background-color: #eeeeee; color: #333; font-weight: bold; padding: 8px 10px; text-align: left; border: none; }}\n"
+            f".{table_class} tbody td {{ padding: 8px 10px; text-align: left; border: none; white-space: nowrap; }}\n"
+            f".{table_class} tbody tr:nth-child(even) {{ background-color: #f5f5f5; }}\n"
         )
-        
-        return highlighted_df
-class TTAdapter():
+    def render_lines(self, df : DataFrame, formatters : Optional[dict] = None, styles : Optional[np.ndarray] = None, chunk_size : Optional[int] = None) -> Iterator[str]:
 
-    '''Adapts SettingBag properties for use in TT*Factory methods.'''
+        '''
+            Yields the HTML of df line by line (table opening, header, one line per row, table closing), without index.
 
-    __df_factory : TTDataFrameFactory
-    __effort_highlighter : EffortHighlighter
+            formatters maps column names to format strings (i.e. "{:.2f}") or functions, styles (same shape as df, optional) contains
+            the CSS declarations of each cell ("" for none). If chunk_size is provided, the cells are created chunk_size rows at a time,
+            so that no more than chunk_size rows are held as strings at once.
+        '''
 
-    def __init__(
-        self, 
-        df_factory : TTDataFrameFactory, 
-        effort_highlighter : EffortHighlighter) -> None:
-        
-        self.__df_factory = df_factory
-        self.__effort_highlighter = effort_highlighter
+        header : str = "".join(f"<th>{escape(str(column_name))}</th>" for column_name in df.columns)
 
-    def __create_tt_df(self, setting_bag : SettingBag) -> DataFrame:
+        yield f"<table class=\"{self.__get_table_class()}\">"
+        yield f"<thead><tr>{header}</tr></thead>"
+        yield "<tbody>"
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        row_template : str = "<tr>" + ("{}" * len(df.columns)) + "</tr>"
+        step : int = chunk_size if chunk_size is not None and chunk_size > 0 else max(len(df), 1)
 
-        tt_df : DataFrame = self.__df_factory.create_tt_df(
-            excel_path = setting_bag.excel_path,
-            excel_skiprows = setting_bag.excel_skiprows,
-            excel_nrows = setting_bag.excel_nrows,
-            excel_tabname = setting_bag.excel_tabname,
-            years = setting_bag.years
-        )
+        for start in range(0, len(df), step):
+            columns : list[list[str]] = self.__create_cells(
+                df = df.iloc[start:start + step],
+                formatters = formatters,
+                styles = styles[start:start + step] if styles is not None else None
+            )
 
-        return tt_df
-    def __create_tt_latest_four_df(self, tt_df : DataFrame) -> DataFrame:
+            for cells in zip(*columns):
+                yield row_template.format(*cells)
 
-        '''Creates the expected dataframes out of the provided arguments.'''
+        yield "</tbody>"
+        yield "</table>"
+    def render(self, df : DataFrame, formatters : Optional[dict] = None, styles : Optional[np.ndarray] = None) -> str:
 
-        return self.__df_factory.create_tt_latest_four_df(tt_df = tt_df)
-    def __create_tts_by_month_df(self, tt_df : DataFrame, setting_bag : SettingBag) -> DataFrame:
+        '''Same as render_lines(), but returns the whole HTML table as a single string.'''
 
-        '''Creates the expected dataframes out of the provided arguments.'''
+        return "\n".join(self.render_lines(df = df, formatters = formatters, styles = styles))
+class TTAssetBundle():
 
-        tts_by_month_df : DataFrame = self.__df_factory.create_tts_by_month_df(
-            tt_df = tt_df,
-            now = setting_bag.now
-        )
+    '''
+        Serves the assets of the report (i.e. the logo) from memory, so that rendering a report never touches the network:
 
-        return tts_by_month_df
-    def __create_tts_by_year_df(self, tt_df : DataFrame) -> DataFrame:
+            - inline() replaces their URLs in the HTML with data URIs;
+            - fetch() is the url_fetcher given to WeasyPrint, which refuses every URL that is neither a data URI nor in the bundle
+              (WeasyPrint then leaves the resource out instead of waiting for a connection).
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        If no assets are provided, it serves the ones that ship with nwtimetracking (see create_default_assets()).
+    '''
 
-        tts_by_year_df : DataFrame = self.__df_factory.create_tts_by_year_df(
-            tt_df = tt_df
-        )
+    __assets : dict[str, Tuple[str, bytes]]
 
-        return tts_by_year_df
-    def __create_tts_by_range_df(self, tt_df : DataFrame) -> DataFrame:
+    def __init__(self, assets : Optional[dict[str, Tuple[str, bytes]]] = None) -> None:
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        self.__assets = assets if assets is not None else TTAssetBundle.create_default_assets()
 
-        tts_by_range_df : DataFrame = self.__df_factory.create_tts_by_range_df(
-            tt_df = tt_df
+    @staticmethod
+    def create_default_assets() -> dict[str, Tuple[str, bytes]]:
+
+        '''Returns the assets that ship with nwtimetracking (i.e. the 120x120 PNG logo), keyed by the URL they replace.'''
+
+        logo_png : str = (
+            "iVBORw0KGgoAAAANSUhEUgAAAHgAAAB4BAMAAADLSivhAAAAGFBMVEX///////7+///8/Py5urw4PUIkKS8YHSTg+k0zAAAEDElEQVR42u2YvY7bRhDH/7uM"
+            "ixQSl6cyEY6yL91Joq2kdIBDCj9BXiFPF+QFEqRxG32nMxJRUH3ikGoCA8tJQVLc5Yd0UOGKKk5Dan8czs7nnvgFt38kOriDO7iDO7iDvxws1O2wSHfqZrj/"
+            "6bfVrbD49HH8p7oR5v14/biu/ig8dfHGV9mXu9HYv7ov7kYAPA/HfxLfgvsL9RpMFZjVM5LlU367PwcwOFI0/8GG+XfnydCewyAgfbd386sFQ939CsygyISj"
+            "2fwPfKjBAFhTAd+l8OUM/67kk2UyLcQ7qMYIOx2L+xRFjJ6OwPaG6SkvVtwIh8trviFACr8R1o/76mqmFyeGsJYOQmgVX3qUBW/sIIuBobXYFSHgtaVkaj7a"
+            "k5mV5tMJPZ+aYT0237Ie6gzAb9UsduZFEah2sos2eLNQtuqQlZHsdLEMpW5oOHWocFqZyR6ltjU2zEPDaKH8zMwi2UU6hdi2F8DDUdWN4/14O91nGyDhtsK0"
+            "bIjI/malNTUUSmlvL0+NCB0AKVO+c9GV8GQg1WRcrsETAeyOwIkVUgotT5lw8JMHbI0IVRJggtBTAEtACUIatGgWCWDuh1eanf3dAFMzeUxYThT0t/tqSDIA"
+            "pBxngtem2fUB7CxfhRFcCgEeX8vnNwdguyyNHivEUNhS9tpRNV0s+I4A9KnMZx9yVdSxSFAPOLRqjscB9HBvNU7OIhrrndI+BLmtZcgHsD/ahsXZehll5a/1"
+            "tfnhACSl0QpImZ79l00GgoB0ek5LJwQXT0p5R3YpqMLJ+wCsi7RkdQKGTCEA8IQR2gFmthsAGCTA6ZUVYtFW53V3q+Fa1aRSDEbrWuPgwrsMwL+7MA2JQEE/"
+            "hlaIpVlgrzKXXYCTnm82jglAc4ZwggCY8xWYB3tgSbkOYgV4hXdHtYGrOsSNEgB/5Tqk8lFG9A4QG74EJ5Og4kwAeDvIhh15WbO4LzbYSKGe8GRTD6rCPNii"
+            "1lp8T7xscDUdyTIfzRRNao2qCU5+DCpdFjhAcAAAveDKyOzWuqwTu/lG+fbsUIP5YVs3ThUb5V3RLALfkHOEnfWLJv2kV7qDtALQ8wkj2TAtNBwTBsJwlW+l"
+            "0uGaZh5tUD87iD4Axyp/jZrjSWWUOSggvg/qB5EGWLq+5SuH3JbzSwPMb0rTnHWhT9UDrPFcdXeOBFayQJw1KuWvLICB1TiwMkpg7zsC2JMarh1gZ3gO4MO5"
+            "cZQDlXrOPaUq058Bxz8bFvHDx+JC0Fmqm1zA8rU5EQtSlLUKCvQqk+KzVD9XRVEUUdk4nNnf9wAge4UkztKVUyx/P5xnxyR+0DWp/DizJvrz19+8/S97eIPU"
+            "1qvOcZLPyo3SFdhY1iR1/3Do4A7u4A7u4C8I/w9ZXoSuEwH0dQAAAABJRU5ErkJggg=="
         )
 
-        return tts_by_range_df
-    def __create_tts_by_spn_df(self, tt_df : DataFrame, setting_bag : SettingBag) -> DataFrame:
+        return { REPORTSTR.LOGOURL : ("image/png", base64.b64decode(logo_png)) }
+    def __create_data_uri(self, mime_type : str, content : bytes) -> str:
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        '''Example: "data:image/png;base64,iVBORw0KGgo...".'''
 
-        tts_by_spn_df : DataFrame = self.__df_factory.create_tts_by_spn_df(
-            tt_df = tt_df,
-            software_project_names = setting_bag.tts_by_spn_software_project_names
-        )
+        return f"data:{mime_type};base64,{base64.b64encode(content).decode('ascii')}"
 
-        return tts_by_spn_df
-    def __create_tts_by_spv_df(self, tt_df : DataFrame, setting_bag : SettingBag) -> DataFrame:
+    @staticmethod
+    def load_asset(file_path : str) -> Tuple[str, bytes]:
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        '''Returns the MIME type (guessed from the extension) and the content of file_path, ready to be put in a bundle.'''
 
-        tts_by_spn_spv_df : DataFrame = self.__df_factory.create_tts_by_spv_df(
-            tt_df = tt_df,
-            software_project_names = setting_bag.tts_by_spv_software_project_names
-        )
+        mime_type : Optional[str] = mimetypes.guess_type(file_path)[0]
 
-        return tts_by_spn_spv_df
-    def __create_tts_by_hashtag_year_df(self, tt_df : DataFrame) -> DataFrame:
+        return (mime_type if mime_type is not None else "application/octet-stream", Path(file_path).read_bytes())
+    def inline(self, html : str) -> str:
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        '''Replaces the URL of each asset in html with its data URI.'''
 
-        tts_by_hashtag_year_df : DataFrame = self.__df_factory.create_tts_by_hashtag_year_df(tt_df = tt_df)
+        for url, (mime_type, content) in self.__assets.items():
+            if url in html:
+                html = html.replace(url, self.__create_data_uri(mime_type = mime_type, content = content))
 
-        return tts_by_hashtag_year_df
-    def __create_tts_by_hashtag_df(self, tt_df : DataFrame) -> DataFrame:
+        return html
+    def fetch(self, url : str, timeout : int = 10, ssl_context : Any = None) -> dict[str, Any]:
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        '''Same signature and return value as WeasyPrint's default_url_fetcher(), but it serves data URIs and the bundle only.'''
 
-        tts_by_hashtag_df : DataFrame = self.__df_factory.create_tts_by_hashtag_df(tt_df = tt_df)
+        if url.startswith("data:"):
+            return default_url_fetcher(url)
 
-        return tts_by_hashtag_df
-    def __create_tts_by_year_month_spnv_df(self, tt_df : DataFrame, setting_bag : SettingBag) -> DataFrame:
+        if url not in self.__assets:
+            raise ValueError(_MessageCollection.provided_url_not_in_asset_bundle(url = url))
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        mime_type, content = self.__assets[url]
 
-        tts_by_year_month_spnv_df : DataFrame = self.__df_factory.create_tts_by_year_month_spnv_df(
-            tt_df = tt_df,
-            software_project_names = setting_bag.tts_by_spv_software_project_names
-        )
+        return { "string" : content, "mime_type" : mime_type, "redirected_url" : url }
+class TTReportCache():
 
-        return tts_by_year_month_spnv_df
-    def __create_tts_by_timeranges_df(self, tt_df : DataFrame, setting_bag : SettingBag) -> DataFrame:
+    '''
+        Persists the HTML sections of the latest report saved in a folder, keyed by a hash of their content, together with a hash of the whole document.
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        Both are plain strings, so they are stored as JSON.
+    '''
 
-        tts_by_timeranges_df : DataFrame = self.__df_factory.create_tts_by_timeranges_df(
-            tt_df = tt_df,
-            min_occurrences = setting_bag.tts_by_timeranges_min_occurrences
-        )
+    def __create_file_path(self, folder_path : str) -> Path:
 
-        return tts_by_timeranges_df
-    def __create_ttd_effort_status_df(self, tt_df : DataFrame, setting_bag : SettingBag) -> DataFrame:
+        '''Example: /home/nwtimetracking/TTREPORTCACHE.json'''
 
-        '''Creates the expected dataframe out of the provided arguments.'''
+        return Path(folder_path) / "TTREPORTCACHE.json"
 
-        ttd_effort_status_df : DataFrame = self.__df_factory.create_ttd_effort_status_df(
-            tt_df = tt_df,
-            is_correct = setting_bag.ttd_effort_status_is_correct
-        )
+    def load(self, folder_path : str) -> Tuple[Optional[str], dict[str, str]]:
 
-        return ttd_effort_status_df
+        '''Returns the document key and the HTML sections stored in folder_path, or (None, {}) if there are none or if the file is malformed.'''
 
-    def create_summary(self, setting_bag : SettingBag) -> TTSummary:
+        file_path : Path = self.__create_file_path(folder_path = folder_path)
 
-        '''Creates a TTSummary object out of setting_bag.'''
-
-        tt_df : DataFrame = self.__create_tt_df(setting_bag = setting_bag)
-        tt_latest_four_df : DataFrame = self.__create_tt_latest_four_df(tt_df = tt_df)
-        tts_by_month_df : DataFrame = self.__create_tts_by_month_df(tt_df = tt_df, setting_bag = setting_bag)
-        tts_by_year_df : DataFrame = self.__create_tts_by_year_df(tt_df = tt_df)
-        tts_by_range_df : DataFrame = self.__create_tts_by_range_df(tt_df = tt_df)
-        tts_by_spn_df : DataFrame = self.__create_tts_by_spn_df(tt_df = tt_df, setting_bag = setting_bag)
-        tts_by_spv_df : DataFrame = self.__create_tts_by_spv_df(tt_df = tt_df, setting_bag = setting_bag)
-        tts_by_hashtag_year_df : DataFrame = self.__create_tts_by_hashtag_year_df(tt_df = tt_df)
-        tts_by_hashtag_df : DataFrame = self.__create_tts_by_hashtag_df(tt_df = tt_df)
-        tts_by_year_month_spnv_df : DataFrame = self.__create_tts_by_year_month_spnv_df(tt_df = tt_df, setting_bag = setting_bag)
-        tts_by_timeranges_df : DataFrame = self.__create_tts_by_timeranges_df(tt_df = tt_df, setting_bag = setting_bag)
-        ttd_effort_status_df : DataFrame = self.__create_ttd_effort_status_df(tt_df = tt_df, setting_bag = setting_bag)
-        definitions_df : DataFrame = self.__df_factory.create_definitions_df()
-
-        if setting_bag.enable_effort_highlighting:
-            tts_by_month_df = self.__effort_highlighter.highlight_tts_by_month(tts_by_month_df = tts_by_month_df)
-            tts_by_year_df = self.__effort_highlighter.highlight_tts_by_year(tts_by_year_df = tts_by_year_df)
-            tts_by_spv_df = self.__effort_highlighter.highlight_tts_by_spv(tts_by_spv_df = tts_by_spv_df)
-            tts_by_hashtag_year_df = self.__effort_highlighter.highlight_tts_by_hashtag_year(tts_by_hashtag_year_df = tts_by_hashtag_year_df)
-            tts_by_hashtag_df = self.__effort_highlighter.highlight_tts_by_hashtag(tts_by_hashtag_df = tts_by_hashtag_df)
-            tts_by_year_month_spnv_df = self.__effort_highlighter.highlight_tts_by_year_month_spnv(tts_by_year_month_spnv_df = tts_by_year_month_spnv_df)
-
-        tt_summary : TTSummary = TTSummary(
-            tt_df = tt_df,
-            tt_latest_four_df = tt_latest_four_df,
-            tts_by_month_df = tts_by_month_df,
-            tts_by_year_df = tts_by_year_df,
-            tts_by_range_df = tts_by_range_df,
-            tts_by_spn_df = tts_by_spn_df,
-            tts_by_spv_df = tts_by_spv_df,
-            tts_by_hashtag_year_df = tts_by_hashtag_year_df,
-            tts_by_hashtag_df = tts_by_hashtag_df,
-            tts_by_year_month_spnv_df = tts_by_year_month_spnv_df,
-            tts_by_timeranges_df = tts_by_timeranges_df,
-            ttd_effort_status_df = ttd_effort_status_df,
-            definitions_df = definitions_df
-        )
+        if not file_path.exists():
+            return (None, {})
 
-        return tt_summary
+        try:
+            content : Any = json.loads(file_path.read_text(encoding = "utf-8"))
+            document_key : Optional[str] = content["document_key"]
+            section_cache : dict[str, str] = dict(content["section_cache"])
+        except (ValueError, TypeError, KeyError):
+            return (None, {})
+
+        return (document_key, section_cache)
+    def save(self, folder_path : str, document_key : str, section_cache : dict[str, str]) -> None:
+
+        '''Stores document_key and section_cache in folder_path.'''
+
+        file_path : Path = self.__create_file_path(folder_path = folder_path)
+        file_path.parent.mkdir(parents = True, exist_ok = True)
+
+        file_path.write_text(data = json.dumps({ "document_key": document_key, "section_cache": section_cache }), encoding = "utf-8")
 class TTReportManager():
 
     '''Collects all the logic related to the creation of reports out of TTSummary objects.'''
 
+    __table_renderer : TTHTMLTableRenderer
+    __report_cache : TTReportCache
+    __asset_bundle : TTAssetBundle
+
+    def __init__(
+        self,
+        table_renderer : Optional[TTHTMLTableRenderer] = None,
+        report_cache : Optional[TTReportCache] = None,
+        asset_bundle : Optional[TTAssetBundle] = None) -> None:
+
+        self.__table_renderer = table_renderer if table_renderer is not None else TTHTMLTableRenderer()
+        self.__report_cache = report_cache if report_cache is not None else TTReportCache()
+        self.__asset_bundle = asset_bundle if asset_bundle is not None else TTAssetBundle()
+
     def __format_for_file_name(self, last_update : datetime) ->  str:
 
         '''Example: "20251222".'''
@@ -1689,76 +4257,240 @@ class TTReportManager():
         pdf_path : Path = base_path.with_suffix(".pdf")
 
         return (html_path, pdf_path)
-    def __create_html(self, df : DataFrame, title : str, formatters : Optional[dict], footer : Optional[str] = None) -> str:
+    def __create_html_lines(
+        self,
+        df : DataFrame,
+        title : str,
+        formatters : Optional[dict],
+        footer : Optional[str] = None,
+        mask : Optional[DataFrame] = None,
+        chunk_size : Optional[int] = None) -> Iterator[str]:
+
+        '''Same as __create_html(), but it yields the HTML piece by piece (one line per table row, see TTHTMLTableRenderer.render_lines()).'''
+
+        styles : Optional[np.ndarray] = None
+
+        if mask is not None:
+            styles = self.__create_background_styles(intensities = mask.to_numpy(dtype = float))
+
+        footer_html : str = (
+                f"<br/><div style='margin-top: 6px; font-size: 14px; color: #666;'>{footer}</div>"
+                if footer
+                else ""
+            )
 
-        """Converts the provided DataFrame into a styled HTML table using a layout similar to Jupyter Notebook."""
+        yield f"<div style='margin-bottom: 20px;'><h2>{title}</h2>\n"
+
+        for line in self.__table_renderer.render_lines(df = df, formatters = formatters, styles = styles, chunk_size = chunk_size):
+            yield f"{line}\n"
+
+        yield f"{footer_html}</div>"
+    def __create_html(self, df : DataFrame, title : str, formatters : Optional[dict], footer : Optional[str] = None, mask : Optional[DataFrame] = None) -> str:
+
+        """
+            Converts the provided DataFrame into an HTML table using a layout similar to Jupyter Notebook (see TTHTMLTableRenderer.create_css()).
+
+            If mask is provided, its highlights are rendered as background colors (see create_styler()).
+        """
+
+        return "".join(self.__create_html_lines(df = df, title = title, formatters = formatters, footer = footer, mask = mask))
+    def __create_heatmap_html(self, matrix_df : DataFrame, title : str) -> str:
+
+        '''Converts the provided matrix into a heatmap, after removing the rows and columns that contain only zeros.'''
+
+        condition_rows : Series = (matrix_df.sum(axis = 1) > 0)
+        condition_columns : Series = (matrix_df.sum(axis = 0) > 0)
+        heatmap_df : DataFrame = matrix_df.loc[condition_rows, condition_columns]
 
         styled = (
-            df.style
-            .format(formatters)
-            .hide(axis="index")
+            heatmap_df.style
+            .background_gradient(cmap = "Blues", axis = None)
             .set_table_styles(
                 [
                     {
-                        "selector": "thead th", 
-                        "props": "background-color: #eeeeee; color: #333; font-weight: bold; padding: 8px 10px; text-align: left; border: none;"
-                    },
-                    {
-                        "selector": "tbody td", 
-                        "props": "padding: 8px 10px; text-align: left; border: none; white-space: nowrap;"
+                        "selector": "th", 
+                        "props": "background-color: #eeeeee; color: #333; font-weight: bold; padding: 2px 4px; border: none;"
                     },
                     {
-                        "selector": "tbody tr:nth-child(even)", 
-                        "props": "background-color: #f5f5f5;"
+                        "selector": "td", 
+                        "props": "padding: 2px 4px; text-align: center; border: none;"
                     },
                     {
                         "selector": "", 
-                        "props": "border-collapse: collapse; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif; font-size: 12px; color: #444;"
+                        "props": "border-collapse: collapse; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif; font-size: 9px; color: #444;"
                     }
                 ]
             )
         )
 
-        footer_html : str = (
-                f"<br/><div style='margin-top: 6px; font-size: 14px; color: #666;'>{footer}</div>"
-                if footer
-                else ""
-            )
-    
         return (
             "<div style='margin-bottom: 20px;'>"
             f"<h2>{title}</h2>\n"
             f"{styled.to_html()}\n"
-            f"{footer_html}"
             "</div>"
             )
-    def __create_html_sections(self, tt_summary : TTSummary, formatters : Optional[dict]) -> list[str]:
+    def __create_section_key(self, df : DataFrame, title : str, formatters : Optional[dict], mask : Optional[DataFrame] = None) -> Optional[str]:
+
+        '''
+            Returns a SHA-256 hash of everything the HTML section of df depends on: its cells, columns and dtypes, title, formatters and mask.
+
+            The cells that can't be hashed as they are (i.e. lists) are hashed as strings.
+
+            It returns None if any formatter is callable, because what a function does can't be hashed (and its repr contains a 
+            memory address, which changes at every run), therefore the section can't be cached.
+        '''
+
+        if formatters is not None and any(callable(formatter) for formatter in formatters.values()):
+            return None
+
+        formatters_key : list[Tuple[str, str]] = sorted((str(column), str(formatter)) for column, formatter in (formatters or {}).items())
+
+        hasher = hashlib.sha256()
+        hasher.update(f"{title}|{list(df.columns)}|{df.dtypes.tolist()}|{formatters_key}".encode("utf-8"))
+
+        try:
+            row_hashes : Series = pd.util.hash_pandas_object(df, index = True)
+        except TypeError:
+            row_hashes = pd.util.hash_pandas_object(df.astype(str), index = True)
+
+        hasher.update(row_hashes.to_numpy().tobytes())
+
+        if mask is not None:
+            hasher.update(mask.to_numpy(dtype = float).tobytes())
+
+        return hasher.hexdigest()
+    def __create_cached_html(
+        self, 
+        create_html : Callable[[], str], 
+        df : DataFrame, 
+        title : str, 
+        formatters : Optional[dict], 
+        mask : Optional[DataFrame],
+        previous_sections : Optional[dict[str, str]],
+        current_sections : dict[str, str]) -> str:
+
+        '''
+            Returns the HTML section of df from previous_sections if it's there, otherwise it calls create_html(). Either way, the section is stored into current_sections.
+
+            The sections that have no key (see __create_section_key()) are always created and never stored.
+        '''
+
+        if previous_sections is None:
+            return create_html()
+
+        key : Optional[str] = self.__create_section_key(df = df, title = title, formatters = formatters, mask = mask)
+
+        if key is None:
+            return create_html()
+
+        current_sections[key] = previous_sections[key] if key in previous_sections else create_html()
+
+        return current_sections[key]
+    def __create_section_specs(self, tt_summary : TTSummary) -> list[Tuple[DataFrame, str, Optional[str], bool]]:
+
+        '''Returns the df, title, name of the highlight mask (None if it has none) and whether it's a heatmap of each report section, in order.'''
+
+        specs : list[Tuple[DataFrame, str, Optional[str], bool]] = [
+            (tt_summary.tt_latest_four_df, REPORTSTR.TTLATESTFIVE, None, False),
+            (tt_summary.tts_by_month_df, REPORTSTR.TTSBYMONTH, "tts_by_month_df", False),
+            (tt_summary.tts_by_year_df, REPORTSTR.TTSBYYEAR, "tts_by_year_df", False),
+            (tt_summary.tts_by_range_df, REPORTSTR.TTSBYRANGE, None, False)
+        ]
+
+        if not tt_summary.tts_by_quarter_df.empty:
+            specs.append((tt_summary.tts_by_quarter_df, REPORTSTR.TTSBYQUARTER, None, False))
+
+        if not tt_summary.tts_by_week_df.empty:
+            specs.append((tt_summary.tts_by_week_df, REPORTSTR.TTSBYWEEK, None, False))
+
+        if not tt_summary.tts_by_day_df.empty:
+            specs.append((tt_summary.tts_by_day_df, REPORTSTR.TTSBYDAY, None, False))
+
+        specs.extend([
+            (tt_summary.tts_by_spn_df, REPORTSTR.TTSBYSPN, None, False),
+            (tt_summary.tts_by_spv_df, REPORTSTR.TTSBYSPV, "tts_by_spv_df", False),
+            (tt_summary.tts_by_hashtag_year_df, REPORTSTR.TTSBYHASHTAGYEAR, "tts_by_hashtag_year_df", False),
+            (tt_summary.tts_by_hashtag_df, REPORTSTR.TTSBYHASHTAG, "tts_by_hashtag_df", False),
+            (tt_summary.tts_by_year_month_spnv_df, REPORTSTR.TTSBYYEARMONTHSPNV, "tts_by_year_month_spnv_df", False),
+            (tt_summary.tts_by_timeranges_df, REPORTSTR.TTSBYTIMERANGES, None, False)
+        ])
+
+        if not tt_summary.tts_timerange_matrix_df.empty:
+            specs.append((tt_summary.tts_timerange_matrix_df, REPORTSTR.TTSTIMERANGEMATRIX, None, True))
 
-        '''Converts summary to a collection of HTML code blocks.'''
+        specs.append((tt_summary.definitions_df, REPORTSTR.DEFINITIONS, None, False))
+
+        return specs
+    def __create_section(self, df : DataFrame, title : str, formatters : Optional[dict], mask_name : Optional[str], is_heatmap : bool, masks : dict[str, DataFrame]) -> str:
+
+        '''Converts one report section to HTML (see __create_section_specs()).'''
+
+        if is_heatmap:
+            return self.__create_heatmap_html(df, title)
+
+        if mask_name is None:
+            return self.__create_html(df, title, formatters)
+
+        return self.__create_html(df, title, formatters, mask = masks.get(mask_name))
+    def __create_html_sections(self, tt_summary : TTSummary, formatters : Optional[dict], section_cache : Optional[dict[str, str]] = None) -> list[str]:
+
+        '''
+            Converts summary to a collection of HTML code blocks.
+
+            If section_cache is provided, the sections whose key (see __create_section_key()) is in it are reused instead of being created,
+            and section_cache is then replaced with the sections of this report.
+        '''
 
         html_sections: list[str] = []
-        
-        html_sections.append(self.__create_html(tt_summary.tt_latest_four_df, REPORTSTR.TTLATESTFIVE, formatters))
-        html_sections.append(self.__create_html(tt_summary.tts_by_month_df, REPORTSTR.TTSBYMONTH, formatters))
-        html_sections.append(self.__create_html(tt_summary.tts_by_year_df, REPORTSTR.TTSBYYEAR, formatters))
-        html_sections.append(self.__create_html(tt_summary.tts_by_range_df, REPORTSTR.TTSBYRANGE, formatters))
-        html_sections.append(self.__create_html(tt_summary.tts_by_spn_df, REPORTSTR.TTSBYSPN, formatters))
-        html_sections.append(self.__create_html(tt_summary.tts_by_spv_df, REPORTSTR.TTSBYSPV, formatters))
-        html_sections.append(self.__create_html(tt_summary.tts_by_hashtag_year_df, REPORTSTR.TTSBYHASHTAGYEAR, formatters))
-        html_sections.append(self.__create_html(tt_summary.tts_by_hashtag_df, REPORTSTR.TTSBYHASHTAG, formatters))        
-        html_sections.append(self.__create_html(tt_summary.tts_by_year_month_spnv_df, REPORTSTR.TTSBYYEARMONTHSPNV, formatters))
-        html_sections.append(self.__create_html(tt_summary.tts_by_timeranges_df, REPORTSTR.TTSBYTIMERANGES, formatters))
-        html_sections.append(self.__create_html(tt_summary.definitions_df, REPORTSTR.DEFINITIONS, formatters))
+        masks : dict[str, DataFrame] = tt_summary.highlight_masks
+        previous_sections : Optional[dict[str, str]] = dict(section_cache) if section_cache is not None else None
+        current_sections : dict[str, str] = {}
+
+        for df, title, mask_name, is_heatmap in self.__create_section_specs(tt_summary = tt_summary):
+            html_sections.append(self.__create_cached_html(
+                create_html = lambda : self.__create_section(df, title, formatters, mask_name, is_heatmap, masks),
+                df = df,
+                title = title,
+                formatters = formatters,
+                mask = masks.get(mask_name) if mask_name is not None else None,
+                previous_sections = previous_sections,
+                current_sections = current_sections
+            ))
+
+        if section_cache is not None:
+            section_cache.clear()
+            section_cache.update(current_sections)
+
+        return html_sections
+    def __write_html_sections(self, file : Any, tt_summary : TTSummary, formatters : Optional[dict], chunk_size : int) -> None:
+
+        '''Same as __create_html_sections(), but it writes the sections into file piece by piece, chunk_size table rows at a time.'''
+
+        masks : dict[str, DataFrame] = tt_summary.highlight_masks
+
+        for df, title, mask_name, is_heatmap in self.__create_section_specs(tt_summary = tt_summary):
+            if is_heatmap:
+                file.write(self.__create_heatmap_html(df, title))
+                continue
+
+            mask : Optional[DataFrame] = masks.get(mask_name) if mask_name is not None else None
 
-        return html_sections
-    def __create_html_template(self, html_sections : list[str], last_update : datetime) -> str:
+            for piece in self.__create_html_lines(df = df, title = title, formatters = formatters, mask = mask, chunk_size = chunk_size):
+                file.write(piece)
+    def __create_html_head(self, last_update : datetime, include_header : bool = True) -> str:
 
-        '''Creates HTML template.'''
+        '''Creates the part of the HTML template that comes before the sections (the header can be left out, when the report is rendered in parts).'''
 
         report_title : str = "Time Tracking Report"
-        app_name : str = "nwtimetracking"
 
-        full_html: str = f"""
+        header_html : str = (
+            f"<img src='{REPORTSTR.LOGOURL}' alt='NW logo' style='width:120px; height:120px; margin-bottom:10px;'>\n"
+            f"<h1>{report_title} | {self.__format_for_title(last_update)}</h1>"
+            if include_header
+            else ""
+        )
+
+        head_html: str = f"""
         <html>
         <head>
             <meta charset="utf-8">
@@ -1783,26 +4515,198 @@ class TTReportManager():
                     line-height: 1.5;
                     font-size: 12px;
                 }}                
+                {self.__table_renderer.create_css()}
             </style>
         </head>
         <body>
-            <img src='https://avatars.githubusercontent.com/u/10279234' alt='NW logo' style='width:120px; height:120px; margin-bottom:10px;'>
-            <h1>{report_title} | {self.__format_for_title(last_update)}</h1>
-            {''.join(html_sections)}
-            <br/><p>© 2025 numbworks. This report is generated by '{app_name}' and licensed under the MIT License. Additional information: <a href="https://github.com/numbworks">github.com/numbworks</a>.</p>
+            {header_html}
+            """
+
+        return self.__asset_bundle.inline(html = head_html)
+    def __create_html_tail(self, include_footer : bool = True) -> str:
+
+        '''Creates the part of the HTML template that comes after the sections (the footer can be left out, when the report is rendered in parts).'''
+
+        app_name : str = "nwtimetracking"
+
+        footer_html : str = (
+            f"<br/><p>© 2025 numbworks. This report is generated by '{app_name}' and licensed under the MIT License. Additional information: <a href=\"https://github.com/numbworks\">github.com/numbworks</a>.</p>"
+            if include_footer
+            else ""
+        )
+
+        tail_html : str = f"""
+            {footer_html}
         </body>
         </html>
         """
-        
-        return full_html
+
+        return self.__asset_bundle.inline(html = tail_html)
+    def __create_html_template(self, html_sections : list[str], last_update : datetime, include_header : bool = True, include_footer : bool = True) -> str:
+
+        '''Creates HTML template (the header and the footer can be left out, when the report is rendered in parts).'''
+
+        head_html : str = self.__create_html_head(last_update = last_update, include_header = include_header)
+        tail_html : str = self.__create_html_tail(include_footer = include_footer)
+
+        return f"{head_html}{''.join(html_sections)}{tail_html}"
+    def __write_html_file(self, file_path : Path, tt_summary : TTSummary, formatters : Optional[dict], last_update : datetime, chunk_size : int) -> None:
+
+        '''Writes the same HTML as __create_html_template() into file_path piece by piece, without ever holding the whole report in memory.'''
+
+        with open(file_path, mode = "w", encoding = "utf-8") as file:
+            file.write(self.__create_html_head(last_update = last_update))
+            self.__write_html_sections(file = file, tt_summary = tt_summary, formatters = formatters, chunk_size = chunk_size)
+            file.write(self.__create_html_tail())
+    def __save_as_streamed_report(
+        self,
+        tt_summary: TTSummary,
+        html_path : Path,
+        pdf_path : Path,
+        last_update : datetime,
+        save_html : bool,
+        save_pdf : bool,
+        formatters : Optional[dict],
+        chunk_size : int) -> None:
+
+        '''
+            Streams the HTML report to html_path (see __write_html_file()) and renders the PDF from that file.
+
+            If the HTML report isn't requested, it's streamed to a temporary file next to pdf_path, which is removed afterwards.
+        '''
+
+        if not save_html and not save_pdf:
+            return
+
+        file_path : Path = html_path if save_html else pdf_path.with_suffix(".tmp.html")
+
+        try:
+            self.__write_html_file(file_path = file_path, tt_summary = tt_summary, formatters = formatters, last_update = last_update, chunk_size = chunk_size)
+
+            if save_pdf:
+                HTML(filename = str(file_path), encoding = "utf-8", url_fetcher = self.__asset_bundle.fetch).write_pdf(target = str(pdf_path), stylesheets = [self.__create_stylesheet()])
+        finally:
+            if not save_html:
+                file_path.unlink(missing_ok = True)
+    def __create_background_styles(self, intensities : np.ndarray) -> np.ndarray:
+
+        '''
+            Converts a matrix of intensities into a matrix of CSS declarations, the same colors as the tags of EffortHighlighter:
+            
+                1.0 => "background-color: pink", 0.5 => "background-color: rgba(255, 192, 203, 0.50)", 0.0 => "".
+        '''
+
+        styles : np.ndarray = np.full(shape = intensities.shape, fill_value = "", dtype = object)
+
+        for intensity in np.unique(intensities[intensities > 0]).tolist():
+            color : str = "pink" if intensity >= 1.0 else f"rgba(255, 192, 203, {intensity:.2f})"
+            styles[intensities == intensity] = f"background-color: {color}"
+
+        return styles
+    def __get_page_css(self) -> str:
+
+        '''Returns the CSS of the report pages.'''
+
+        return "@page { size: A3 landscape; margin: 20mm; }"
     def __create_stylesheet(self):
 
         '''Creates a CSS stylesheet.'''
 
-        stylesheet : CSS = CSS(string = "@page { size: A3 landscape; margin: 20mm; }")
+        stylesheet : CSS = CSS(string = self.__get_page_css())
         
         return stylesheet
-    
+    def __create_document_key(self, full_html : str, max_workers : int) -> str:
+
+        '''Returns a SHA-256 hash of full_html and of max_workers (which decides where the PDF pages break).'''
+
+        return hashlib.sha256(f"{max_workers}|{full_html}".encode("utf-8")).hexdigest()
+    def __are_report_files_saved(self, html_path : Path, pdf_path : Path, save_html : bool, save_pdf : bool) -> bool:
+
+        '''Returns True if all the requested report files exist.'''
+
+        return (not save_html or html_path.exists()) and (not save_pdf or pdf_path.exists())
+    def __split_html_sections(self, html_sections : list[str], parts : int) -> list[list[str]]:
+
+        '''
+            Splits html_sections in (at most) parts contiguous groups, each one with a similar amount of HTML (in characters), 
+            which is a proxy of the time WeasyPrint needs to lay it out. The order of the sections is preserved.
+        '''
+
+        sizes : np.ndarray = np.array([len(html_section) for html_section in html_sections], dtype = float)
+        starts : np.ndarray = np.cumsum(sizes) - sizes
+        group_ids : np.ndarray = np.minimum((starts * parts / max(sizes.sum(), 1)).astype(int), parts - 1)
+
+        groups : list[list[str]] = []
+        for group_id, group in itertools.groupby(zip(group_ids.tolist(), html_sections), key = lambda x : x[0]):
+            groups.append([html_section for _, html_section in group])
+
+        return groups
+    def __merge_pdfs(self, pdfs : list[bytes], pdf_path : Path) -> None:
+
+        '''Writes the pages of all pdfs, in order, as a single PDF to pdf_path.'''
+
+        writer : PdfWriter = PdfWriter()
+
+        for pdf in pdfs:
+            writer.append(fileobj = BytesIO(pdf))
+
+        with open(pdf_path, "wb") as file:
+            writer.write(file)
+    def __write_pdf_in_parts(self, html_sections : list[str], last_update : datetime, pdf_path : Path, max_workers : int) -> None:
+
+        '''
+            Splits html_sections in max_workers parts (see __split_html_sections()), renders each of them to its own PDF concurrently 
+            in a ProcessPoolExecutor (see _PDFWorker), then merges their pages, in order, into a single PDF (see __merge_pdfs()).
+
+            The header is rendered only in the first part and the footer only in the last one. Each part starts on a new page.
+        '''
+
+        groups : list[list[str]] = self.__split_html_sections(html_sections = html_sections, parts = max_workers)
+        htmls : list[str] = [ 
+            self.__create_html_template(
+                html_sections = group, 
+                last_update = last_update, 
+                include_header = (idx == 0), 
+                include_footer = (idx == len(groups) - 1)
+            ) 
+            for idx, group in enumerate(groups) 
+        ]
+
+        page_css : str = self.__get_page_css()
+
+        with ProcessPoolExecutor(max_workers = min(max_workers, len(htmls))) as executor:
+            pdfs : list[bytes] = list(executor.map(_PDFWorker.write_pdf, htmls, itertools.repeat(page_css), itertools.repeat(self.__asset_bundle)))
+
+        self.__merge_pdfs(pdfs = pdfs, pdf_path = pdf_path)
+
+    def create_styler(self, df : DataFrame, formatters : Optional[dict] = None, mask : Optional[DataFrame] = None) -> Styler:
+
+        '''
+            Creates a Styler out of df that applies formatters and hides the index. 
+            
+            If mask is provided (same shape as df), the cells for which it's True get a pink background at render time, while df is left untouched.
+            A numeric mask (EFFORTMODE.heat_scale) is read as the intensity of the pink background of each cell (0.0 means no background).
+            Since Styler.apply() doesn't support duplicated column names (i.e. "↕"), the columns are styled by position and relabeled afterwards.
+        '''
+
+        if mask is None:
+            return df.style.format(formatters).hide(axis = "index")
+
+        column_names : list[str] = [str(column_name) for column_name in df.columns]
+        positional_formatters : Optional[dict] = (
+            { i: formatters[column_name] for i, column_name in enumerate(df.columns) if column_name in formatters }
+            if isinstance(formatters, dict) else formatters
+        )
+        styles : np.ndarray = self.__create_background_styles(intensities = mask.to_numpy(dtype = float))
+
+        return (
+            df.set_axis(range(len(column_names)), axis = "columns")
+            .style
+            .format(positional_formatters)
+            .apply(lambda _ : styles, axis = None)
+            .relabel_index(column_names, axis = "columns")
+            .hide(axis = "index")
+        )
     def save_as_report(
         self, 
         tt_summary: TTSummary, 
@@ -1810,19 +4714,112 @@ class TTReportManager():
         last_update : datetime, 
         save_html : bool, 
         save_pdf : bool, 
-        formatters : Optional[dict] = None) -> None:
-        
-        '''Builds an HTML report from selected DataFrames in RLSummary and saves it as both HTML and PDF.'''
+        formatters : Optional[dict] = None,
+        max_workers : int = 1,
+        enable_cache : bool = False,
+        enable_streaming : bool = False,
+        chunk_size : int = 10000) -> None:
+
+        '''
+            Builds an HTML report from selected DataFrames in RLSummary and saves it as both HTML and PDF.
+
+            If max_workers is greater than 1, the PDF is rendered in max_workers parts by as many processes (see __write_pdf_in_parts()).
+
+            If enable_cache is True, the unchanged sections of the latest report saved in folder_path are reused (see TTReportCache) and,
+            if the whole document is unchanged and its files are still there, nothing is written.
+
+            If enable_streaming is True, the HTML is written to its file while it's created, chunk_size table rows at a time,
+            and the PDF is rendered from that file (see __save_as_streamed_report()). max_workers and enable_cache are ignored.
+        '''
 
         html_path, pdf_path = self.__create_report_file_paths(folder_path = folder_path, last_update = last_update)
-        html_sections : list[str] = self.__create_html_sections(tt_summary = tt_summary, formatters = formatters)
+
+        if enable_streaming:
+            self.__save_as_streamed_report(
+                tt_summary = tt_summary,
+                html_path = html_path,
+                pdf_path = pdf_path,
+                last_update = last_update,
+                save_html = save_html,
+                save_pdf = save_pdf,
+                formatters = formatters,
+                chunk_size = chunk_size
+            )
+            return
+
+        if not enable_cache:
+            html_sections : list[str] = self.__create_html_sections(tt_summary = tt_summary, formatters = formatters)
+        else:
+            previous_document_key, section_cache = self.__report_cache.load(folder_path = folder_path)
+            html_sections = self.__create_html_sections(tt_summary = tt_summary, formatters = formatters, section_cache = section_cache)
+
         full_html : str = self.__create_html_template(html_sections = html_sections, last_update = last_update)
 
+        if enable_cache:
+            document_key : str = self.__create_document_key(full_html = full_html, max_workers = max_workers)
+
+            if document_key == previous_document_key and self.__are_report_files_saved(html_path, pdf_path, save_html, save_pdf):
+                return
+
         if save_html:
             html_path.write_text(data = full_html, encoding = "utf-8")
         
-        if save_pdf:
-            HTML(string = full_html).write_pdf(target = str(pdf_path), stylesheets = [self.__create_stylesheet()])
+        if save_pdf and max_workers > 1 and len(html_sections) > 1:
+            self.__write_pdf_in_parts(html_sections = html_sections, last_update = last_update, pdf_path = pdf_path, max_workers = max_workers)
+        elif save_pdf:
+            HTML(string = full_html, url_fetcher = self.__asset_bundle.fetch).write_pdf(target = str(pdf_path), stylesheets = [self.__create_stylesheet()])
+
+        if enable_cache:
+            self.__report_cache.save(folder_path = folder_path, document_key = document_key, section_cache = section_cache)
+class TTReportJob():
+
+    '''
+        Represents a report that is being saved in the background (see TimeTrackingProcessor.save_as_report_async()).
+
+        It can be polled (status()), cancelled as long as it hasn't started (cancel()), waited for (result()) or awaited by asyncio callers.
+    '''
+
+    __future : Future
+
+    def __init__(self, future : Future) -> None:
+
+        self.__future = future
+
+    def __await__(self) -> Any:
+
+        '''Allows asyncio callers to "await job", which returns once the report has been saved (or raises its exception).'''
+
+        return asyncio.wrap_future(self.__future).__await__()
+
+    def status(self) -> REPORTSTATUS:
+
+        '''Returns the current REPORTSTATUS of the job, without waiting for it.'''
+
+        if self.__future.cancelled():
+            return REPORTSTATUS.cancelled
+
+        if self.__future.done():
+            return REPORTSTATUS.failed if self.__future.exception() is not None else REPORTSTATUS.succeeded
+
+        if self.__future.running():
+            return REPORTSTATUS.running
+
+        return REPORTSTATUS.pending
+    def done(self) -> bool:
+
+        '''Returns True if the job succeeded, failed or has been cancelled.'''
+
+        return self.__future.done()
+    def cancel(self) -> bool:
+
+        '''Cancels the job and returns True, unless it is already running or done (in which case it returns False).'''
+
+        return self.__future.cancel()
+    def result(self, timeout : Optional[float] = None) -> None:
+
+        '''Waits up to timeout seconds (forever if None) for the report to be saved, raising its exception if it failed.'''
+
+        self.__future.result(timeout = timeout)
 @dataclass(frozen=True)
 class ComponentBag():
 
@@ -1834,14 +4831,16 @@ class ComponentBag():
     ttr_manager : TTReportManager = field(default = TTReportManager())
     tt_adapter : TTAdapter = field(default = TTAdapter(
         df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()),
-        effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper())))
+        effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()),
+        tt_partials_cache = TTPartialsCache(),
+        sqlite_backend = TTSQLiteBackend(df_helper = TTDataFrameHelper())))
 class TimeTrackingProcessor():
 
     '''Collects all the logic related to the processing of "Time Tracking.xlsx".'''
 
     __component_bag : ComponentBag
     __setting_bag : SettingBag
-    __tt_summary : TTSummary
+    __tt_summary : Union[TTSummary, LazyTTSummary]
 
     def __init__(self, component_bag : ComponentBag, setting_bag : SettingBag) -> None:
 
@@ -1854,6 +4853,14 @@ class TimeTrackingProcessor():
 
         if not hasattr(self, '_TimeTrackingProcessor__tt_summary'):
             raise Exception(_MessageCollection.please_run_initialize_first())
+    def __load_summary(self) -> TTSummary:
+
+        '''Returns __tt_summary, after creating all its fields if it's a LazyTTSummary object.'''
+
+        if isinstance(self.__tt_summary, LazyTTSummary):
+            return self.__tt_summary.to_summary()
+
+        return self.__tt_summary
     def __merge_formatters(self) -> dict:
 
         '''Merges all formatters in one dict'''
@@ -1864,12 +4871,54 @@ class TimeTrackingProcessor():
         )
             
         return formatters
+    def __display(self, df : DataFrame, name : str, formatters : Optional[dict] = None) -> None:
+
+        '''Displays df, styled with the highlight mask called name if __setting_bag.effort_highlighting_mode is HIGHLIGHTMODE.styler and __tt_summary has one.'''
+
+        mask : Optional[DataFrame] = None
+
+        if self.__setting_bag.effort_highlighting_mode == HIGHLIGHTMODE.styler:
+            mask = self.__tt_summary.highlight_masks.get(name)
+
+        if mask is None:
+            if formatters is None:
+                self.__component_bag.displayer.display(obj = df)
+            else:
+                self.__component_bag.displayer.display(obj = df, formatters = formatters)
+        else:
+            styler : Styler = self.__component_bag.ttr_manager.create_styler(df = df, formatters = formatters, mask = mask)
+            self.__component_bag.displayer.display(obj = styler)
 
     def initialize(self) -> None:
 
-        '''Creates a TTSummary object and assign it to __tt_summary.'''
+        '''
+            Creates a TTSummary object and assign it to __tt_summary.
+
+            If __setting_bag.enable_chunked_tt_df is True, tt_df is aggregated chunk by chunk and left empty.
+            If __setting_bag.enable_lazy_summary is True, only tt_df is created and all the other tables are created on first access.
+        '''
+
+        if self.__setting_bag.enable_chunked_tt_df:
+            self.__tt_summary = self.__component_bag.tt_adapter.create_chunked_summary(setting_bag = self.__setting_bag)
+        elif self.__setting_bag.enable_lazy_summary:
+            self.__tt_summary = self.__component_bag.tt_adapter.create_lazy_summary(setting_bag = self.__setting_bag)
+        else:
+            self.__tt_summary = self.__component_bag.tt_adapter.create_summary(setting_bag = self.__setting_bag)
+    def append_sessions(self, new_tt_df : DataFrame) -> None:
+
+        '''
+            Updates __tt_summary with the sessions in new_tt_df, without recomputing it from scratch.
+            
+            It raises an exception if the 'initialize' method has not been run yet.
+        '''
+
+        self.__validate_summary()
 
-        self.__tt_summary = self.__component_bag.tt_adapter.create_summary(setting_bag = self.__setting_bag)
+        self.__tt_summary = self.__component_bag.tt_adapter.update_summary(
+            tt_summary = self.__load_summary(), 
+            new_tt_df = new_tt_df, 
+            setting_bag = self.__setting_bag
+        )
     def process_tt(self) -> None:
 
         '''
@@ -1914,7 +4963,7 @@ class TimeTrackingProcessor():
         df : DataFrame = self.__tt_summary.tts_by_month_df
 
         if OPTION.display in options:
-            self.__component_bag.displayer.display(obj = df)
+            self.__display(df = df, name = "tts_by_month_df")
     def process_tts_by_year(self) -> None:
 
         '''
@@ -1929,7 +4978,7 @@ class TimeTrackingProcessor():
         df : DataFrame = self.__tt_summary.tts_by_year_df
 
         if OPTION.display in options:
-            self.__component_bag.displayer.display(obj = df)
+            self.__display(df = df, name = "tts_by_year_df")
     def process_tts_by_range(self) -> None:
 
         '''
@@ -1974,7 +5023,7 @@ class TimeTrackingProcessor():
         df : DataFrame = self.__tt_summary.tts_by_spv_df
 
         if OPTION.display in options:
-            self.__component_bag.displayer.display(obj = df)
+            self.__display(df = df, name = "tts_by_spv_df")
     def process_tts_by_hashtag_year(self) -> None:
 
         '''
@@ -1989,7 +5038,7 @@ class TimeTrackingProcessor():
         df : DataFrame = self.__tt_summary.tts_by_hashtag_year_df
 
         if OPTION.display in options:
-            self.__component_bag.displayer.display(obj = df)
+            self.__display(df = df, name = "tts_by_hashtag_year_df")
     def process_tts_by_hashtag(self) -> None:
 
         '''
@@ -2005,7 +5054,7 @@ class TimeTrackingProcessor():
         formatters : dict = self.__setting_bag.tts_by_hashtag_formatters
 
         if OPTION.display in options:
-            self.__component_bag.displayer.display(obj = df, formatters = formatters)
+            self.__display(df = df, name = "tts_by_hashtag_df", formatters = formatters)
     def process_tts_by_year_month_spnv(self) -> None:
 
         '''
@@ -2020,7 +5069,7 @@ class TimeTrackingProcessor():
         df : DataFrame = self.__tt_summary.tts_by_year_month_spnv_df
 
         if OPTION.display in options:
-            self.__component_bag.displayer.display(obj = df)
+            self.__display(df = df, name = "tts_by_year_month_spnv_df")
     def process_tts_by_timeranges(self) -> None:
 
         '''
@@ -2037,6 +5086,66 @@ class TimeTrackingProcessor():
 
         if OPTION.display in options:
             self.__component_bag.displayer.display(obj = df, formatters = formatters)
+    def process_tts_timerange_matrix(self) -> None:
+
+        '''
+            Performs all the actions listed in __setting_bag.options_tts_timerange_matrix.
+            
+            It raises an exception if the 'initialize' method has not been run yet.
+        '''
+
+        self.__validate_summary()
+
+        options : list = self.__setting_bag.options_tts_timerange_matrix
+        df : DataFrame = self.__tt_summary.tts_timerange_matrix_df
+
+        if OPTION.display in options:
+            self.__component_bag.displayer.display(obj = df)
+    def process_tts_by_week(self) -> None:
+
+        '''
+            Performs all the actions listed in __setting_bag.options_tts_by_week.
+            
+            It raises an exception if the 'initialize' method has not been run yet.
+        '''
+
+        self.__validate_summary()
+
+        options : list = self.__setting_bag.options_tts_by_week
+        df : DataFrame = self.__tt_summary.tts_by_week_df
+
+        if OPTION.display in options:
+            self.__component_bag.displayer.display(obj = df)
+    def process_tts_by_day(self) -> None:
+
+        '''
+            Performs all the actions listed in __setting_bag.options_tts_by_day.
+            
+            It raises an exception if the 'initialize' method has not been run yet.
+        '''
+
+        self.__validate_summary()
+
+        options : list = self.__setting_bag.options_tts_by_day
+        df : DataFrame = self.__tt_summary.tts_by_day_df
+
+        if OPTION.display in options:
+            self.__component_bag.displayer.display(obj = df)
+    def process_tts_by_quarter(self) -> None:
+
+        '''
+            Performs all the actions listed in __setting_bag.options_tts_by_quarter.
+            
+            It raises an exception if the 'initialize' method has not been run yet.
+        '''
+
+        self.__validate_summary()
+
+        options : list = self.__setting_bag.options_tts_by_quarter
+        df : DataFrame = self.__tt_summary.tts_by_quarter_df
+
+        if OPTION.display in options:
+            self.__component_bag.displayer.display(obj = df)
     def process_ttd_effort_status(self) -> None:
 
         '''
@@ -2071,19 +5180,22 @@ class TimeTrackingProcessor():
     def get_summary(self) -> TTSummary:
 
         '''
-            Returns __tt_summary.
+            Returns __tt_summary, with all its tables.
+
+            The tables that have been pruned by __setting_bag.enable_table_pruning (because no option needs them) are created
+            on the first call (see TTAdapter.complete_summary()), so callers never get them empty.
 
-            It raises an exception if the 'initialize' method has not been run yet.    
+            It raises an exception if the 'initialize' method has not been run yet.
         '''
 
         self.__validate_summary()
 
-        return self.__tt_summary
-    def save_as_report(self) -> None:
+        self.__tt_summary = self.__component_bag.tt_adapter.complete_summary(tt_summary = self.__load_summary(), setting_bag = self.__setting_bag)
 
-        '''Builds an HTML report from selected DataFrames in RLSummary and saves it as both HTML and PDF.'''
+        return self.__tt_summary
+    def __create_report_arguments(self, tt_summary : TTSummary) -> dict[str, Any]:
 
-        self.__validate_summary()
+        '''Returns the arguments of TTReportManager.save_as_report() for tt_summary, according to __setting_bag.'''
 
         options : list = self.__setting_bag.options_report
         formatters :dict = self.__merge_formatters()
@@ -2096,13 +5208,172 @@ class TimeTrackingProcessor():
         if OPTION.save_pdf in options:
             save_pdf = True
 
-        self.__component_bag.ttr_manager.save_as_report(
-            tt_summary = self.__tt_summary,
-            folder_path = self.__setting_bag.working_folder_path,
-            last_update = self.__setting_bag.now,
-            save_html = save_html,
-            save_pdf = save_pdf,
-            formatters = formatters)
+        return {
+            "tt_summary" : tt_summary,
+            "folder_path" : self.__setting_bag.working_folder_path,
+            "last_update" : self.__setting_bag.now,
+            "save_html" : save_html,
+            "save_pdf" : save_pdf,
+            "formatters" : formatters,
+            "max_workers" : self.__setting_bag.report_max_workers,
+            "enable_cache" : self.__setting_bag.enable_report_cache,
+            "enable_streaming" : self.__setting_bag.enable_report_streaming,
+            "chunk_size" : self.__setting_bag.report_chunk_size
+        }
+    def save_as_report(self) -> None:
+
+        '''Builds an HTML report from selected DataFrames in RLSummary and saves it as both HTML and PDF.'''
+
+        self.__validate_summary()
+
+        self.__component_bag.ttr_manager.save_as_report(**self.__create_report_arguments(tt_summary = cast(TTSummary, self.__tt_summary)))
+    def save_as_report_async(self, executor : Optional[Executor] = None) -> TTReportJob:
+
+        '''
+            Same as save_as_report(), but returns immediately: the report is saved in the background and the returned TTReportJob 
+            can be polled, cancelled or awaited.
+
+            The TTSummary object is snapshotted (a LazyTTSummary is fully created first) and shipped to executor, 
+            which can be shared to queue many reports on a bounded pool of workers. If None, a ProcessPoolExecutor with one worker is used.
+        '''
+
+        self.__validate_summary()
+
+        arguments : dict[str, Any] = self.__create_report_arguments(tt_summary = self.__load_summary())
+
+        if executor is not None:
+            return TTReportJob(future = executor.submit(self.__component_bag.ttr_manager.save_as_report, **arguments))
+
+        own_executor : ProcessPoolExecutor = ProcessPoolExecutor(max_workers = 1)
+        future : Future = own_executor.submit(self.__component_bag.ttr_manager.save_as_report, **arguments)
+        own_executor.shutdown(wait = False)
+
+        return TTReportJob(future = future)
+
+class TTBatchRunner():
+
+    '''
+        Creates the TTSummary objects (and reports) of many "Time Tracking.xlsx" files, one per SettingBag, in a process pool.
+
+        Each workbook fails on its own without stopping the others, and the TTPartials of the succeeded ones are merged into a team-level summary.
+    '''
+
+    __component_bag : ComponentBag
+
+    def __init__(self, component_bag : ComponentBag) -> None:
+
+        self.__component_bag = component_bag
+
+    def __collect(self, future : Future) -> Tuple[Optional[TTSummary], Optional[str], float]:
+
+        '''Returns the outcome of future, or a failure if the worker process couldn't deliver it (i.e. it crashed).'''
+
+        try:
+            return future.result()
+        except Exception as e:
+            return (None, f"{type(e).__name__}: {e}", 0.0)
+    def __run_serially(self, setting_bags : list[SettingBag]) -> list[Tuple[Optional[TTSummary], Optional[str], float]]:
+
+        '''Processes setting_bags one after the other in the current process.'''
+
+        return [ _BatchWorker.process_workbook(component_bag = self.__component_bag, setting_bag = x) for x in setting_bags ]
+    def __run_in_pool(self, setting_bags : list[SettingBag], max_workers : int) -> list[Tuple[Optional[TTSummary], Optional[str], float]]:
+
+        '''
+            Processes setting_bags in a ProcessPoolExecutor and returns their outcomes in the same order.
+
+            No more than 2 * max_workers workbooks are submitted at once: the next one is submitted only after one of them completes, 
+            so that the finished TTSummary objects are collected while the pool is working instead of piling up.
+        '''
+
+        outcomes : list[Tuple[Optional[TTSummary], Optional[str], float]] = [ (None, None, 0.0) ] * len(setting_bags)
+        max_pending : int = 2 * max_workers
+        pending : dict[Future, int] = {}
+
+        with ProcessPoolExecutor(max_workers = max_workers, initializer = _BatchWorker.initialize, initargs = (self.__component_bag,)) as executor:
+            for idx, setting_bag in enumerate(setting_bags):
+                if len(pending) >= max_pending:
+                    done, _ = wait(fs = list(pending.keys()), return_when = FIRST_COMPLETED)
+
+                    for future in done:
+                        outcomes[pending.pop(future)] = self.__collect(future = future)
+
+                pending[executor.submit(_BatchWorker.process, setting_bag)] = idx
+
+            for future, idx in pending.items():
+                outcomes[idx] = self.__collect(future = future)
+
+        return outcomes
+    def __create_progress_df(self, setting_bags : list[SettingBag], outcomes : list[Tuple[Optional[TTSummary], Optional[str], float]]) -> DataFrame:
+
+        '''
+                Workbook                                    Status      Seconds     Error
+            0   /home/nwtimetracking/team/Alice.xlsx        succeeded   1.53        None
+            1   /home/nwtimetracking/team/Bob.xlsx          failed      0.02        FileNotFoundError: ...
+            ...
+        '''
+
+        progress_df : DataFrame = DataFrame(
+            data = [
+                (setting_bag.excel_path, BATCHSTATUS.failed if error is not None else BATCHSTATUS.succeeded, seconds, error)
+                for setting_bag, (_, error, seconds) in zip(setting_bags, outcomes)
+            ],
+            columns = [TTCN.WORKBOOK, TTCN.STATUS, TTCN.SECONDS, TTCN.ERROR]
+        )
+
+        return progress_df
+
+    def create_setting_bags(self, setting_bag : SettingBag, folder_path : str, pattern : str = "*.xlsx") -> list[SettingBag]:
+
+        '''
+            Returns one copy of setting_bag for each workbook in folder_path matching pattern, sorted by file name.
+
+            Each workbook gets its own subfolder of setting_bag.working_folder_path (named after the file), so that reports and 
+            TTPartials caches of different people don't overwrite each other.
+        '''
+
+        setting_bags : list[SettingBag] = []
+
+        for excel_path in sorted(Path(folder_path).glob(pattern)):
+            working_folder_path : str = os.path.join(setting_bag.working_folder_path, excel_path.stem)
+
+            setting_bags.append(replace(
+                setting_bag, 
+                excel_path = str(excel_path),
+                working_folder_path = working_folder_path,
+                tt_partials_cache_folder_path = os.path.join(setting_bag.tt_partials_cache_folder_path, excel_path.stem)
+            ))
+
+        return setting_bags
+    def run(self, setting_bags : list[SettingBag], max_workers : int = 1, team_setting_bag : Optional[SettingBag] = None) -> TTBatchSummary:
+
+        '''
+            Creates the TTSummary object (and report) of each of setting_bags, plus a team-level summary. 
+            
+            If max_workers is greater than 1, the workbooks are processed in a ProcessPoolExecutor, otherwise in the current process.
+            The team-level summary is created with team_setting_bag (the first of setting_bags if None).
+        '''
+
+        if max_workers <= 1:
+            outcomes : list[Tuple[Optional[TTSummary], Optional[str], float]] = self.__run_serially(setting_bags = setting_bags)
+        else:
+            outcomes = self.__run_in_pool(setting_bags = setting_bags, max_workers = max_workers)
+
+        tt_summaries : list[Optional[TTSummary]] = [ outcome[0] for outcome in outcomes ]
+        tt_partials : list[TTPartials] = [ cast(TTPartials, x.tt_partials) for x in tt_summaries if x is not None and x.tt_partials is not None ]
+        team_summary : Optional[TTSummary] = None
+
+        if len(tt_partials) > 0:
+            team_summary = self.__component_bag.tt_adapter.create_team_summary(
+                tt_partials = tt_partials,
+                setting_bag = team_setting_bag if team_setting_bag is not None else setting_bags[0]
+            )
+
+        return TTBatchSummary(
+            tt_summaries = tt_summaries,
+            team_summary = team_summary,
+            progress_df = self.__create_progress_df(setting_bags = setting_bags, outcomes = outcomes)
+        )
 
 # MAIN
 if __name__ == "__main__":
@@ -6,7 +6,7 @@ from setuptools import setup
 # INFORMATION
 MODULE_ALIAS : str = "nwtt"
 MODULE_NAME : str = "nwtimetracking"
-MODULE_VERSION : str = "5.1.0"
+MODULE_VERSION : str = "5.2.0"
 
 # SETUP
 if __name__ == "__main__":
@@ -24,6 +24,7 @@ if __name__ == "__main__":
             "requests>=2.32.3",
             "tabulate>=0.9.0",
             "weasyprint>=66.0",
+            "pypdf>=5.1.0",
             "nwshared @ git+https://github.com/numbworks/nwshared.git@v1.8.1#egg=nwshared&subdirectory=src",
             "matplotlib>=3.9.2"
         ],
@@ -1,23 +1,40 @@
 # GLOBAL MODULES
+import asyncio
 import importlib
+import json
+import pickle
+import re
+import socket
+import time
+import tracemalloc
 import unittest
 import numpy as np
 import pandas as pd
+import sqlite3
+import tempfile
+from dataclasses import fields, replace
 from datetime import datetime, date, timedelta
+from io import BytesIO
 from numpy import int64, uint
+from openpyxl import load_workbook
 from pandas import DataFrame
 from pandas.testing import assert_frame_equal
 from parameterized import parameterized
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Literal, Optional, Tuple, cast
+from pyarrow import Table
+from pyarrow.parquet import ParquetWriter
+from pypdf import PdfReader, PdfWriter
+from typing import Any, Callable, Literal, Optional, Tuple, cast
 from unittest.mock import _Call, Mock, call, patch
 
 # LOCAL/NW MODULES
 import sys, os
 sys.path.append(os.path.dirname(__file__).replace('tests', 'src'))
-from nwtimetracking import EFFORTMODE, REPORTSTR, TTCN, DEFINITIONSTR, OPTION, EffortCell, EffortHighlighter, TTAdapter, TTReportManager
-from nwtimetracking import _MessageCollection, TTDataFrameFactory, TimeTrackingProcessor
-from nwtimetracking import EffortStatus, TTSummary, DefaultPathProvider, YearProvider
+from nwtimetracking import BATCHSTATUS, EFFORTMODE, EXECUTORTYPE, HIGHLIGHTMODE, PARTITIONTYPE, QUERYMEASURE, QUERYSTEP, REPORTSTATUS, REPORTSTR, TTCN, DEFINITIONSTR, OPTION, EffortHighlighter, EffortRule, TTAdapter, TTAssetBundle, TTHTMLTableRenderer, TTReportManager
+from nwtimetracking import _MessageCollection, _TableWorker, TTDataFrameFactory, TimeTrackingProcessor, TTBatchRunner, TTBatchSummary, TTReportJob
+from nwtimetracking import TTQuery, TTQueryStep, TTQueryPlan, TTQueryPlanner
+from nwtimetracking import EffortStatus, EffortTable, SoftwareProjectFrame, TTPartials, TTPartialsCache, TTReportCache, TTSQLiteBackend, TTSummary, LazyTTSummary, DefaultPathProvider, YearProvider
 from nwtimetracking import SoftwareProjectNameProvider, SettingBag, ComponentBag, TTDataFrameHelper
 from nwshared import FilePathManager, FileManager, Displayer
 
@@ -59,6 +76,44 @@ class SupportMethodProvider():
                  ef1.is_correct == ef2.is_correct and
                  ef1.message == ef2.message
             )
+
+    @staticmethod
+    def can_render_pdf() -> bool:
+
+        '''
+            Returns True if WeasyPrint (and its native libraries) can render a PDF in the current environment.
+        '''
+
+        try:
+            return isinstance(importlib.import_module("weasyprint").HTML(string = "<p></p>").write_pdf(), bytes)
+        except Exception:
+            return False
+
+    @staticmethod
+    def are_benchmarks_enabled() -> bool:
+
+        '''
+            Returns True if the NWTT_BENCHMARKS environment variable is "1".
+
+            The benchmarks are slow, therefore they are opt-in: "cd tests; NWTT_BENCHMARKS=1 python -m unittest -k benchmark nwtimetrackingtests.py".
+        '''
+
+        return os.environ.get("NWTT_BENCHMARKS", "0") == "1"
+
+    @staticmethod
+    def measure(function : Callable[[], Any], repeat : int = 3) -> Tuple[Any, float]:
+
+        '''Runs function repeat times and returns its last outcome together with the fastest elapsed seconds.'''
+
+        outcome : Any = None
+        timings : list[float] = []
+
+        for _ in range(repeat):
+            start : float = time.perf_counter()
+            outcome = function()
+            timings.append(time.perf_counter() - start)
+
+        return (outcome, min(timings))
 class ObjectMother():
 
     '''Collects all the DTOs required by the unit tests.'''
@@ -163,6 +218,42 @@ class ObjectMother():
                 TTCN.MONTH: np.array([2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2], dtype=int64),
             }, index=pd.RangeIndex(start=980, stop=1001, step=1)) 
     @staticmethod
+    def get_synthetic_tt_df(rows : int, start : int = 0) -> DataFrame:
+
+        '''
+            Returns rows sessions that repeat the ones of get_tt_df() over ten years (2015-2024), moving to the next month at every row.
+
+            start is the position of the first row, so that consecutive calls return consecutive slices of the same (endless) tt_df.
+        '''
+
+        template_df : DataFrame = ObjectMother.get_tt_df().reset_index(drop = True)
+        positions : np.ndarray = np.arange(start, start + rows)
+        years : np.ndarray = 2015 + (positions // 12) % 10
+        months : np.ndarray = 1 + positions % 12
+        days : np.ndarray = 1 + (positions // 120) % 28
+
+        tt_df : DataFrame = template_df.iloc[positions % len(template_df)].reset_index(drop = True)
+        tt_df[TTCN.DATE] = pd.to_datetime(DataFrame({ "year": years, "month": months, "day": days })).dt.date
+        tt_df[TTCN.YEAR] = years.astype(int64)
+        tt_df[TTCN.MONTH] = months.astype(int64)
+        tt_df.index = pd.RangeIndex(start = start, stop = start + rows)
+
+        return tt_df
+    @staticmethod
+    def get_blank_pdf(widths : list[float]) -> bytes:
+
+        '''Returns a PDF with one blank page per item in widths, each one as wide as its item (so that the pages can be told apart).'''
+
+        writer : PdfWriter = PdfWriter()
+
+        for width in widths:
+            writer.add_blank_page(width = width, height = 100)
+
+        buffer : BytesIO = BytesIO()
+        writer.write(buffer)
+
+        return buffer.getvalue()
+    @staticmethod
     def get_tts_by_month_df() -> DataFrame:
 
         '''
@@ -302,6 +393,54 @@ class ObjectMother():
                 ]],
             }, index=pd.RangeIndex(start=0, stop=1, step=1),
         )   
+    @staticmethod
+    def get_tts_by_week_df() -> DataFrame:
+
+        '''
+                Year    Week    Effort
+            0   2024    7       12h 45m
+            1   2024    8       18h 45m
+            2   2024    9       04h 30m
+        '''
+
+        return pd.DataFrame({
+                TTCN.YEAR: np.array([2024, 2024, 2024], dtype=int64),
+                TTCN.WEEK: np.array([7, 8, 9], dtype=int64),
+                TTCN.EFFORT: np.array(['12h 45m', '18h 45m', '04h 30m'], dtype=object)
+            }, index=pd.RangeIndex(start=0, stop=3, step=1))
+    @staticmethod
+    def get_tts_by_day_df() -> DataFrame:
+
+        '''
+                Date        Effort
+            0   2024-02-12  01h 00m
+            1   2024-02-13  04h 15m
+            ...
+            14  2024-02-26  04h 30m
+        '''
+
+        return pd.DataFrame({
+                TTCN.DATE: [date(2024, 2, day) for day in range(12, 27)],
+                TTCN.EFFORT: np.array([
+                    '01h 00m', '04h 15m', '01h 30m', '00h 30m', '00h 00m', '00h 00m', '05h 30m', '05h 15m', 
+                    '05h 00m', '00h 00m', '00h 00m', '00h 00m', '00h 00m', '08h 30m', '04h 30m'
+                ], dtype=object)
+            }, index=pd.RangeIndex(start=0, stop=15, step=1))
+    @staticmethod
+    def get_tts_by_quarter_df() -> DataFrame:
+
+        '''
+                Year    Q1          Q2  Q3  Q4
+            0   2024    36h 00m
+        '''
+
+        return pd.DataFrame({
+                TTCN.YEAR: np.array([2024], dtype=int64),
+                "Q1": np.array(['36h 00m'], dtype=object),
+                "Q2": np.array([''], dtype=object),
+                "Q3": np.array([''], dtype=object),
+                "Q4": np.array([''], dtype=object)
+            }, index=pd.RangeIndex(start=0, stop=1, step=1))
     @staticmethod # TBD
     def get_ttd_effort_status_df(is_correct : bool) -> DataFrame:
 
@@ -342,6 +481,59 @@ class ObjectMother():
             }
         )   
     @staticmethod
+    def get_tt_partials() -> TTPartials:
+
+        '''
+            Note: this applies to: get_tt_df()
+
+            by_year_month:
+
+                Year    Month
+                2024    2       1 days 12:00:00
+        '''
+
+        by_year_month : pd.Series = pd.Series(
+            data = [pd.Timedelta(hours = 36)],
+            index = pd.MultiIndex.from_tuples([(2024, 2)], names = [TTCN.YEAR, TTCN.MONTH]),
+            name = TTCN.EFFORT
+        )
+        by_year_hashtag : pd.Series = pd.Series(
+            data = [pd.Timedelta(hours = 6, minutes = 15), pd.Timedelta(hours = 4, minutes = 30), pd.Timedelta(hours = 2), pd.Timedelta(hours = 23, minutes = 15)],
+            index = pd.MultiIndex.from_tuples(
+                [(2024, "#csharp"), (2024, "#maintenance"), (2024, "#python"), (2024, "#studying")], 
+                names = [TTCN.YEAR, TTCN.HASHTAG]),
+            name = TTCN.EFFORT
+        )
+        by_software_project : pd.Series = pd.Series(
+            data = [pd.Timedelta(hours = 1, minutes = 15), pd.Timedelta(hours = 4, minutes = 15), pd.Timedelta(minutes = 45), pd.Timedelta(minutes = 30), pd.Timedelta(hours = 2)],
+            index = pd.MultiIndex.from_tuples(
+                [
+                    (2024, 2, "NW.NGramTextClassification", "4.2.0", "#csharp"),
+                    (2024, 2, "NW.Shared.Serialization", "1.0.0", "#csharp"),
+                    (2024, 2, "NW.UnivariateForecasting", "4.2.0", "#csharp"),
+                    (2024, 2, "ERROR", "ERROR", "#maintenance"),
+                    (2024, 2, "nwreadinglistmanager", "2.1.0", "#python")
+                ], 
+                names = [TTCN.YEAR, TTCN.MONTH, TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION, TTCN.HASHTAG]),
+            name = TTCN.EFFORT
+        ).sort_index()
+
+        time_ranges : list[str] = ObjectMother.get_tts_by_timeranges_df()[TTCN.TIMERANGES][0]
+        by_time_range : pd.Series = pd.Series(
+            data = np.ones(len(time_ranges), dtype = int64),
+            index = pd.Index(time_ranges, name = TTCN.TIMERANGE),
+            name = TTCN.OCCURRENCES
+        )
+
+        tt_partials : TTPartials = TTPartials(
+            by_year_month = by_year_month,
+            by_year_hashtag = by_year_hashtag,
+            by_software_project = by_software_project,
+            by_time_range = by_time_range
+        )
+
+        return tt_partials
+    @staticmethod
     def get_definitions_df() -> DataFrame:
 
         columns : list[str] = [DEFINITIONSTR.TERM, DEFINITIONSTR.DEFINITION]
@@ -464,6 +656,37 @@ class MessageCollectionTestCase(unittest.TestCase):
 
         # Assert
         self.assertEqual(expected, actual)	
+    def test_providedgroupkeysnotsupported_shouldreturnexpectedmessage_wheninvoked(self) -> None:
+
+        # Arrange
+        expected : str = "The provided group keys are not supported: '['Foo']'."
+
+        # Act
+        actual : str = _MessageCollection.provided_group_keys_not_supported(keys = ["Foo"])
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_providedorderkeysnotsupported_shouldreturnexpectedmessage_wheninvoked(self) -> None:
+
+        # Arrange
+        expected : str = "The provided order keys are neither group keys nor the measure: '['Foo']'."
+
+        # Act
+        actual : str = _MessageCollection.provided_order_keys_not_supported(keys = ["Foo"])
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_providedstepnotsupported_shouldreturnexpectedmessage_wheninvoked(self) -> None:
+
+        # Arrange
+        invalid_step : QUERYSTEP = cast(QUERYSTEP, "invalid")
+        expected : str = f"The provided step is not supported: '{invalid_step}'."
+
+        # Act
+        actual : str = _MessageCollection.provided_step_not_supported(step = invalid_step)
+
+        # Assert
+        self.assertEqual(expected, actual)
 class EffortStatusTestCase(unittest.TestCase):
 
     def test_init_shouldinitializeobjectwithexpectedproperties_wheninvoked(self) -> None:
@@ -561,6 +784,50 @@ class EffortStatusTestCase(unittest.TestCase):
         self.assertIsNone(actual.expected_str)
         self.assertEqual(actual.is_correct, is_correct)
         self.assertEqual(actual.message, message)
+class TTPartialsTestCase(unittest.TestCase):
+    
+    def test_init_shouldinitializeobjectwithexpectedproperties_wheninvoked(self) -> None:
+        
+        # Arrange
+        by_year_month : pd.Series = pd.Series(dtype = "timedelta64[ns]")
+        by_year_hashtag : pd.Series = pd.Series(dtype = "timedelta64[ns]")
+        by_software_project : pd.Series = pd.Series(dtype = "timedelta64[ns]")
+        by_time_range : pd.Series = pd.Series(dtype = int64)
+
+        # Act
+        actual : TTPartials = TTPartials(
+            by_year_month = by_year_month,
+            by_year_hashtag = by_year_hashtag,
+            by_software_project = by_software_project,
+            by_time_range = by_time_range
+        )
+
+        # Assert
+        self.assertIs(actual.by_year_month, by_year_month)
+        self.assertIs(actual.by_year_hashtag, by_year_hashtag)
+        self.assertIs(actual.by_software_project, by_software_project)
+        self.assertIs(actual.by_time_range, by_time_range)
+class TTQueryTestCase(unittest.TestCase):
+
+    def test_init_shouldinitializeobjectwithexpecteddefaults_wheninvoked(self) -> None:
+
+        # Arrange
+        group_by : list[str] = [TTCN.YEAR]
+
+        # Act
+        actual : TTQuery = TTQuery(group_by = group_by)
+
+        # Assert
+        self.assertEqual(group_by, actual.group_by)
+        self.assertEqual(QUERYMEASURE.effort, actual.measure)
+        self.assertIsNone(actual.years)
+        self.assertIsNone(actual.hashtags)
+        self.assertIsNone(actual.software_project_names)
+        self.assertIsNone(actual.start_date)
+        self.assertIsNone(actual.end_date)
+        self.assertEqual([], actual.order_by)
+        self.assertIsNone(actual.top_n)
+        self.assertFalse(actual.box_efforts)
 class TTSummaryTestCase(unittest.TestCase):
     
     def test_init_shouldinitializeobjectwithexpectedproperties_wheninvoked(self) -> None:
@@ -599,6 +866,69 @@ class TTSummaryTestCase(unittest.TestCase):
         self.assertEqual(actual.tts_by_timeranges_df.shape, empty_df.shape)
         self.assertEqual(actual.ttd_effort_status_df.shape, empty_df.shape)
         self.assertEqual(actual.definitions_df.shape, empty_df.shape)
+        self.assertIsNone(actual.tt_partials)
+        self.assertEqual(actual.skipped_tables, [])
+        self.assertEqual(actual.timings_df.shape, empty_df.shape)
+        self.assertEqual(actual.tts_timerange_matrix_df.shape, empty_df.shape)
+        self.assertEqual(actual.tt_memory_usage_df.shape, empty_df.shape)
+class LazyTTSummaryTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.tt_df : DataFrame = ObjectMother().get_tt_df()
+        self.loaders : dict[str, Mock] = { name: Mock(return_value = DataFrame()) for name in [
+            "tt_latest_four_df", "tts_by_month_df", "tts_by_year_df", "tts_by_range_df", "tts_by_spn_df", "tts_by_spv_df",
+            "tts_by_hashtag_year_df", "tts_by_hashtag_df", "tts_by_year_month_spnv_df", "tts_by_timeranges_df",
+            "ttd_effort_status_df", "definitions_df", "tt_partials"
+        ]}
+    def test_getattr_shouldcallloaderonce_whenaccessedtwice(self) -> None:
+
+        # Arrange
+        lazy_summary : LazyTTSummary = LazyTTSummary(tt_df = self.tt_df, loaders = self.loaders)  # type: ignore
+
+        # Act
+        first : DataFrame = lazy_summary.tts_by_month_df
+        second : DataFrame = lazy_summary.tts_by_month_df
+
+        # Assert
+        self.assertIs(first, second)
+        self.loaders["tts_by_month_df"].assert_called_once_with()
+        self.loaders["tts_by_year_df"].assert_not_called()
+    def test_getattr_shouldraiseattributeerror_whennoloader(self) -> None:
+
+        # Arrange
+        lazy_summary : LazyTTSummary = LazyTTSummary(tt_df = self.tt_df, loaders = self.loaders)  # type: ignore
+
+        # Act & Assert
+        with self.assertRaises(AttributeError):
+            lazy_summary.some_df
+    def test_isloaded_shouldreturnexpectedvalues_wheninvoked(self) -> None:
+
+        # Arrange
+        lazy_summary : LazyTTSummary = LazyTTSummary(tt_df = self.tt_df, loaders = self.loaders)  # type: ignore
+
+        # Act
+        before : bool = lazy_summary.is_loaded(name = "tts_by_year_df")
+        lazy_summary.tts_by_year_df
+        after : bool = lazy_summary.is_loaded(name = "tts_by_year_df")
+
+        # Assert
+        self.assertTrue(lazy_summary.is_loaded(name = "tt_df"))
+        self.assertFalse(before)
+        self.assertTrue(after)
+    def test_tosummary_shouldcallallloadersonce_wheninvoked(self) -> None:
+
+        # Arrange
+        lazy_summary : LazyTTSummary = LazyTTSummary(tt_df = self.tt_df, loaders = self.loaders)  # type: ignore
+        lazy_summary.tts_by_month_df
+
+        # Act
+        actual : TTSummary = lazy_summary.to_summary()
+
+        # Assert
+        self.assertIs(actual.tt_df, self.tt_df)
+        for loader in self.loaders.values():
+            loader.assert_called_once_with()
 class DefaultPathProviderTestCase(unittest.TestCase):
 
     def test_getdefaulttimetrackingpath_shouldreturnexpectedpath_wheninvoked(self):
@@ -734,6 +1064,10 @@ class SettingBagTestCase(unittest.TestCase):
         excel_nrows : int = 100
 
         options_ttd_effort_status : list[Literal[OPTION.display]] = [OPTION.display]            # type: ignore
+        options_tts_timerange_matrix : list[Literal[OPTION.display]] = [OPTION.display]         # type: ignore
+        options_tts_by_week : list[Literal[OPTION.display]] = [OPTION.display]                  # type: ignore
+        options_tts_by_day : list[Literal[OPTION.display]] = [OPTION.display]                   # type: ignore
+        options_tts_by_quarter : list[Literal[OPTION.display]] = [OPTION.display]               # type: ignore
         working_folder_path : str = "/home/nwtimetracking/"
         excel_path : str = "/workspaces/nwtimetracking/data/"
         excel_skiprows : int = 0
@@ -741,6 +1075,22 @@ class SettingBagTestCase(unittest.TestCase):
         years : Optional[list[int]] = [2020, 2021, 2022]
         now : datetime = datetime.now()
         enable_effort_highlighting : bool = True
+        enable_compact_tt_df : bool = True
+        enable_tt_partials : bool = True
+        enable_tt_partials_cache : bool = True
+        tt_partials_cache_folder_path : str = "/home/nwtimetracking/cache/"
+        enable_tt_partials_sqlite : bool = True
+        tt_partials_sqlite_database_path : str = "/home/nwtimetracking/tt.db"
+        enable_tt_partials_map_reduce : bool = True
+        tt_partials_partition_type : PARTITIONTYPE = PARTITIONTYPE.rows
+        tt_partials_max_workers : int = 8
+        enable_lazy_summary : bool = True
+        enable_chunked_tt_df : bool = True
+        tt_chunk_size : int = 5000
+        tt_parquet_path : Optional[str] = "/home/nwtimetracking/tt.parquet"
+        enable_table_pruning : bool = False
+        max_workers : int = 4
+        executor_type : EXECUTORTYPE = EXECUTORTYPE.process
         tts_by_spn_software_project_names : list[str] = ["SPN1", "SPN2"]
         tts_by_spv_software_project_names : list[str] = ["SPN3"]
         tts_by_hashtag_formatters : dict = { TTCN.EFFORTPERC : "{:.2f}" }
@@ -765,6 +1115,10 @@ class SettingBagTestCase(unittest.TestCase):
             options_report = options_report,
             excel_nrows = excel_nrows,
             options_ttd_effort_status = options_ttd_effort_status,
+            options_tts_timerange_matrix = options_tts_timerange_matrix,
+            options_tts_by_week = options_tts_by_week,
+            options_tts_by_day = options_tts_by_day,
+            options_tts_by_quarter = options_tts_by_quarter,
             working_folder_path = working_folder_path,
             excel_path = excel_path,
             excel_skiprows = excel_skiprows,
@@ -772,6 +1126,22 @@ class SettingBagTestCase(unittest.TestCase):
             years = years,
             now = now,
             enable_effort_highlighting = enable_effort_highlighting,
+            enable_compact_tt_df = enable_compact_tt_df,
+            enable_tt_partials = enable_tt_partials,
+            enable_tt_partials_cache = enable_tt_partials_cache,
+            tt_partials_cache_folder_path = tt_partials_cache_folder_path,
+            enable_tt_partials_sqlite = enable_tt_partials_sqlite,
+            tt_partials_sqlite_database_path = tt_partials_sqlite_database_path,
+            enable_tt_partials_map_reduce = enable_tt_partials_map_reduce,
+            tt_partials_partition_type = tt_partials_partition_type,
+            tt_partials_max_workers = tt_partials_max_workers,
+            enable_lazy_summary = enable_lazy_summary,
+            enable_chunked_tt_df = enable_chunked_tt_df,
+            tt_chunk_size = tt_chunk_size,
+            tt_parquet_path = tt_parquet_path,
+            enable_table_pruning = enable_table_pruning,
+            max_workers = max_workers,
+            executor_type = executor_type,
             tts_by_spn_software_project_names = tts_by_spn_software_project_names,
             tts_by_spv_software_project_names = tts_by_spv_software_project_names,
             tts_by_hashtag_formatters = tts_by_hashtag_formatters,
@@ -797,6 +1167,10 @@ class SettingBagTestCase(unittest.TestCase):
         self.assertEqual(actual.excel_nrows, excel_nrows)
 
         self.assertEqual(actual.options_ttd_effort_status, options_ttd_effort_status)
+        self.assertEqual(actual.options_tts_timerange_matrix, options_tts_timerange_matrix)
+        self.assertEqual(actual.options_tts_by_week, options_tts_by_week)
+        self.assertEqual(actual.options_tts_by_day, options_tts_by_day)
+        self.assertEqual(actual.options_tts_by_quarter, options_tts_by_quarter)
         self.assertEqual(actual.working_folder_path, working_folder_path)
         self.assertEqual(actual.excel_path, excel_path)
         self.assertEqual(actual.excel_skiprows, excel_skiprows)
@@ -804,6 +1178,28 @@ class SettingBagTestCase(unittest.TestCase):
         self.assertEqual(actual.years, years)
         self.assertEqual(actual.now, now)
         self.assertEqual(actual.enable_effort_highlighting, enable_effort_highlighting)
+        self.assertEqual(actual.effort_highlighting_mode, HIGHLIGHTMODE.tags)
+        self.assertEqual(actual.report_max_workers, 1)
+        self.assertFalse(actual.enable_report_cache)
+        self.assertFalse(actual.enable_report_streaming)
+        self.assertEqual(actual.report_chunk_size, 10000)
+        self.assertEqual(actual.tts_by_hashtag_year_effort_rule, EffortRule(mode = EFFORTMODE.top_three_efforts, n = 3))
+        self.assertEqual(actual.enable_compact_tt_df, enable_compact_tt_df)
+        self.assertEqual(actual.enable_tt_partials, enable_tt_partials)
+        self.assertEqual(actual.enable_tt_partials_cache, enable_tt_partials_cache)
+        self.assertEqual(actual.tt_partials_cache_folder_path, tt_partials_cache_folder_path)
+        self.assertEqual(actual.enable_tt_partials_sqlite, enable_tt_partials_sqlite)
+        self.assertEqual(actual.tt_partials_sqlite_database_path, tt_partials_sqlite_database_path)
+        self.assertEqual(actual.enable_tt_partials_map_reduce, enable_tt_partials_map_reduce)
+        self.assertEqual(actual.tt_partials_partition_type, tt_partials_partition_type)
+        self.assertEqual(actual.tt_partials_max_workers, tt_partials_max_workers)
+        self.assertEqual(actual.enable_lazy_summary, enable_lazy_summary)
+        self.assertEqual(actual.enable_chunked_tt_df, enable_chunked_tt_df)
+        self.assertEqual(actual.tt_chunk_size, tt_chunk_size)
+        self.assertEqual(actual.tt_parquet_path, tt_parquet_path)
+        self.assertEqual(actual.enable_table_pruning, enable_table_pruning)
+        self.assertEqual(actual.max_workers, max_workers)
+        self.assertEqual(actual.executor_type, executor_type)
         self.assertEqual(actual.tts_by_spn_software_project_names, tts_by_spn_software_project_names)
         self.assertEqual(actual.tts_by_spv_software_project_names, tts_by_spv_software_project_names)
         self.assertEqual(actual.tts_by_hashtag_formatters, tts_by_hashtag_formatters)
@@ -1214,6 +1610,18 @@ class TTDataFrameHelperTestCase(unittest.TestCase):
         # Assert
         self.assertEqual(expected, actual)
 
+    def test_calculatepercentage_shouldnotoverflow_whentimedeltasarebig(self):
+
+        # Arrange
+        part : Any = pd.Timedelta(hours = 1000000)
+        whole : Any = pd.Timedelta(hours = 2000000)
+        expected : float = 50.0
+        
+        # Act
+        actual : float = self.df_helper.calculate_percentage(part = part, whole = whole)
+
+        # Assert
+        self.assertEqual(expected, actual)
     def test_extractsoftwareprojectname_shouldreturnexpectedstring_whenproperstring(self):
 
         # Arrange
@@ -1259,20 +1667,6 @@ class TTDataFrameHelperTestCase(unittest.TestCase):
         # Assert
         self.assertEqual(expected, actual)
 
-    @parameterized.expand([
-        ["07:00", "08:00", "07:00-08:00"],
-        ["", "08:00", "Unknown"],
-        ["07:00", "", "Unknown"]
-    ])
-    def test_createtimerangeid_shouldreturnexpectedtimerangeid_wheninvoked(self, start_time : str, end_time : str, expected : str):
-
-        # Arrange
-        # Act
-        actual : str = self.df_helper.create_time_range_id(start_time = start_time, end_time = end_time)
-
-        # Assert
-        self.assertEqual(expected, actual)
-
     @parameterized.expand([
         (2024, True),
         (1000, True),
@@ -1303,6 +1697,98 @@ class TTDataFrameHelperTestCase(unittest.TestCase):
         # Act
         actual : bool = self.df_helper.is_even(number = number)
 
+        # Assert
+        self.assertEqual(expected, actual)
+class TTQueryPlannerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.query_planner : TTQueryPlanner = TTQueryPlanner()
+    def test_createplan_shouldpushfiltersbeforeparsingandunboxing_wheninvoked(self) -> None:
+
+        # Arrange
+        query : TTQuery = TTQuery(
+            group_by = [TTCN.SOFTWAREPROJECTNAME],
+            years = [2024],
+            hashtags = ["#csharp"],
+            software_project_names = ["NW.Shared.Serialization"],
+            start_date = date(2024, 2, 1),
+            order_by = [(TTCN.EFFORT, False)],
+            top_n = 3,
+            box_efforts = True
+        )
+        expected : list[QUERYSTEP] = [
+            QUERYSTEP.filter_years, QUERYSTEP.filter_dates, QUERYSTEP.filter_hashtags, QUERYSTEP.select_software_projects,
+            QUERYSTEP.parse_descriptors, QUERYSTEP.filter_software_project_names, QUERYSTEP.unbox_efforts, QUERYSTEP.group,
+            QUERYSTEP.sort, QUERYSTEP.take_top_n, QUERYSTEP.box_efforts
+        ]
+
+        # Act
+        actual : TTQueryPlan = self.query_planner.create_plan(query = query)
+
+        # Assert
+        self.assertEqual(expected, [step.step for step in actual.steps])
+    def test_createplan_shouldnotunboxefforts_whenmeasureiscount(self) -> None:
+
+        # Arrange
+        query : TTQuery = TTQuery(group_by = [TTCN.HASHTAG], measure = QUERYMEASURE.occurrences, box_efforts = True)
+
+        # Act
+        actual : TTQueryPlan = self.query_planner.create_plan(query = query)
+
+        # Assert
+        self.assertEqual([QUERYSTEP.group], [step.step for step in actual.steps])
+    def test_createplan_shouldmergeduplicatedorderkeys_wheninvoked(self) -> None:
+
+        # Arrange
+        query : TTQuery = TTQuery(group_by = [TTCN.YEAR], order_by = [(TTCN.EFFORT, False), (TTCN.YEAR, True), (TTCN.EFFORT, True)])
+
+        # Act
+        actual : TTQueryPlan = self.query_planner.create_plan(query = query)
+
+        # Assert
+        self.assertEqual([(TTCN.EFFORT, False), (TTCN.YEAR, True)], actual.query.order_by)
+        self.assertEqual(1, [step.step for step in actual.steps].count(QUERYSTEP.sort))
+    def test_createplan_shoulddropsort_whengroupbyalreadysorts(self) -> None:
+
+        # Arrange
+        query : TTQuery = TTQuery(group_by = [TTCN.YEAR, TTCN.MONTH], order_by = [(TTCN.YEAR, True), (TTCN.YEAR, True)])
+
+        # Act
+        actual : TTQueryPlan = self.query_planner.create_plan(query = query)
+
+        # Assert
+        self.assertEqual([], actual.query.order_by)
+        self.assertNotIn(QUERYSTEP.sort, [step.step for step in actual.steps])
+
+    @parameterized.expand([
+        [TTQuery(group_by = [])],
+        [TTQuery(group_by = ["Foo"])],
+        [TTQuery(group_by = [TTCN.YEAR], order_by = [(TTCN.HASHTAG, True)])],
+        [TTQuery(group_by = [TTCN.YEAR], measure = QUERYMEASURE.occurrences, order_by = [(TTCN.EFFORT, True)])]
+    ])
+    def test_createplan_shouldraiseexception_whenqueryisnotsupported(self, query : TTQuery) -> None:
+
+        # Arrange
+        # Act
+        # Assert
+        with self.assertRaises(Exception):
+            self.query_planner.create_plan(query = query)
+    def test_explain_shouldreturnexpectedstring_wheninvoked(self) -> None:
+
+        # Arrange
+        query : TTQuery = TTQuery(group_by = [TTCN.YEAR, TTCN.HASHTAG], years = [2024], order_by = [(TTCN.EFFORT, False)], top_n = 2)
+        expected : str = (
+            "1. filter_years: Year in [2024]\n"
+            "2. unbox_efforts: Effort: str => timedelta\n"
+            "3. group: groupby(by = ['Year', 'Hashtag']).sum(Effort)\n"
+            "4. sort: sort_values(by = ['Effort'], ascending = [False])\n"
+            "5. take_top_n: head(2)"
+        )
+
+        # Act
+        actual : str = self.query_planner.explain(plan = self.query_planner.create_plan(query = query))
+
         # Assert
         self.assertEqual(expected, actual)
 class TTDataFrameFactoryTestCase(unittest.TestCase):
@@ -1339,6 +1825,132 @@ class TTDataFrameFactoryTestCase(unittest.TestCase):
         self.assertEqual(expected_nan, actual[expected_column_names[1]][0])
         self.assertEqual(expected_nan, actual[expected_column_names[2]][0])
         self.assertEqual(expected_nan, actual[expected_column_names[5]][0])    
+    def test_createttdf_shouldreturncompactdataframe_whencompactistrue(self):
+
+        # Arrange
+        excel_data_df : DataFrame = ObjectMother().get_excel_data()
+        expected_dtype_names : list[str] = ["datetime64[ns]", "string", "string", "string", "category", "category", "boolean", "boolean", "Int16", "Int8"]
+
+        # Act
+        with patch.object(pd, 'read_excel', return_value = excel_data_df):
+            actual : DataFrame = self.df_factory.create_tt_df(
+                excel_path = "/workspaces/nwtimetracking/",
+                excel_skiprows = 0,
+                excel_nrows = 100,
+                excel_tabname = "Sessions",
+                compact = True
+            )
+
+        # Assert
+        self.assertEqual(expected_dtype_names, SupportMethodProvider().get_dtype_names(df = actual))
+    @parameterized.expand([
+        [1, 21],
+        [5, 5],
+        [100, 1]
+    ])
+    def test_createttdfchunks_shouldreturnsamerowsascreatettdf_wheninvoked(self, chunk_size : int, expected_chunks : int) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+            excel_path : str = os.path.join(folder_path, "Time Tracking.xlsx")
+            ObjectMother().get_tt_df().to_excel(excel_writer = excel_path, sheet_name = "Sessions", index = False)
+            expected_df : DataFrame = self.df_factory.create_tt_df(excel_path = excel_path, excel_skiprows = 0, excel_nrows = 100, excel_tabname = "Sessions")
+
+            # Act
+            actual : list[DataFrame] = list(self.df_factory.create_tt_df_chunks(
+                excel_path = excel_path, 
+                excel_skiprows = 0, 
+                excel_nrows = 100, 
+                excel_tabname = "Sessions", 
+                chunk_size = chunk_size
+            ))
+
+        # Assert
+        self.assertEqual(expected_chunks, len(actual))
+        assert_frame_equal(expected_df, pd.concat(objs = actual))
+    def test_createttdfchunks_shouldskipblankrows_whenexcelnrowsisgreaterthandatarows(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+            excel_path : str = os.path.join(folder_path, "Time Tracking.xlsx")
+            ObjectMother().get_tt_df().to_excel(excel_writer = excel_path, sheet_name = "Sessions", index = False)
+
+            workbook : Any = load_workbook(filename = excel_path)
+            worksheet : Any = workbook["Sessions"]
+            worksheet.cell(row = worksheet.max_row + 2, column = 1).number_format = "0"
+            workbook.save(excel_path)
+
+            expected_df : DataFrame = self.df_factory.create_tt_df(excel_path = excel_path, excel_skiprows = 0, excel_nrows = 100, excel_tabname = "Sessions")
+
+            # Act
+            actual : list[DataFrame] = list(self.df_factory.create_tt_df_chunks(
+                excel_path = excel_path, 
+                excel_skiprows = 0, 
+                excel_nrows = 100, 
+                excel_tabname = "Sessions", 
+                chunk_size = 10
+            ))
+
+        # Assert
+        assert_frame_equal(expected_df, pd.concat(objs = actual))
+    def test_createttdfchunks_shouldreturnoneemptychunk_whenthereisnorow(self) -> None:
+
+        # Arrange
+        expected_column_names : list[str] = ObjectMother().get_tt_df_column_names()
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            excel_path : str = os.path.join(folder_path, "Time Tracking.xlsx")
+            ObjectMother().get_tt_df().to_excel(excel_writer = excel_path, sheet_name = "Sessions", index = False)
+
+            # Act
+            actual : list[DataFrame] = list(self.df_factory.create_tt_df_chunks(
+                excel_path = excel_path, 
+                excel_skiprows = 0, 
+                excel_nrows = 0, 
+                excel_tabname = "Sessions", 
+                chunk_size = 10
+            ))
+
+        # Assert
+        self.assertEqual(1, len(actual))
+        self.assertEqual(0, len(actual[0]))
+        self.assertEqual(expected_column_names, actual[0].columns.tolist())
+    def test_createttdfchunksfromparquet_shouldreturnsamerowsasttdf_wheninvoked(self) -> None:
+
+        # Arrange
+        tt_df : DataFrame = ObjectMother().get_tt_df().reset_index(drop = True)
+        tt_df[TTCN.DATE] = pd.to_datetime(tt_df[TTCN.DATE]).dt.date
+        years : list[int] = [2024]
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            parquet_path : str = os.path.join(folder_path, "tt.parquet")
+            tt_df.to_parquet(path = parquet_path)
+
+            # Act
+            actual : list[DataFrame] = list(self.df_factory.create_tt_df_chunks_from_parquet(parquet_path = parquet_path, chunk_size = 8, years = years))
+
+        # Assert
+        self.assertEqual(3, len(actual))
+        self.assertEqual([0, 8, 16], [x.index[0] for x in actual])
+        assert_frame_equal(tt_df, pd.concat(objs = actual), check_dtype = False)
+    @parameterized.expand([
+        [None, 21],
+        [[], 21],
+        [[2024], 16],
+        [[2023], 5],
+        [[2022], 0]
+    ])
+    def test_filterttdf_shouldreturnexpectedrows_wheninvoked(self, years : Optional[list[int]], expected : int) -> None:
+
+        # Arrange
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        tt_df.loc[tt_df.index[:5], TTCN.YEAR] = 2023
+
+        # Act
+        actual : DataFrame = self.df_factory.filter_tt_df(tt_df = tt_df, years = years)
+
+        # Assert
+        self.assertEqual(expected, len(actual))
     def test_createttdf_shouldnotcallfilterbyyear_whenyearsisnone(self) -> None:
 
         # Arrange
@@ -1506,26 +2118,68 @@ class TTDataFrameFactoryTestCase(unittest.TestCase):
 
         # Assert
         assert_frame_equal(expected, actual)
-    def test_createttsbytimerangesdf_shouldreturnexpecteddataframe_wheninvoked(self):
+    def test_createttsbydffromframe_shouldreturnexpecteddataframes_wheninvoked(self):
 
         # Arrange
-        min_occurrences : int = 1
+        software_project_names : list[str] = ["NW.NGramTextClassification", "NW.Shared.Serialization", "NW.UnivariateForecasting", "nwreadinglistmanager"]
         tt_df : DataFrame = ObjectMother().get_tt_df()
 
-        expected_df : DataFrame = ObjectMother().get_tts_by_timeranges_df()
-        expected_df.sort_values(by = TTCN.TIMERANGES, ascending = True, inplace = True)
-        expected_df.reset_index(drop = True, inplace = True)
-
         # Act
-        actual_df : DataFrame  = self.df_factory.create_tts_by_timeranges_df(
-            tt_df = tt_df, 
-            min_occurrences = min_occurrences
-        )
-        actual_df.sort_values(by = TTCN.TIMERANGES, ascending = True, inplace = True)
-        actual_df.reset_index(drop = True, inplace = True)
+        sp_frame : SoftwareProjectFrame = self.df_factory.create_software_project_frame(tt_df = tt_df)
+        actual_spn_df : DataFrame = self.df_factory.create_tts_by_spn_df_from_frame(sp_frame = sp_frame, software_project_names = software_project_names)
+        actual_spv_df : DataFrame = self.df_factory.create_tts_by_spv_df_from_frame(sp_frame = sp_frame, software_project_names = software_project_names)
+        actual_ymspnv_df : DataFrame = self.df_factory.create_tts_by_year_month_spnv_df_from_frame(sp_frame = sp_frame, software_project_names = software_project_names)
 
         # Assert
-        assert_frame_equal(expected_df, actual_df)
+        assert_frame_equal(ObjectMother().get_tts_by_spn_df(), actual_spn_df)
+        assert_frame_equal(ObjectMother().get_tts_by_spv_df(), actual_spv_df)
+        assert_frame_equal(ObjectMother().get_tts_by_year_month_spnv_df(), actual_ymspnv_df)
+    @parameterized.expand([
+        ("tts_by_month", lambda f, tt_df : f.create_tts_by_month_table(tt_df = tt_df, now = datetime(2024, 12, 1)), ObjectMother().get_tts_by_month_df),
+        ("tts_by_year", lambda f, tt_df : f.create_tts_by_year_table(tt_df = tt_df), ObjectMother().get_tts_by_year_df),
+        ("tts_by_hashtag_year", lambda f, tt_df : f.create_tts_by_hashtag_year_table(tt_df = tt_df), ObjectMother().get_tts_by_hashtag_year_df),
+        ("tts_by_hashtag", lambda f, tt_df : f.create_tts_by_hashtag_table(tt_df = tt_df), ObjectMother().get_tts_by_hashtag_df)
+    ])
+    def test_createttsbytable_shouldreturnboxeddfandalignedminutes_wheninvoked(self, _ : str, create_table : Callable, get_expected_df : Callable):
+
+        # Arrange
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        expected_df : DataFrame = get_expected_df()
+
+        # Act
+        actual : EffortTable = create_table(self.df_factory, tt_df)
+
+        # Assert
+        assert_frame_equal(expected_df, actual.df)
+        self.assertEqual(actual.minutes_df.shape, actual.df.shape)
+        self.assertTrue(actual.minutes_df.index.equals(actual.df.index))
+
+        for (row, col), minutes in np.ndenumerate(actual.minutes_df.to_numpy(dtype = float)):
+            if np.isnan(minutes):
+                continue
+            self.assertEqual(
+                TTDataFrameHelper().unbox_effort(effort_str = actual.df.iloc[row, col]), 
+                timedelta(minutes = minutes))
+    def test_createttsbytimerangesdf_shouldreturnexpecteddataframe_wheninvoked(self):
+
+        # Arrange
+        min_occurrences : int = 1
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+
+        expected_df : DataFrame = ObjectMother().get_tts_by_timeranges_df()
+        expected_df.sort_values(by = TTCN.TIMERANGES, ascending = True, inplace = True)
+        expected_df.reset_index(drop = True, inplace = True)
+
+        # Act
+        actual_df : DataFrame  = self.df_factory.create_tts_by_timeranges_df(
+            tt_df = tt_df, 
+            min_occurrences = min_occurrences
+        )
+        actual_df.sort_values(by = TTCN.TIMERANGES, ascending = True, inplace = True)
+        actual_df.reset_index(drop = True, inplace = True)
+
+        # Assert
+        assert_frame_equal(expected_df, actual_df)
     
     @parameterized.expand([
         [True],
@@ -1553,822 +2207,3090 @@ class TTDataFrameFactoryTestCase(unittest.TestCase):
 
         # Assert
         assert_frame_equal(expected_df , actual_df)
-class EffortCellTestCase(unittest.TestCase):
-
-    def test_init_shouldinitializeobjectwithexpectedproperties_whenvalidarguments(self) -> None:
+    def test_createttdeltadf_shouldfilterandreindexnewrows_wheninvoked(self) -> None:
 
         # Arrange
-        coordinate_pair : Tuple[int, int] = (5, 10)
-        effort_str : str = "10h 00m"
-        effort_td : timedelta = timedelta(hours = 10)
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        new_tt_df : DataFrame = ObjectMother().get_tt_df().tail(2).reset_index(drop = True)
+        new_tt_df.loc[0, TTCN.YEAR] = 2023
+        expected_index : list[int] = [1001]
 
         # Act
-        effort_cell : EffortCell = EffortCell(
-            coordinate_pair = coordinate_pair,
-            effort_str = effort_str,
-            effort_td = effort_td
-        )
+        actual_df : DataFrame = self.df_factory.create_tt_delta_df(tt_df = tt_df, new_tt_df = new_tt_df, years = [2024])
 
         # Assert
-        self.assertEqual(effort_cell.coordinate_pair, coordinate_pair)
-        self.assertEqual(effort_cell.effort_str, effort_str)
-        self.assertEqual(effort_cell.effort_td, effort_td)
-class EffortHighlighterTestCase(unittest.TestCase):
-
-    def setUp(self) -> None:
-
-        self.effort_highlighter : EffortHighlighter = EffortHighlighter(df_helper = TTDataFrameHelper())
+        self.assertEqual(expected_index, actual_df.index.tolist())
+        self.assertEqual([2024], actual_df[TTCN.YEAR].tolist())
+    def test_appendttdeltadf_shouldreturnexpecteddataframe_wheninvoked(self) -> None:
 
-        data : dict[str, list] = {
-            "Month": ["1", "2"],
-            "2015": ["00h 00m", "00h 00m"],
-            "↕": ["↑", "↑"],
-            "2016": ["18h 00m", "45h 30m"],
-            "↕_duplicate_1": ["↑", "↑"],
-            "2017": ["88h 30m", "65h 30m"]
-        }
-        columns_01 : list[str] = ["Month", "2015", "↕", "2016", "↕", "2017"]
-        self.df_with_duplicates : DataFrame = DataFrame(data, columns = columns_01)
+        # Arrange
+        expected_df : DataFrame = ObjectMother().get_tt_df()
+        tt_df : DataFrame = expected_df.iloc[:15]
+        tt_delta_df : DataFrame = self.df_factory.create_tt_delta_df(tt_df = tt_df, new_tt_df = expected_df.iloc[15:].reset_index(drop = True))
 
-        columns_02 : list[str] = ["Month", "2015", "↕", "2016", "↕_duplicate_1", "2017"]
-        self.df_without_duplicates : DataFrame = DataFrame(data, columns = columns_02)
+        # Act
+        actual_df : DataFrame = self.df_factory.append_tt_delta_df(tt_df = tt_df, tt_delta_df = tt_delta_df)
 
-    def test_init_shouldinitializeobjectwithexpectedproperties_wheninvoked(self) -> None:
+        # Assert
+        assert_frame_equal(expected_df, actual_df)
+    def test_creatthash_shouldreturnsamehash_whensamerows(self) -> None:
 
         # Arrange
-        df_helper : TTDataFrameHelper = TTDataFrameHelper()
+        tt_df : DataFrame = ObjectMother().get_tt_df()
 
         # Act
-        actual : EffortHighlighter = EffortHighlighter(df_helper = df_helper)
+        actual : str = self.df_factory.create_tt_hash(tt_df = tt_df)
 
         # Assert
-        self.assertIsInstance(actual, EffortHighlighter)
+        self.assertEqual(self.df_factory.create_tt_hash(tt_df = ObjectMother().get_tt_df()), actual)
+        self.assertEqual(64, len(actual))
+    def test_creatthash_shouldreturndifferenthash_whenrowisedited(self) -> None:
 
-    @parameterized.expand([
-        ("00h 00m", True),
-        ("10h 45m", True),
-        ("101h 30m", True),
-        ("+71h 00m", True),
-		("+159h 00m", True),
-        ("-79h 30m", True),
-        ("-455h 45m", True),
-        ("invalid", False),
-        ("10h 60m", False),
-        ("h 30m", False),
-        ("-10h m", False),
-        ("+h m", False)
-    ])
-    def test_iseffort_shouldreturnexpectedresult_wheninvoked(self, effort: str, expected: bool) -> None:
-        
         # Arrange
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        edited_df : DataFrame = ObjectMother().get_tt_df()
+        edited_df.loc[3, TTCN.DESCRIPTOR] = "Edited"
+
         # Act
-        actual : bool = self.effort_highlighter._EffortHighlighter__is_effort(cell_content = effort)    # type: ignore
+        actual : str = self.df_factory.create_tt_hash(tt_df = edited_df)
 
         # Assert
-        self.assertEqual(actual, expected)
+        self.assertNotEqual(self.df_factory.create_tt_hash(tt_df = tt_df), actual)
+    def test_createttstimerangematrixdf_shouldreturnexpecteddataframe_wheninvoked(self) -> None:
 
-    def test_appendneweffortcell_shouldappendprovidedcell_wheninvoked(self) -> None:
-        
         # Arrange
-        effort_cells : list[EffortCell] = []
-        coordinate_pair : Tuple[int, int] = (0, 1)
-        cell_content : str = "5h 30m"
-        effort_td : timedelta = timedelta(hours = 5, minutes = 30)
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        expected_time_ranges : list[str] = ObjectMother().get_tts_by_timeranges_df()[TTCN.TIMERANGES][0]
 
         # Act
-        self.effort_highlighter._EffortHighlighter__append_new_effort_cell(effort_cells, coordinate_pair, cell_content) # type: ignore
+        actual_df : DataFrame = self.df_factory.create_tts_timerange_matrix_df(tt_df = tt_df)
 
         # Assert
-        self.assertEqual(len(effort_cells), 1)
-        self.assertEqual(effort_cells[0].coordinate_pair, coordinate_pair)
-        self.assertEqual(effort_cells[0].effort_str, cell_content)
-        self.assertEqual(effort_cells[0].effort_td, effort_td)
-    def test_extractrow_shouldreturneffortcells_whenrowhasvalidtimes(self) -> None:
-        
+        self.assertEqual((96, 96), actual_df.shape)
+        self.assertEqual("00:00", actual_df.index[0])
+        self.assertEqual("23:45", actual_df.columns[-1])
+        self.assertEqual(len(expected_time_ranges), actual_df.to_numpy().sum())
+        self.assertEqual(1, actual_df.loc["08:15", "12:45"])
+        self.assertEqual(1, actual_df.loc["23:00", "23:30"])
+    def test_createttstimerangematrixdffrompartials_shouldreturnsamedataframeasfromttdf_wheninvoked(self) -> None:
+
         # Arrange
-        df : DataFrame = DataFrame({"2015": ["10h 30m"], "↕": ["↑"], "2016": ["20h 45m"]})
-        column_names : list[str] = ["2015", "2016"]
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        expected_df : DataFrame = self.df_factory.create_tts_timerange_matrix_df(tt_df = tt_df)
 
         # Act
-        actual : list[EffortCell] = self.effort_highlighter._EffortHighlighter__extract_row(df = df, row_idx = 0, column_names = column_names)   # type: ignore
+        actual_df : DataFrame = self.df_factory.create_tts_timerange_matrix_df_from_partials(tt_partials = ObjectMother().get_tt_partials())
 
         # Assert
-        self.assertEqual(len(actual), 2)
-        self.assertEqual(actual[0].effort_str, "10h 30m")
-        self.assertEqual(actual[1].effort_str, "20h 45m")
+        assert_frame_equal(expected_df, actual_df)
+    def test_createttsbyweekdf_shouldreturnexpecteddataframe_wheninvoked(self) -> None:
 
-    @parameterized.expand([
-        (EFFORTMODE.top_one_effort_per_row, 1),
-        (EFFORTMODE.top_three_efforts, 3)
-    ])
-    def test_extractn_shouldreturnexpected_whenvalid(self, mode: EFFORTMODE, expected: int) -> None:
-        
         # Arrange
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        expected_df : DataFrame = ObjectMother().get_tts_by_week_df()
+
         # Act
-        actual : int = self.effort_highlighter._EffortHighlighter__extract_n(mode = mode)   # type: ignore
+        actual_df : DataFrame = self.df_factory.create_tts_by_week_df(tt_df = tt_df)
 
         # Assert
-        self.assertEqual(actual, expected)
+        assert_frame_equal(expected_df, actual_df)
+    def test_createttsbydaydf_shouldreturnexpecteddataframe_wheninvoked(self) -> None:
 
-    def test_extractn_shouldraiseexception_wheninvalid(self) -> None:
-        
         # Arrange
-        mode : EFFORTMODE = cast(EFFORTMODE, "Invalid")
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        expected_df : DataFrame = ObjectMother().get_tts_by_day_df()
 
-        # Act & Assert
-        with self.assertRaises(Exception):
-            self.effort_highlighter._EffortHighlighter__extract_n(mode = mode)   # type: ignore
-    def test_extracttopneffortcells_shouldreturntopncells_wheninvoked(self) -> None:
+        # Act
+        actual_df : DataFrame = self.df_factory.create_tts_by_day_df(tt_df = tt_df)
+
+        # Assert
+        assert_frame_equal(expected_df, actual_df)
+    def test_createttsbyquarterdf_shouldreturnexpecteddataframe_wheninvoked(self) -> None:
 
         # Arrange
-        effort_cells : list[EffortCell] = [
-            EffortCell(coordinate_pair = (0, 0), effort_str = "10h 00m", effort_td = timedelta(hours = 10)),
-            EffortCell(coordinate_pair = (0, 1), effort_str = "5h 30m", effort_td = timedelta(hours = 5, minutes = 30)),
-            EffortCell(coordinate_pair = (0, 2), effort_str = "20h 45m", effort_td = timedelta(hours = 20, minutes = 45))
-        ]
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        expected_df : DataFrame = ObjectMother().get_tts_by_quarter_df()
 
         # Act
-        actual : list[EffortCell] = self.effort_highlighter._EffortHighlighter__extract_top_n_effort_cells(effort_cells = effort_cells, n = 2)   # type: ignore
+        actual_df : DataFrame = self.df_factory.create_tts_by_quarter_df(tt_df = tt_df)
 
         # Assert
-        self.assertEqual(len(actual), 2)
-        self.assertEqual(actual[0].effort_str, "20h 45m")
-        self.assertEqual(actual[1].effort_str, "10h 00m")
-    def test_calculateeffortcells_shouldreturnexpectedcells_whentoponeeffortperrow(self) -> None:
-        
+        assert_frame_equal(expected_df, actual_df)
+    def test_createttsbydaydf_shouldreturnfulldailygrid_whenttdfspanstwelveyears(self) -> None:
+
         # Arrange
-        df : DataFrame = DataFrame({"2015": ["10h 30m", "15h 45m"], "↕": ["↑", "↑"], "2016": ["20h 45m", "20h 00m"]})
-        mode : EFFORTMODE = EFFORTMODE.top_one_effort_per_row
-        column_names : list[str] = ["2015", "2016"]
+        dates : list[date] = [d.date() for d in pd.date_range(start = "2014-01-01", end = "2025-12-31", freq = "3D")]
+        tt_df : DataFrame = DataFrame({ TTCN.DATE: dates, TTCN.EFFORT: ["1h 30m"] * len(dates) })
+        expected_days : int = (dates[-1] - dates[0]).days + 1
 
         # Act
-        actual : list[EffortCell] = self.effort_highlighter._EffortHighlighter__calculate_effort_cells(df = df, mode = mode, column_names = column_names)   # type: ignore
+        actual_df : DataFrame = self.df_factory.create_tts_by_day_df(tt_df = tt_df)
 
         # Assert
-        self.assertEqual(len(actual), 2)
-        self.assertEqual(actual[0].effort_str, "20h 45m")
-        self.assertEqual(actual[1].effort_str, "20h 00m")
-    def test_calculateeffortcells_shouldreturnexpectedcells_whentopthreeefforts(self) -> None:
-        
+        self.assertEqual(expected_days, len(actual_df))
+        self.assertEqual(len(dates), int((actual_df[TTCN.EFFORT] == "01h 30m").sum()))
+        self.assertEqual(expected_days - len(dates), int((actual_df[TTCN.EFFORT] == "00h 00m").sum()))
+    def test_createttsbyquarterdf_shouldfillmissingquarterswithzero_wheninvoked(self) -> None:
+
         # Arrange
-        df : DataFrame = DataFrame({"2015": ["10h 30m", "15h 45m"], "↕": ["↑", "↑"], "2016": ["20h 45m", "20h 00m"]})
-        mode : EFFORTMODE = EFFORTMODE.top_three_efforts
-        column_names : list[str] = ["2015", "2016"]
+        tt_df : DataFrame = DataFrame({ 
+            TTCN.DATE: [date(2023, 11, 2), date(2024, 8, 3)], 
+            TTCN.EFFORT: ["2h 00m", "3h 15m"] 
+        })
+        expected_df : DataFrame = DataFrame({
+            TTCN.YEAR: np.array([2023, 2024], dtype = int64),
+            "Q1": ["", "00h 00m"],
+            "Q2": ["", "00h 00m"],
+            "Q3": ["", "03h 15m"],
+            "Q4": ["02h 00m", ""]
+        })
 
         # Act
-        actual : list[EffortCell] = self.effort_highlighter._EffortHighlighter__calculate_effort_cells(df = df, mode = mode, column_names = column_names)   # type: ignore
+        actual_df : DataFrame = self.df_factory.create_tts_by_quarter_df(tt_df = tt_df)
 
         # Assert
-        self.assertEqual(len(actual), 3)
-        self.assertEqual(actual[0].effort_str, "20h 45m")
-        self.assertEqual(actual[1].effort_str, "20h 00m")
-        self.assertEqual(actual[2].effort_str, "15h 45m")
-    def test_calculateeffortcells_shouldraiseexception_wheninvalidmode(self) -> None:
+        assert_frame_equal(expected_df, actual_df)
+    def test_createttsbyweekdf_shouldreturnisoweeks_whenyearchanges(self) -> None:
 
         # Arrange
-        df : DataFrame = DataFrame({"2015": ["10h 30m", "15h 45m"], "↕": ["↑", "↑"], "2016": ["20h 45m", "20h 00m"]})
-        mode : EFFORTMODE = cast(EFFORTMODE, "Invalid")
-        column_names : list[str] = ["2015", "2016"]
+        tt_df : DataFrame = DataFrame({ 
+            TTCN.DATE: [date(2020, 12, 28), date(2021, 1, 3), date(2021, 1, 4)], 
+            TTCN.EFFORT: ["1h 00m", "1h 00m", "0h 45m"] 
+        })
 
-        expected : str = _MessageCollection.provided_mode_not_supported(mode)
-        
         # Act
-        with self.assertRaises(Exception) as context:
-            self.effort_highlighter._EffortHighlighter__calculate_effort_cells(df = df, mode = mode, column_names = column_names)   # type: ignore
+        actual_df : DataFrame = self.df_factory.create_tts_by_week_df(tt_df = tt_df)
 
         # Assert
-        self.assertEqual(expected, str(context.exception))
-    def test_addtags_shouldsurroundeffortcellsswithtokens_wheninvoked(self) -> None:
+        self.assertEqual([2020, 2021], actual_df[TTCN.YEAR].tolist())
+        self.assertEqual([53, 1], actual_df[TTCN.WEEK].tolist())
+        self.assertEqual(["02h 00m", "00h 45m"], actual_df[TTCN.EFFORT].tolist())
+    def test_createcompactttdf_shouldreducememoryusage_wheninvoked(self) -> None:
 
         # Arrange
-        effort_cells : list[EffortCell] = [
-            EffortCell((0, 1), "00h 00m", timedelta(hours = 0, minutes = 0)),
-            EffortCell((1, 3), "45h 30m", timedelta(hours = 45, minutes = 30))
-        ]
-        tags : Tuple[str, str] = ("[[ ", " ]]")
-        expected : DataFrame = self.df_without_duplicates.copy(deep = True)
-        expected.iloc[0, 1] = "[[ 00h 00m ]]"
-        expected.iloc[1, 3] = "[[ 45h 30m ]]"
+        tt_df : DataFrame = ObjectMother().get_tt_df()
 
         # Act
-        actual : DataFrame = self.effort_highlighter._EffortHighlighter__add_tags(self.df_without_duplicates, effort_cells, tags)   # type: ignore
+        actual_df : DataFrame = self.df_factory.create_compact_tt_df(tt_df = tt_df)
 
         # Assert
-        self.assertTrue(expected.equals(actual))
-    def test_highlightdataframe_shouldhighlightexpectedcells_whencolumnnamesareprovided(self) -> None:
+        self.assertEqual(tt_df.columns.tolist(), actual_df.columns.tolist())
+        self.assertLess(actual_df.memory_usage(deep = True).sum(), tt_df.memory_usage(deep = True).sum())
+        self.assertEqual(tt_df[TTCN.HASHTAG].tolist(), actual_df[TTCN.HASHTAG].tolist())
+        self.assertEqual(tt_df[TTCN.YEAR].tolist(), actual_df[TTCN.YEAR].tolist())
+    def test_createttmemoryusagedf_shouldreturnexpecteddataframe_wheninvoked(self) -> None:
 
         # Arrange
-        mode : EFFORTMODE = EFFORTMODE.top_one_effort_per_row
-        column_names : list[str] = ["2015", "2016", "2017"]
-
-        expected : DataFrame = self.df_without_duplicates.copy(deep = True)
-        expected.iloc[0, 5] = "<mark style='background-color: pink'>88h 30m</mark>"
-        expected.iloc[1, 5] = "<mark style='background-color: pink'>65h 30m</mark>"
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        compact_tt_df : DataFrame = self.df_factory.create_compact_tt_df(tt_df = tt_df)
+        expected_columns : list[str] = [TTCN.COLUMN, TTCN.MEMORYBEFORE, TTCN.MEMORYAFTER]
 
         # Act
-        actual : DataFrame = self.effort_highlighter._EffortHighlighter__highlight_dataframe(self.df_without_duplicates, mode, column_names) # type: ignore
+        actual_df : DataFrame = self.df_factory.create_tt_memory_usage_df(tt_df = tt_df, compact_tt_df = compact_tt_df)
 
         # Assert
-        assert_frame_equal(expected, actual)
-    def test_highlightdataframe_shouldhighlightexpectedcells_whencolumnnamesarenotprovided(self) -> None:
+        self.assertEqual(expected_columns, actual_df.columns.tolist())
+        self.assertEqual(["Index"] + tt_df.columns.tolist() + ["Total"], actual_df[TTCN.COLUMN].tolist())
+        self.assertEqual(tt_df.memory_usage(deep = True).sum(), actual_df[TTCN.MEMORYBEFORE].iloc[-1])
+        self.assertEqual(compact_tt_df.memory_usage(deep = True).sum(), actual_df[TTCN.MEMORYAFTER].iloc[-1])
+    def test_createttsdfs_shouldreturnsamedataframes_whenttdfiscompact(self) -> None:
 
         # Arrange
-        mode : EFFORTMODE = EFFORTMODE.top_one_effort_per_row
-        column_names : list[str] = []
+        software_project_names : list[str] = ["NW.NGramTextClassification", "NW.Shared.Serialization", "NW.UnivariateForecasting", "nwreadinglistmanager"]
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        compact_tt_df : DataFrame = self.df_factory.create_compact_tt_df(tt_df = tt_df)
+        now : datetime = datetime(2024, 12, 1)
+
+        # Act, Assert
+        assert_frame_equal(self.df_factory.create_tts_by_month_df(tt_df = tt_df, now = now), self.df_factory.create_tts_by_month_df(tt_df = compact_tt_df, now = now))
+        assert_frame_equal(self.df_factory.create_tts_by_year_df(tt_df = tt_df), self.df_factory.create_tts_by_year_df(tt_df = compact_tt_df))
+        assert_frame_equal(self.df_factory.create_tts_by_range_df(tt_df = tt_df), self.df_factory.create_tts_by_range_df(tt_df = compact_tt_df))
+        assert_frame_equal(
+            self.df_factory.create_tts_by_spn_df(tt_df = tt_df, software_project_names = software_project_names), 
+            self.df_factory.create_tts_by_spn_df(tt_df = compact_tt_df, software_project_names = software_project_names))
+        assert_frame_equal(
+            self.df_factory.create_tts_by_spv_df(tt_df = tt_df, software_project_names = software_project_names), 
+            self.df_factory.create_tts_by_spv_df(tt_df = compact_tt_df, software_project_names = software_project_names))
+        assert_frame_equal(self.df_factory.create_tts_by_hashtag_year_df(tt_df = tt_df), self.df_factory.create_tts_by_hashtag_year_df(tt_df = compact_tt_df))
+        assert_frame_equal(self.df_factory.create_tts_by_hashtag_df(tt_df = tt_df), self.df_factory.create_tts_by_hashtag_df(tt_df = compact_tt_df))
+        assert_frame_equal(
+            self.df_factory.create_tts_by_year_month_spnv_df(tt_df = tt_df, software_project_names = software_project_names), 
+            self.df_factory.create_tts_by_year_month_spnv_df(tt_df = compact_tt_df, software_project_names = software_project_names))
+        assert_frame_equal(
+            self.df_factory.create_tts_by_timeranges_df(tt_df = tt_df, min_occurrences = 1), 
+            self.df_factory.create_tts_by_timeranges_df(tt_df = compact_tt_df, min_occurrences = 1))
+        assert_frame_equal(self.df_factory.create_tts_timerange_matrix_df(tt_df = tt_df), self.df_factory.create_tts_timerange_matrix_df(tt_df = compact_tt_df))
+    def test_createquerydf_shouldreturntopnhashtags_whenorderedbyeffort(self) -> None:
 
-        expected : DataFrame = self.df_without_duplicates.copy(deep = True)
-        expected.iloc[0, 5] = "<mark style='background-color: pink'>88h 30m</mark>"
-        expected.iloc[1, 5] = "<mark style='background-color: pink'>65h 30m</mark>"
+        # Arrange
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        query : TTQuery = TTQuery(group_by = [TTCN.HASHTAG], order_by = [(TTCN.EFFORT, False)], top_n = 2, box_efforts = True)
+        expected_df : DataFrame = DataFrame({ TTCN.HASHTAG: ["#studying", "#csharp"], TTCN.EFFORT: ["23h 15m", "06h 15m"] })
 
         # Act
-        actual : DataFrame = self.effort_highlighter._EffortHighlighter__highlight_dataframe(self.df_without_duplicates, mode, column_names) # type: ignore
+        actual_df : DataFrame = self.df_factory.create_query_df(tt_df = tt_df, query = query)
 
         # Assert
-        assert_frame_equal(expected, actual)
-    def test_getlatestyear_shouldreturnexpectedstring_whencolumnnamesarestring(self) -> None:
-        
+        assert_frame_equal(expected_df, actual_df)
+    def test_createquerydf_shouldreturnsameefforts_astablesbuiltbyhand(self) -> None:
+
         # Arrange
-        data : dict = {
-            TTCN.HASHTAG : ["#python", "#studying"],
-            "2022" : ["06h 15m", "23h 15m"],
-            "2023" : ["06h 15m", "23h 15m"],
-            "2024" : ["06h 15m", "23h 15m"],
-            "2025" : ["06h 15m", "23h 15m"]
-        }
-        tts_by_hashtag_year_df : DataFrame = DataFrame(data)
-        expected : str = "2025"
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        query : TTQuery = TTQuery(
+            group_by = [TTCN.SOFTWAREPROJECTNAME, TTCN.SOFTWAREPROJECTVERSION], 
+            software_project_names = ["NW.NGramTextClassification", "NW.Shared.Serialization", "NW.UnivariateForecasting", "nwreadinglistmanager"],
+            box_efforts = True
+        )
+        expected_df : DataFrame = ObjectMother().get_tts_by_spv_df()
 
         # Act
-        actual : str = self.effort_highlighter._EffortHighlighter__get_latest_year(tts_by_hashtag_year_df) # type: ignore
+        actual_df : DataFrame = self.df_factory.create_query_df(tt_df = tt_df, query = query)
 
         # Assert
-        self.assertEqual(expected, actual)
-    def test_getlatestyear_shouldreturnexpectedstring_whencolumnnamesarenotstring(self) -> None:
-        
+        assert_frame_equal(expected_df, actual_df)
+    def test_createquerydf_shouldreturnexpectedpercentages_whenmeasureiseffortpercentage(self) -> None:
+
         # Arrange
-        data : dict = {
-            TTCN.HASHTAG : ["#python", "#studying"],
-            2022 : ["06h 15m", "23h 15m"],
-            2023 : ["06h 15m", "23h 15m"],
-            2024 : ["06h 15m", "23h 15m"],
-            2025 : ["06h 15m", "23h 15m"]
-        }
-        tts_by_hashtag_year_df : DataFrame = DataFrame(data)
-        expected : str = "2025"
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        query : TTQuery = TTQuery(group_by = [TTCN.HASHTAG], measure = QUERYMEASURE.effort_percentage)
+        expected : list[float] = ObjectMother().get_tts_by_hashtag_df()[TTCN.EFFORTPERC].tolist()
 
         # Act
-        actual : str = self.effort_highlighter._EffortHighlighter__get_latest_year(tts_by_hashtag_year_df) # type: ignore
+        actual_df : DataFrame = self.df_factory.create_query_df(tt_df = tt_df, query = query)
 
         # Assert
-        self.assertEqual(expected, actual)
-
-    def test_highlightttsbymonth_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual([TTCN.HASHTAG, TTCN.EFFORTPERC], actual_df.columns.tolist())
+        self.assertEqual(expected, actual_df[TTCN.EFFORTPERC].tolist())
+    def test_createquerydf_shouldcountfilteredsessions_whenmeasureiscount(self) -> None:
 
         # Arrange
-        tts_by_month_df : DataFrame = DataFrame()
-
-        highlighted_df : Mock = Mock()
-        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        query : TTQuery = TTQuery(
+            group_by = [TTCN.DATE], 
+            measure = QUERYMEASURE.occurrences, 
+            hashtags = ["#maintenance", "#python"], 
+            start_date = date(2024, 2, 12), 
+            end_date = date(2024, 2, 18)
+        )
+        expected_df : DataFrame = DataFrame({ TTCN.DATE: ["2024-02-12", "2024-02-18"], TTCN.OCCURRENCES: np.array([1, 5], dtype = int64) })
 
         # Act
-        self.effort_highlighter.highlight_tts_by_month(tts_by_month_df = tts_by_month_df)
+        actual_df : DataFrame = self.df_factory.create_query_df(tt_df = tt_df, query = query)
 
         # Assert
-        highlighted_df.assert_called_once_with(
-            df = tts_by_month_df,
-            mode = EFFORTMODE.top_three_efforts
-        )
-    def test_highlightttsbyyear_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        assert_frame_equal(expected_df, actual_df)
+    def test_explainquery_shouldreturnplan_wheninvoked(self) -> None:
 
         # Arrange
-        tts_by_year_df : DataFrame = DataFrame()
-
-        highlighted_df : Mock = Mock()
-        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+        query : TTQuery = TTQuery(group_by = [TTCN.HASHTAG], measure = QUERYMEASURE.occurrences)
+        expected : str = "1. group: groupby(by = ['Hashtag']).size()"
 
         # Act
-        self.effort_highlighter.highlight_tts_by_year(tts_by_year_df = tts_by_year_df)
+        actual : str = self.df_factory.explain_query(query = query)
 
         # Assert
-        highlighted_df.assert_called_once_with(
-            df = tts_by_year_df,
-            mode = EFFORTMODE.top_three_efforts
-        )
-    def test_highlightttsbyspv_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(expected, actual)
+    def test_createttpartials_shouldreturnexpectedobject_wheninvoked(self) -> None:
 
         # Arrange
-        tts_by_spv_df : DataFrame = DataFrame()
-
-        highlighted_df : Mock = Mock()
-        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        expected : TTPartials = ObjectMother().get_tt_partials()
 
         # Act
-        self.effort_highlighter.highlight_tts_by_spv(tts_by_spv_df = tts_by_spv_df)
+        actual : TTPartials = self.df_factory.create_tt_partials(tt_df = tt_df)
 
         # Assert
-        highlighted_df.assert_called_once_with(
-            df = tts_by_spv_df,
-            mode = EFFORTMODE.top_three_efforts
-        )    
-    def test_highlightttsbyhashtagyear_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        pd.testing.assert_series_equal(expected.by_year_month, actual.by_year_month)
+        pd.testing.assert_series_equal(expected.by_year_hashtag, actual.by_year_hashtag)
+        pd.testing.assert_series_equal(expected.by_software_project, actual.by_software_project)
+        pd.testing.assert_series_equal(expected.by_time_range, actual.by_time_range)
+    @parameterized.expand([
+        [PARTITIONTYPE.rows, 4, [5, 5, 5, 6]],
+        [PARTITIONTYPE.rows, 50, [1] * 21],
+        [PARTITIONTYPE.year, 4, [21]]
+    ])
+    def test_createttpartitions_shouldreturnexpectedpartitions_wheninvoked(self, partition_type : PARTITIONTYPE, partition_count : int, expected : list[int]) -> None:
 
         # Arrange
-        tts_by_hashtag_year_df : DataFrame = DataFrame()
-        latest_year : str = "2025"
-
-        get_latest_year_mock : Mock = Mock(return_value = latest_year)
-        highlighted_df : Mock = Mock()
-
-        self.effort_highlighter._EffortHighlighter__get_latest_year = get_latest_year_mock  # type: ignore
-        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df    # type: ignore
+        tt_df : DataFrame = ObjectMother().get_tt_df()
 
         # Act
-        self.effort_highlighter.highlight_tts_by_hashtag_year(tts_by_hashtag_year_df = tts_by_hashtag_year_df)
+        actual : list[DataFrame] = self.df_factory.create_tt_partitions(tt_df = tt_df, partition_type = partition_type, partition_count = partition_count)
 
         # Assert
-        get_latest_year_mock.assert_called_once_with(tts_by_hashtag_year_df)
-        highlighted_df.assert_called_once_with(
-            df = tts_by_hashtag_year_df,
-            mode = EFFORTMODE.top_three_efforts,
-            column_names = [latest_year]
-        )
-    def test_highlightttsbyhashtag_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(expected, [len(x) for x in actual])
+        assert_frame_equal(tt_df, pd.concat(objs = actual))
+    def test_createttpartitions_shouldreturnonepartitionperyear_whenpartitiontypeisyear(self) -> None:
 
         # Arrange
-        tts_by_hashtag_df : DataFrame = DataFrame()
-
-        highlighted_df : Mock = Mock()
-        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        tt_df.loc[tt_df.index[:5], TTCN.YEAR] = 2023
 
         # Act
-        self.effort_highlighter.highlight_tts_by_hashtag(tts_by_hashtag_df = tts_by_hashtag_df)
+        actual : list[DataFrame] = self.df_factory.create_tt_partitions(tt_df = tt_df, partition_type = PARTITIONTYPE.year, partition_count = 1)
 
         # Assert
-        highlighted_df.assert_called_once_with(
-            df = tts_by_hashtag_df,
-            mode = EFFORTMODE.top_three_efforts
-        )
-    def test_highlightttsbyyearmonthspnv_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual([[2023], [2024]], [x[TTCN.YEAR].unique().tolist() for x in actual])
+    def test_createttpartitions_shouldreturnttdf_whenttdfisempty(self) -> None:
 
         # Arrange
-        tts_by_year_month_spnv_df : DataFrame = DataFrame()
-
-        highlighted_df : Mock = Mock()
-        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+        tt_df : DataFrame = ObjectMother().get_tt_df().iloc[0:0]
 
         # Act
-        self.effort_highlighter.highlight_tts_by_year_month_spnv(tts_by_year_month_spnv_df = tts_by_year_month_spnv_df)
+        actual : list[DataFrame] = self.df_factory.create_tt_partitions(tt_df = tt_df, partition_type = PARTITIONTYPE.rows, partition_count = 4)
 
         # Assert
-        highlighted_df.assert_called_once_with(
-            df = tts_by_year_month_spnv_df,
-            mode = EFFORTMODE.top_three_efforts
-        )
-class TTAdapterTestCase(unittest.TestCase):
-
-    def setUp(self) -> None:
+        self.assertEqual(1, len(actual))
+        self.assertEqual(0, len(actual[0]))
+    def test_mergettpartials_shouldreturnsameobjectasforthewholedataframe_whenpartialsofsplitdataframe(self) -> None:
 
-        self.mocked_df_factory : Mock = Mock(spec = TTDataFrameFactory)
-        self.mocked_effort_highlighter : Mock = Mock(spec = EffortHighlighter)
+        # Arrange
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        expected : TTPartials = ObjectMother().get_tt_partials()
+        tt_partials : list[TTPartials] = [
+            self.df_factory.create_tt_partials(tt_df = tt_df.iloc[:7]),
+            self.df_factory.create_tt_partials(tt_df = tt_df.iloc[7:15]),
+            self.df_factory.create_tt_partials(tt_df = tt_df.iloc[15:])
+        ]
 
-        self.adapter : TTAdapter = TTAdapter(
-            df_factory = self.mocked_df_factory,  # type: ignore
-            effort_highlighter = self.mocked_effort_highlighter  # type: ignore
-        )
+        # Act
+        actual : TTPartials = self.df_factory.merge_tt_partials(tt_partials = tt_partials)
 
-        self.tt_df : DataFrame = DataFrame()
-        self.setting_bag : SettingBag = SettingBag(
-            options_tt = [OPTION.display],
-            options_tt_latest_four = [OPTION.display],
-            options_tts_by_month = [OPTION.display],
-            options_tts_by_year = [OPTION.display],
-            options_tts_by_range = [OPTION.display],
-            options_tts_by_spn = [OPTION.display],
-            options_tts_by_spv = [OPTION.display],
-            options_tts_by_hashtag_year = [OPTION.display],
-            options_tts_by_hashtag = [OPTION.display],
-            options_tts_by_year_month_spnv = [OPTION.display],
-            options_tts_by_timeranges = [OPTION.display],
-            options_definitions = [OPTION.display],
-            options_report = [OPTION.save_html],
-            excel_nrows = 10,
-            now = datetime(year = 2025, month = 12, day = 22)
-        )
-    def test_createttdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        # Assert
+        pd.testing.assert_series_equal(expected.by_year_month, actual.by_year_month)
+        pd.testing.assert_series_equal(expected.by_year_hashtag, actual.by_year_hashtag)
+        pd.testing.assert_series_equal(expected.by_software_project, actual.by_software_project)
+        pd.testing.assert_series_equal(expected.by_time_range, actual.by_time_range)
+    def test_createttsfrompartials_shouldreturnexpecteddataframes_wheninvoked(self) -> None:
 
         # Arrange
-        self.mocked_df_factory.create_tt_df = Mock(return_value = DataFrame())
+        software_project_names : list[str] = ["NW.NGramTextClassification", "NW.Shared.Serialization", "NW.UnivariateForecasting", "nwreadinglistmanager"]
+        tt_partials : TTPartials = ObjectMother().get_tt_partials()
 
         # Act
-        self.adapter._TTAdapter__create_tt_df(setting_bag = self.setting_bag)  # type: ignore
+        actual_month_df : DataFrame = self.df_factory.create_tts_by_month_df_from_partials(tt_partials = tt_partials, now = datetime(2024, 12, 1))
+        actual_year_df : DataFrame = self.df_factory.create_tts_by_year_df_from_partials(tt_partials = tt_partials)
+        actual_range_df : DataFrame = self.df_factory.create_tts_by_range_df_from_partials(tt_partials = tt_partials)
+        actual_spn_df : DataFrame = self.df_factory.create_tts_by_spn_df_from_partials(tt_partials = tt_partials, software_project_names = software_project_names)
+        actual_spv_df : DataFrame = self.df_factory.create_tts_by_spv_df_from_partials(tt_partials = tt_partials, software_project_names = software_project_names)
+        actual_hashtag_year_df : DataFrame = self.df_factory.create_tts_by_hashtag_year_df_from_partials(tt_partials = tt_partials)
+        actual_hashtag_df : DataFrame = self.df_factory.create_tts_by_hashtag_df_from_partials(tt_partials = tt_partials)
+        actual_ymspnv_df : DataFrame = self.df_factory.create_tts_by_year_month_spnv_df_from_partials(tt_partials = tt_partials, software_project_names = software_project_names)
+        actual_timeranges_df : DataFrame = self.df_factory.create_tts_by_timeranges_df_from_partials(tt_partials = tt_partials, min_occurrences = 1)
 
         # Assert
-        self.mocked_df_factory.create_tt_df.assert_called_once_with(
-            excel_path = self.setting_bag.excel_path,
-            excel_skiprows = self.setting_bag.excel_skiprows,
-            excel_nrows = self.setting_bag.excel_nrows,
-            excel_tabname = self.setting_bag.excel_tabname,
-            years = self.setting_bag.years
-        )
-    def test_createttlatestfourdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        assert_frame_equal(ObjectMother().get_tts_by_month_df(), actual_month_df)
+        assert_frame_equal(ObjectMother().get_tts_by_year_df(), actual_year_df)
+        assert_frame_equal(ObjectMother().get_tts_by_range_df(), actual_range_df)
+        assert_frame_equal(ObjectMother().get_tts_by_spn_df().sort_values(by = TTCN.SOFTWAREPROJECTNAME, ignore_index = True), actual_spn_df.sort_values(by = TTCN.SOFTWAREPROJECTNAME, ignore_index = True))
+        assert_frame_equal(ObjectMother().get_tts_by_spv_df(), actual_spv_df)
+        assert_frame_equal(ObjectMother().get_tts_by_hashtag_year_df(), actual_hashtag_year_df)
+        assert_frame_equal(ObjectMother().get_tts_by_hashtag_df(), actual_hashtag_df)
+        assert_frame_equal(ObjectMother().get_tts_by_year_month_spnv_df(), actual_ymspnv_df)
+        assert_frame_equal(ObjectMother().get_tts_by_timeranges_df(), actual_timeranges_df)
+class EffortRuleTestCase(unittest.TestCase):
 
-        # Arrange
-        self.mocked_df_factory.create_tt_latest_four_df = Mock(return_value = DataFrame())
+    @parameterized.expand([
+        [{ "n" : 0 }, _MessageCollection.provided_n_not_valid(n = 0)],
+        [{ "n" : -1 }, _MessageCollection.provided_n_not_valid(n = -1)],
+        [{ "percentile" : -0.5 }, _MessageCollection.provided_percentile_not_valid(percentile = -0.5)],
+        [{ "percentile" : 100.5 }, _MessageCollection.provided_percentile_not_valid(percentile = 100.5)],
+        [{ "buckets" : 0 }, _MessageCollection.provided_buckets_not_valid(buckets = 0)]
+    ])
+    def test_init_shouldraisevalueerror_whenargumentisoutofrange(self, kwargs : dict[str, Any], expected_message : str) -> None:
 
+        # Arrange
         # Act
-        self.adapter._TTAdapter__create_tt_latest_four_df(tt_df = self.tt_df)  # type: ignore
+        with self.assertRaises(ValueError) as context:
+            EffortRule(mode = EFFORTMODE.top_n_efforts, **kwargs)
 
         # Assert
-        self.mocked_df_factory.create_tt_latest_four_df.assert_called_once_with(tt_df = self.tt_df)
-    def test_createttsbymonthdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(expected_message, str(context.exception))
+    @parameterized.expand([
+        [{ "n" : 1 }],
+        [{ "percentile" : 0.0 }],
+        [{ "percentile" : 100.0 }],
+        [{ "buckets" : 1 }]
+    ])
+    def test_init_shouldnotraise_whenargumentisatboundary(self, kwargs : dict[str, Any]) -> None:
 
         # Arrange
-        self.mocked_df_factory.create_tts_by_month_df = Mock(return_value = DataFrame())
-
         # Act
-        self.adapter._TTAdapter__create_tts_by_month_df(tt_df = self.tt_df, setting_bag = self.setting_bag)  # type: ignore
+        actual : EffortRule = EffortRule(mode = EFFORTMODE.top_n_efforts, **kwargs)
 
         # Assert
-        self.mocked_df_factory.create_tts_by_month_df.assert_called_once_with(
-            tt_df = self.tt_df,
-            now = self.setting_bag.now
-        )
-    def test_createttsbyyeardf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertIsInstance(actual, EffortRule)
+class EffortHighlighterTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.effort_highlighter : EffortHighlighter = EffortHighlighter(df_helper = TTDataFrameHelper())
+
+        data : dict[str, list] = {
+            "Month": ["1", "2"],
+            "2015": ["00h 00m", "00h 00m"],
+            "↕": ["↑", "↑"],
+            "2016": ["18h 00m", "45h 30m"],
+            "↕_duplicate_1": ["↑", "↑"],
+            "2017": ["88h 30m", "65h 30m"]
+        }
+        columns_01 : list[str] = ["Month", "2015", "↕", "2016", "↕", "2017"]
+        self.df_with_duplicates : DataFrame = DataFrame(data, columns = columns_01)
+
+        columns_02 : list[str] = ["Month", "2015", "↕", "2016", "↕_duplicate_1", "2017"]
+        self.df_without_duplicates : DataFrame = DataFrame(data, columns = columns_02)
+
+    def test_init_shouldinitializeobjectwithexpectedproperties_wheninvoked(self) -> None:
 
         # Arrange
-        self.mocked_df_factory.create_tts_by_year_df = Mock(return_value = DataFrame())
+        df_helper : TTDataFrameHelper = TTDataFrameHelper()
 
         # Act
-        self.adapter._TTAdapter__create_tts_by_year_df(tt_df = self.tt_df)  # type: ignore
+        actual : EffortHighlighter = EffortHighlighter(df_helper = df_helper)
 
         # Assert
-        self.mocked_df_factory.create_tts_by_year_df.assert_called_once_with(tt_df = self.tt_df)
-    def test_createttsbyrangedf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertIsInstance(actual, EffortHighlighter)
 
+    @parameterized.expand([
+        ("00h 00m", True),
+        ("10h 45m", True),
+        ("101h 30m", True),
+        ("+71h 00m", True),
+		("+159h 00m", True),
+        ("-79h 30m", True),
+        ("-455h 45m", True),
+        ("invalid", False),
+        ("10h 60m", False),
+        ("h 30m", False),
+        ("-10h m", False),
+        ("+h m", False)
+    ])
+    def test_createminutesmatrix_shouldmaskonlyefforts_wheninvoked(self, effort: str, expected: bool) -> None:
+        
         # Arrange
-        self.mocked_df_factory.create_tts_by_range_df = Mock(return_value = DataFrame())
+        cells : np.ndarray = np.array([[effort]], dtype = object)
 
         # Act
-        self.adapter._TTAdapter__create_tts_by_range_df(tt_df = self.tt_df)  # type: ignore
+        _, actual_mask = self.effort_highlighter._EffortHighlighter__create_minutes_matrix(cells = cells)   # type: ignore
 
         # Assert
-        self.mocked_df_factory.create_tts_by_range_df.assert_called_once_with(tt_df = self.tt_df)
-    def test_createttsbyspndf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(bool(actual_mask[0, 0]), expected)
 
+    def test_createminutesmatrix_shouldreturnexpectedminutesandmask_wheninvoked(self) -> None:
+        
         # Arrange
-        self.mocked_df_factory.create_tts_by_spn_df = Mock(return_value = DataFrame())
+        cells : np.ndarray = np.array([["10h 30m", "↑", "-20h 45m"], ["+15h 45m", "10h 60m", "00h 00m"]], dtype = object)
+        expected_minutes : np.ndarray = np.array([[630, 0, -1245], [945, 0, 0]])
+        expected_mask : np.ndarray = np.array([[True, False, True], [True, False, True]])
 
         # Act
-        self.adapter._TTAdapter__create_tts_by_spn_df(tt_df = self.tt_df, setting_bag = self.setting_bag)  # type: ignore
+        actual_minutes, actual_mask = self.effort_highlighter._EffortHighlighter__create_minutes_matrix(cells = cells)   # type: ignore
 
         # Assert
-        self.mocked_df_factory.create_tts_by_spn_df.assert_called_once_with(
-            tt_df = self.tt_df,
-            software_project_names = self.setting_bag.tts_by_spn_software_project_names
-        )
-    def test_createttsbyspvdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
-
+        np.testing.assert_array_equal(actual_minutes, expected_minutes)
+        np.testing.assert_array_equal(actual_mask, expected_mask)
+    @parameterized.expand([
+        (EFFORTMODE.top_one_effort_per_row, 1),
+        (EFFORTMODE.top_three_efforts, 3),
+        (EFFORTMODE.top_n_efforts, 5),
+        (EFFORTMODE.top_n_efforts_per_row, 5),
+        (EFFORTMODE.top_n_efforts_per_column, 5)
+    ])
+    def test_extractn_shouldreturnexpected_whenvalid(self, mode: EFFORTMODE, expected: int) -> None:
+        
         # Arrange
-        self.mocked_df_factory.create_tts_by_spv_df = Mock(return_value = DataFrame())
-
         # Act
-        self.adapter._TTAdapter__create_tts_by_spv_df(tt_df = self.tt_df, setting_bag = self.setting_bag)  # type: ignore
+        actual : int = self.effort_highlighter._EffortHighlighter__extract_n(mode = mode, n = 5)   # type: ignore
 
         # Assert
-        self.mocked_df_factory.create_tts_by_spv_df.assert_called_once_with(
-            tt_df = self.tt_df,
-            software_project_names = self.setting_bag.tts_by_spv_software_project_names
-        )
-    def test_createttsbyhashtagyeardf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(actual, expected)
+
+    def test_extractn_shouldraiseexception_wheninvalid(self) -> None:
+        
+        # Arrange
+        mode : EFFORTMODE = cast(EFFORTMODE, "Invalid")
+
+        # Act & Assert
+        with self.assertRaises(Exception):
+            self.effort_highlighter._EffortHighlighter__extract_n(mode = mode)   # type: ignore
+    def test_selecttopn_shouldkeeprowmajororder_whenthereareties(self) -> None:
 
         # Arrange
-        self.mocked_df_factory.create_tts_by_hashtag_year_df = Mock(return_value = DataFrame())
+        minutes : np.ndarray = np.array([[60, 120, 60], [120, 60, 0]])
+        mask : np.ndarray = np.array([[True, True, True], [True, True, False]])
+        expected : list[int] = [1, 3, 0]
 
         # Act
-        self.adapter._TTAdapter__create_tts_by_hashtag_year_df(tt_df = self.tt_df)  # type: ignore
+        actual : np.ndarray = self.effort_highlighter._EffortHighlighter__select_top_n(minutes = minutes, mask = mask, n = 3)   # type: ignore
 
         # Assert
-        self.mocked_df_factory.create_tts_by_hashtag_year_df.assert_called_once_with(tt_df = self.tt_df)
-    def test_createttsbyhashtagdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(actual.tolist(), expected)
+    def test_selecttopnperrow_shouldreturnfirsthighestmaskedcellofeachrow_wheninvoked(self) -> None:
 
         # Arrange
-        self.mocked_df_factory.create_tts_by_hashtag_df = Mock(return_value = DataFrame())
+        minutes : np.ndarray = np.array([[60, 120, 120], [500, 60, 0], [0, 0, 0]])
+        mask : np.ndarray = np.array([[True, True, True], [False, True, True], [False, False, False]])
+        expected : list[int] = [1, 4]
 
         # Act
-        self.adapter._TTAdapter__create_tts_by_hashtag_df(tt_df = self.tt_df)  # type: ignore
+        actual : np.ndarray = self.effort_highlighter._EffortHighlighter__select_top_n_per_row(minutes = minutes, mask = mask, n = 1)   # type: ignore
 
         # Assert
-        self.mocked_df_factory.create_tts_by_hashtag_df.assert_called_once_with(tt_df = self.tt_df)
-    def test_createttsbyyearmonthspnvdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(actual.tolist(), expected)
+    def test_selecttopnpercolumn_shouldreturnhighestmaskedcellsofeachcolumn_wheninvoked(self) -> None:
 
         # Arrange
-        self.mocked_df_factory.create_tts_by_year_month_spnv_df = Mock(return_value = DataFrame())
+        minutes : np.ndarray = np.array([[60, 120, 0], [500, 120, 0], [90, 30, 0]])
+        mask : np.ndarray = np.array([[True, True, False], [True, True, False], [True, True, True]])
+        expected : list[int] = [3, 6, 1, 4, 8]
 
         # Act
-        self.adapter._TTAdapter__create_tts_by_year_month_spnv_df(tt_df = self.tt_df, setting_bag = self.setting_bag)  # type: ignore
+        actual : np.ndarray = self.effort_highlighter._EffortHighlighter__select_top_n_per_column(minutes = minutes, mask = mask, n = 2)   # type: ignore
 
         # Assert
-        self.mocked_df_factory.create_tts_by_year_month_spnv_df.assert_called_once_with(
-            tt_df = self.tt_df,
-            software_project_names = self.setting_bag.tts_by_spv_software_project_names
-        )
-    def test_createttsbytimerangesdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(actual.tolist(), expected)
+    def test_selecttoppercentile_shouldreturneffortsatorabovethreshold_wheninvoked(self) -> None:
 
         # Arrange
-        self.mocked_df_factory.create_tts_by_timeranges_df = Mock(return_value = DataFrame())
+        minutes : np.ndarray = np.array([[10, 20, 30], [40, 50, 50], [0, 0, 999]])
+        mask : np.ndarray = np.array([[True, True, True], [True, True, True], [True, True, False]])
+        expected : list[int] = [4, 5]
 
         # Act
-        self.adapter._TTAdapter__create_tts_by_timeranges_df(tt_df = self.tt_df, setting_bag = self.setting_bag)  # type: ignore
+        actual : np.ndarray = self.effort_highlighter._EffortHighlighter__select_top_percentile(minutes = minutes, mask = mask, percentile = 75.0)   # type: ignore
 
         # Assert
-        self.mocked_df_factory.create_tts_by_timeranges_df.assert_called_once_with(
-            tt_df = self.tt_df,
-            min_occurrences = self.setting_bag.tts_by_timeranges_min_occurrences
-        )
-    def test_createttdeffortstatusdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(actual.tolist(), expected)
+    def test_calculateheatintensities_shouldreturnquantilebuckets_wheninvoked(self) -> None:
 
         # Arrange
-        self.mocked_df_factory.create_ttd_effort_status_df = Mock(return_value = DataFrame())
+        minutes : np.ndarray = np.array([[10, 20, 30, 40], [50, 60, 70, 80], [80, 80, 0, 0]])
+        mask : np.ndarray = np.array([[True, True, True, True], [True, True, True, True], [True, True, False, False]])
+        expected_positions : list[int] = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+        expected_intensities : list[float] = [0.25, 0.25, 0.25, 0.5, 0.5, 0.75, 0.75, 1.0, 1.0, 1.0]
 
         # Act
-        self.adapter._TTAdapter__create_ttd_effort_status_df(tt_df = self.tt_df, setting_bag = self.setting_bag)  # type: ignore
+        actual_positions, actual_intensities = self.effort_highlighter._EffortHighlighter__calculate_heat_intensities(minutes = minutes, mask = mask, buckets = 4)   # type: ignore
 
         # Assert
-        self.mocked_df_factory.create_ttd_effort_status_df.assert_called_once_with(
-            tt_df = self.tt_df,
-            is_correct = self.setting_bag.ttd_effort_status_is_correct
-        )
-    def test_createsummary_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertEqual(actual_positions.tolist(), expected_positions)
+        self.assertEqual(actual_intensities.tolist(), expected_intensities)
+    def test_highlightttsbyyear_shouldaddgradedtags_wheneffortruleisheatscale(self) -> None:
 
         # Arrange
-        tt_df : DataFrame = DataFrame()
-        tt_latest_four_df : DataFrame = DataFrame()
-        tts_by_month_df : DataFrame = DataFrame()
-        tts_by_year_df : DataFrame = DataFrame()
-        tts_by_range_df : DataFrame = DataFrame()
-        tts_by_spn_df : DataFrame = DataFrame()
-        tts_by_spv_df : DataFrame = DataFrame()
-        tts_by_hashtag_year_df : DataFrame = DataFrame()
-        tts_by_hashtag_df : DataFrame = DataFrame()
-        tts_by_year_month_spnv_df : DataFrame = DataFrame()
-        tts_by_timeranges_df : DataFrame = DataFrame()
-        ttd_effort_status_df : DataFrame = DataFrame()
-        definitions_df : DataFrame = DataFrame()
-
-        with (
-            patch.object(self.adapter, "_TTAdapter__create_tt_df", return_value = tt_df) as mocked_create_tt_df,
-            patch.object(self.adapter, "_TTAdapter__create_tt_latest_four_df", return_value = tt_latest_four_df) as mocked_create_tt_latest_four_df,
-            patch.object(self.adapter, "_TTAdapter__create_tts_by_month_df", return_value = tts_by_month_df) as mocked_create_tts_by_month_df,
-            patch.object(self.adapter, "_TTAdapter__create_tts_by_year_df", return_value = tts_by_year_df) as mocked_create_tts_by_year_df,
-            patch.object(self.adapter, "_TTAdapter__create_tts_by_range_df", return_value = tts_by_range_df) as mocked_create_tts_by_range_df,
-            patch.object(self.adapter, "_TTAdapter__create_tts_by_spn_df", return_value = tts_by_spn_df) as mocked_create_tts_by_spn_df,
-            patch.object(self.adapter, "_TTAdapter__create_tts_by_spv_df", return_value = tts_by_spv_df) as mocked_create_tts_by_spv_df,
-            patch.object(self.adapter, "_TTAdapter__create_tts_by_hashtag_year_df", return_value = tts_by_hashtag_year_df) as mocked_create_tts_by_hashtag_year_df,
-            patch.object(self.adapter, "_TTAdapter__create_tts_by_hashtag_df", return_value = tts_by_hashtag_df) as mocked_create_tts_by_hashtag_df,
-            patch.object(self.adapter, "_TTAdapter__create_tts_by_year_month_spnv_df", return_value = tts_by_year_month_spnv_df) as mocked_create_tts_by_year_month_spnv_df,
-            patch.object(self.adapter, "_TTAdapter__create_tts_by_timeranges_df", return_value = tts_by_timeranges_df) as mocked_create_tts_by_timeranges_df,
-            patch.object(self.adapter, "_TTAdapter__create_ttd_effort_status_df", return_value = ttd_effort_status_df) as mocked_create_ttd_effort_status_df,
-            patch.object(self.mocked_df_factory, "create_definitions_df", return_value = definitions_df) as mocked_create_definitions_df
-        ):
+        tts_by_year_df : DataFrame = DataFrame(data = {"2015": ["10h 00m"], "2016": ["20h 00m"], "2017": ["30h 00m"], "2018": ["40h 00m"]})
+        effort_rule : EffortRule = EffortRule(mode = EFFORTMODE.heat_scale, buckets = 2)
+        expected : DataFrame = DataFrame(data = {
+            "2015": ["<mark style='background-color: rgba(255, 192, 203, 0.50)'>10h 00m</mark>"], 
+            "2016": ["<mark style='background-color: rgba(255, 192, 203, 0.50)'>20h 00m</mark>"], 
+            "2017": ["<mark style='background-color: pink'>30h 00m</mark>"], 
+            "2018": ["<mark style='background-color: pink'>40h 00m</mark>"]
+        })
 
-            self.mocked_effort_highlighter.highlight_tts_by_month = Mock(return_value = tts_by_month_df)
-            self.mocked_effort_highlighter.highlight_tts_by_year = Mock(return_value = tts_by_year_df)
-            self.mocked_effort_highlighter.highlight_tts_by_spv = Mock(return_value = tts_by_spv_df)
-            self.mocked_effort_highlighter.highlight_tts_by_hashtag_year = Mock(return_value = tts_by_hashtag_year_df)
-            self.mocked_effort_highlighter.highlight_tts_by_hashtag = Mock(return_value = tts_by_hashtag_df)
-            self.mocked_effort_highlighter.highlight_tts_by_year_month_spnv = Mock(return_value = tts_by_year_month_spnv_df)
+        # Act
+        actual : DataFrame = self.effort_highlighter.highlight_tts_by_year(tts_by_year_df = tts_by_year_df, effort_rule = effort_rule)
 
-            # Act
-            self.adapter.create_summary(setting_bag = self.setting_bag)
+        # Assert
+        assert_frame_equal(expected, actual)
+    def test_maskttsbyyear_shouldreturnintensities_wheneffortruleisheatscale(self) -> None:
 
-            # Assert
-            mocked_create_tt_df.assert_called_once_with(setting_bag = self.setting_bag)
-            mocked_create_tt_latest_four_df.assert_called_once_with(tt_df = tt_df)
-            mocked_create_tts_by_month_df.assert_called_once_with(tt_df = tt_df, setting_bag = self.setting_bag)
-            mocked_create_tts_by_year_df.assert_called_once_with(tt_df = tt_df)
-            mocked_create_tts_by_range_df.assert_called_once_with(tt_df = tt_df)
-            mocked_create_tts_by_spn_df.assert_called_once_with(tt_df = tt_df, setting_bag = self.setting_bag)
-            mocked_create_tts_by_spv_df.assert_called_once_with(tt_df = tt_df, setting_bag = self.setting_bag)
-            mocked_create_tts_by_hashtag_year_df.assert_called_once_with(tt_df = tt_df)
-            mocked_create_tts_by_hashtag_df.assert_called_once_with(tt_df = tt_df)
-            mocked_create_tts_by_year_month_spnv_df.assert_called_once_with(tt_df = tt_df, setting_bag = self.setting_bag)
-            mocked_create_tts_by_timeranges_df.assert_called_once_with(tt_df = tt_df, setting_bag = self.setting_bag)
-            mocked_create_ttd_effort_status_df.assert_called_once_with(tt_df = tt_df, setting_bag = self.setting_bag)
+        # Arrange
+        tts_by_year_df : DataFrame = DataFrame(data = {"2015": ["10h 00m"], "↕": ["↑"], "2016": ["20h 00m"]})
+        effort_rule : EffortRule = EffortRule(mode = EFFORTMODE.heat_scale, buckets = 2)
+        expected : DataFrame = DataFrame(data = {"2015": [0.5], "↕": [0.0], "2016": [1.0]})
 
-            mocked_create_definitions_df.assert_called_once_with()
+        # Act
+        actual : DataFrame = self.effort_highlighter.mask_tts_by_year(tts_by_year_df = tts_by_year_df, effort_rule = effort_rule)
 
-            self.mocked_effort_highlighter.highlight_tts_by_month.assert_called_once_with(tts_by_month_df = tts_by_month_df)
-            self.mocked_effort_highlighter.highlight_tts_by_year.assert_called_once_with(tts_by_year_df = tts_by_year_df)
-            self.mocked_effort_highlighter.highlight_tts_by_spv.assert_called_once_with(tts_by_spv_df = tts_by_spv_df)
-            self.mocked_effort_highlighter.highlight_tts_by_hashtag_year.assert_called_once_with(tts_by_hashtag_year_df = tts_by_hashtag_year_df)
-            self.mocked_effort_highlighter.highlight_tts_by_hashtag.assert_called_once_with(tts_by_hashtag_df = tts_by_hashtag_df)
-            self.mocked_effort_highlighter.highlight_tts_by_year_month_spnv.assert_called_once_with(tts_by_year_month_spnv_df = tts_by_year_month_spnv_df)
-class TTReportManagerTestCase(unittest.TestCase):
+        # Assert
+        assert_frame_equal(expected, actual)
+    def test_selecttopn_shouldreturnnoposition_whennislessthanone(self) -> None:
 
-    def setUp(self) -> None:
+        # Arrange
+        minutes : np.ndarray = np.array([[10, 20], [30, 40]], dtype = int64)
+        mask : np.ndarray = np.ones(shape = (2, 2), dtype = bool)
 
-        self.report_manager : TTReportManager = TTReportManager()
-        self.report_module : Any = importlib.import_module(TTReportManager.__module__)
+        # Act
+        actual : np.ndarray = self.effort_highlighter._EffortHighlighter__select_top_n(minutes = minutes, mask = mask, n = 0)  # type: ignore
 
-        empty_df : DataFrame = DataFrame()
-        self.tt_summary : TTSummary = TTSummary(
-            tt_df = empty_df,
-            tt_latest_four_df = empty_df,
-            tts_by_month_df = empty_df,
-            tts_by_year_df = empty_df,
-            tts_by_range_df = empty_df,
-            tts_by_spn_df = empty_df,
-            tts_by_spv_df = empty_df,
-            tts_by_hashtag_year_df = empty_df,
-            tts_by_hashtag_df = empty_df,
-            tts_by_year_month_spnv_df = empty_df,
-            tts_by_timeranges_df = empty_df,
-            ttd_effort_status_df = empty_df,
-            definitions_df = empty_df
-        )
-    def test_formatforfilename_shouldreturnexpectedstring_wheninvoked(self) -> None:
+        # Assert
+        self.assertEqual(0, len(actual))
+    @parameterized.expand([
+        (EffortRule(mode = EFFORTMODE.top_n_efforts, n = 2), [[False, False, True], [False, True, False]]),
+        (EffortRule(mode = EFFORTMODE.top_n_efforts_per_row, n = 2), [[False, True, True], [False, True, True]]),
+        (EffortRule(mode = EFFORTMODE.top_n_efforts_per_column, n = 1), [[False, False, True], [True, True, False]]),
+        (EffortRule(mode = EFFORTMODE.top_percentile_efforts, percentile = 50.0), [[False, True, True], [False, True, False]])
+    ])
+    def test_maskttsbyhashtag_shouldreturnexpectedmask_wheneffortruleisprovided(self, effort_rule : EffortRule, expected : list[list[bool]]) -> None:
 
         # Arrange
-        last_update : datetime = datetime(year = 2025, month = 12, day = 22, hour = 15, minute = 30, second = 45)
-        expected : str = "20251222"
+        tts_by_hashtag_df : DataFrame = DataFrame(data = [["01h 00m", "05h 00m", "90h 00m"], ["02h 00m", "60h 00m", "03h 00m"]], columns = ["A", "B", "C"])
 
         # Act
-        actual : str = self.report_manager._TTReportManager__format_for_file_name(last_update = last_update)  # type: ignore
+        actual : DataFrame = self.effort_highlighter.mask_tts_by_hashtag(tts_by_hashtag_df = tts_by_hashtag_df, effort_rule = effort_rule)
 
         # Assert
-        self.assertEqual(actual, expected)
-    def test_formatfortitle_shouldreturnexpectedstring_wheninvoked(self) -> None:
-
+        self.assertEqual(actual.to_numpy().tolist(), expected)
+    def test_createintensitymatrix_shouldmarktopthreeefforts_wheninvoked(self) -> None:
+        
         # Arrange
-        last_update : datetime = datetime(year = 2025, month = 12, day = 22, hour = 15, minute = 30, second = 45)
-        expected : str = "2025-12-22"
+        df : DataFrame = DataFrame({"2015": ["10h 30m", "15h 45m"], "↕": ["↑", "↑"], "2016": ["20h 45m", "20h 00m"]})
+        mode : EFFORTMODE = EFFORTMODE.top_three_efforts
+        column_names : list[str] = ["2015", "2016"]
+        expected : list[list[float]] = [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0]]
 
         # Act
-        actual : str = self.report_manager._TTReportManager__format_for_title(last_update = last_update)  # type: ignore
+        actual : np.ndarray = self.effort_highlighter._EffortHighlighter__create_intensity_matrix(df = df, mode = mode, column_names = column_names)   # type: ignore
 
         # Assert
-        self.assertEqual(actual, expected)
-    def test_createreportfilepaths_shouldreturnexpectedpaths_wheninvoked(self) -> None:
-
+        self.assertEqual(expected, actual.tolist())
+    def test_createintensitymatrix_shouldskipduplicatedcolumns_wheninvoked(self) -> None:
+        
         # Arrange
-        folder_path : str = "/home/nwreadinglist"
-        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
-        expected_html_path : Path = Path("/home/nwreadinglist") / "TIMETRACKINGREPORT20251222.html"
-        expected_pdf_path : Path = Path("/home/nwreadinglist") / "TIMETRACKINGREPORT20251222.pdf"
+        mode : EFFORTMODE = EFFORTMODE.top_three_efforts
+        column_names : list[str] = ["2015", "↕", "2016"]
 
         # Act
-        actual : Tuple[Path, Path] = self.report_manager._TTReportManager__create_report_file_paths(folder_path = folder_path,last_update = last_update)  # type: ignore
-        actual_html_path : Path = actual[0]
-        actual_pdf_path : Path = actual[1]
+        actual : np.ndarray = self.effort_highlighter._EffortHighlighter__create_intensity_matrix(df = self.df_with_duplicates, mode = mode, column_names = column_names)   # type: ignore
 
         # Assert
-        self.assertEqual(actual_html_path, expected_html_path)
-        self.assertEqual(actual_pdf_path, expected_pdf_path)
-    def test_createhtml_shouldcontainexpectedhtmlexcerpts_whenfooterisnotprovided(self) -> None:
+        self.assertEqual([(0, 1), (0, 3), (1, 3)], [tuple(x) for x in np.argwhere(actual > 0).tolist()])
+    def test_createintensitymatrix_shouldraiseexception_wheninvalidmode(self) -> None:
 
         # Arrange
-        df : DataFrame = DataFrame(data = {"A": [1.234]})
-        title : str = "Some Title"
-        formatters : Optional[dict] = {"A": "{:.2f}"}
+        df : DataFrame = DataFrame({"2015": ["10h 30m", "15h 45m"], "↕": ["↑", "↑"], "2016": ["20h 45m", "20h 00m"]})
+        mode : EFFORTMODE = cast(EFFORTMODE, "Invalid")
+        column_names : list[str] = ["2015", "2016"]
 
+        expected : str = _MessageCollection.provided_mode_not_supported(mode)
+        
         # Act
-        actual : str = self.report_manager._TTReportManager__create_html(df = df, title = title, formatters = formatters)  # type: ignore
+        with self.assertRaises(Exception) as context:
+            self.effort_highlighter._EffortHighlighter__create_intensity_matrix(df = df, mode = mode, column_names = column_names)   # type: ignore
 
         # Assert
-        self.assertIn("<div style='margin-bottom: 20px;'>", actual)
-        self.assertIn(f"<h2>{title}</h2>", actual)
+        self.assertEqual(expected, str(context.exception))
+    def test_addtags_shouldsurroundeffortcellsswithtokens_wheninvoked(self) -> None:
+
+        # Arrange
+        mask : np.ndarray = np.zeros(shape = self.df_without_duplicates.shape, dtype = float)
+        mask[0, 1] = 1.0
+        mask[1, 3] = 1.0
+        tags : Tuple[str, str] = ("[[ ", " ]]")
+        expected : DataFrame = self.df_without_duplicates.copy(deep = True)
+        expected.iloc[0, 1] = "[[ 00h 00m ]]"
+        expected.iloc[1, 3] = "[[ 45h 30m ]]"
+
+        # Act
+        actual : DataFrame = self.effort_highlighter._EffortHighlighter__add_tags(self.df_without_duplicates, mask, tags)   # type: ignore
+
+        # Assert
+        self.assertTrue(expected.equals(actual))
+    def test_highlightdataframe_shouldhighlightexpectedcells_whencolumnnamesareprovided(self) -> None:
+
+        # Arrange
+        mode : EFFORTMODE = EFFORTMODE.top_one_effort_per_row
+        column_names : list[str] = ["2015", "2016", "2017"]
+
+        expected : DataFrame = self.df_without_duplicates.copy(deep = True)
+        expected.iloc[0, 5] = "<mark style='background-color: pink'>88h 30m</mark>"
+        expected.iloc[1, 5] = "<mark style='background-color: pink'>65h 30m</mark>"
+
+        # Act
+        actual : DataFrame = self.effort_highlighter._EffortHighlighter__highlight_dataframe(self.df_without_duplicates, mode, column_names) # type: ignore
+
+        # Assert
+        assert_frame_equal(expected, actual)
+    def test_highlightdataframe_shouldhighlightexpectedcells_whencolumnnamesarenotprovided(self) -> None:
+
+        # Arrange
+        mode : EFFORTMODE = EFFORTMODE.top_one_effort_per_row
+        column_names : list[str] = []
+
+        expected : DataFrame = self.df_without_duplicates.copy(deep = True)
+        expected.iloc[0, 5] = "<mark style='background-color: pink'>88h 30m</mark>"
+        expected.iloc[1, 5] = "<mark style='background-color: pink'>65h 30m</mark>"
+
+        # Act
+        actual : DataFrame = self.effort_highlighter._EffortHighlighter__highlight_dataframe(self.df_without_duplicates, mode, column_names) # type: ignore
+
+        # Assert
+        assert_frame_equal(expected, actual)
+    def test_highlightdataframe_shouldrankonminutesdf_whenprovided(self) -> None:
+
+        # Arrange
+        mode : EFFORTMODE = EFFORTMODE.top_one_effort_per_row
+        column_names : list[str] = ["2015", "2016", "2017"]
+        minutes_df : DataFrame = DataFrame(
+            data = [[0.0, np.nan, 5000.0, np.nan, 0.0], [0.0, np.nan, 0.0, np.nan, 0.0]], 
+            columns = ["2015", "↕", "2016", "↕_duplicate_1", "2017"])
+        minutes_df.insert(0, "Month", np.nan)
+
+        expected : DataFrame = self.df_without_duplicates.copy(deep = True)
+        expected.iloc[0, 3] = "<mark style='background-color: pink'>18h 00m</mark>"
+        expected.iloc[1, 1] = "<mark style='background-color: pink'>00h 00m</mark>"
+
+        # Act
+        actual : DataFrame = self.effort_highlighter._EffortHighlighter__highlight_dataframe(self.df_without_duplicates, mode, column_names, minutes_df) # type: ignore
+
+        # Assert
+        assert_frame_equal(expected, actual)
+    @parameterized.expand([
+        ("mask_tts_by_month", "highlight_tts_by_month"),
+        ("mask_tts_by_year", "highlight_tts_by_year"),
+        ("mask_tts_by_spv", "highlight_tts_by_spv"),
+        ("mask_tts_by_hashtag", "highlight_tts_by_hashtag"),
+        ("mask_tts_by_year_month_spnv", "highlight_tts_by_year_month_spnv")
+    ])
+    def test_masktts_shouldflagsamecellsashighlighttts_wheninvoked(self, mask_name : str, highlight_name : str) -> None:
+
+        # Arrange
+        df : DataFrame = self.df_with_duplicates.copy(deep = True)
+        highlighted_df : DataFrame = getattr(self.effort_highlighter, highlight_name)(df)
+        expected : np.ndarray = highlighted_df.apply(lambda column : column.str.contains("<mark")).to_numpy()
+
+        # Act
+        actual : DataFrame = getattr(self.effort_highlighter, mask_name)(df)
+
+        # Assert
+        np.testing.assert_array_equal(expected, actual.to_numpy())
+        self.assertTrue(actual.columns.equals(df.columns))
+        assert_frame_equal(self.df_with_duplicates, df)
+    def test_maskttsbyhashtagyear_shouldflagonlylatestyear_wheninvoked(self) -> None:
+
+        # Arrange
+        data : dict = {
+            TTCN.HASHTAG : ["#python", "#studying"],
+            "2024" : ["06h 15m", "23h 15m"],
+            "2025" : ["01h 15m", "03h 15m"]
+        }
+        tts_by_hashtag_year_df : DataFrame = DataFrame(data)
+        expected : DataFrame = DataFrame(
+            data = [[False, False, True], [False, False, True]], 
+            columns = tts_by_hashtag_year_df.columns)
+
+        # Act
+        actual : DataFrame = self.effort_highlighter.mask_tts_by_hashtag_year(tts_by_hashtag_year_df = tts_by_hashtag_year_df)
+
+        # Assert
+        assert_frame_equal(expected, actual)
+    def test_getlatestyear_shouldreturnexpectedstring_whencolumnnamesarestring(self) -> None:
+        
+        # Arrange
+        data : dict = {
+            TTCN.HASHTAG : ["#python", "#studying"],
+            "2022" : ["06h 15m", "23h 15m"],
+            "2023" : ["06h 15m", "23h 15m"],
+            "2024" : ["06h 15m", "23h 15m"],
+            "2025" : ["06h 15m", "23h 15m"]
+        }
+        tts_by_hashtag_year_df : DataFrame = DataFrame(data)
+        expected : str = "2025"
+
+        # Act
+        actual : str = self.effort_highlighter._EffortHighlighter__get_latest_year(tts_by_hashtag_year_df) # type: ignore
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_getlatestyear_shouldreturnexpectedstring_whencolumnnamesarenotstring(self) -> None:
+        
+        # Arrange
+        data : dict = {
+            TTCN.HASHTAG : ["#python", "#studying"],
+            2022 : ["06h 15m", "23h 15m"],
+            2023 : ["06h 15m", "23h 15m"],
+            2024 : ["06h 15m", "23h 15m"],
+            2025 : ["06h 15m", "23h 15m"]
+        }
+        tts_by_hashtag_year_df : DataFrame = DataFrame(data)
+        expected : str = "2025"
+
+        # Act
+        actual : str = self.effort_highlighter._EffortHighlighter__get_latest_year(tts_by_hashtag_year_df) # type: ignore
+
+        # Assert
+        self.assertEqual(expected, actual)
+
+    def test_highlightttsbymonth_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        tts_by_month_df : DataFrame = DataFrame()
+
+        highlighted_df : Mock = Mock()
+        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+
+        # Act
+        self.effort_highlighter.highlight_tts_by_month(tts_by_month_df = tts_by_month_df)
+
+        # Assert
+        highlighted_df.assert_called_once_with(
+            df = tts_by_month_df,
+            mode = EFFORTMODE.top_three_efforts,
+            minutes_df = None,
+            effort_rule = EffortRule()
+        )
+    def test_highlightttsbyyear_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        tts_by_year_df : DataFrame = DataFrame()
+
+        highlighted_df : Mock = Mock()
+        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+
+        # Act
+        self.effort_highlighter.highlight_tts_by_year(tts_by_year_df = tts_by_year_df)
+
+        # Assert
+        highlighted_df.assert_called_once_with(
+            df = tts_by_year_df,
+            mode = EFFORTMODE.top_three_efforts,
+            minutes_df = None,
+            effort_rule = EffortRule()
+        )
+    def test_highlightttsbyspv_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        tts_by_spv_df : DataFrame = DataFrame()
+
+        highlighted_df : Mock = Mock()
+        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+
+        # Act
+        self.effort_highlighter.highlight_tts_by_spv(tts_by_spv_df = tts_by_spv_df)
+
+        # Assert
+        highlighted_df.assert_called_once_with(
+            df = tts_by_spv_df,
+            mode = EFFORTMODE.top_three_efforts,
+            minutes_df = None,
+            effort_rule = EffortRule()
+        )    
+    def test_highlightttsbyhashtagyear_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        tts_by_hashtag_year_df : DataFrame = DataFrame()
+        latest_year : str = "2025"
+
+        get_latest_year_mock : Mock = Mock(return_value = latest_year)
+        highlighted_df : Mock = Mock()
+
+        self.effort_highlighter._EffortHighlighter__get_latest_year = get_latest_year_mock  # type: ignore
+        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df    # type: ignore
+
+        # Act
+        self.effort_highlighter.highlight_tts_by_hashtag_year(tts_by_hashtag_year_df = tts_by_hashtag_year_df)
+
+        # Assert
+        get_latest_year_mock.assert_called_once_with(tts_by_hashtag_year_df)
+        highlighted_df.assert_called_once_with(
+            df = tts_by_hashtag_year_df,
+            mode = EFFORTMODE.top_three_efforts,
+            column_names = [latest_year],
+            minutes_df = None,
+            effort_rule = EffortRule()
+        )
+    def test_highlightttsbyhashtag_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        tts_by_hashtag_df : DataFrame = DataFrame()
+
+        highlighted_df : Mock = Mock()
+        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+
+        # Act
+        self.effort_highlighter.highlight_tts_by_hashtag(tts_by_hashtag_df = tts_by_hashtag_df)
+
+        # Assert
+        highlighted_df.assert_called_once_with(
+            df = tts_by_hashtag_df,
+            mode = EFFORTMODE.top_three_efforts,
+            minutes_df = None,
+            effort_rule = EffortRule()
+        )
+    def test_highlightttsbyyearmonthspnv_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        tts_by_year_month_spnv_df : DataFrame = DataFrame()
+
+        highlighted_df : Mock = Mock()
+        self.effort_highlighter._EffortHighlighter__highlight_dataframe = highlighted_df  # type: ignore
+
+        # Act
+        self.effort_highlighter.highlight_tts_by_year_month_spnv(tts_by_year_month_spnv_df = tts_by_year_month_spnv_df)
+
+        # Assert
+        highlighted_df.assert_called_once_with(
+            df = tts_by_year_month_spnv_df,
+            mode = EFFORTMODE.top_three_efforts,
+            minutes_df = None,
+            effort_rule = EffortRule()
+        )
+class TTPartialsCacheTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.tt_partials_cache : TTPartialsCache = TTPartialsCache()
+        self.tt_partials : TTPartials = ObjectMother().get_tt_partials()
+    def test_load_shouldreturnnone_whennofile(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+
+            # Act
+            actual : Optional[TTPartials] = self.tt_partials_cache.load(folder_path = folder_path, year = 2024, key = "abc")
+
+        # Assert
+        self.assertIsNone(actual)
+    def test_load_shouldreturnstoredobject_whensamekey(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+            self.tt_partials_cache.save(folder_path = folder_path, year = 2024, key = "abc", tt_partials = self.tt_partials)
+
+            # Act
+            actual : Optional[TTPartials] = self.tt_partials_cache.load(folder_path = folder_path, year = 2024, key = "abc")
+
+        # Assert
+        self.assertIsNotNone(actual)
+        pd.testing.assert_series_equal(self.tt_partials.by_year_month, cast(TTPartials, actual).by_year_month)
+        pd.testing.assert_series_equal(self.tt_partials.by_year_hashtag, cast(TTPartials, actual).by_year_hashtag)
+        pd.testing.assert_series_equal(self.tt_partials.by_software_project, cast(TTPartials, actual).by_software_project)
+        pd.testing.assert_series_equal(self.tt_partials.by_time_range, cast(TTPartials, actual).by_time_range)
+    def test_load_shouldreturnnone_whendifferentkey(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+            self.tt_partials_cache.save(folder_path = folder_path, year = 2024, key = "abc", tt_partials = self.tt_partials)
+
+            # Act
+            with patch.object(pd, "read_parquet") as mocked_read_parquet:
+                actual : Optional[TTPartials] = self.tt_partials_cache.load(folder_path = folder_path, year = 2024, key = "def")
+
+        # Assert
+        self.assertIsNone(actual)
+        mocked_read_parquet.assert_not_called()
+    def test_save_shouldnotwritepickle_wheninvoked(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+
+            # Act
+            self.tt_partials_cache.save(folder_path = folder_path, year = 2024, key = "abc", tt_partials = self.tt_partials)
+            actual : list[str] = sorted(x.name for x in Path(folder_path).iterdir())
+
+        # Assert
+        self.assertEqual([
+            "TTPARTIALS2024.by_software_project.parquet",
+            "TTPARTIALS2024.by_time_range.parquet",
+            "TTPARTIALS2024.by_year_hashtag.parquet",
+            "TTPARTIALS2024.by_year_month.parquet",
+            "TTPARTIALS2024.json"
+        ], actual)
+    def test_load_shouldreturnnone_whenkeyfileismalformed(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+            self.tt_partials_cache.save(folder_path = folder_path, year = 2024, key = "abc", tt_partials = self.tt_partials)
+            (Path(folder_path) / "TTPARTIALS2024.json").write_text("not json", encoding = "utf-8")
+
+            # Act
+            actual : Optional[TTPartials] = self.tt_partials_cache.load(folder_path = folder_path, year = 2024, key = "abc")
+
+        # Assert
+        self.assertIsNone(actual)
+class TTAssetBundleTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.asset_bundle : TTAssetBundle = TTAssetBundle(assets = { REPORTSTR.LOGOURL : ("image/png", b"png") })
+    def test_inline_shouldreplaceurlwithdatauri_whenurlisinbundle(self) -> None:
+
+        # Arrange
+        html : str = f"<img src='{REPORTSTR.LOGOURL}'><img src='https://www.numbworks.com/other.png'>"
+        expected : str = "<img src='data:image/png;base64,cG5n'><img src='https://www.numbworks.com/other.png'>"
+
+        # Act
+        actual : str = self.asset_bundle.inline(html = html)
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_fetch_shouldreturncontent_whenurlisinbundle(self) -> None:
+
+        # Arrange
+        expected : dict[str, Any] = { "string" : b"png", "mime_type" : "image/png", "redirected_url" : REPORTSTR.LOGOURL }
+
+        # Act
+        actual : dict[str, Any] = self.asset_bundle.fetch(url = REPORTSTR.LOGOURL)
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_fetch_shouldraisevalueerror_whenurlisnotinbundle(self) -> None:
+
+        # Arrange
+        url : str = "https://www.numbworks.com/other.png"
+
+        # Act
+        with self.assertRaises(ValueError) as context:
+            self.asset_bundle.fetch(url = url)
+
+        # Assert
+        self.assertEqual(_MessageCollection.provided_url_not_in_asset_bundle(url = url), str(context.exception))
+    def test_fetch_shouldusedefaulturlfetcher_whenurlisdatauri(self) -> None:
+
+        # Arrange
+        url : str = "data:image/png;base64,cG5n"
+        report_module : Any = importlib.import_module(TTAssetBundle.__module__)
+
+        with patch.object(report_module, "default_url_fetcher", return_value = { "string" : b"png" }) as mocked_default_url_fetcher:
+
+            # Act
+            actual : dict[str, Any] = self.asset_bundle.fetch(url = url)
+
+            # Assert
+            mocked_default_url_fetcher.assert_called_once_with(url)
+            self.assertEqual({ "string" : b"png" }, actual)
+    def test_loadasset_shouldreturnmimetypeandcontent_wheninvoked(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+            file_path : Path = Path(folder_path) / "logo.png"
+            file_path.write_bytes(b"png")
+
+            # Act
+            actual : Tuple[str, bytes] = TTAssetBundle.load_asset(file_path = str(file_path))
+
+        # Assert
+        self.assertEqual(("image/png", b"png"), actual)
+    def test_fetch_shouldreturnlogo_whennoassetsareprovided(self) -> None:
+
+        # Arrange
+        # Act
+        actual : dict[str, Any] = TTAssetBundle().fetch(url = REPORTSTR.LOGOURL)
+
+        # Assert
+        self.assertEqual("image/png", actual["mime_type"])
+        self.assertTrue(actual["string"].startswith(b"\x89PNG\r\n\x1a\n"))
+    def test_init_shouldinlinelogo_whencomponentbagisdefault(self) -> None:
+
+        # Arrange
+        html : str = f"<img src='{REPORTSTR.LOGOURL}'>"
+
+        # Act
+        actual : str = ComponentBag().ttr_manager._TTReportManager__asset_bundle.inline(html = html)  # type: ignore
+
+        # Assert
+        self.assertTrue(actual.startswith("<img src='data:image/png;base64,iVBORw0KGgo"))
+class TTReportCacheTestCase(unittest.TestCase):
+
+    def test_load_shouldreturnnoneandemptydict_whennofile(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+
+            # Act
+            actual : Tuple[Optional[str], dict[str, str]] = TTReportCache().load(folder_path = folder_path)
+
+        # Assert
+        self.assertEqual((None, {}), actual)
+    def test_load_shouldreturnstoredobjects_whenfileexists(self) -> None:
+
+        # Arrange
+        report_cache : TTReportCache = TTReportCache()
+        section_cache : dict[str, str] = { "abc" : "<div>One</div>" }
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            report_cache.save(folder_path = folder_path, document_key = "def", section_cache = section_cache)
+
+            # Act
+            actual : Tuple[Optional[str], dict[str, str]] = report_cache.load(folder_path = folder_path)
+
+        # Assert
+        self.assertEqual(("def", section_cache), actual)
+    def test_save_shouldwritejson_wheninvoked(self) -> None:
+
+        # Arrange
+        section_cache : dict[str, str] = { "abc" : "<div>One</div>" }
+        expected : dict[str, Any] = { "document_key" : "def", "section_cache" : section_cache }
+
+        with tempfile.TemporaryDirectory() as folder_path:
+
+            # Act
+            TTReportCache().save(folder_path = folder_path, document_key = "def", section_cache = section_cache)
+            actual : dict[str, Any] = json.loads((Path(folder_path) / "TTREPORTCACHE.json").read_text(encoding = "utf-8"))
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_load_shouldreturnnoneandemptydict_whenfileismalformed(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+            (Path(folder_path) / "TTREPORTCACHE.json").write_text("not json", encoding = "utf-8")
+
+            # Act
+            actual : Tuple[Optional[str], dict[str, str]] = TTReportCache().load(folder_path = folder_path)
+
+        # Assert
+        self.assertEqual((None, {}), actual)
+class TTSQLiteBackendTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.sqlite_backend : TTSQLiteBackend = TTSQLiteBackend(df_helper = TTDataFrameHelper())
+        self.tt_df : DataFrame = ObjectMother().get_tt_df()
+    def test_load_shouldcreateindexedsessionstable_wheninvoked(self) -> None:
+
+        # Arrange
+        expected_indexes : list[str] = [ "IX_Sessions_Date", "IX_Sessions_Hashtag", "IX_Sessions_SoftwareProjectName", "IX_Sessions_YearMonth" ]
+
+        # Act
+        connection : sqlite3.Connection = self.sqlite_backend.load(tt_df = self.tt_df)
+        actual_count : int = connection.execute("SELECT COUNT(*) FROM Sessions").fetchone()[0]
+        actual_indexes : list[str] = [ x[0] for x in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' ORDER BY name").fetchall() ]
+        connection.close()
+
+        # Assert
+        self.assertEqual(len(self.tt_df), actual_count)
+        self.assertEqual(expected_indexes, actual_indexes)
+    def test_load_shouldreplacesessionstable_whendatabasefilealreadyexists(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+            database_path : str = os.path.join(folder_path, "tt.db")
+            self.sqlite_backend.load(tt_df = self.tt_df, database_path = database_path).close()
+
+            # Act
+            connection : sqlite3.Connection = self.sqlite_backend.load(tt_df = self.tt_df, database_path = database_path)
+            actual : int = connection.execute("SELECT COUNT(*) FROM Sessions").fetchone()[0]
+            connection.close()
+
+        # Assert
+        self.assertEqual(len(self.tt_df), actual)
+    def test_readsql_shouldreturnexpecteddataframe_wheninvoked(self) -> None:
+
+        # Arrange
+        expected_df : DataFrame = DataFrame({ TTCN.YEAR: [ 2024 ], TTCN.OCCURRENCES: [ 21 ] })
+        sql : str = f'SELECT "{TTCN.YEAR}", COUNT(*) AS "{TTCN.OCCURRENCES}" FROM Sessions GROUP BY 1'
+
+        # Act
+        connection : sqlite3.Connection = self.sqlite_backend.load(tt_df = self.tt_df)
+        actual_df : DataFrame = self.sqlite_backend.read_sql(connection = connection, sql = sql)
+        connection.close()
+
+        # Assert
+        assert_frame_equal(expected_df, actual_df)
+    def test_createttpartials_shouldreturnsameobjectasdataframefactory_wheninvoked(self) -> None:
+
+        # Arrange
+        expected : TTPartials = TTDataFrameFactory(df_helper = TTDataFrameHelper()).create_tt_partials(tt_df = self.tt_df)
+
+        # Act
+        connection : sqlite3.Connection = self.sqlite_backend.load(tt_df = self.tt_df)
+        actual : TTPartials = self.sqlite_backend.create_tt_partials(connection = connection)
+        connection.close()
+
+        # Assert
+        pd.testing.assert_series_equal(expected.by_year_month, actual.by_year_month)
+        pd.testing.assert_series_equal(expected.by_year_hashtag, actual.by_year_hashtag)
+        pd.testing.assert_series_equal(expected.by_software_project, actual.by_software_project)
+        pd.testing.assert_series_equal(expected.by_time_range, actual.by_time_range)
+    @unittest.skipUnless(SupportMethodProvider.are_benchmarks_enabled(), "Benchmarks are disabled (see SupportMethodProvider.are_benchmarks_enabled()).")
+    def test_createttpartials_shouldprintbenchmarkagainstdataframefactory_whenbenchmarksareenabled(self) -> None:
+
+        # Arrange
+        df_factory : TTDataFrameFactory = TTDataFrameFactory(df_helper = TTDataFrameHelper())
+        print("\nTTSQLiteBackend vs TTDataFrameFactory (create_tt_partials(), best of 3)")
+        print(f"{'Rows':>10} {'pandas (s)':>12} {'SQLite (s)':>12} {'SQLite load (s)':>16} {'SQLite query (s)':>17}")
+
+        for rows in [10_000, 100_000, 1_000_000]:
+            tt_df : DataFrame = ObjectMother().get_synthetic_tt_df(rows = rows)
+
+            # Act
+            expected, pandas_seconds = SupportMethodProvider.measure(lambda : df_factory.create_tt_partials(tt_df = tt_df))
+            connection, load_seconds = SupportMethodProvider.measure(lambda : self.sqlite_backend.load(tt_df = tt_df), repeat = 1)
+            actual, query_seconds = SupportMethodProvider.measure(lambda : self.sqlite_backend.create_tt_partials(connection = connection))
+            connection.close()
+            print(f"{rows:>10} {pandas_seconds:>12.3f} {load_seconds + query_seconds:>12.3f} {load_seconds:>16.3f} {query_seconds:>17.3f}")
+
+            # Assert
+            pd.testing.assert_series_equal(expected.by_year_month, actual.by_year_month)
+            pd.testing.assert_series_equal(expected.by_software_project, actual.by_software_project)
+            pd.testing.assert_series_equal(expected.by_time_range, actual.by_time_range)
+class TTAdapterTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.mocked_df_factory : Mock = Mock(spec = TTDataFrameFactory)
+        self.mocked_effort_highlighter : Mock = Mock(spec = EffortHighlighter)
+
+        self.adapter : TTAdapter = TTAdapter(
+            df_factory = self.mocked_df_factory,  # type: ignore
+            effort_highlighter = self.mocked_effort_highlighter  # type: ignore
+        )
+
+        self.tt_df : DataFrame = DataFrame()
+        self.setting_bag : SettingBag = SettingBag(
+            options_tt = [OPTION.display],
+            options_tt_latest_four = [OPTION.display],
+            options_tts_by_month = [OPTION.display],
+            options_tts_by_year = [OPTION.display],
+            options_tts_by_range = [OPTION.display],
+            options_tts_by_spn = [OPTION.display],
+            options_tts_by_spv = [OPTION.display],
+            options_tts_by_hashtag_year = [OPTION.display],
+            options_tts_by_hashtag = [OPTION.display],
+            options_tts_by_year_month_spnv = [OPTION.display],
+            options_tts_by_timeranges = [OPTION.display],
+            options_definitions = [OPTION.display],
+            options_report = [OPTION.save_html],
+            excel_nrows = 10,
+            now = datetime(year = 2025, month = 12, day = 22),
+            options_ttd_effort_status = [OPTION.display]
+        )
+    def test_createttdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        self.mocked_df_factory.create_tt_df = Mock(return_value = DataFrame())
+
+        # Act
+        self.adapter._TTAdapter__create_tt_df(setting_bag = self.setting_bag)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tt_df.assert_called_once_with(
+            excel_path = self.setting_bag.excel_path,
+            excel_skiprows = self.setting_bag.excel_skiprows,
+            excel_nrows = self.setting_bag.excel_nrows,
+            excel_tabname = self.setting_bag.excel_tabname,
+            years = self.setting_bag.years
+        )
+    def test_createttlatestfourdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        self.mocked_df_factory.create_tt_latest_four_df = Mock(return_value = DataFrame())
+
+        # Act
+        self.adapter._TTAdapter__create_tt_latest_four_df(tt_df = self.tt_df)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tt_latest_four_df.assert_called_once_with(tt_df = self.tt_df)
+    def test_createttsbymonthtable_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        self.mocked_df_factory.create_tts_by_month_table = Mock(return_value = EffortTable(df = DataFrame(), minutes_df = DataFrame()))
+
+        # Act
+        self.adapter._TTAdapter__create_tts_by_month_table(tt_df = self.tt_df, setting_bag = self.setting_bag)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tts_by_month_table.assert_called_once_with(
+            tt_df = self.tt_df,
+            now = self.setting_bag.now
+        )
+    def test_createttsbyyeartable_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        self.mocked_df_factory.create_tts_by_year_table = Mock(return_value = EffortTable(df = DataFrame(), minutes_df = DataFrame()))
+
+        # Act
+        self.adapter._TTAdapter__create_tts_by_year_table(tt_df = self.tt_df)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tts_by_year_table.assert_called_once_with(tt_df = self.tt_df)
+    def test_createttsbyrangedf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        self.mocked_df_factory.create_tts_by_range_df = Mock(return_value = DataFrame())
+
+        # Act
+        self.adapter._TTAdapter__create_tts_by_range_df(tt_df = self.tt_df)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tts_by_range_df.assert_called_once_with(tt_df = self.tt_df)
+    def test_createttsbyspndf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        sp_frame : SoftwareProjectFrame = SoftwareProjectFrame(by_software_project = pd.Series(dtype = "object"))
+        self.mocked_df_factory.create_tts_by_spn_df_from_frame = Mock(return_value = DataFrame())
+
+        # Act
+        self.adapter._TTAdapter__create_tts_by_spn_df(sp_frame = sp_frame, setting_bag = self.setting_bag)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tts_by_spn_df_from_frame.assert_called_once_with(
+            sp_frame = sp_frame,
+            software_project_names = self.setting_bag.tts_by_spn_software_project_names
+        )
+    def test_createttsbyspvtable_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        sp_frame : SoftwareProjectFrame = SoftwareProjectFrame(by_software_project = pd.Series(dtype = "object"))
+        self.mocked_df_factory.create_tts_by_spv_table_from_frame = Mock(return_value = EffortTable(df = DataFrame(), minutes_df = DataFrame()))
+
+        # Act
+        self.adapter._TTAdapter__create_tts_by_spv_table(sp_frame = sp_frame, setting_bag = self.setting_bag)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tts_by_spv_table_from_frame.assert_called_once_with(
+            sp_frame = sp_frame,
+            software_project_names = self.setting_bag.tts_by_spv_software_project_names
+        )
+    def test_createttsbyhashtagyeartable_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        self.mocked_df_factory.create_tts_by_hashtag_year_table = Mock(return_value = EffortTable(df = DataFrame(), minutes_df = DataFrame()))
+
+        # Act
+        self.adapter._TTAdapter__create_tts_by_hashtag_year_table(tt_df = self.tt_df)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tts_by_hashtag_year_table.assert_called_once_with(tt_df = self.tt_df)
+    def test_createttsbyhashtagtable_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        self.mocked_df_factory.create_tts_by_hashtag_table = Mock(return_value = EffortTable(df = DataFrame(), minutes_df = DataFrame()))
+
+        # Act
+        self.adapter._TTAdapter__create_tts_by_hashtag_table(tt_df = self.tt_df)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tts_by_hashtag_table.assert_called_once_with(tt_df = self.tt_df)
+    def test_createttsbyyearmonthspnvtable_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        sp_frame : SoftwareProjectFrame = SoftwareProjectFrame(by_software_project = pd.Series(dtype = "object"))
+        self.mocked_df_factory.create_tts_by_year_month_spnv_table_from_frame = Mock(return_value = EffortTable(df = DataFrame(), minutes_df = DataFrame()))
+
+        # Act
+        self.adapter._TTAdapter__create_tts_by_year_month_spnv_table(sp_frame = sp_frame, setting_bag = self.setting_bag)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tts_by_year_month_spnv_table_from_frame.assert_called_once_with(
+            sp_frame = sp_frame,
+            software_project_names = self.setting_bag.tts_by_spv_software_project_names
+        )
+    def test_createttsbytimerangesdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        self.mocked_df_factory.create_tts_by_timeranges_df = Mock(return_value = DataFrame())
+
+        # Act
+        self.adapter._TTAdapter__create_tts_by_timeranges_df(tt_df = self.tt_df, setting_bag = self.setting_bag)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tts_by_timeranges_df.assert_called_once_with(
+            tt_df = self.tt_df,
+            min_occurrences = self.setting_bag.tts_by_timeranges_min_occurrences
+        )
+
+    @parameterized.expand([
+        ["_TTAdapter__create_tts_by_week_df", "create_tts_by_week_df"],
+        ["_TTAdapter__create_tts_by_day_df", "create_tts_by_day_df"],
+        ["_TTAdapter__create_tts_by_quarter_df", "create_tts_by_quarter_df"]
+    ])
+    def test_createttsbyperioddf_shouldperformexpectedcalls_wheninvoked(self, adapter_method : str, factory_method : str) -> None:
+
+        # Arrange
+        setattr(self.mocked_df_factory, factory_method, Mock(return_value = DataFrame()))
+
+        # Act
+        getattr(self.adapter, adapter_method)(tt_df = self.tt_df)
+
+        # Assert
+        getattr(self.mocked_df_factory, factory_method).assert_called_once_with(tt_df = self.tt_df)
+    def test_createttdeffortstatusdf_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        self.mocked_df_factory.create_ttd_effort_status_df = Mock(return_value = DataFrame())
+
+        # Act
+        self.adapter._TTAdapter__create_ttd_effort_status_df(tt_df = self.tt_df, setting_bag = self.setting_bag)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_ttd_effort_status_df.assert_called_once_with(
+            tt_df = self.tt_df,
+            is_correct = self.setting_bag.ttd_effort_status_is_correct
+        )
+    def test_createsummary_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        tt_df : DataFrame = DataFrame()
+        tt_latest_four_df : DataFrame = DataFrame()
+        tts_by_month_df : DataFrame = DataFrame()
+        tts_by_year_df : DataFrame = DataFrame()
+        tts_by_range_df : DataFrame = DataFrame()
+        tts_by_spn_df : DataFrame = DataFrame()
+        tts_by_spv_df : DataFrame = DataFrame()
+        tts_by_hashtag_year_df : DataFrame = DataFrame()
+        tts_by_hashtag_df : DataFrame = DataFrame()
+        tts_by_year_month_spnv_df : DataFrame = DataFrame()
+        tts_by_timeranges_df : DataFrame = DataFrame()
+        ttd_effort_status_df : DataFrame = DataFrame()
+        definitions_df : DataFrame = DataFrame()
+        sp_frame : SoftwareProjectFrame = SoftwareProjectFrame(by_software_project = pd.Series(dtype = "object"))
+        minutes_df : DataFrame = DataFrame()
+
+        with (
+            patch.object(self.adapter, "_TTAdapter__create_tt_df", return_value = tt_df) as mocked_create_tt_df,
+            patch.object(self.mocked_df_factory, "create_software_project_frame", return_value = sp_frame) as mocked_create_software_project_frame,
+            patch.object(self.adapter, "_TTAdapter__create_tt_latest_four_df", return_value = tt_latest_four_df) as mocked_create_tt_latest_four_df,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_month_table", return_value = EffortTable(df = tts_by_month_df, minutes_df = minutes_df)) as mocked_create_tts_by_month_table,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_year_table", return_value = EffortTable(df = tts_by_year_df, minutes_df = minutes_df)) as mocked_create_tts_by_year_table,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_range_df", return_value = tts_by_range_df) as mocked_create_tts_by_range_df,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_spn_df", return_value = tts_by_spn_df) as mocked_create_tts_by_spn_df,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_spv_table", return_value = EffortTable(df = tts_by_spv_df, minutes_df = minutes_df)) as mocked_create_tts_by_spv_table,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_hashtag_year_table", return_value = EffortTable(df = tts_by_hashtag_year_df, minutes_df = minutes_df)) as mocked_create_tts_by_hashtag_year_table,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_hashtag_table", return_value = EffortTable(df = tts_by_hashtag_df, minutes_df = minutes_df)) as mocked_create_tts_by_hashtag_table,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_year_month_spnv_table", return_value = EffortTable(df = tts_by_year_month_spnv_df, minutes_df = minutes_df)) as mocked_create_tts_by_year_month_spnv_table,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_timeranges_df", return_value = tts_by_timeranges_df) as mocked_create_tts_by_timeranges_df,
+            patch.object(self.adapter, "_TTAdapter__create_ttd_effort_status_df", return_value = ttd_effort_status_df) as mocked_create_ttd_effort_status_df,
+            patch.object(self.mocked_df_factory, "create_definitions_df", return_value = definitions_df) as mocked_create_definitions_df
+        ):
+
+            self.mocked_effort_highlighter.highlight_tts_by_month = Mock(return_value = tts_by_month_df)
+            self.mocked_effort_highlighter.highlight_tts_by_year = Mock(return_value = tts_by_year_df)
+            self.mocked_effort_highlighter.highlight_tts_by_spv = Mock(return_value = tts_by_spv_df)
+            self.mocked_effort_highlighter.highlight_tts_by_hashtag_year = Mock(return_value = tts_by_hashtag_year_df)
+            self.mocked_effort_highlighter.highlight_tts_by_hashtag = Mock(return_value = tts_by_hashtag_df)
+            self.mocked_effort_highlighter.highlight_tts_by_year_month_spnv = Mock(return_value = tts_by_year_month_spnv_df)
+
+            # Act
+            self.adapter.create_summary(setting_bag = self.setting_bag)
+
+            # Assert
+            mocked_create_tt_df.assert_called_once_with(setting_bag = self.setting_bag)
+            mocked_create_tt_latest_four_df.assert_called_once_with(tt_df = tt_df)
+            mocked_create_tts_by_month_table.assert_called_once_with(tt_df = tt_df, setting_bag = self.setting_bag)
+            mocked_create_tts_by_year_table.assert_called_once_with(tt_df = tt_df)
+            mocked_create_tts_by_range_df.assert_called_once_with(tt_df = tt_df)
+            mocked_create_software_project_frame.assert_called_once_with(tt_df = tt_df)
+            mocked_create_tts_by_spn_df.assert_called_once_with(sp_frame = sp_frame, setting_bag = self.setting_bag)
+            mocked_create_tts_by_spv_table.assert_called_once_with(sp_frame = sp_frame, setting_bag = self.setting_bag)
+            mocked_create_tts_by_hashtag_year_table.assert_called_once_with(tt_df = tt_df)
+            mocked_create_tts_by_hashtag_table.assert_called_once_with(tt_df = tt_df)
+            mocked_create_tts_by_year_month_spnv_table.assert_called_once_with(sp_frame = sp_frame, setting_bag = self.setting_bag)
+            mocked_create_tts_by_timeranges_df.assert_called_once_with(tt_df = tt_df, setting_bag = self.setting_bag)
+            mocked_create_ttd_effort_status_df.assert_called_once_with(tt_df = tt_df, setting_bag = self.setting_bag)
+
+            mocked_create_definitions_df.assert_called_once_with()
+
+            self.mocked_effort_highlighter.highlight_tts_by_month.assert_called_once_with(tts_by_month_df = tts_by_month_df, minutes_df = minutes_df, effort_rule = self.setting_bag.tts_by_month_effort_rule)
+            self.mocked_effort_highlighter.highlight_tts_by_year.assert_called_once_with(tts_by_year_df = tts_by_year_df, minutes_df = minutes_df, effort_rule = self.setting_bag.tts_by_year_effort_rule)
+            self.mocked_effort_highlighter.highlight_tts_by_spv.assert_called_once_with(tts_by_spv_df = tts_by_spv_df, minutes_df = minutes_df, effort_rule = self.setting_bag.tts_by_spv_effort_rule)
+            self.mocked_effort_highlighter.highlight_tts_by_hashtag_year.assert_called_once_with(tts_by_hashtag_year_df = tts_by_hashtag_year_df, minutes_df = minutes_df, effort_rule = self.setting_bag.tts_by_hashtag_year_effort_rule)
+            self.mocked_effort_highlighter.highlight_tts_by_hashtag.assert_called_once_with(tts_by_hashtag_df = tts_by_hashtag_df, minutes_df = minutes_df, effort_rule = self.setting_bag.tts_by_hashtag_effort_rule)
+            self.mocked_effort_highlighter.highlight_tts_by_year_month_spnv.assert_called_once_with(tts_by_year_month_spnv_df = tts_by_year_month_spnv_df, minutes_df = minutes_df, effort_rule = self.setting_bag.tts_by_year_month_spnv_effort_rule)
+    def test_createsummary_shouldcreatettpartials_whenenablettpartialsistrue(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, enable_tt_partials = True, years = [2024], now = datetime(2024, 12, 1))
+        expected : TTPartials = ObjectMother().get_tt_partials()
+
+        # Act
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            actual : Optional[TTPartials] = adapter.create_summary(setting_bag = setting_bag).tt_partials
+
+        # Assert
+        self.assertIsNotNone(actual)
+        pd.testing.assert_series_equal(expected.by_year_month, cast(TTPartials, actual).by_year_month)
+    def test_createchunkedsummary_shouldreturnsametablesascreatesummary_wheninvoked(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        tt_df : DataFrame = ObjectMother().get_tt_df().reset_index(drop = True)
+        tt_df[TTCN.DATE] = pd.to_datetime(tt_df[TTCN.DATE]).dt.date
+        table_names : list[str] = [
+            "tt_latest_four_df", "tts_by_month_df", "tts_by_year_df", "tts_by_range_df", "tts_by_spn_df", "tts_by_spv_df", "tts_by_hashtag_year_df", 
+            "tts_by_hashtag_df", "tts_by_year_month_spnv_df", "tts_by_timeranges_df", "ttd_effort_status_df", "definitions_df"
+        ]
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            parquet_path : str = os.path.join(folder_path, "tt.parquet")
+            tt_df.to_parquet(path = parquet_path)
+            setting_bag : SettingBag = replace(self.setting_bag, tt_parquet_path = parquet_path, tt_chunk_size = 5, years = [2024], now = datetime(2024, 12, 1))
+
+            with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = tt_df):
+                expected : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+            # Act
+            actual : TTSummary = adapter.create_chunked_summary(setting_bag = setting_bag)
+
+        # Assert
+        self.assertEqual(0, len(actual.tt_df))
+        self.assertEqual(["tts_by_week_df", "tts_by_day_df", "tts_by_quarter_df"], actual.skipped_tables[-3:])
+        pd.testing.assert_series_equal(ObjectMother().get_tt_partials().by_year_month, cast(TTPartials, actual.tt_partials).by_year_month)
+
+        for name in table_names:
+            assert_frame_equal(getattr(expected, name), getattr(actual, name), obj = name)
+    def test_createchunkedsummary_shouldnotcreatettdeffortstatusdf_whennooptionneedsit(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, options_ttd_effort_status = [], tt_chunk_size = 5, now = datetime(2024, 12, 1))
+        tt_chunks : list[DataFrame] = [ ObjectMother().get_tt_df() ]
+
+        # Act
+        with (
+            patch.object(adapter, "_TTAdapter__create_tt_df_chunks", return_value = iter(tt_chunks)),
+            patch.object(adapter, "_TTAdapter__create_ttd_effort_status_df") as mocked_create_ttd_effort_status_df
+        ):
+            actual : TTSummary = adapter.create_chunked_summary(setting_bag = setting_bag)
+
+        # Assert
+        mocked_create_ttd_effort_status_df.assert_not_called()
+        self.assertIn("ttd_effort_status_df", actual.skipped_tables)
+        self.assertEqual(0, len(actual.ttd_effort_status_df))
+    @unittest.skipUnless(SupportMethodProvider.are_benchmarks_enabled(), "Benchmarks are disabled (see SupportMethodProvider.are_benchmarks_enabled()).")
+    def test_createchunkedsummary_shouldkeeppeakmemorybounded_whenbenchmarksareenabled(self) -> None:
+
+        # Arrange
+        rows : int = 50_000_000
+        batch_size : int = 1_000_000
+        chunk_size : int = 100_000
+        budget : int = 256 * 1024 * 1024
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+
+        efforts : list[timedelta] = [ TTDataFrameHelper().unbox_effort(effort_str = x) for x in ObjectMother().get_tt_df()[TTCN.EFFORT] ]
+        expected : timedelta = sum(efforts, timedelta()) * (rows // len(efforts)) + sum(efforts[:(rows % len(efforts))], timedelta())
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            parquet_path : str = os.path.join(folder_path, "tt.parquet")
+            writer : Optional[ParquetWriter] = None
+
+            for start in range(0, rows, batch_size):
+                table : Table = Table.from_pandas(ObjectMother().get_synthetic_tt_df(rows = min(batch_size, rows - start), start = start), preserve_index = False)
+                writer = writer if writer is not None else ParquetWriter(where = parquet_path, schema = table.schema)
+                writer.write_table(table)
+
+            cast(ParquetWriter, writer).close()
+            setting_bag : SettingBag = replace(
+                self.setting_bag, options_ttd_effort_status = [], tt_parquet_path = parquet_path, tt_chunk_size = chunk_size, now = datetime(2024, 12, 1)
+            )
+
+            # Act
+            tracemalloc.start()
+
+            try:
+                actual, elapsed = SupportMethodProvider.measure(lambda : adapter.create_chunked_summary(setting_bag = setting_bag), repeat = 1)
+                peak : int = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+            print(f"\ncreate_chunked_summary(): {rows} rows, {chunk_size} rows per chunk, {elapsed:.1f}s, peak {peak / 2**20:.1f} MiB (budget {budget / 2**20:.0f} MiB)")
+
+        # Assert
+        self.assertLess(peak, budget)
+        self.assertEqual(expected, cast(TTPartials, actual.tt_partials).by_year_month.sum())
+    @parameterized.expand([
+        [PARTITIONTYPE.rows, 1],
+        [PARTITIONTYPE.rows, 3],
+        [PARTITIONTYPE.year, 2]
+    ])
+    def test_createsummary_shouldcreatesamettpartials_whenenablettpartialsmapreduceistrue(self, partition_type : PARTITIONTYPE, max_workers : int) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(
+            self.setting_bag, 
+            enable_tt_partials = True, 
+            enable_tt_partials_map_reduce = True, 
+            tt_partials_partition_type = partition_type,
+            tt_partials_max_workers = max_workers,
+            years = [2024], 
+            now = datetime(2024, 12, 1)
+        )
+        expected : TTPartials = ObjectMother().get_tt_partials()
+
+        # Act
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            actual : Optional[TTPartials] = adapter.create_summary(setting_bag = setting_bag).tt_partials
+
+        # Assert
+        self.assertIsNotNone(actual)
+        pd.testing.assert_series_equal(expected.by_year_month, cast(TTPartials, actual).by_year_month)
+        pd.testing.assert_series_equal(expected.by_year_hashtag, cast(TTPartials, actual).by_year_hashtag)
+        pd.testing.assert_series_equal(expected.by_software_project, cast(TTPartials, actual).by_software_project)
+        pd.testing.assert_series_equal(expected.by_time_range, cast(TTPartials, actual).by_time_range)
+    @unittest.skipUnless(SupportMethodProvider.are_benchmarks_enabled(), "Benchmarks are disabled (see SupportMethodProvider.are_benchmarks_enabled()).")
+    def test_createmapreducedttpartials_shouldprintspeedupcurve_whenbenchmarksareenabled(self) -> None:
+
+        # Arrange
+        rows : int = 1_000_000
+        max_workers : int = max(os.cpu_count() or 1, 4)
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        tt_df : DataFrame = ObjectMother().get_synthetic_tt_df(rows = rows)
+        setting_bag : SettingBag = replace(self.setting_bag, enable_tt_partials = True, enable_tt_partials_map_reduce = True, tt_partials_partition_type = PARTITIONTYPE.rows)
+        timings : dict[int, float] = {}
+        print(f"\n__create_map_reduced_tt_partials(): {rows} rows, PARTITIONTYPE.rows, {os.cpu_count()} CPU(s)")
+        print(f"{'Workers':>8} {'Seconds':>10} {'Speedup':>8}")
+
+        for workers in range(1, max_workers + 1):
+
+            # Act
+            actual, timings[workers] = SupportMethodProvider.measure(
+                lambda : adapter._TTAdapter__create_map_reduced_tt_partials(tt_df = tt_df, setting_bag = replace(setting_bag, tt_partials_max_workers = workers)),  # type: ignore
+                repeat = 1
+            )
+            print(f"{workers:>8} {timings[workers]:>10.3f} {timings[1] / timings[workers]:>7.2f}x")
+
+            if workers == 1:
+                expected : TTPartials = actual
+
+            # Assert
+            pd.testing.assert_series_equal(expected.by_year_month, actual.by_year_month)
+            pd.testing.assert_series_equal(expected.by_software_project, actual.by_software_project)
+            pd.testing.assert_series_equal(expected.by_time_range, actual.by_time_range)
+    @parameterized.expand([
+        [1],
+        [3]
+    ])
+    def test_createsummaries_shouldreturnsamesummariesascreatesummary_whenmanyscenarios(self, max_workers : int) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        tt_df.loc[tt_df.index[:5], TTCN.YEAR] = 2023
+        setting_bag : SettingBag = replace(self.setting_bag, now = datetime(2024, 12, 1))
+        setting_bags : list[SettingBag] = [
+            setting_bag,
+            replace(setting_bag, years = [2024], enable_effort_highlighting = False),
+            replace(setting_bag, now = datetime(2024, 6, 1), tts_by_timeranges_min_occurrences = 1, enable_compact_tt_df = True)
+        ]
+        table_names : list[str] = [ f.name for f in fields(TTSummary) if f.name not in ["timings_df", "tt_partials"] ]
+
+        def create_tt_df(setting_bag : SettingBag) -> DataFrame:
+            return TTDataFrameFactory(df_helper = TTDataFrameHelper()).filter_tt_df(tt_df = tt_df.copy(deep = True), years = setting_bag.years)
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", side_effect = create_tt_df) as mocked_create_tt_df:
+            expected : list[TTSummary] = [ adapter.create_summary(setting_bag = x) for x in setting_bags ]
+            mocked_create_tt_df.reset_mock()
+
+            # Act
+            actual : list[TTSummary] = adapter.create_summaries(setting_bags = setting_bags, max_workers = max_workers)
+
+        # Assert
+        mocked_create_tt_df.assert_called_once()
+        self.assertEqual(len(expected), len(actual))
+
+        for expected_summary, actual_summary in zip(expected, actual):
+            for name in table_names:
+                expected_value : Any = getattr(expected_summary, name)
+
+                if isinstance(expected_value, DataFrame):
+                    assert_frame_equal(expected_value, getattr(actual_summary, name), obj = name)
+                else:
+                    self.assertEqual(expected_value, getattr(actual_summary, name))
+    def test_createteamsummary_shouldmergettpartialsandskipothertables_wheninvoked(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        tt_partials : TTPartials = ObjectMother().get_tt_partials()
+        setting_bag : SettingBag = replace(self.setting_bag, now = datetime(2024, 12, 1))
+        expected_skipped_tables : list[str] = ["tt_latest_four_df", "tts_by_week_df", "tts_by_day_df", "tts_by_quarter_df", "ttd_effort_status_df"]
+
+        # Act
+        actual : TTSummary = adapter.create_team_summary(tt_partials = [tt_partials, tt_partials], setting_bag = setting_bag)
+
+        # Assert
+        self.assertEqual(expected_skipped_tables, actual.skipped_tables)
+        self.assertEqual(0, len(actual.tt_df))
+        self.assertEqual(0, len(actual.ttd_effort_status_df))
+        self.assertGreater(len(actual.tts_by_year_df), 0)
+        pd.testing.assert_series_equal(tt_partials.by_year_month * 2, cast(TTPartials, actual.tt_partials).by_year_month)
+    def test_createsummary_shouldcreatesamettpartials_whenenablettpartialssqliteistrue(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, enable_tt_partials = True, enable_tt_partials_sqlite = True, years = [2024], now = datetime(2024, 12, 1))
+        expected : TTPartials = ObjectMother().get_tt_partials()
+
+        # Act
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            actual : Optional[TTPartials] = adapter.create_summary(setting_bag = setting_bag).tt_partials
+
+        # Assert
+        self.assertIsNotNone(actual)
+        pd.testing.assert_series_equal(expected.by_year_month, cast(TTPartials, actual).by_year_month)
+        pd.testing.assert_series_equal(expected.by_software_project, cast(TTPartials, actual).by_software_project)
+    def test_getrequiredtables_shouldreturnalltablesbutttdeffortstatus_whendefaultoptions(self) -> None:
+
+        # Arrange
+        setting_bag : SettingBag = replace(self.setting_bag, options_ttd_effort_status = [])
+        expected : list[str] = [
+            "tt_latest_four_df", "tts_by_month_df", "tts_by_year_df", "tts_by_range_df", "tts_by_spn_df", "tts_by_spv_df",
+            "tts_by_hashtag_year_df", "tts_by_hashtag_df", "tts_by_year_month_spnv_df", "tts_by_timeranges_df", "tts_timerange_matrix_df", 
+            "tts_by_quarter_df", "definitions_df"
+        ]
+
+        # Act
+        actual : list[str] = self.adapter._TTAdapter__get_required_tables(setting_bag = setting_bag)  # type: ignore
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_getrequiredtables_shouldreturnonlytablewithoptions_whennoreport(self) -> None:
+
+        # Arrange
+        setting_bag : SettingBag = replace(
+            self.setting_bag,
+            options_tt_latest_four = [],
+            options_tts_by_year = [],
+            options_tts_by_range = [],
+            options_tts_by_spn = [],
+            options_tts_by_spv = [],
+            options_tts_by_hashtag_year = [],
+            options_tts_by_hashtag = [],
+            options_tts_by_year_month_spnv = [],
+            options_tts_by_timeranges = [],
+            options_definitions = [],
+            options_ttd_effort_status = [],
+            options_report = []
+        )
+        expected : list[str] = [ "tts_by_month_df" ]
+
+        # Act
+        actual : list[str] = self.adapter._TTAdapter__get_required_tables(setting_bag = setting_bag)  # type: ignore
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_createsummary_shouldskiptables_whennooptionneedsthem(self) -> None:
+
+        # Arrange
+        setting_bag : SettingBag = replace(self.setting_bag, options_ttd_effort_status = [], options_tts_by_timeranges = [], options_report = [])
+        
+        with (
+            patch.object(self.adapter, "_TTAdapter__create_tt_df", return_value = DataFrame()),
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_timeranges_df") as mocked_create_tts_by_timeranges_df,
+            patch.object(self.adapter, "_TTAdapter__create_ttd_effort_status_df") as mocked_create_ttd_effort_status_df
+        ):
+
+            # Act
+            actual : TTSummary = self.adapter.create_summary(setting_bag = setting_bag)
+
+            # Assert
+            mocked_create_tts_by_timeranges_df.assert_not_called()
+            mocked_create_ttd_effort_status_df.assert_not_called()
+            self.assertEqual(
+                ["tts_by_timeranges_df", "tts_timerange_matrix_df", "tts_by_week_df", "tts_by_day_df", "tts_by_quarter_df", "ttd_effort_status_df"], 
+                actual.skipped_tables)
+            self.assertEqual((0, 0), actual.ttd_effort_status_df.shape)
+    def test_createsummary_shouldcreatealltables_whenenabletablepruningisfalse(self) -> None:
+
+        # Arrange
+        setting_bag : SettingBag = replace(self.setting_bag, options_ttd_effort_status = [], enable_table_pruning = False)
+        ttd_effort_status_df : DataFrame = DataFrame()
+
+        with (
+            patch.object(self.adapter, "_TTAdapter__create_tt_df", return_value = DataFrame()),
+            patch.object(self.adapter, "_TTAdapter__create_ttd_effort_status_df", return_value = ttd_effort_status_df) as mocked_create_ttd_effort_status_df
+        ):
+
+            # Act
+            actual : TTSummary = self.adapter.create_summary(setting_bag = setting_bag)
+
+            # Assert
+            mocked_create_ttd_effort_status_df.assert_called_once()
+            self.assertEqual([], actual.skipped_tables)
+            self.assertIs(ttd_effort_status_df, actual.ttd_effort_status_df)
+    def test_updatesummary_shouldnotcreateskippedtables_whennewsessionsareappended(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1), options_tts_by_spv = [], options_report = [])
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = tt_df.iloc[:15]):
+            tt_summary : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+        # Act
+        actual : TTSummary = adapter.update_summary(tt_summary = tt_summary, new_tt_df = tt_df.iloc[15:].reset_index(drop = True), setting_bag = setting_bag)
+
+        # Assert
+        self.assertEqual(["tts_by_spv_df", "tts_timerange_matrix_df", "tts_by_week_df", "tts_by_day_df", "tts_by_quarter_df"], actual.skipped_tables)
+        self.assertEqual((0, 0), actual.tts_by_spv_df.shape)
+        self.assertEqual(len(tt_df), len(actual.tt_df))
+    def test_completesummary_shouldcreateskippedtables_wheninvoked(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1), options_tts_by_spv = [], options_report = [])
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            expected : TTSummary = adapter.create_summary(setting_bag = replace(setting_bag, enable_table_pruning = False))
+            tt_summary : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+        # Act
+        actual : TTSummary = adapter.complete_summary(tt_summary = tt_summary, setting_bag = setting_bag)
+
+        # Assert
+        self.assertIn("tts_by_spv_df", tt_summary.skipped_tables)
+        self.assertEqual([], actual.skipped_tables)
+        assert_frame_equal(expected.tts_by_spv_df, actual.tts_by_spv_df)
+        assert_frame_equal(expected.tts_by_week_df, actual.tts_by_week_df)
+        assert_frame_equal(expected.ttd_effort_status_df, actual.ttd_effort_status_df)
+    def test_completesummary_shouldleavetablesthatneedttdfskipped_whenttdfisempty(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1))
+        tt_summary : TTSummary = adapter.create_team_summary(tt_partials = [ObjectMother().get_tt_partials()], setting_bag = setting_bag)
+        expected : DataFrame = tt_summary.tts_by_month_df
+        tt_summary = replace(tt_summary, tts_by_month_df = DataFrame(), skipped_tables = ["tts_by_month_df"] + tt_summary.skipped_tables)
+
+        # Act
+        actual : TTSummary = adapter.complete_summary(tt_summary = tt_summary, setting_bag = setting_bag)
+
+        # Assert
+        self.assertNotIn("tts_by_month_df", actual.skipped_tables)
+        self.assertIn("tts_by_week_df", actual.skipped_tables)
+        assert_frame_equal(expected, actual.tts_by_month_df)
+    def test_createtableloaders_shouldreturnhighlightedtable_wheninvoked(self) -> None:
+
+        # Arrange
+        tt_df : DataFrame = DataFrame()
+        tts_by_year_df : DataFrame = DataFrame()
+        highlighted_df : DataFrame = DataFrame()
+        self.mocked_effort_highlighter.highlight_tts_by_year = Mock(return_value = highlighted_df)
+
+        tts_by_year_table : EffortTable = EffortTable(df = tts_by_year_df, minutes_df = DataFrame())
+
+        with patch.object(self.adapter, "_TTAdapter__create_tts_by_year_table", return_value = tts_by_year_table) as mocked_create_tts_by_year_table:
+
+            # Act
+            actual : DataFrame = self.adapter.create_table_loaders(tt_df = tt_df, setting_bag = self.setting_bag)["tts_by_year_df"]()
+
+            # Assert
+            mocked_create_tts_by_year_table.assert_called_once_with(tt_df = tt_df)
+            self.mocked_effort_highlighter.highlight_tts_by_year.assert_called_once_with(tts_by_year_df = tts_by_year_df, minutes_df = tts_by_year_table.minutes_df, effort_rule = self.setting_bag.tts_by_year_effort_rule)
+            self.assertIs(highlighted_df, actual)
+    def test_createsummary_shouldreturnexpectedtimingsdf_wheninvoked(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1))
+        expected_columns : list[str] = [TTCN.TABLE, TTCN.SECONDS]
+        expected_tables : list[str] = [
+            "tt_latest_four_df", "tts_by_month_df", "tts_by_year_df", "tts_by_range_df", "tts_by_spn_df", "tts_by_spv_df",
+            "tts_by_hashtag_year_df", "tts_by_hashtag_df", "tts_by_year_month_spnv_df", "tts_by_timeranges_df",
+            "tts_timerange_matrix_df", "tts_by_week_df", "tts_by_day_df", "tts_by_quarter_df", "ttd_effort_status_df", "definitions_df", 
+            "tt_partials", "skipped_tables"
+        ]
+
+        # Act
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            actual : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+        # Assert
+        self.assertEqual(expected_columns, actual.timings_df.columns.tolist())
+        self.assertEqual(expected_tables, actual.timings_df[TTCN.TABLE].tolist())
+        self.assertTrue((actual.timings_df[TTCN.SECONDS] >= 0).all())
+
+    @parameterized.expand([
+        [EXECUTORTYPE.thread, False],
+        [EXECUTORTYPE.process, False],
+        [EXECUTORTYPE.thread, True],
+        [EXECUTORTYPE.process, True]
+    ])
+    def test_createsummary_shouldreturnsamesummaryasserialrun_whenmaxworkersisgreaterthanone(self, executor_type : EXECUTORTYPE, enable_tt_partials : bool) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(
+            self.setting_bag, years = [2024], now = datetime(2024, 12, 1), options_tts_by_spn = [], options_report = [], enable_tt_partials = enable_tt_partials
+        )
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            expected : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+            # Act
+            actual : TTSummary = adapter.create_summary(setting_bag = replace(setting_bag, max_workers = 2, executor_type = executor_type))
+
+        # Assert
+        self.assertEqual(expected.skipped_tables, actual.skipped_tables)
+        self.assertEqual(expected.timings_df[TTCN.TABLE].tolist(), actual.timings_df[TTCN.TABLE].tolist())
+        assert_frame_equal(expected.tt_latest_four_df, actual.tt_latest_four_df)
+        assert_frame_equal(expected.tts_by_month_df, actual.tts_by_month_df)
+        assert_frame_equal(expected.tts_by_year_df, actual.tts_by_year_df)
+        assert_frame_equal(expected.tts_by_range_df, actual.tts_by_range_df)
+        assert_frame_equal(expected.tts_by_spn_df, actual.tts_by_spn_df)
+        assert_frame_equal(expected.tts_by_spv_df, actual.tts_by_spv_df)
+        assert_frame_equal(expected.tts_by_hashtag_year_df, actual.tts_by_hashtag_year_df)
+        assert_frame_equal(expected.tts_by_hashtag_df, actual.tts_by_hashtag_df)
+        assert_frame_equal(expected.tts_by_year_month_spnv_df, actual.tts_by_year_month_spnv_df)
+        assert_frame_equal(expected.tts_by_timeranges_df, actual.tts_by_timeranges_df)
+        assert_frame_equal(expected.ttd_effort_status_df, actual.ttd_effort_status_df)
+        assert_frame_equal(expected.definitions_df, actual.definitions_df)
+    def test_tableworker_shouldreuseshippedttpartialsandsoftwareprojectframe_whentablesarecreated(self) -> None:
+
+        # Arrange
+        df_factory : TTDataFrameFactory = TTDataFrameFactory(df_helper = TTDataFrameHelper())
+        adapter : TTAdapter = TTAdapter(df_factory = df_factory, effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        tt_partials : TTPartials = ObjectMother().get_tt_partials()
+
+        with (
+            patch.object(adapter, "_TTAdapter__create_tt_partials") as mocked_create_tt_partials,
+            patch.object(df_factory, "create_software_project_frame", wraps = df_factory.create_software_project_frame) as mocked_create_software_project_frame
+        ):
+
+            # Act
+            _TableWorker.initialize(adapter, tt_df, replace(self.setting_bag, now = datetime(2024, 12, 1)), None)
+            _TableWorker.create_table("tts_by_spn_df")
+            _TableWorker.create_table("tts_by_spv_df")
+            _TableWorker.initialize(adapter, tt_df, replace(self.setting_bag, now = datetime(2024, 12, 1), enable_tt_partials = True), tt_partials)
+            _TableWorker.create_table("tts_by_month_df")
+            actual : Tuple[Any, float] = _TableWorker.create_table("tt_partials")
+
+            # Assert
+            mocked_create_tt_partials.assert_not_called()
+            mocked_create_software_project_frame.assert_called_once_with(tt_df = tt_df)
+            self.assertIs(tt_partials, actual[0])
+    def test_createcachedttpartials_shouldstorettpartials_whenclosedyearnotcached(self) -> None:
+
+        # Arrange
+        mocked_cache : Mock = Mock(spec = TTPartialsCache)
+        mocked_cache.load = Mock(return_value = None)
+        df_factory : TTDataFrameFactory = TTDataFrameFactory(df_helper = TTDataFrameHelper())
+        adapter : TTAdapter = TTAdapter(df_factory = df_factory, effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()), tt_partials_cache = mocked_cache)
+        setting_bag : SettingBag = replace(self.setting_bag, now = datetime(2025, 1, 1), tt_partials_cache_folder_path = "/cache/")
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+        key : str = df_factory.create_tt_hash(tt_df = tt_df)
+        expected : TTPartials = ObjectMother().get_tt_partials()
+
+        # Act
+        actual : TTPartials = adapter._TTAdapter__create_cached_tt_partials(tt_df = tt_df, setting_bag = setting_bag)  # type: ignore
+
+        # Assert
+        mocked_cache.load.assert_called_once_with(folder_path = "/cache/", year = 2024, key = key)
+        mocked_cache.save.assert_called_once()
+        self.assertEqual(key, mocked_cache.save.call_args.kwargs["key"])
+        pd.testing.assert_series_equal(expected.by_year_month, actual.by_year_month)
+    def test_createcachedttpartials_shouldnotrecreatettpartials_whenclosedyeariscached(self) -> None:
+
+        # Arrange
+        cached : TTPartials = ObjectMother().get_tt_partials()
+        mocked_cache : Mock = Mock(spec = TTPartialsCache)
+        mocked_cache.load = Mock(return_value = cached)
+        self.mocked_df_factory.create_tt_hash = Mock(return_value = "abc")
+        self.mocked_df_factory.merge_tt_partials = Mock(return_value = cached)
+        adapter : TTAdapter = TTAdapter(df_factory = self.mocked_df_factory, effort_highlighter = self.mocked_effort_highlighter, tt_partials_cache = mocked_cache)  # type: ignore
+        setting_bag : SettingBag = replace(self.setting_bag, now = datetime(2025, 1, 1))
+
+        # Act
+        actual : TTPartials = adapter._TTAdapter__create_cached_tt_partials(tt_df = ObjectMother().get_tt_df(), setting_bag = setting_bag)  # type: ignore
+
+        # Assert
+        self.mocked_df_factory.create_tt_partials.assert_not_called()
+        mocked_cache.save.assert_not_called()
+        self.mocked_df_factory.merge_tt_partials.assert_called_once_with(tt_partials = [cached])
+        self.assertIs(cached, actual)
+    def test_createcachedttpartials_shouldnotusecache_whenopenyear(self) -> None:
+
+        # Arrange
+        mocked_cache : Mock = Mock(spec = TTPartialsCache)
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()), tt_partials_cache = mocked_cache)
+        setting_bag : SettingBag = replace(self.setting_bag, now = datetime(2024, 12, 1))
+
+        # Act
+        adapter._TTAdapter__create_cached_tt_partials(tt_df = ObjectMother().get_tt_df(), setting_bag = setting_bag)  # type: ignore
+
+        # Assert
+        mocked_cache.load.assert_not_called()
+        mocked_cache.save.assert_not_called()
+    def test_compactttdf_shouldreturnsamedataframe_whenenablecompactttdfisfalse(self) -> None:
+
+        # Arrange
+        tt_df : DataFrame = DataFrame()
+
+        # Act
+        actual_tt_df, actual_memory_usage_df = self.adapter._TTAdapter__compact_tt_df(tt_df = tt_df, setting_bag = self.setting_bag)  # type: ignore
+
+        # Assert
+        self.assertIs(tt_df, actual_tt_df)
+        self.assertTrue(actual_memory_usage_df.empty)
+        self.mocked_df_factory.create_compact_tt_df.assert_not_called()
+    def test_createsummary_shouldcontaincompactttdf_whenenablecompactttdfistrue(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1))
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            expected : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+            # Act
+            actual : TTSummary = adapter.create_summary(setting_bag = replace(setting_bag, enable_compact_tt_df = True))
+
+        # Assert
+        self.assertEqual("category", actual.tt_df[TTCN.HASHTAG].dtype.name)
+        self.assertEqual(12, len(actual.tt_memory_usage_df))
+        assert_frame_equal(expected.tts_by_month_df, actual.tts_by_month_df)
+        assert_frame_equal(expected.tts_by_spv_df, actual.tts_by_spv_df)
+        assert_frame_equal(expected.tts_by_hashtag_year_df, actual.tts_by_hashtag_year_df)
+        assert_frame_equal(expected.tts_by_timeranges_df, actual.tts_by_timeranges_df)
+    def test_createlazysummary_shouldcreateonlyttdf_wheninvoked(self) -> None:
+
+        # Arrange
+        tt_df : DataFrame = DataFrame()
+
+        with (
+            patch.object(self.adapter, "_TTAdapter__create_tt_df", return_value = tt_df) as mocked_create_tt_df,
+            patch.object(self.adapter, "_TTAdapter__create_tts_by_month_table", return_value = EffortTable(df = DataFrame(), minutes_df = DataFrame())) as mocked_create_tts_by_month_table
+        ):
+
+            # Act
+            actual : LazyTTSummary = self.adapter.create_lazy_summary(setting_bag = self.setting_bag)
+
+            # Assert
+            mocked_create_tt_df.assert_called_once_with(setting_bag = self.setting_bag)
+            mocked_create_tts_by_month_table.assert_not_called()
+            self.assertIs(actual.tt_df, tt_df)
+    def test_createlazysummary_shouldcreatettpartialsonce_whenfirsttablethatneedsthemisaccessed(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, enable_tt_partials = True, years = [2024], now = datetime(2024, 12, 1))
+        tt_partials : TTPartials = ObjectMother().get_tt_partials()
+
+        with (
+            patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()),
+            patch.object(adapter, "_TTAdapter__create_tt_partials", return_value = tt_partials) as mocked_create_tt_partials
+        ):
+
+            # Act
+            actual : LazyTTSummary = adapter.create_lazy_summary(setting_bag = setting_bag)
+            mocked_create_tt_partials.assert_not_called()
+            _ = actual.tts_by_month_df
+            _ = actual.tts_by_spv_df
+
+            # Assert
+            mocked_create_tt_partials.assert_called_once()
+            self.assertIs(actual.tt_partials, tt_partials)
+    def test_createlazysummary_shouldreturnsamesummaryascreatesummary_whenalltablesareaccessed(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1))
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            expected : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+            lazy_summary : LazyTTSummary = adapter.create_lazy_summary(setting_bag = setting_bag)
+
+        # Act
+        actual : TTSummary = lazy_summary.to_summary()
+
+        # Assert
+        assert_frame_equal(expected.tts_by_month_df, actual.tts_by_month_df)
+        assert_frame_equal(expected.tts_by_spv_df, actual.tts_by_spv_df)
+        assert_frame_equal(expected.tts_by_hashtag_df, actual.tts_by_hashtag_df)
+        assert_frame_equal(expected.tts_by_timeranges_df, actual.tts_by_timeranges_df)
+        assert_frame_equal(expected.definitions_df, actual.definitions_df)
+    def test_updatesummary_shouldreturnsamesummaryascreatesummary_whennewsessionsareappended(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1))
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = tt_df):
+            expected : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = tt_df.iloc[:15]):
+            tt_summary : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+        # Act
+        actual : TTSummary = adapter.update_summary(tt_summary = tt_summary, new_tt_df = tt_df.iloc[15:].reset_index(drop = True), setting_bag = setting_bag)
+
+        # Assert
+        assert_frame_equal(expected.tt_df, actual.tt_df)
+        assert_frame_equal(expected.tt_latest_four_df, actual.tt_latest_four_df)
+        assert_frame_equal(expected.tts_by_month_df, actual.tts_by_month_df)
+        assert_frame_equal(expected.tts_by_year_df, actual.tts_by_year_df)
+        assert_frame_equal(expected.tts_by_range_df, actual.tts_by_range_df)
+        assert_frame_equal(expected.tts_by_spn_df, actual.tts_by_spn_df)
+        assert_frame_equal(expected.tts_by_spv_df, actual.tts_by_spv_df)
+        assert_frame_equal(expected.tts_by_hashtag_year_df, actual.tts_by_hashtag_year_df)
+        assert_frame_equal(expected.tts_by_hashtag_df, actual.tts_by_hashtag_df)
+        assert_frame_equal(expected.tts_by_year_month_spnv_df, actual.tts_by_year_month_spnv_df)
+        assert_frame_equal(expected.tts_by_timeranges_df, actual.tts_by_timeranges_df)
+        assert_frame_equal(expected.ttd_effort_status_df, actual.ttd_effort_status_df)
+    def test_createsummary_shouldreturncleantablesandhighlightmasks_whenefforthighlightingmodeisstyler(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1))
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            tagged_summary : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+            # Act
+            actual : TTSummary = adapter.create_summary(setting_bag = replace(setting_bag, effort_highlighting_mode = HIGHLIGHTMODE.styler))
+            lazy_summary : LazyTTSummary = adapter.create_lazy_summary(setting_bag = replace(setting_bag, effort_highlighting_mode = HIGHLIGHTMODE.styler))
+
+        # Assert
+        self.assertEqual({}, tagged_summary.highlight_masks)
+        self.assertEqual(["tts_by_month_df", "tts_by_year_df", "tts_by_hashtag_year_df", "tts_by_hashtag_df"], list(actual.highlight_masks.keys()))
+        self.assertTrue(actual.tts_by_spv_df.empty)
+
+        for name, mask in actual.highlight_masks.items():
+            tagged_df : DataFrame = getattr(tagged_summary, name)
+            clean_df : DataFrame = getattr(actual, name)
+
+            np.testing.assert_array_equal(tagged_df.astype(str).apply(lambda column : column.str.contains("<mark")).to_numpy(), mask.to_numpy())
+            self.assertFalse(clean_df.astype(str).apply(lambda column : column.str.contains("<mark")).to_numpy().any())
+            assert_frame_equal(mask, lazy_summary.highlight_masks[name])
+    def test_createsummary_shouldhighlightaspereffortrule_whensettingbagprovidesone(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        effort_rule : EffortRule = EffortRule(mode = EFFORTMODE.top_n_efforts_per_column, n = 1)
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1), tts_by_month_effort_rule = effort_rule)
+
+        # Act
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = ObjectMother().get_tt_df()):
+            actual : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+        # Assert
+        marks : DataFrame = actual.tts_by_month_df.astype(str).apply(lambda column : column.str.contains("<mark"))
+        self.assertEqual(1, int(marks["2024"].sum()))
+        self.assertEqual(1, int(marks.to_numpy().sum()))
+    def test_updatesummary_shouldreturnsamehighlightmasksascreatesummary_whennewsessionsareappended(self) -> None:
+
+        # Arrange
+        adapter : TTAdapter = TTAdapter(df_factory = TTDataFrameFactory(df_helper = TTDataFrameHelper()), effort_highlighter = EffortHighlighter(df_helper = TTDataFrameHelper()))
+        setting_bag : SettingBag = replace(self.setting_bag, years = [2024], now = datetime(2024, 12, 1), effort_highlighting_mode = HIGHLIGHTMODE.styler)
+        tt_df : DataFrame = ObjectMother().get_tt_df()
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = tt_df):
+            expected : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+        with patch.object(adapter, "_TTAdapter__create_tt_df", return_value = tt_df.iloc[:15]):
+            tt_summary : TTSummary = adapter.create_summary(setting_bag = setting_bag)
+
+        # Act
+        actual : TTSummary = adapter.update_summary(tt_summary = tt_summary, new_tt_df = tt_df.iloc[15:].reset_index(drop = True), setting_bag = setting_bag)
+
+        # Assert
+        self.assertEqual(list(expected.highlight_masks.keys()), list(actual.highlight_masks.keys()))
+
+        for name, mask in expected.highlight_masks.items():
+            assert_frame_equal(mask, actual.highlight_masks[name])
+    def test_updatesummary_shouldreturnsametables_whennonewsessions(self) -> None:
+
+        # Arrange
+        tt_summary : Mock = Mock(spec = TTSummary)
+        tt_summary.tt_df = DataFrame()
+        tt_summary.tt_partials = Mock(spec = TTPartials)
+        self.mocked_df_factory.create_tt_delta_df = Mock(return_value = DataFrame())
+
+        # Act
+        with patch("nwtimetracking.replace", return_value = tt_summary) as mocked_replace:
+            actual : TTSummary = self.adapter.update_summary(tt_summary = tt_summary, new_tt_df = DataFrame(), setting_bag = self.setting_bag)
+
+        # Assert
+        self.assertIs(actual, tt_summary)
+        mocked_replace.assert_called_once_with(tt_summary, tt_partials = tt_summary.tt_partials)
+        self.mocked_df_factory.append_tt_delta_df.assert_not_called()
+class TTHTMLTableRendererTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.table_renderer : TTHTMLTableRenderer = TTHTMLTableRenderer()
+    def __extract_cells(self, html : str) -> list[str]:
+
+        '''Returns the contents of all the th/td elements in html, without ids, classes and styles.'''
+
+        return re.findall(r"<t[hd](?:\s[^>]*)?>(.*?)</t[hd]>", html, flags = re.DOTALL)
+
+    def test_render_shouldreturnsamecellsasstyler_wheninvoked(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = {
+            "Hashtag": ["#python", "#a&b"],
+            "Effort": ["<mark style='background-color: pink'>10h 00m</mark>", "05h 00m"],
+            "%": [66.6666, np.nan],
+            "Count": [3, 4],
+            "Ratio": [0.5, 1.25]
+        })
+        formatters : dict = { "%": "{:.2f}", "Missing": "{:.1f}" }
+        styler_html : str = df.style.format(formatters).hide(axis = "index").to_html()
+        expected : list[str] = [cell.strip() for cell in self.__extract_cells(styler_html)]
+        expected[10] = "#a&amp;b"
+
+        # Act
+        actual : str = self.table_renderer.render(df = df, formatters = formatters)
+
+        # Assert
+        self.assertEqual(expected, self.__extract_cells(actual))
+        self.assertTrue(actual.startswith("<table class=\"tt-table\">"))
+        self.assertNotIn(" id=", actual)
+    def test_render_shouldescapecells_whentheycontainmarkup(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = {"<b>": ["<script>x</script>", "<mark style='color: red'>x</mark>"]})
+
+        # Act
+        actual : str = self.table_renderer.render(df = df)
+
+        # Assert
+        self.assertIn("<th>&lt;b&gt;</th>", actual)
+        self.assertIn("<td>&lt;script&gt;x&lt;/script&gt;</td>", actual)
+        self.assertIn("<td>&lt;mark style=&#x27;color: red&#x27;&gt;x&lt;/mark&gt;</td>", actual)
+    def test_render_shouldapplystyles_whenstylesareprovided(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = [["a", "b"], ["c", "d"]], columns = ["↕", "↕"])
+        styles : np.ndarray = np.array([["", "background-color: pink"], ["", ""]], dtype = object)
+        expected : list[str] = [
+            "<table class=\"tt-table\">",
+            "<thead><tr><th>↕</th><th>↕</th></tr></thead>",
+            "<tbody>",
+            "<tr><td>a</td><td style=\"background-color: pink\">b</td></tr>",
+            "<tr><td>c</td><td>d</td></tr>",
+            "</tbody>",
+            "</table>"
+        ]
+
+        # Act
+        actual : list[str] = list(self.table_renderer.render_lines(df = df, styles = styles))
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_render_shouldreturnemptytable_whendfisempty(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame()
+
+        # Act
+        actual : str = self.table_renderer.render(df = df)
+
+        # Assert
+        self.assertEqual("<table class=\"tt-table\">\n<thead><tr></tr></thead>\n<tbody>\n</tbody>\n</table>", actual)
+    @parameterized.expand([
+        [1],
+        [2],
+        [100]
+    ])
+    def test_renderlines_shouldreturnsamelines_whenchunksizeisprovided(self, chunk_size : int) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = [["00h 10m", 1.5], ["00h 20m", 2.25], ["00h 30m", 3.0]], columns = ["2015", "%"])
+        styles : np.ndarray = np.array([["", ""], ["background-color: pink", ""], ["", ""]], dtype = object)
+        expected : list[str] = list(self.table_renderer.render_lines(df = df, styles = styles))
+
+        # Act
+        actual : list[str] = list(self.table_renderer.render_lines(df = df, styles = styles, chunk_size = chunk_size))
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_createcss_shouldcontainexpectedrules_wheninvoked(self) -> None:
+
+        # Arrange
+        # Act
+        actual : str = self.table_renderer.create_css()
+
+        # Assert
+        self.assertIn(".tt-table tbody tr:nth-child(even) { background-color: #f5f5f5; }", actual)
+        self.assertIn(".tt-table tbody td { padding: 8px 10px;", actual)
+    @unittest.skipUnless(SupportMethodProvider.are_benchmarks_enabled(), "Benchmarks are disabled (see SupportMethodProvider.are_benchmarks_enabled()).")
+    def test_render_shouldprintbenchmarkagainststyler_whenbenchmarksareenabled(self) -> None:
+
+        # Arrange
+        formatters : dict = { "%": "{:.2f}" }
+        print("\nTTHTMLTableRenderer.render() vs Styler.to_html() (6 columns, best of 3)")
+        print(f"{'Rows':>8} {'Styler (s)':>11} {'Renderer (s)':>13} {'Speedup':>8} {'Styler (KB)':>12} {'Renderer (KB)':>14}")
+
+        for rows in [1_000, 10_000, 40_000]:
+            df : DataFrame = DataFrame(data = {
+                "Year": np.arange(rows) % 10 + 2015,
+                "Hashtag": np.resize(np.array(["#python", "#csharp", "#maintenance", "#a&b"]), rows),
+                "Effort": np.resize(np.array(["10h 00m", "05h 30m", "<mark style='background-color: pink'>45h 15m</mark>"]), rows),
+                "%": np.linspace(start = 0.0, stop = 100.0, num = rows),
+                "Count": np.arange(rows),
+                "Ratio": np.linspace(start = 0.0, stop = 1.0, num = rows)
+            })
+
+            # Act
+            expected, styler_seconds = SupportMethodProvider.measure(lambda : df.style.format(formatters).hide(axis = "index").to_html())
+            actual, renderer_seconds = SupportMethodProvider.measure(lambda : self.table_renderer.render(df = df, formatters = formatters))
+            print(
+                f"{rows:>8} {styler_seconds:>11.3f} {renderer_seconds:>13.3f} {styler_seconds / renderer_seconds:>7.1f}x "
+                f"{len(expected) / 1024:>12.0f} {len(actual) / 1024:>14.0f}"
+            )
+
+            # Assert
+            self.assertEqual(len(self.__extract_cells(expected)), len(self.__extract_cells(actual)))
+class TTReportManagerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.report_manager : TTReportManager = TTReportManager()
+        self.report_module : Any = importlib.import_module(TTReportManager.__module__)
+
+        empty_df : DataFrame = DataFrame()
+        self.tt_summary : TTSummary = TTSummary(
+            tt_df = empty_df,
+            tt_latest_four_df = empty_df,
+            tts_by_month_df = empty_df,
+            tts_by_year_df = empty_df,
+            tts_by_range_df = empty_df,
+            tts_by_spn_df = empty_df,
+            tts_by_spv_df = empty_df,
+            tts_by_hashtag_year_df = empty_df,
+            tts_by_hashtag_df = empty_df,
+            tts_by_year_month_spnv_df = empty_df,
+            tts_by_timeranges_df = empty_df,
+            ttd_effort_status_df = empty_df,
+            definitions_df = empty_df
+        )
+    def test_formatforfilename_shouldreturnexpectedstring_wheninvoked(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22, hour = 15, minute = 30, second = 45)
+        expected : str = "20251222"
+
+        # Act
+        actual : str = self.report_manager._TTReportManager__format_for_file_name(last_update = last_update)  # type: ignore
+
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_formatfortitle_shouldreturnexpectedstring_wheninvoked(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22, hour = 15, minute = 30, second = 45)
+        expected : str = "2025-12-22"
+
+        # Act
+        actual : str = self.report_manager._TTReportManager__format_for_title(last_update = last_update)  # type: ignore
+
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_createreportfilepaths_shouldreturnexpectedpaths_wheninvoked(self) -> None:
+
+        # Arrange
+        folder_path : str = "/home/nwreadinglist"
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+        expected_html_path : Path = Path("/home/nwreadinglist") / "TIMETRACKINGREPORT20251222.html"
+        expected_pdf_path : Path = Path("/home/nwreadinglist") / "TIMETRACKINGREPORT20251222.pdf"
+
+        # Act
+        actual : Tuple[Path, Path] = self.report_manager._TTReportManager__create_report_file_paths(folder_path = folder_path,last_update = last_update)  # type: ignore
+        actual_html_path : Path = actual[0]
+        actual_pdf_path : Path = actual[1]
+
+        # Assert
+        self.assertEqual(actual_html_path, expected_html_path)
+        self.assertEqual(actual_pdf_path, expected_pdf_path)
+    def test_createhtml_shouldcontainexpectedhtmlexcerpts_whenfooterisnotprovided(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = {"A": [1.234]})
+        title : str = "Some Title"
+        formatters : Optional[dict] = {"A": "{:.2f}"}
+
+        # Act
+        actual : str = self.report_manager._TTReportManager__create_html(df = df, title = title, formatters = formatters)  # type: ignore
+
+        # Assert
+        self.assertIn("<div style='margin-bottom: 20px;'>", actual)
+        self.assertIn(f"<h2>{title}</h2>", actual)
         self.assertIn("</div>", actual)
         self.assertIn(">1.23<", actual)
-        self.assertIn("background-color: #eeeeee", actual)
+        self.assertIn("<table class=\"tt-table\">", actual)
+        self.assertNotIn("margin-top: 6px", actual)
+    def test_createstyler_shouldreturnsamehtmlasplainstyler_whenmaskisnone(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = {"A": [1.234], "B": ["x"]})
+        formatters : Optional[dict] = {"A": "{:.2f}"}
+        expected : str = df.style.format(formatters).hide(axis = "index").to_html()
+
+        # Act
+        actual : str = self.report_manager.create_styler(df = df, formatters = formatters).to_html()
+
+        # Assert
+        self.assertEqual(re.sub("T_[0-9a-f]+", "", expected), re.sub("T_[0-9a-f]+", "", actual))
+    def test_createstyler_shouldstylemaskedcells_whencolumnnamesareduplicated(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = [["00h 10m", "↑", 1.234, "↓"]], columns = ["2015", "↕", "A", "↕"])
+        mask : DataFrame = DataFrame(data = [[True, False, False, False]], columns = df.columns)
+        formatters : Optional[dict] = {"A": "{:.2f}"}
+
+        # Act
+        actual : str = self.report_manager.create_styler(df = df, formatters = formatters, mask = mask).to_html()
+
+        # Assert
+        self.assertRegex(actual, r"_row0_col0 \{\s*background-color: pink;")
+        self.assertNotRegex(actual, r"_row0_col[123] \{")
+        self.assertIn("1.23", actual)
+        self.assertEqual(2, actual.count(">↕</th>"))
+        self.assertNotIn("<mark", actual)
+    def test_createstyler_shouldgradebackgrounds_whenmaskcontainsintensities(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = [["00h 10m", "00h 20m", "00h 00m"]], columns = ["2015", "2016", "2017"])
+        mask : DataFrame = DataFrame(data = [[0.5, 1.0, 0.0]], columns = df.columns)
+
+        # Act
+        actual : str = self.report_manager.create_styler(df = df, mask = mask).to_html()
+
+        # Assert
+        self.assertRegex(actual, r"_row0_col0 \{\s*background-color: rgba\(255, 192, 203, 0.50\);")
+        self.assertRegex(actual, r"_row0_col1 \{\s*background-color: pink;")
+        self.assertNotRegex(actual, r"_row0_col2 \{")
+    def test_createhtml_shouldcontainexpectedhtmlexcerpts_whenfooterisprovided(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = {"A": [1.234]})
+        title : str = "Some Title"
+        formatters : Optional[dict] = {"A": "{:.2f}"}
+        footer : Optional[str] = "Some Footer"
+
+        # Act
+        actual : str = self.report_manager._TTReportManager__create_html(df = df, title = title, formatters = formatters, footer = footer)  # type: ignore
+
+        # Assert
+        self.assertIn(f"{footer}", actual)
+        self.assertIn("margin-top: 6px", actual)
+        self.assertIn("<br/><div", actual)
+    def test_createhtmlsections_shouldperformexpectedcalls_wheninvoked(self) -> None:
+
+        # Arrange
+        formatters : Optional[dict] = None
+
+        expected_call_00 : _Call = call(self.tt_summary.tt_latest_four_df, REPORTSTR.TTLATESTFIVE, formatters)
+        expected_call_01 : _Call = call(self.tt_summary.tts_by_month_df, REPORTSTR.TTSBYMONTH, formatters, mask = None)
+        expected_call_02 : _Call = call(self.tt_summary.tts_by_year_df, REPORTSTR.TTSBYYEAR, formatters, mask = None)
+        expected_call_03 : _Call = call(self.tt_summary.tts_by_range_df, REPORTSTR.TTSBYRANGE, formatters)
+        expected_call_04 : _Call = call(self.tt_summary.tts_by_spn_df, REPORTSTR.TTSBYSPN, formatters)
+        expected_call_05 : _Call = call(self.tt_summary.tts_by_spv_df, REPORTSTR.TTSBYSPV, formatters, mask = None)
+        expected_call_06 : _Call = call(self.tt_summary.tts_by_hashtag_year_df, REPORTSTR.TTSBYHASHTAGYEAR, formatters, mask = None)
+        expected_call_07 : _Call = call(self.tt_summary.tts_by_hashtag_df, REPORTSTR.TTSBYHASHTAG, formatters, mask = None)
+        expected_call_08 : _Call = call(self.tt_summary.tts_by_year_month_spnv_df, REPORTSTR.TTSBYYEARMONTHSPNV, formatters, mask = None)
+        expected_call_09 : _Call = call(self.tt_summary.tts_by_timeranges_df, REPORTSTR.TTSBYTIMERANGES, formatters)
+        expected_call_10 : _Call = call(self.tt_summary.definitions_df, REPORTSTR.DEFINITIONS, formatters)
+        expected_calls : int = 11
+
+        with patch.object(self.report_manager, "_TTReportManager__create_html", return_value = "<div></div>") as mocked_create_html:
+
+            # Act
+            actual : list[str] = self.report_manager._TTReportManager__create_html_sections(tt_summary = self.tt_summary, formatters = formatters)  # type: ignore
+
+            # Assert
+            self.assertEqual(expected_call_00, mocked_create_html.call_args_list[0])
+            self.assertEqual(expected_call_01, mocked_create_html.call_args_list[1])
+            self.assertEqual(expected_call_02, mocked_create_html.call_args_list[2])
+            self.assertEqual(expected_call_03, mocked_create_html.call_args_list[3])
+            self.assertEqual(expected_call_04, mocked_create_html.call_args_list[4])
+            self.assertEqual(expected_call_05, mocked_create_html.call_args_list[5])
+            self.assertEqual(expected_call_06, mocked_create_html.call_args_list[6])
+            self.assertEqual(expected_call_07, mocked_create_html.call_args_list[7])
+            self.assertEqual(expected_call_08, mocked_create_html.call_args_list[8])
+            self.assertEqual(expected_call_09, mocked_create_html.call_args_list[9])
+            self.assertEqual(expected_call_10, mocked_create_html.call_args_list[10])
+            self.assertEqual(len(actual), expected_calls)
+    def test_createhtmlsections_shouldaddheatmap_whenttstimerangematrixdfisnotempty(self) -> None:
+
+        # Arrange
+        matrix_df : DataFrame = TTDataFrameFactory(df_helper = TTDataFrameHelper()).create_tts_timerange_matrix_df(tt_df = ObjectMother().get_tt_df())
+        tt_summary : TTSummary = replace(self.tt_summary, tts_timerange_matrix_df = matrix_df)
+
+        with (
+            patch.object(self.report_manager, "_TTReportManager__create_html", return_value = "<div></div>"),
+            patch.object(self.report_manager, "_TTReportManager__create_heatmap_html", return_value = "<div>heatmap</div>") as mocked_create_heatmap_html
+        ):
+
+            # Act
+            actual : list[str] = self.report_manager._TTReportManager__create_html_sections(tt_summary = tt_summary, formatters = None)  # type: ignore
+
+            # Assert
+            mocked_create_heatmap_html.assert_called_once_with(matrix_df, REPORTSTR.TTSTIMERANGEMATRIX)
+            self.assertEqual(12, len(actual))
+            self.assertEqual("<div>heatmap</div>", actual[10])
+    def test_createhtmlsections_shouldaddperiodtables_whentheyarenotempty(self) -> None:
+
+        # Arrange
+        tts_by_quarter_df : DataFrame = ObjectMother().get_tts_by_quarter_df()
+        tts_by_week_df : DataFrame = ObjectMother().get_tts_by_week_df()
+        tt_summary : TTSummary = replace(self.tt_summary, tts_by_quarter_df = tts_by_quarter_df, tts_by_week_df = tts_by_week_df)
+
+        with patch.object(self.report_manager, "_TTReportManager__create_html", return_value = "<div></div>") as mocked_create_html:
+
+            # Act
+            actual : list[str] = self.report_manager._TTReportManager__create_html_sections(tt_summary = tt_summary, formatters = None)  # type: ignore
+
+            # Assert
+            self.assertEqual(13, len(actual))
+            self.assertEqual(call(tts_by_quarter_df, REPORTSTR.TTSBYQUARTER, None), mocked_create_html.call_args_list[4])
+            self.assertEqual(call(tts_by_week_df, REPORTSTR.TTSBYWEEK, None), mocked_create_html.call_args_list[5])
+    def test_createhtmlsections_shouldreusecachedsections_whentheyareunchanged(self) -> None:
+
+        # Arrange
+        section_cache : dict[str, str] = {}
+        expected : list[str] = self.report_manager._TTReportManager__create_html_sections(tt_summary = self.tt_summary, formatters = None, section_cache = section_cache)  # type: ignore
+
+        with patch.object(self.report_manager, "_TTReportManager__create_html", return_value = "<div></div>") as mocked_create_html:
+
+            # Act
+            actual : list[str] = self.report_manager._TTReportManager__create_html_sections(tt_summary = self.tt_summary, formatters = None, section_cache = section_cache)  # type: ignore
+
+            # Assert
+            mocked_create_html.assert_not_called()
+            self.assertEqual(expected, actual)
+            self.assertEqual(11, len(section_cache))
+    def test_createhtmlsections_shouldrecreateonlychangedsections_whencacheisprovided(self) -> None:
+
+        # Arrange
+        section_cache : dict[str, str] = {}
+        self.report_manager._TTReportManager__create_html_sections(tt_summary = self.tt_summary, formatters = None, section_cache = section_cache)  # type: ignore
+
+        definitions_df : DataFrame = DataFrame(data = [["DE", "Some definition"]], columns = [DEFINITIONSTR.TERM, DEFINITIONSTR.DEFINITION])
+        tt_summary : TTSummary = replace(self.tt_summary, definitions_df = definitions_df)
+
+        with patch.object(self.report_manager, "_TTReportManager__create_html", return_value = "<div>Definitions</div>") as mocked_create_html:
+
+            # Act
+            actual : list[str] = self.report_manager._TTReportManager__create_html_sections(tt_summary = tt_summary, formatters = None, section_cache = section_cache)  # type: ignore
+
+            # Assert
+            mocked_create_html.assert_called_once_with(definitions_df, REPORTSTR.DEFINITIONS, None)
+            self.assertEqual("<div>Definitions</div>", actual[-1])
+            self.assertEqual(11, len(section_cache))
+    def test_createhtmlsections_shouldnotcachesections_whenformatteriscallable(self) -> None:
+
+        # Arrange
+        section_cache : dict[str, str] = {}
+        formatters : dict = { TTCN.EFFORTPERC : lambda x : f"{x:.2f}" }
+        self.report_manager._TTReportManager__create_html_sections(tt_summary = self.tt_summary, formatters = formatters, section_cache = section_cache)  # type: ignore
+
+        with patch.object(self.report_manager, "_TTReportManager__create_html", return_value = "<div></div>") as mocked_create_html:
+
+            # Act
+            self.report_manager._TTReportManager__create_html_sections(tt_summary = self.tt_summary, formatters = formatters, section_cache = section_cache)  # type: ignore
+
+            # Assert
+            self.assertEqual(11, mocked_create_html.call_count)
+            self.assertEqual(0, len(section_cache))
+    def test_createsectionkey_shouldreturnsamekey_whenformattersareequalstrings(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame({ "A" : [1.0, 2.0] })
+
+        # Act
+        actual_00 : Optional[str] = self.report_manager._TTReportManager__create_section_key(df = df, title = "T", formatters = { "A" : "{:.2f}", "B" : "{:.1f}" })  # type: ignore
+        actual_01 : Optional[str] = self.report_manager._TTReportManager__create_section_key(df = df, title = "T", formatters = { "B" : "{:.1f}", "A" : "{:.2f}" })  # type: ignore
+
+        # Assert
+        self.assertIsNotNone(actual_00)
+        self.assertEqual(actual_00, actual_01)
+    def test_saveasreport_shouldwritenothing_whendocumentisunchanged(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            self.report_manager.save_as_report(
+                tt_summary = self.tt_summary, folder_path = folder_path, last_update = last_update, save_html = True, save_pdf = False, enable_cache = True
+            )
+
+            with patch.object(Path, "write_text", autospec = True) as mocked_write_text:
+
+                # Act
+                self.report_manager.save_as_report(
+                    tt_summary = self.tt_summary, folder_path = folder_path, last_update = last_update, save_html = True, save_pdf = False, enable_cache = True
+                )
+
+                # Assert
+                mocked_write_text.assert_not_called()
+    def test_saveasreport_shouldwriteagain_whenreportfileismissing(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            self.report_manager.save_as_report(
+                tt_summary = self.tt_summary, folder_path = folder_path, last_update = last_update, save_html = True, save_pdf = False, enable_cache = True
+            )
+            html_path : Path = Path(folder_path) / "TIMETRACKINGREPORT20251222.html"
+            html_path.unlink()
+
+            # Act
+            self.report_manager.save_as_report(
+                tt_summary = self.tt_summary, folder_path = folder_path, last_update = last_update, save_html = True, save_pdf = False, enable_cache = True
+            )
+
+            # Assert
+            self.assertTrue(html_path.exists())
+    def test_saveasreport_shouldwritesamehtmlasinmemory_whenstreamingisenabled(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+        tt_summary : TTSummary = replace(self.tt_summary, tt_latest_four_df = ObjectMother().get_tt_df())
+
+        with (
+            tempfile.TemporaryDirectory() as expected_folder_path,
+            tempfile.TemporaryDirectory() as actual_folder_path
+        ):
+            self.report_manager.save_as_report(
+                tt_summary = tt_summary, folder_path = expected_folder_path, last_update = last_update, save_html = True, save_pdf = False
+            )
+
+            # Act
+            self.report_manager.save_as_report(
+                tt_summary = tt_summary, folder_path = actual_folder_path, last_update = last_update, save_html = True, save_pdf = False,
+                enable_streaming = True, chunk_size = 2
+            )
+
+            # Assert
+            expected : str = (Path(expected_folder_path) / "TIMETRACKINGREPORT20251222.html").read_text(encoding = "utf-8")
+            actual : str = (Path(actual_folder_path) / "TIMETRACKINGREPORT20251222.html").read_text(encoding = "utf-8")
+            self.assertEqual(expected, actual)
+    def test_saveasreport_shouldrenderpdffromtemporaryfile_whenstreamingisenabledandhtmlisnotrequested(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+        stylesheet : object = object()
+        html_instance : Mock = Mock()
+
+        with (
+            tempfile.TemporaryDirectory() as folder_path,
+            patch.object(self.report_manager, "_TTReportManager__create_stylesheet", return_value = stylesheet),
+            patch.object(self.report_module, "HTML", return_value = html_instance) as mocked_html
+        ):
+            html_path : Path = Path(folder_path) / "TIMETRACKINGREPORT20251222.html"
+            pdf_path : Path = Path(folder_path) / "TIMETRACKINGREPORT20251222.pdf"
+            file_path : Path = Path(folder_path) / "TIMETRACKINGREPORT20251222.tmp.html"
+
+            # Act
+            self.report_manager.save_as_report(
+                tt_summary = self.tt_summary, folder_path = folder_path, last_update = last_update, save_html = False, save_pdf = True,
+                enable_streaming = True
+            )
+
+            # Assert
+            mocked_html.assert_called_once_with(
+                filename = str(file_path), encoding = "utf-8", url_fetcher = self.report_manager._TTReportManager__asset_bundle.fetch  # type: ignore
+            )
+            html_instance.write_pdf.assert_called_once_with(target = str(pdf_path), stylesheets = [stylesheet])
+            self.assertFalse(file_path.exists())
+            self.assertFalse(html_path.exists())
+    def test_createheatmaphtml_shouldremoveemptyrowsandcolumns_wheninvoked(self) -> None:
+
+        # Arrange
+        matrix_df : DataFrame = TTDataFrameFactory(df_helper = TTDataFrameHelper()).create_tts_timerange_matrix_df(tt_df = ObjectMother().get_tt_df())
+        title : str = "Heatmap"
+
+        # Act
+        actual : str = self.report_manager._TTReportManager__create_heatmap_html(matrix_df = matrix_df, title = title)  # type: ignore
+
+        # Assert
+        self.assertIn(f"<h2>{title}</h2>", actual)
+        self.assertIn(">08:15<", actual)
+        self.assertIn(">23:30<", actual)
+        self.assertNotIn(">00:00<", actual)
+    def test_createhtmltemplate_shouldcontainexpectedhtmlexcerpts_wheninvoked(self) -> None:
+
+        # Arrange
+        html_sections : list[str] = ["<div>One</div>", "<div>Two</div>"]
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+        report_title : str = "Time Tracking Report"
+        app_name : str = "nwtimetracking"
+
+        # Act
+        actual : str = self.report_manager._TTReportManager__create_html_template(html_sections = html_sections, last_update = last_update) # type: ignore
+
+        # Assert
+        self.assertIn("<meta charset=\"utf-8\">", actual)
+        self.assertIn(f"<title>{report_title} | 2025-12-22</title>", actual)
+        self.assertIn(f"<h1>{report_title} | 2025-12-22</h1>", actual)
+        self.assertIn("".join(html_sections), actual)
+        self.assertIn("<img src='data:image/png;base64,iVBORw0KGgo", actual)
+        self.assertNotIn(REPORTSTR.LOGOURL, actual)
+        self.assertIn(f"This report is generated by '{app_name}'", actual)
+        self.assertIn("© 2025 numbworks.", actual)
+        self.assertIn(".tt-table thead th { background-color: #eeeeee;", actual)
         self.assertIn("white-space: nowrap", actual)
         self.assertIn("border-collapse: collapse", actual)
-        self.assertNotIn("margin-top: 6px", actual)
-    def test_createhtml_shouldcontainexpectedhtmlexcerpts_whenfooterisprovided(self) -> None:
+    def test_createhtmltemplate_shouldinlinelogo_whenlogoisinassetbundle(self) -> None:
 
         # Arrange
-        df : DataFrame = DataFrame(data = {"A": [1.234]})
-        title : str = "Some Title"
-        formatters : Optional[dict] = {"A": "{:.2f}"}
-        footer : Optional[str] = "Some Footer"
+        asset_bundle : TTAssetBundle = TTAssetBundle(assets = { REPORTSTR.LOGOURL : ("image/png", b"png") })
+        report_manager : TTReportManager = TTReportManager(asset_bundle = asset_bundle)
 
         # Act
-        actual : str = self.report_manager._TTReportManager__create_html(df = df, title = title, formatters = formatters, footer = footer)  # type: ignore
+        actual : str = report_manager._TTReportManager__create_html_template(html_sections = [], last_update = datetime(2025, 12, 22))  # type: ignore
 
         # Assert
-        self.assertIn(f"{footer}", actual)
-        self.assertIn("margin-top: 6px", actual)
-        self.assertIn("<br/><div", actual)
-    def test_createhtmlsections_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        self.assertIn("<img src='data:image/png;base64,cG5n'", actual)
+        self.assertNotIn(REPORTSTR.LOGOURL, actual)
+    def test_saveasreport_shouldinlinelogo_whennetworkingisdisabled(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+        network_error : OSError = OSError("Networking is disabled.")
+        data_uri : str = "<img src='data:image/png;base64,iVBORw0KGgo"
+
+        with (
+            tempfile.TemporaryDirectory() as folder_path,
+            patch.object(socket, "getaddrinfo", side_effect = network_error),
+            patch.object(socket, "create_connection", side_effect = network_error),
+            patch.object(socket.socket, "connect", side_effect = network_error),
+            patch.object(self.report_module, "HTML") as mocked_html
+        ):
+
+            # Act
+            self.report_manager.save_as_report(
+                tt_summary = self.tt_summary, folder_path = folder_path, last_update = last_update, save_html = True, save_pdf = True
+            )
+            actual_html : str = (Path(folder_path) / "TIMETRACKINGREPORT20251222.html").read_text(encoding = "utf-8")
+            actual_pdf_html : str = mocked_html.call_args.kwargs["string"]
+
+            # Assert
+            self.assertIn(data_uri, actual_html)
+            self.assertNotIn(REPORTSTR.LOGOURL, actual_html)
+            self.assertIn(data_uri, actual_pdf_html)
+            self.assertNotIn(REPORTSTR.LOGOURL, actual_pdf_html)
+            mocked_html.return_value.write_pdf.assert_called_once()
+    @unittest.skipUnless(SupportMethodProvider.can_render_pdf(), "WeasyPrint can't render a PDF in this environment.")
+    def test_saveasreport_shouldrenderpdfwithinbudget_whennetworkingisdisabled(self) -> None:
+
+        # Arrange
+        budget : float = 10.0
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+        network_error : OSError = OSError("Networking is disabled.")
+        fetch : Callable = TTAssetBundle.fetch
+
+        with (
+            tempfile.TemporaryDirectory() as folder_path,
+            patch.object(socket, "getaddrinfo", side_effect = network_error),
+            patch.object(socket, "create_connection", side_effect = network_error),
+            patch.object(socket.socket, "connect", side_effect = network_error),
+            patch.object(TTAssetBundle, "fetch", autospec = True, side_effect = fetch) as mocked_fetch
+        ):
+
+            # Act
+            start : float = time.perf_counter()
+            self.report_manager.save_as_report(
+                tt_summary = self.tt_summary, folder_path = folder_path, last_update = last_update, save_html = False, save_pdf = True
+            )
+            elapsed : float = time.perf_counter() - start
+            fetched_urls : list[str] = [ x.kwargs.get("url", x.args[1] if len(x.args) > 1 else "") for x in mocked_fetch.call_args_list ]
+
+            # Assert
+            self.assertTrue((Path(folder_path) / "TIMETRACKINGREPORT20251222.pdf").exists())
+            self.assertLess(elapsed, budget)
+            self.assertTrue(any(url.startswith("data:image/png;base64,") for url in fetched_urls))
+            self.assertNotIn(REPORTSTR.LOGOURL, fetched_urls)
+    def test_createhtml_shouldrendermaskasbackgroundcolors_whenmaskisprovided(self) -> None:
+
+        # Arrange
+        df : DataFrame = DataFrame(data = [["00h 10m", "↑", "00h 20m"]], columns = ["2015", "↕", "2016"])
+        mask : DataFrame = DataFrame(data = [[False, False, True]], columns = df.columns)
+
+        # Act
+        actual : str = self.report_manager._TTReportManager__create_html(df = df, title = "Some Title", formatters = None, mask = mask)  # type: ignore
+
+        # Assert
+        self.assertIn("<tr><td>00h 10m</td><td>↑</td><td style=\"background-color: pink\">00h 20m</td></tr>", actual)
+    def test_createstylesheet_shouldcallcsswiththeexpectedstring_wheninvoked(self) -> None:
+
+        # Arrange
+        css_mock = Mock()
+
+        with patch.object(self.report_module, "CSS", css_mock):
+
+            # Act
+            self.report_manager._TTReportManager__create_stylesheet()  # type: ignore
+
+            # Assert
+            css_mock.assert_called_once_with(string = "@page { size: A3 landscape; margin: 20mm; }")
+    def test_saveasreport_shouldperformexpectedcalls_wheninvoked(self) -> None:
 
         # Arrange
+        folder_path : str = "/home"
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+        save_html : bool = True
+        save_pdf : bool = True
         formatters : Optional[dict] = None
 
-        expected_call_00 : _Call = call(self.tt_summary.tt_latest_four_df, REPORTSTR.TTLATESTFIVE, formatters)
-        expected_call_01 : _Call = call(self.tt_summary.tts_by_month_df, REPORTSTR.TTSBYMONTH, formatters)
-        expected_call_02 : _Call = call(self.tt_summary.tts_by_year_df, REPORTSTR.TTSBYYEAR, formatters)
-        expected_call_03 : _Call = call(self.tt_summary.tts_by_range_df, REPORTSTR.TTSBYRANGE, formatters)
-        expected_call_04 : _Call = call(self.tt_summary.tts_by_spn_df, REPORTSTR.TTSBYSPN, formatters)
-        expected_call_05 : _Call = call(self.tt_summary.tts_by_spv_df, REPORTSTR.TTSBYSPV, formatters)
-        expected_call_06 : _Call = call(self.tt_summary.tts_by_hashtag_year_df, REPORTSTR.TTSBYHASHTAGYEAR, formatters)
-        expected_call_07 : _Call = call(self.tt_summary.tts_by_hashtag_df, REPORTSTR.TTSBYHASHTAG, formatters)
-        expected_call_08 : _Call = call(self.tt_summary.tts_by_year_month_spnv_df, REPORTSTR.TTSBYYEARMONTHSPNV, formatters)
-        expected_call_09 : _Call = call(self.tt_summary.tts_by_timeranges_df, REPORTSTR.TTSBYTIMERANGES, formatters)
-        expected_call_10 : _Call = call(self.tt_summary.definitions_df, REPORTSTR.DEFINITIONS, formatters)
-        expected_calls : int = 11
+        html_sections : list[str] = ["<div>Section</div>"]
+        full_html : str = "<html><body>Report</body></html>"
+        stylesheet : object = object()
+        html_path : Path = Path("/home/some_file_name.html")
+        pdf_path : Path = Path("/home/some_file_name.pdf")
 
-        with patch.object(self.report_manager, "_TTReportManager__create_html", return_value = "<div></div>") as mocked_create_html:
+        html_instance : Mock = Mock()
+
+        with (
+            patch.object(self.report_manager, "_TTReportManager__create_report_file_paths", return_value = (html_path, pdf_path)) as mocked_create_report_file_paths,
+            patch.object(self.report_manager, "_TTReportManager__create_html_sections", return_value = html_sections) as mocked_create_html_sections,
+            patch.object(self.report_manager, "_TTReportManager__create_html_template", return_value = full_html) as mocked_create_html_template,
+            patch.object(self.report_manager, "_TTReportManager__create_stylesheet", return_value = stylesheet) as mocked_create_stylesheet,
+            patch.object(Path, "write_text", autospec = True) as mocked_write_text,
+            patch.object(self.report_module, "HTML", return_value = html_instance) as mocked_html
+        ):
 
             # Act
-            actual : list[str] = self.report_manager._TTReportManager__create_html_sections(tt_summary = self.tt_summary, formatters = formatters)  # type: ignore
+            self.report_manager.save_as_report(
+                tt_summary = self.tt_summary,
+                folder_path = folder_path,
+                last_update = last_update,
+                save_html = save_html,
+                save_pdf = save_pdf,
+                formatters = formatters
+            )
 
             # Assert
-            self.assertEqual(expected_call_00, mocked_create_html.call_args_list[0])
-            self.assertEqual(expected_call_01, mocked_create_html.call_args_list[1])
-            self.assertEqual(expected_call_02, mocked_create_html.call_args_list[2])
-            self.assertEqual(expected_call_03, mocked_create_html.call_args_list[3])
-            self.assertEqual(expected_call_04, mocked_create_html.call_args_list[4])
-            self.assertEqual(expected_call_05, mocked_create_html.call_args_list[5])
-            self.assertEqual(expected_call_06, mocked_create_html.call_args_list[6])
-            self.assertEqual(expected_call_07, mocked_create_html.call_args_list[7])
-            self.assertEqual(expected_call_08, mocked_create_html.call_args_list[8])
-            self.assertEqual(expected_call_09, mocked_create_html.call_args_list[9])
-            self.assertEqual(expected_call_10, mocked_create_html.call_args_list[10])
-            self.assertEqual(len(actual), expected_calls)
-    def test_createhtmltemplate_shouldcontainexpectedhtmlexcerpts_wheninvoked(self) -> None:
+            mocked_create_report_file_paths.assert_called_once_with(folder_path = folder_path, last_update = last_update)
+            mocked_create_html_sections.assert_called_once_with(tt_summary = self.tt_summary, formatters = formatters)
+            mocked_create_html_template.assert_called_once_with(html_sections = html_sections, last_update = last_update)
+            mocked_write_text.assert_called_once_with(html_path, data = full_html, encoding = "utf-8")
+            mocked_html.assert_called_once_with(string = full_html, url_fetcher = self.report_manager._TTReportManager__asset_bundle.fetch)  # type: ignore
+            mocked_create_stylesheet.assert_called_once()
+            html_instance.write_pdf.assert_called_once_with(target = str(pdf_path), stylesheets = [stylesheet])
+    def test_saveasreport_shouldmergepagesofallpartsinorder_whenmaxworkersisgreaterthanone(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+        html_sections : list[str] = ["<p>1</p>", "<p>2</p>", "<p>3</p>"]
+        html_sections_indices : dict[str, int] = { html_section : idx for idx, html_section in enumerate(html_sections) }
+        asset_bundle : TTAssetBundle = self.report_manager._TTReportManager__asset_bundle  # type: ignore
+        page_css : str = "@page { size: A3 landscape; margin: 20mm; }"
+
+        def create_html_template(html_sections : list[str], last_update : datetime, include_header : bool = True, include_footer : bool = True) -> str:
+            return f"part{html_sections_indices[html_sections[0]]}"
+
+        with (
+            tempfile.TemporaryDirectory() as folder_path,
+            patch.object(self.report_manager, "_TTReportManager__create_html_sections", return_value = html_sections),
+            patch.object(self.report_manager, "_TTReportManager__create_html_template", side_effect = create_html_template) as mocked_create_html_template,
+            patch.object(self.report_module, "ProcessPoolExecutor", side_effect = ThreadPoolExecutor) as mocked_executor,
+            patch.object(self.report_module._PDFWorker, "write_pdf", side_effect = lambda html, page_css, asset_bundle : ObjectMother.get_blank_pdf(widths = [100 + 10 * int(html[-1]), 105 + 10 * int(html[-1])])) as mocked_write_pdf,
+            patch.object(self.report_module, "HTML") as mocked_html
+        ):
+
+            # Act
+            self.report_manager.save_as_report(
+                tt_summary = self.tt_summary,
+                folder_path = folder_path,
+                last_update = last_update,
+                save_html = False,
+                save_pdf = True,
+                max_workers = 3
+            )
+            actual : list[float] = [ float(page.mediabox.width) for page in PdfReader(Path(folder_path) / "TIMETRACKINGREPORT20251222.pdf").pages ]
+
+            # Assert
+            mocked_create_html_template.assert_any_call(html_sections = ["<p>1</p>"], last_update = last_update, include_header = True, include_footer = False)
+            mocked_create_html_template.assert_any_call(html_sections = ["<p>2</p>"], last_update = last_update, include_header = False, include_footer = False)
+            mocked_create_html_template.assert_any_call(html_sections = ["<p>3</p>"], last_update = last_update, include_header = False, include_footer = True)
+            mocked_executor.assert_called_once_with(max_workers = 3)
+            mocked_write_pdf.assert_has_calls([ call(f"part{idx}", page_css, asset_bundle) for idx in range(3) ], any_order = True)
+            mocked_html.assert_not_called()
+            self.assertEqual([100.0, 105.0, 110.0, 115.0, 120.0, 125.0], actual)
+    def test_saveasreport_shouldrenderonepdf_whenthereisonesectiononly(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+
+        with (
+            patch.object(self.report_manager, "_TTReportManager__create_report_file_paths", return_value = (Path("/home/some_file_name.html"), Path("/home/some_file_name.pdf"))),
+            patch.object(self.report_manager, "_TTReportManager__create_html_sections", return_value = ["<p>1</p>"]),
+            patch.object(self.report_module, "ProcessPoolExecutor") as mocked_executor,
+            patch.object(self.report_module, "HTML") as mocked_html
+        ):
+
+            # Act
+            self.report_manager.save_as_report(
+                tt_summary = self.tt_summary,
+                folder_path = "/home",
+                last_update = last_update,
+                save_html = False,
+                save_pdf = True,
+                max_workers = 3
+            )
+
+            # Assert
+            mocked_executor.assert_not_called()
+            mocked_html.return_value.write_pdf.assert_called_once()
+    def test_writepdf_shouldreturnpdfbytesofhtml_wheninvoked(self) -> None:
+
+        # Arrange
+        asset_bundle : TTAssetBundle = TTAssetBundle()
+        page_css : str = "@page { size: A3 landscape; margin: 20mm; }"
+        expected : bytes = b"%PDF-1.7"
+
+        with (
+            patch.object(self.report_module, "HTML") as mocked_html,
+            patch.object(self.report_module, "CSS") as mocked_css
+        ):
+            mocked_html.return_value.write_pdf.return_value = expected
+
+            # Act
+            actual : bytes = self.report_module._PDFWorker.write_pdf("<p>1</p>", page_css, asset_bundle)
+
+            # Assert
+            self.assertEqual(expected, actual)
+            mocked_css.assert_called_once_with(string = page_css)
+            mocked_html.assert_called_once_with(string = "<p>1</p>", url_fetcher = asset_bundle.fetch)
+            mocked_html.return_value.write_pdf.assert_called_once_with(stylesheets = [mocked_css.return_value])
+    def test_assetbundle_shouldbepicklable_whenshippedtopdfworkers(self) -> None:
+
+        # Arrange
+        asset_bundle : TTAssetBundle = self.report_manager._TTReportManager__asset_bundle  # type: ignore
+        html : str = asset_bundle.inline(html = f"<img src='{REPORTSTR.LOGOURL}'>")
+        url : str = html.split("'")[1]
+
+        # Act
+        actual : TTAssetBundle = pickle.loads(pickle.dumps(asset_bundle))
+
+        # Assert
+        self.assertEqual(asset_bundle.fetch(url = url), actual.fetch(url = url))
+    @unittest.skipUnless(SupportMethodProvider.are_benchmarks_enabled(), "Benchmarks are disabled (see SupportMethodProvider.are_benchmarks_enabled()).")
+    @unittest.skipUnless(SupportMethodProvider.can_render_pdf(), "WeasyPrint can't render a PDF in this environment.")
+    def test_saveasreport_shouldprintbenchmarkofmaxworkers_whenbenchmarksareenabled(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+        rows : int = 1_000
+        tables : list[str] = [
+            "tt_latest_four_df", "tts_by_month_df", "tts_by_year_df", "tts_by_range_df", "tts_by_spn_df", "tts_by_spv_df",
+            "tts_by_hashtag_year_df", "tts_by_hashtag_df", "tts_by_year_month_spnv_df", "tts_by_timeranges_df"
+        ]
+        tt_summary : TTSummary = replace(
+            self.tt_summary,
+            **{ name : ObjectMother.get_synthetic_tt_df(rows = rows, start = idx * rows) for idx, name in enumerate(tables) }
+        )
+        print(f"\nTTReportManager.save_as_report() with save_pdf ({len(tables)} sections, {rows} rows each, {os.cpu_count()} CPUs, best of 3)")
+        print(f"{'Workers':>8} {'Seconds':>8} {'Speedup':>8} {'Pages':>6}")
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            pdf_path : Path = Path(folder_path) / "TIMETRACKINGREPORT20251222.pdf"
+            baseline_seconds : float = 0.0
+
+            for max_workers in range(1, max(cast(int, os.cpu_count()), 4) + 1):
+
+                # Act
+                _, seconds = SupportMethodProvider.measure(lambda : self.report_manager.save_as_report(
+                    tt_summary = tt_summary, folder_path = folder_path, last_update = last_update, save_html = False, save_pdf = True, max_workers = max_workers
+                ))
+                baseline_seconds = seconds if max_workers == 1 else baseline_seconds
+                pages : int = len(PdfReader(pdf_path).pages)
+                print(f"{max_workers:>8} {seconds:>8.2f} {baseline_seconds / seconds:>7.2f}x {pages:>6}")
+
+                # Assert
+                self.assertGreater(pages, 0)
+
+    @parameterized.expand([
+        [["a" * 10, "b" * 10, "c" * 10, "d" * 10], 2, [["a" * 10, "b" * 10], ["c" * 10, "d" * 10]]],
+        [["a" * 30, "b" * 5, "c" * 5], 2, [["a" * 30], ["b" * 5, "c" * 5]]],
+        [["a" * 10, "b" * 10], 4, [["a" * 10], ["b" * 10]]],
+        [["a" * 10, "b" * 10, "c" * 10], 1, [["a" * 10, "b" * 10, "c" * 10]]]
+    ])
+    def test_splithtmlsections_shouldreturnexpectedgroups_wheninvoked(self, html_sections : list[str], parts : int, expected : list[list[str]]) -> None:
+
+        # Arrange
+        # Act
+        actual : list[list[str]] = self.report_manager._TTReportManager__split_html_sections(html_sections = html_sections, parts = parts)  # type: ignore
+
+        # Assert
+        self.assertEqual(expected, actual)
+    def test_createhtmltemplate_shouldleaveoutheaderandfooter_whenrequested(self) -> None:
+
+        # Arrange
+        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
+
+        # Act
+        actual : str = self.report_manager._TTReportManager__create_html_template(   # type: ignore
+            html_sections = ["<div>One</div>"], 
+            last_update = last_update, 
+            include_header = False, 
+            include_footer = False
+        )
+
+        # Assert
+        self.assertIn("<div>One</div>", actual)
+        self.assertNotIn("<h1>", actual)
+        self.assertNotIn("© 2025 numbworks.", actual)
+        self.assertIn(".tt-table thead th", actual)
+class TTReportJobTestCase(unittest.TestCase):
+
+    def test_status_shouldreturnpending_whenfutureisnotrunning(self) -> None:
 
         # Arrange
-        html_sections : list[str] = ["<div>One</div>", "<div>Two</div>"]
-        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
-        report_title : str = "Time Tracking Report"
-        app_name : str = "nwtimetracking"
+        job : TTReportJob = TTReportJob(future = Future())
 
         # Act
-        actual : str = self.report_manager._TTReportManager__create_html_template(html_sections = html_sections, last_update = last_update) # type: ignore
+        actual : REPORTSTATUS = job.status()
 
         # Assert
-        self.assertIn("<meta charset=\"utf-8\">", actual)
-        self.assertIn(f"<title>{report_title} | 2025-12-22</title>", actual)
-        self.assertIn(f"<h1>{report_title} | 2025-12-22</h1>", actual)
-        self.assertIn("".join(html_sections), actual)
-        self.assertIn("avatars.githubusercontent.com/u/10279234", actual)
-        self.assertIn(f"This report is generated by '{app_name}'", actual)
-        self.assertIn("© 2025 numbworks.", actual)
-    def test_createstylesheet_shouldcallcsswiththeexpectedstring_wheninvoked(self) -> None:
+        self.assertEqual(REPORTSTATUS.pending, actual)
+        self.assertFalse(job.done())
+    def test_status_shouldreturnrunning_whenfutureisrunning(self) -> None:
 
         # Arrange
-        css_mock = Mock()
+        future : Future = Future()
+        future.set_running_or_notify_cancel()
+        job : TTReportJob = TTReportJob(future = future)
 
-        with patch.object(self.report_module, "CSS", css_mock):
+        # Act
+        actual : REPORTSTATUS = job.status()
 
-            # Act
-            self.report_manager._TTReportManager__create_stylesheet()  # type: ignore
+        # Assert
+        self.assertEqual(REPORTSTATUS.running, actual)
+        self.assertFalse(job.cancel())
+    def test_status_shouldreturnsucceeded_whenfuturehasresult(self) -> None:
 
-            # Assert
-            css_mock.assert_called_once_with(string = "@page { size: A3 landscape; margin: 20mm; }")
-    def test_saveasreport_shouldperformexpectedcalls_wheninvoked(self) -> None:
+        # Arrange
+        future : Future = Future()
+        future.set_result(None)
+        job : TTReportJob = TTReportJob(future = future)
+
+        # Act
+        actual : REPORTSTATUS = job.status()
+
+        # Assert
+        self.assertEqual(REPORTSTATUS.succeeded, actual)
+        self.assertTrue(job.done())
+        job.result(timeout = 0)
+    def test_status_shouldreturnfailed_whenfuturehasexception(self) -> None:
 
         # Arrange
-        folder_path : str = "/home"
-        last_update : datetime = datetime(year = 2025, month = 12, day = 22)
-        save_html : bool = True
-        save_pdf : bool = True
-        formatters : Optional[dict] = None
+        future : Future = Future()
+        future.set_exception(ValueError("some error"))
+        job : TTReportJob = TTReportJob(future = future)
 
-        html_sections : list[str] = ["<div>Section</div>"]
-        full_html : str = "<html><body>Report</body></html>"
-        stylesheet : object = object()
-        html_path : Path = Path("/home/some_file_name.html")
-        pdf_path : Path = Path("/home/some_file_name.pdf")
+        # Act
+        actual : REPORTSTATUS = job.status()
 
-        html_instance : Mock = Mock()
+        # Assert
+        self.assertEqual(REPORTSTATUS.failed, actual)
+        self.assertRaises(ValueError, job.result, 0)
+    def test_cancel_shouldreturncancelled_whenfutureisnotrunning(self) -> None:
 
-        with (
-            patch.object(self.report_manager, "_TTReportManager__create_report_file_paths", return_value = (html_path, pdf_path)) as mocked_create_report_file_paths,
-            patch.object(self.report_manager, "_TTReportManager__create_html_sections", return_value = html_sections) as mocked_create_html_sections,
-            patch.object(self.report_manager, "_TTReportManager__create_html_template", return_value = full_html) as mocked_create_html_template,
-            patch.object(self.report_manager, "_TTReportManager__create_stylesheet", return_value = stylesheet) as mocked_create_stylesheet,
-            patch.object(Path, "write_text", autospec = True) as mocked_write_text,
-            patch.object(self.report_module, "HTML", return_value = html_instance) as mocked_html
-        ):
+        # Arrange
+        job : TTReportJob = TTReportJob(future = Future())
 
-            # Act
-            self.report_manager.save_as_report(
-                tt_summary = self.tt_summary,
-                folder_path = folder_path,
-                last_update = last_update,
-                save_html = save_html,
-                save_pdf = save_pdf,
-                formatters = formatters
-            )
+        # Act
+        cancelled : bool = job.cancel()
 
-            # Assert
-            mocked_create_report_file_paths.assert_called_once_with(folder_path = folder_path, last_update = last_update)
-            mocked_create_html_sections.assert_called_once_with(tt_summary = self.tt_summary, formatters = formatters)
-            mocked_create_html_template.assert_called_once_with(html_sections = html_sections, last_update = last_update)
-            mocked_write_text.assert_called_once_with(html_path, data = full_html, encoding = "utf-8")
-            mocked_html.assert_called_once_with(string = full_html)
-            mocked_create_stylesheet.assert_called_once()
-            html_instance.write_pdf.assert_called_once_with(target = str(pdf_path), stylesheets = [stylesheet])
+        # Assert
+        self.assertTrue(cancelled)
+        self.assertEqual(REPORTSTATUS.cancelled, job.status())
+    def test_await_shouldreturnnone_whenfuturehasresult(self) -> None:
+
+        # Arrange
+        future : Future = Future()
+        future.set_result(None)
+        job : TTReportJob = TTReportJob(future = future)
+
+        async def await_job() -> None:
+            return await job
+
+        # Act
+        actual : None = asyncio.run(await_job())
+
+        # Assert
+        self.assertIsNone(actual)
 class ComponentBagTestCase(unittest.TestCase):
 
     def test_init_shouldinitializeobjectwithexpectedproperties_whendefault(self) -> None:
@@ -2407,7 +5329,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tt = [OPTION.display]   # type: ignore
 
         # Act
@@ -2433,7 +5355,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tt_latest_four = [OPTION.display]    # type: ignore
 
         # Act
@@ -2459,7 +5381,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tts_by_month = [OPTION.display]     # type: ignore
 
         # Act
@@ -2469,6 +5391,39 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
 
         # Assert
         displayer.display.assert_called_once_with(obj = tts_by_month_df)
+    def test_processttsbymonth_shoulddisplaystyler_whenefforthighlightingmodeisstyler(self) -> None:
+        
+        # Arrange
+        tts_by_month_df : DataFrame = Mock()
+        mask : DataFrame = Mock()
+        styler : Mock = Mock()
+
+        summary : Mock = Mock()
+        summary.tts_by_month_df = tts_by_month_df
+        summary.highlight_masks = { "tts_by_month_df": mask }
+
+        displayer : Mock = Mock()
+        tt_adapter : Mock = Mock()
+        tt_adapter.create_summary.return_value = summary
+        ttr_manager : Mock = Mock()
+        ttr_manager.create_styler.return_value = styler
+
+        component_bag : Mock = Mock()
+        component_bag.displayer = displayer
+        component_bag.tt_adapter = tt_adapter
+        component_bag.ttr_manager = ttr_manager
+
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False, effort_highlighting_mode = HIGHLIGHTMODE.styler)
+        setting_bag.options_tts_by_month = [OPTION.display]     # type: ignore
+
+        # Act
+        tt_processor : TimeTrackingProcessor = TimeTrackingProcessor(component_bag = component_bag, setting_bag = setting_bag)
+        tt_processor.initialize()        
+        tt_processor.process_tts_by_month()
+
+        # Assert
+        ttr_manager.create_styler.assert_called_once_with(df = tts_by_month_df, formatters = None, mask = mask)
+        displayer.display.assert_called_once_with(obj = styler)
     def test_processttsbyyear_shoulddisplay_whenoptionisdisplay(self) -> None:
         
         # Arrange
@@ -2485,7 +5440,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tts_by_year = [OPTION.display]  # type: ignore
         
         # Act
@@ -2511,7 +5466,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
         
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tts_by_range = [OPTION.display]     # type: ignore
 
         # Act
@@ -2537,7 +5492,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tts_by_spn = [OPTION.display]   # type: ignore
 
         # Act
@@ -2563,7 +5518,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tts_by_spv = [OPTION.display]   # type: ignore
 
         # Act
@@ -2589,7 +5544,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tts_by_hashtag_year = [OPTION.display]  # type: ignore
 
         # Act
@@ -2615,7 +5570,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tts_by_hashtag = [OPTION.display]   # type: ignore
         setting_bag.tts_by_hashtag_formatters = { TTCN.EFFORTPERC : "{:.2f}" }
 
@@ -2645,7 +5600,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tts_by_year_month_spnv = [OPTION.display]   # type: ignore
 
         # Act
@@ -2671,7 +5626,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_tts_by_timeranges = [OPTION.display]    # type: ignore
         setting_bag.tts_by_timeranges_formatters = { TTCN.OCCURRENCEPERC : "{:.2f}" }
 
@@ -2701,7 +5656,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_ttd_effort_status = [OPTION.display]   # type: ignore
 
         # Act
@@ -2711,6 +5666,64 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
 
         # Assert
         displayer.display.assert_called_once_with(obj = ttd_effort_status_df)    
+    def test_processttstimerangematrix_shoulddisplay_whenoptionisdisplay(self) -> None:
+        
+        # Arrange
+        tts_timerange_matrix_df : DataFrame = Mock()
+
+        summary : Mock = Mock()
+        summary.tts_timerange_matrix_df = tts_timerange_matrix_df
+
+        displayer : Mock = Mock()
+        tt_adapter : Mock = Mock()
+        tt_adapter.create_summary.return_value = summary
+
+        component_bag : Mock = Mock()
+        component_bag.displayer = displayer
+        component_bag.tt_adapter = tt_adapter
+
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
+        setting_bag.options_tts_timerange_matrix = [OPTION.display]   # type: ignore
+
+        # Act
+        tt_processor = TimeTrackingProcessor(component_bag = component_bag, setting_bag = setting_bag)
+        tt_processor.initialize()
+        tt_processor.process_tts_timerange_matrix()
+
+        # Assert
+        displayer.display.assert_called_once_with(obj = tts_timerange_matrix_df)
+
+    @parameterized.expand([
+        ["options_tts_by_week", "tts_by_week_df", "process_tts_by_week"],
+        ["options_tts_by_day", "tts_by_day_df", "process_tts_by_day"],
+        ["options_tts_by_quarter", "tts_by_quarter_df", "process_tts_by_quarter"]
+    ])
+    def test_processttsbyperiod_shoulddisplay_whenoptionisdisplay(self, option_name : str, table_name : str, method_name : str) -> None:
+        
+        # Arrange
+        df : DataFrame = Mock()
+
+        summary : Mock = Mock()
+        setattr(summary, table_name, df)
+
+        displayer : Mock = Mock()
+        tt_adapter : Mock = Mock()
+        tt_adapter.create_summary.return_value = summary
+
+        component_bag : Mock = Mock()
+        component_bag.displayer = displayer
+        component_bag.tt_adapter = tt_adapter
+
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
+        setattr(setting_bag, option_name, [OPTION.display])
+
+        # Act
+        tt_processor = TimeTrackingProcessor(component_bag = component_bag, setting_bag = setting_bag)
+        tt_processor.initialize()
+        getattr(tt_processor, method_name)()
+
+        # Assert
+        displayer.display.assert_called_once_with(obj = df)
     def test_processdefinitions_shoulddisplay_whenoptionisdisplay(self) -> None:
         
         # Arrange
@@ -2727,7 +5740,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         setting_bag.options_definitions = [OPTION.display]  # type: ignore
 
         # Act
@@ -2741,16 +5754,18 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         
         # Arrange
         summary : Mock = Mock()
+        completed_summary : Mock = Mock()
 
         displayer : Mock = Mock()
         tt_adapter : Mock = Mock()
         tt_adapter.create_summary.return_value = summary
+        tt_adapter.complete_summary.return_value = completed_summary
 
         component_bag : Mock = Mock()
         component_bag.displayer = displayer
         component_bag.tt_adapter = tt_adapter
 
-        setting_bag : Mock = Mock()
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
         
         # Act
         tt_processor : TimeTrackingProcessor = TimeTrackingProcessor(component_bag = component_bag, setting_bag = setting_bag)
@@ -2758,7 +5773,142 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         actual : TTSummary = tt_processor.get_summary()
 
         # Assert
+        tt_adapter.complete_summary.assert_called_once_with(tt_summary = summary, setting_bag = setting_bag)
+        self.assertEqual(actual, completed_summary)
+
+    def test_initialize_shouldcreatelazysummary_whenenablelazysummaryistrue(self):
+        
+        # Arrange
+        lazy_summary : Mock = Mock(spec = LazyTTSummary)
+        summary : Mock = Mock()
+        lazy_summary.to_summary.return_value = summary
+
+        tt_adapter : Mock = Mock()
+        tt_adapter.create_lazy_summary.return_value = lazy_summary
+        tt_adapter.complete_summary.side_effect = lambda tt_summary, setting_bag : tt_summary
+
+        component_bag : Mock = Mock()
+        component_bag.tt_adapter = tt_adapter
+
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = True)
+        
+        # Act
+        tt_processor : TimeTrackingProcessor = TimeTrackingProcessor(component_bag = component_bag, setting_bag = setting_bag)
+        tt_processor.initialize()
+        actual : TTSummary = tt_processor.get_summary()
+
+        # Assert
+        tt_adapter.create_lazy_summary.assert_called_once_with(setting_bag = setting_bag)
+        tt_adapter.create_summary.assert_not_called()
+        lazy_summary.to_summary.assert_called_once_with()
+        self.assertEqual(actual, summary)
+    def test_saveasreportasync_shouldsavereportwithsnapshotinexecutor_wheninvoked(self):
+        
+        # Arrange
+        lazy_summary : Mock = Mock(spec = LazyTTSummary)
+        summary : Mock = Mock()
+        lazy_summary.to_summary.return_value = summary
+
+        component_bag : Mock = Mock()
+        component_bag.tt_adapter.create_lazy_summary.return_value = lazy_summary
+
+        setting_bag : Mock = Mock(
+            enable_chunked_tt_df = False, 
+            enable_lazy_summary = True,
+            options_report = [OPTION.save_html, OPTION.save_pdf],
+            working_folder_path = "/home/nwtimetracking/",
+            now = datetime(2024, 12, 1),
+            report_max_workers = 1,
+            enable_report_cache = False,
+            enable_report_streaming = False,
+            report_chunk_size = 10000,
+            tts_by_hashtag_formatters = { TTCN.EFFORTPERC : "{:.2f}" },
+            tts_by_timeranges_formatters = { TTCN.OCCURRENCEPERC : "{:.2f}" }
+        )
+
+        # Act
+        tt_processor : TimeTrackingProcessor = TimeTrackingProcessor(component_bag = component_bag, setting_bag = setting_bag)
+        tt_processor.initialize()
+
+        with ThreadPoolExecutor(max_workers = 1) as executor:
+            job : TTReportJob = tt_processor.save_as_report_async(executor = executor)
+            job.result(timeout = 10)
+
+        # Assert
+        self.assertEqual(REPORTSTATUS.succeeded, job.status())
+        component_bag.ttr_manager.save_as_report.assert_called_once_with(
+            tt_summary = summary,
+            folder_path = "/home/nwtimetracking/",
+            last_update = datetime(2024, 12, 1),
+            save_html = True,
+            save_pdf = True,
+            formatters = { TTCN.EFFORTPERC : "{:.2f}", TTCN.OCCURRENCEPERC : "{:.2f}" },
+            max_workers = 1,
+            enable_cache = False,
+            enable_streaming = False,
+            chunk_size = 10000
+        )
+    def test_saveasreportasync_shouldraiseexception_wheninitializehasnotbeenrun(self):
+        
+        # Arrange
+        tt_processor : TimeTrackingProcessor = TimeTrackingProcessor(component_bag = Mock(), setting_bag = Mock())
+
+        # Act
+        with self.assertRaises(Exception) as context:
+            tt_processor.save_as_report_async()
+
+        # Assert
+        self.assertEqual(_MessageCollection.please_run_initialize_first(), str(context.exception))
+    def test_initialize_shouldcreatechunkedsummary_whenenablechunkedttdfistrue(self):
+        
+        # Arrange
+        summary : Mock = Mock()
+
+        tt_adapter : Mock = Mock()
+        tt_adapter.create_chunked_summary.return_value = summary
+        tt_adapter.complete_summary.side_effect = lambda tt_summary, setting_bag : tt_summary
+
+        component_bag : Mock = Mock()
+        component_bag.tt_adapter = tt_adapter
+
+        setting_bag : Mock = Mock(enable_chunked_tt_df = True, enable_lazy_summary = True)
+        
+        # Act
+        tt_processor : TimeTrackingProcessor = TimeTrackingProcessor(component_bag = component_bag, setting_bag = setting_bag)
+        tt_processor.initialize()
+        actual : TTSummary = tt_processor.get_summary()
+
+        # Assert
+        tt_adapter.create_chunked_summary.assert_called_once_with(setting_bag = setting_bag)
+        tt_adapter.create_summary.assert_not_called()
+        tt_adapter.create_lazy_summary.assert_not_called()
         self.assertEqual(actual, summary)
+    def test_appendsessions_shouldupdatesummary_wheninvoked(self):
+        
+        # Arrange
+        summary : Mock = Mock()
+        updated_summary : Mock = Mock()
+        new_tt_df : DataFrame = DataFrame()
+
+        tt_adapter : Mock = Mock()
+        tt_adapter.create_summary.return_value = summary
+        tt_adapter.update_summary.return_value = updated_summary
+        tt_adapter.complete_summary.side_effect = lambda tt_summary, setting_bag : tt_summary
+
+        component_bag : Mock = Mock()
+        component_bag.tt_adapter = tt_adapter
+
+        setting_bag : Mock = Mock(enable_chunked_tt_df = False, enable_lazy_summary = False)
+        
+        # Act
+        tt_processor : TimeTrackingProcessor = TimeTrackingProcessor(component_bag = component_bag, setting_bag = setting_bag)
+        tt_processor.initialize()
+        tt_processor.append_sessions(new_tt_df = new_tt_df)
+        actual : TTSummary = tt_processor.get_summary()
+
+        # Assert
+        tt_adapter.update_summary.assert_called_once_with(tt_summary = summary, new_tt_df = new_tt_df, setting_bag = setting_bag)
+        self.assertEqual(actual, updated_summary)
 
     @parameterized.expand([
         ["process_tt"],
@@ -2772,6 +5922,7 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
         ["process_tts_by_hashtag"],
         ["process_tts_by_year_month_spnv"],
         ["process_tts_by_timeranges"],
+        ["process_tts_timerange_matrix"],
         ["process_ttd_effort_status"],
         ["process_definitions"],
         ["get_summary"]
@@ -2786,6 +5937,115 @@ class TimeTrackingProcessorTestCase(unittest.TestCase):
             getattr(tt_processor, method_name)()
 
         self.assertEqual(str(context.exception), "Please run the 'initialize' method first.")
+class TTBatchRunnerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.setting_bag : SettingBag = SettingBag(
+            options_tt = [],
+            options_tt_latest_four = [],
+            options_tts_by_month = [OPTION.display],
+            options_tts_by_year = [],
+            options_tts_by_range = [],
+            options_tts_by_spn = [],
+            options_tts_by_spv = [],
+            options_tts_by_hashtag_year = [],
+            options_tts_by_hashtag = [],
+            options_tts_by_year_month_spnv = [],
+            options_tts_by_timeranges = [],
+            options_definitions = [],
+            options_report = [],
+            excel_nrows = 10,
+            working_folder_path = "/home/nwtimetracking/",
+            tt_partials_cache_folder_path = "/home/nwtimetracking/cache/"
+        )
+        self.setting_bags : list[SettingBag] = [
+            replace(self.setting_bag, excel_path = "/home/nwtimetracking/team/Alice.xlsx"),
+            replace(self.setting_bag, excel_path = "/home/nwtimetracking/team/Bob.xlsx")
+        ]
+        self.tt_partials : TTPartials = ObjectMother().get_tt_partials()
+    def test_run_shouldreturnsummariesandteamsummary_whenallworkbookssucceed(self) -> None:
+
+        # Arrange
+        tt_summary : Mock = Mock(tt_partials = self.tt_partials)
+        team_summary : Mock = Mock()
+
+        component_bag : Mock = Mock()
+        component_bag.tt_adapter.create_summary.return_value = tt_summary
+        component_bag.tt_adapter.complete_summary.side_effect = lambda tt_summary, setting_bag : tt_summary
+        component_bag.tt_adapter.create_team_summary.return_value = team_summary
+
+        # Act
+        actual : TTBatchSummary = TTBatchRunner(component_bag = component_bag).run(setting_bags = self.setting_bags)
+
+        # Assert
+        self.assertEqual([tt_summary, tt_summary], actual.tt_summaries)
+        self.assertEqual(team_summary, actual.team_summary)
+        self.assertEqual([BATCHSTATUS.succeeded, BATCHSTATUS.succeeded], actual.progress_df[TTCN.STATUS].tolist())
+        self.assertEqual([x.excel_path for x in self.setting_bags], actual.progress_df[TTCN.WORKBOOK].tolist())
+        component_bag.tt_adapter.create_team_summary.assert_called_once_with(tt_partials = [self.tt_partials, self.tt_partials], setting_bag = self.setting_bags[0])
+        self.assertTrue(all(x.kwargs["setting_bag"].enable_tt_partials for x in component_bag.tt_adapter.create_summary.call_args_list))
+    def test_run_shouldisolatefailure_whenoneworkbookfails(self) -> None:
+
+        # Arrange
+        tt_summary : Mock = Mock(tt_partials = self.tt_partials)
+
+        component_bag : Mock = Mock()
+        component_bag.tt_adapter.create_summary.side_effect = [FileNotFoundError("Alice.xlsx"), tt_summary]
+        component_bag.tt_adapter.complete_summary.side_effect = lambda tt_summary, setting_bag : tt_summary
+
+        # Act
+        actual : TTBatchSummary = TTBatchRunner(component_bag = component_bag).run(setting_bags = self.setting_bags)
+
+        # Assert
+        self.assertEqual([None, tt_summary], actual.tt_summaries)
+        self.assertEqual([BATCHSTATUS.failed, BATCHSTATUS.succeeded], actual.progress_df[TTCN.STATUS].tolist())
+        self.assertEqual("FileNotFoundError: Alice.xlsx", actual.progress_df[TTCN.ERROR][0])
+        self.assertTrue(pd.isna(actual.progress_df[TTCN.ERROR][1]))
+        component_bag.tt_adapter.create_team_summary.assert_called_once_with(tt_partials = [self.tt_partials], setting_bag = self.setting_bags[0])
+    def test_run_shouldreturnnoteamsummary_whenallworkbooksfail(self) -> None:
+
+        # Arrange
+        component_bag : Mock = Mock()
+        component_bag.tt_adapter.create_summary.side_effect = Exception("Failed.")
+
+        # Act
+        actual : TTBatchSummary = TTBatchRunner(component_bag = component_bag).run(setting_bags = self.setting_bags)
+
+        # Assert
+        self.assertEqual([None, None], actual.tt_summaries)
+        self.assertIsNone(actual.team_summary)
+        component_bag.tt_adapter.create_team_summary.assert_not_called()
+    def test_run_shouldsavereportintoworkingfolder_whenoptionsreportisnotempty(self) -> None:
+
+        # Arrange
+        component_bag : Mock = Mock()
+        component_bag.tt_adapter.create_summary.return_value = Mock(tt_partials = self.tt_partials)
+
+        with tempfile.TemporaryDirectory() as folder_path:
+            working_folder_path : str = os.path.join(folder_path, "Alice")
+            setting_bag : SettingBag = replace(self.setting_bag, options_report = [OPTION.save_html], working_folder_path = working_folder_path)
+
+            # Act
+            TTBatchRunner(component_bag = component_bag).run(setting_bags = [setting_bag])
+
+            # Assert
+            self.assertTrue(os.path.isdir(working_folder_path))
+            component_bag.ttr_manager.save_as_report.assert_called_once()
+    def test_createsettingbags_shouldreturnonesettingbagperworkbook_wheninvoked(self) -> None:
+
+        # Arrange
+        with tempfile.TemporaryDirectory() as folder_path:
+            for file_name in ["Bob.xlsx", "Alice.xlsx", "notes.txt"]:
+                Path(folder_path, file_name).touch()
+
+            # Act
+            actual : list[SettingBag] = TTBatchRunner(component_bag = Mock()).create_setting_bags(setting_bag = self.setting_bag, folder_path = folder_path)
+
+            # Assert
+            self.assertEqual([os.path.join(folder_path, "Alice.xlsx"), os.path.join(folder_path, "Bob.xlsx")], [x.excel_path for x in actual])
+            self.assertEqual(["/home/nwtimetracking/Alice", "/home/nwtimetracking/Bob"], [x.working_folder_path for x in actual])
+            self.assertEqual(["/home/nwtimetracking/cache/Alice", "/home/nwtimetracking/cache/Bob"], [x.tt_partials_cache_folder_path for x in actual])
 
 # MAIN
 if __name__ == "__main__":